@@ -10,6 +10,7 @@
 #
 # 🔗 DEPENDENCIAS:
 #    - ui/consola/menu_consola: para ejecutar_menu_consola
+#    - data/repositorio_usuarios: para compactar_diario_usuarios al inicio
 #
 # 💡 NOTAS PARA LA DEFENSA:
 #    - Punto de entrada simple que delega responsabilidades
@@ -19,9 +20,13 @@
 # =============================================================================
 
 from ui.consola.menu_consola import ejecutar_menu_consola
+from data.repositorio_usuarios import compactar_diario_usuarios
+from config.constantes import RUTA_USUARIOS
 
 def main():
     """Punto de entrada del programa."""
+    # Volcar las partidas del diario en Usuarios.json antes de empezar
+    compactar_diario_usuarios(RUTA_USUARIOS)
     ejecutar_menu_consola()
 
 if __name__ == "__main__":
@@ -0,0 +1,18 @@
+# =============================================================================
+# MÓDULO DE BENCHMARKS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Scripts de medición de rendimiento de la capa de datos y de la lógica.
+#    No forman parte del juego; se ejecutan a mano desde la raíz del proyecto:
+#        python -m benchmarks.<nombre_script>
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno (se ejecutan como scripts)
+#
+# 🔗 DEPENDENCIAS:
+#    Ninguna
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Trabajan sobre archivos temporales: nunca tocan assets/
+#    - Permiten justificar con números las decisiones de diseño
+# =============================================================================
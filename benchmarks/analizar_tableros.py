@@ -0,0 +1,75 @@
+# =============================================================================
+# ANÁLISIS EN LOTE DE TABLEROS DEL MINIJUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Genera muchos tableros con semilla (generar_matriz_resoluble) para
+#    varios tamaños, los resuelve con core/solucionador_minijuego y muestra
+#    por tamaño:
+#      - % de tableros resolubles (debería ser 100%)
+#      - largo medio del camino ganador más corto y más largo
+#      - callejones alcanzables y dificultad media
+#      - tiempo medio de análisis por tablero
+#
+#    Uso: python -m benchmarks.analizar_tableros [tableros] [tamaño ...]
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno (script)
+#
+# 🔗 DEPENDENCIAS:
+#    - random: semilla de los tableros
+#    - core/logica_minijuego: generar_matriz_resoluble
+#    - core/solucionador_minijuego: analizar_tablero_minijuego, calcular_dificultad_tablero
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - El análisis es O(N²): el tiempo por tablero crece con la cantidad de
+#      celdas, no con la cantidad de caminos
+# =============================================================================
+
+import sys
+import time
+import random
+from core.logica_minijuego import generar_matriz_resoluble
+from core.solucionador_minijuego import analizar_tablero_minijuego, calcular_dificultad_tablero
+
+
+def main() -> None:
+    """Analiza tableros generados y muestra el resumen por tamaño."""
+    tableros = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    tamanos = [int(arg) for arg in sys.argv[2:]] or [5, 10, 25, 100]
+
+    print(f"📊 {tableros} tableros por tamaño")
+    for tamano in tamanos:
+        rng = random.Random(tamano)
+        cantidad = tableros if tamano <= 25 else max(1, tableros // 100)
+        resolubles = 0
+        suma_corto = 0
+        suma_largo = 0
+        suma_callejones = 0
+        suma_dificultad = 0.0
+        segundos = 0.0
+
+        for _ in range(cantidad):
+            matriz = generar_matriz_resoluble(tamano, rng)
+            inicio = time.perf_counter()
+            analisis = analizar_tablero_minijuego(matriz)
+            segundos += time.perf_counter() - inicio
+
+            if analisis["resoluble"]:
+                resolubles += 1
+                suma_corto += len(analisis["camino_mas_corto"])
+                suma_largo += len(analisis["camino_mas_largo"])
+            suma_callejones += analisis["callejones_alcanzables"]
+            suma_dificultad += calcular_dificultad_tablero(analisis)
+
+        print(f"  {tamano:4d}x{tamano:<4d} ({cantidad} tableros)")
+        print(f"    Resolubles:             {resolubles * 100 / cantidad:8.1f} %")
+        if resolubles:
+            print(f"    Camino más corto:       {suma_corto / resolubles:8.1f} celdas")
+            print(f"    Camino más largo:       {suma_largo / resolubles:8.1f} celdas")
+        print(f"    Callejones alcanzables: {suma_callejones / cantidad:8.1f}")
+        print(f"    Dificultad media:       {suma_dificultad / cantidad:8.3f}")
+        print(f"    Análisis por tablero:   {segundos * 1000 / cantidad:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# =============================================================================
+# BENCHMARK - CAMINO Y TABLEROS CON SEMILLA DEL MINIJUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Mide cuántos tableros por segundo genera generar_matriz_resoluble al
+#    tamaño por defecto (TAMAÑO_MATRIZ_MINIJUEGO), comprueba que la misma
+#    semilla dé el mismo tablero y genera caminos en tableros muy grandes
+#    (que con la versión recursiva superaban el límite de recursión).
+#
+#    Uso: python -m benchmarks.bench_camino_minijuego [tableros] [tamaño_grande]
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno (script)
+#
+# 🔗 DEPENDENCIAS:
+#    - random: random.Random con semilla
+#    - core/logica_minijuego: generar_matriz_resoluble, generar_camino_garantizado
+#    - config/constantes: TAMAÑO_MATRIZ_MINIJUEGO
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Objetivo: al menos 10.000 tableros por segundo al tamaño por defecto
+#    - El camino iterativo no depende de sys.getrecursionlimit()
+# =============================================================================
+
+import sys
+import time
+import random
+from core.logica_minijuego import generar_matriz_resoluble, generar_camino_garantizado
+from config.constantes import TAMAÑO_MATRIZ_MINIJUEGO
+
+OBJETIVO_TABLEROS_POR_SEGUNDO = 10000
+
+
+def main() -> None:
+    """Ejecuta el benchmark y muestra los resultados."""
+    tableros = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    tamano_grande = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    print(f"📊 {tableros} tableros de {TAMAÑO_MATRIZ_MINIJUEGO}x{TAMAÑO_MATRIZ_MINIJUEGO}")
+    rng = random.Random(1)
+    inicio = time.perf_counter()
+    for _ in range(tableros):
+        generar_matriz_resoluble(TAMAÑO_MATRIZ_MINIJUEGO, rng)
+    segundos = time.perf_counter() - inicio
+    por_segundo = tableros / segundos
+    marca = "✅" if por_segundo >= OBJETIVO_TABLEROS_POR_SEGUNDO else "❌"
+    print(f"  Tableros por segundo:        {por_segundo:12.0f} {marca} (objetivo {OBJETIVO_TABLEROS_POR_SEGUNDO})")
+
+    iguales = True
+    for semilla in range(100):
+        primero = generar_matriz_resoluble(TAMAÑO_MATRIZ_MINIJUEGO, random.Random(semilla))
+        segundo = generar_matriz_resoluble(TAMAÑO_MATRIZ_MINIJUEGO, random.Random(semilla))
+        if primero != segundo:
+            iguales = False
+    print(f"  Misma semilla, mismo tablero: {'✅' if iguales else '❌'}")
+
+    inicio = time.perf_counter()
+    camino = generar_camino_garantizado(tamano_grande, random.Random(1))
+    ms_camino = (time.perf_counter() - inicio) * 1000
+    llega = camino[-1] == (tamano_grande - 1, tamano_grande - 1)
+    print(f"  Camino de {tamano_grande}x{tamano_grande}: {len(camino)} celdas en {ms_camino:.1f} ms "
+          f"{'✅' if llega else '❌'} (límite de recursión: {sys.getrecursionlimit()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# =============================================================================
+# BENCHMARK - COSTO DE FSYNC POR FIN DE PARTIDA
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Simula las escrituras de un fin de partida (consumir objeto, consumir
+#    vidas, ganar vidas y guardar estadísticas) sobre archivos temporales y
+#    mide el tiempo por partida con distintas estrategias de escritura:
+#      1. directa: open("w") + json.dump, una por guardado (comportamiento anterior)
+#      2. atómica sin fsync: temporal + rename
+#      3. atómica con fsync: temporal + fsync + rename, una por guardado
+#      4. actual: el camino del juego (confirmar_sesion_juego,
+#         guardar_registro_eventos y guardar_estadisticas_usuario), que
+#         escribe una vez cada archivo (tests/test_fin_partida.py)
+#
+#    Uso: python -m benchmarks.bench_guardar_json [partidas] [usuarios]
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno (script)
+#
+# 🔗 DEPENDENCIAS:
+#    - data/archivos_json: escribir_json_atomico, guardar_json
+#    - core/sesion_juego, core/registro_eventos, data/repositorio_eventos,
+#      data/repositorio_usuarios: fin de partida actual
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - La diferencia entre 2 y 3 es el costo puro de fsync
+#    - En el juego las escrituras de buffs se agrupan en data/estado_buff
+#      (write-behind) y core/sesion_juego (una transacción por partida), y
+#      las estadísticas se agregan al diario en lugar de reescribir
+#      Usuarios.json: 4 mide ese camino, con fsync
+# =============================================================================
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+from data.archivos_json import escribir_json_atomico, guardar_json
+from core.sesion_juego import crear_sesion_en_memoria, confirmar_sesion_juego
+from core.registro_eventos import crear_registro_eventos, registrar_fin_eventos
+from data.repositorio_eventos import guardar_registro_eventos
+from data.repositorio_usuarios import guardar_estadisticas_usuario
+
+
+# =============================================================================
+# CREAR_DATOS_SINTETICOS
+# =============================================================================
+# Descripción: Genera Usuarios.json y EstadoBuff.json de prueba
+#
+# Parámetros:
+#   - cantidad_usuarios (int): Cantidad de perfiles
+#
+# Retorna:
+#   - tuple: (usuarios: dict, estado_buff: dict)
+# =============================================================================
+def crear_datos_sinteticos(cantidad_usuarios: int) -> tuple:
+    """Genera datos de usuarios y de buffs de prueba."""
+    usuarios = {}
+    estado_buff = {}
+    for i in range(cantidad_usuarios):
+        nombre = "jugador_" + str(i)
+        usuarios[nombre] = {
+            "intentos": 3,
+            "puntajes": [10, 15, 20],
+            "tiempos": [60.0, 55.5, 70.2],
+            "aciertos": [6, 7, 8],
+            "total_preguntas": [10, 10, 10],
+            "porcentajes": [60.0, 70.0, 80.0],
+            "historial": []
+        }
+        estado_buff[nombre] = {"vidas_extra": i % 4, "objeto_excepcional": "espada"}
+    return usuarios, estado_buff
+
+
+def escribir_directo(archivo: str, datos, sincronizar: bool) -> bool:
+    """Escritura anterior: abre el destino en modo "w" y escribe encima."""
+    with open(archivo, "w", encoding="utf-8") as f:
+        json.dump(datos, f, ensure_ascii=False, indent=2)
+    return True
+
+
+def simular_fin_partida(escribir, ruta_usuarios: str, ruta_buff: str, usuarios: dict, estado_buff: dict, sincronizar: bool) -> None:
+    """Aplica las cuatro escrituras de un fin de partida con la función dada."""
+    estado_buff["jugador_0"].pop("objeto_excepcional", None)
+    escribir(ruta_buff, estado_buff, sincronizar)
+    estado_buff["jugador_0"]["vidas_extra"] = 0
+    escribir(ruta_buff, estado_buff, sincronizar)
+    estado_buff["jugador_0"]["vidas_extra"] = 1
+    escribir(ruta_buff, estado_buff, sincronizar)
+    usuarios["jugador_0"]["intentos"] += 1
+    escribir(ruta_usuarios, usuarios, sincronizar)
+
+
+def simular_fin_partida_actual(directorio: str) -> None:
+    """Fin de partida con las funciones del juego: una escritura por archivo."""
+    resultado = {
+        "puntos_totales": 120,
+        "tiempo_total_segundos": 60.0,
+        "respuestas_correctas": 8,
+        "total_preguntas": 10,
+        "detalle": []
+    }
+    ruta_buff = os.path.join(directorio, "EstadoBuff.json")
+    sesion = crear_sesion_en_memoria("jugador_0", "espada", 1, ruta_buff)
+    registro = crear_registro_eventos("jugador_0", 1, "espada", 1)
+    confirmar_sesion_juego(sesion, 1, 1)
+    registrar_fin_eventos(registro, resultado, 1, 1, False)
+    guardar_registro_eventos(registro, os.path.join(directorio, "EventosPartidas.jsonl"))
+    guardar_estadisticas_usuario("jugador_0", resultado, os.path.join(directorio, "Usuarios.json"))
+
+
+def medir(nombre: str, partidas: int, funcion) -> float:
+    """Ejecuta la función 'partidas' veces y muestra ms por partida."""
+    inicio = time.perf_counter()
+    for _ in range(partidas):
+        funcion()
+    ms_por_partida = (time.perf_counter() - inicio) * 1000 / partidas
+    print(f"  {nombre:<38} {ms_por_partida:8.3f} ms/partida")
+    return ms_por_partida
+
+
+def main() -> None:
+    """Ejecuta el benchmark y muestra los resultados."""
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    cantidad_usuarios = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    directorio = tempfile.mkdtemp(prefix="bench_json_")
+    ruta_usuarios = os.path.join(directorio, "Usuarios.json")
+    ruta_buff = os.path.join(directorio, "EstadoBuff.json")
+    usuarios, estado_buff = crear_datos_sinteticos(cantidad_usuarios)
+
+    print(f"📊 Fin de partida con {cantidad_usuarios} usuarios ({partidas} partidas)")
+    try:
+        medir("1. directa (antes)", partidas,
+              lambda: simular_fin_partida(escribir_directo, ruta_usuarios, ruta_buff, usuarios, estado_buff, False))
+        sin_fsync = medir("2. atómica sin fsync", partidas,
+              lambda: simular_fin_partida(escribir_json_atomico, ruta_usuarios, ruta_buff, usuarios, estado_buff, False))
+        con_fsync = medir("3. atómica con fsync (4 escrituras)", partidas,
+              lambda: simular_fin_partida(escribir_json_atomico, ruta_usuarios, ruta_buff, usuarios, estado_buff, True))
+        print(f"  Costo de fsync por partida:            {con_fsync - sin_fsync:8.3f} ms")
+
+        # Mismos usuarios y buffs de partida que en 1-3
+        guardar_json(ruta_usuarios, usuarios)
+        guardar_json(ruta_buff, estado_buff)
+        medir("4. actual (una escritura por archivo)", partidas,
+              lambda: simular_fin_partida_actual(directorio))
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# =============================================================================
+# BENCHMARK - SELECCIÓN PONDERADA CON TABLAS ALIAS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Mide data/indice_ponderado sobre un banco sintético grande con pesos
+#    por pregunta y por categoría:
+#      - construir las tablas (una vez por banco y pesos)
+#      - partidas completas (preparar + seleccionar), comparadas con el
+#        índice uniforme de data/indice_preguntas
+#      - elección ponderada "ingenua" (random.choices sobre la lista de
+#        candidatas, O(k) por elección) como referencia
+#    Y verifica la distribución: frecuencia observada de cada categoría en
+#    la primera pregunta contra la esperada por los pesos.
+#
+#    Uso: python -m benchmarks.bench_seleccion_ponderada [preguntas] [partidas]
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno (script)
+#
+# 🔗 DEPENDENCIAS:
+#    - core/logica_juego: obtener_pregunta_para_nivel
+#    - data/indice_ponderado, data/indice_preguntas: índices a comparar
+#    - benchmarks/bench_seleccion_preguntas: crear_banco_sintetico, jugar_partida
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - El tiempo por partida no debería crecer con el tamaño del banco
+# =============================================================================
+
+import sys
+import time
+import random
+from core.logica_juego import obtener_pregunta_para_nivel
+from data.indice_ponderado import preparar_indice_ponderado
+from data.indice_preguntas import preparar_indice_partida
+from benchmarks.bench_seleccion_preguntas import crear_banco_sintetico, jugar_partida, CATEGORIAS
+
+# Pesos de prueba: categorías con distinto peso, preguntas con peso 1..10
+PESOS_CATEGORIA = {"griega": 1, "egipcia": 2, "hebrea": 3, "nordica": 4, "azteca": 0.5}
+MUESTRAS_DISTRIBUCION = 20000
+
+
+def medir_eleccion_ingenua(preguntas: dict, pesos_pregunta: dict, elecciones: int) -> float:
+    """ms por elección con random.choices sobre todas las candidatas del nivel."""
+    candidatas = [pid for pid, p in preguntas.items() if p["nivel"] == 1]
+    pesos = [pesos_pregunta[pid] * PESOS_CATEGORIA[preguntas[pid]["categoria"]] for pid in candidatas]
+    inicio = time.perf_counter()
+    for _ in range(elecciones):
+        random.choices(candidatas, pesos)
+    return (time.perf_counter() - inicio) * 1000 / elecciones
+
+
+def verificar_distribucion(preguntas: dict, pesos_pregunta: dict) -> float:
+    """Máxima diferencia entre frecuencia observada y esperada por categoría."""
+    rng = random.Random(1)
+    conteo = {categoria: 0 for categoria in CATEGORIAS}
+    indice = None
+    for _ in range(MUESTRAS_DISTRIBUCION):
+        indice = preparar_indice_ponderado(preguntas, pesos_pregunta, PESOS_CATEGORIA, indice)
+        pregunta = obtener_pregunta_para_nivel(preguntas, 1, [], indice, rng)
+        conteo[pregunta["categoria"]] += 1
+
+    total_pesos = sum(PESOS_CATEGORIA.values())
+    diferencia = 0.0
+    for categoria in CATEGORIAS:
+        esperada = PESOS_CATEGORIA[categoria] / total_pesos
+        observada = conteo[categoria] / MUESTRAS_DISTRIBUCION
+        diferencia = max(diferencia, abs(esperada - observada))
+    return diferencia
+
+
+def main() -> None:
+    """Ejecuta el benchmark y muestra los resultados."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    partidas = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    print(f"📊 Banco sintético de {cantidad} preguntas ({partidas} partidas)")
+    preguntas = crear_banco_sintetico(cantidad)
+    pesos_pregunta = {pid: pid % 10 + 1 for pid in preguntas}
+
+    inicio = time.perf_counter()
+    indice = preparar_indice_ponderado(preguntas, pesos_pregunta, PESOS_CATEGORIA)
+    print(f"  Construir tablas alias (una vez):        {(time.perf_counter() - inicio) * 1000:10.3f} ms")
+
+    inicio = time.perf_counter()
+    for _ in range(partidas):
+        indice = preparar_indice_ponderado(preguntas, pesos_pregunta, PESOS_CATEGORIA, indice)
+        jugar_partida(preguntas, indice)
+    ms_ponderado = (time.perf_counter() - inicio) * 1000 / partidas
+    print(f"  Ponderado (preparar + seleccionar):     {ms_ponderado:10.3f} ms/partida")
+
+    indice = preparar_indice_partida(preguntas)
+    inicio = time.perf_counter()
+    for _ in range(partidas):
+        indice = preparar_indice_partida(preguntas, indice)
+        jugar_partida(preguntas, indice)
+    ms_uniforme = (time.perf_counter() - inicio) * 1000 / partidas
+    print(f"  Índice uniforme (referencia):            {ms_uniforme:10.3f} ms/partida")
+
+    ms_ingenua = medir_eleccion_ingenua(preguntas, pesos_pregunta, 5)
+    print(f"  random.choices sobre el nivel:           {ms_ingenua:10.3f} ms/elección")
+
+    diferencia = verificar_distribucion(preguntas, pesos_pregunta)
+    print(f"  Distribución por categoría: máx. desvío {diferencia * 100:.2f} puntos porcentuales ({MUESTRAS_DISTRIBUCION} muestras)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# =============================================================================
+# BENCHMARK - SELECCIÓN DE PREGUNTAS CON Y SIN ÍNDICE
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Compara el camino anterior de obtener_pregunta_para_nivel
+#    (filtrar_preguntas_por_nivel + seleccionar_pregunta_aleatoria) con el
+#    índice (nivel, categoría) de data/indice_preguntas sobre un banco
+#    sintético. Mide una partida completa (PREGUNTAS_POR_NIVEL).
+#
+#    Uso: python -m benchmarks.bench_seleccion_preguntas [preguntas] [partidas]
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno (script)
+#
+# 🔗 DEPENDENCIAS:
+#    - core/logica_juego: obtener_pregunta_para_nivel
+#    - data/indice_preguntas: preparar_indice_partida
+#    - config/constantes: PREGUNTAS_POR_NIVEL
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - El camino anterior es O(N·U) por pregunta: crece con el banco
+#    - Con índice, construir es O(N) una vez por banco y cada partida es O(U)
+# =============================================================================
+
+import sys
+import time
+from core.logica_juego import obtener_pregunta_para_nivel
+from data.indice_preguntas import preparar_indice_partida
+from config.constantes import PREGUNTAS_POR_NIVEL
+
+CATEGORIAS = ["griega", "egipcia", "hebrea", "nordica", "azteca"]
+
+
+# =============================================================================
+# CREAR_BANCO_SINTETICO
+# =============================================================================
+# Descripción: Genera un banco con el formato de cargar_preguntas_desde_csv
+#
+# Parámetros:
+#   - cantidad (int): Cantidad de preguntas
+#
+# Retorna:
+#   - dict: Preguntas indexadas por ID
+# =============================================================================
+def crear_banco_sintetico(cantidad: int) -> dict:
+    """Genera un banco de preguntas sintético."""
+    preguntas = {}
+    for pid in range(1, cantidad + 1):
+        nivel = pid % 3 + 1
+        preguntas[pid] = {
+            "nivel": nivel,
+            "descripcion": "Pregunta " + str(pid),
+            "dificultad": nivel,
+            "categoria": CATEGORIAS[pid % len(CATEGORIAS)],
+            "opciones": ["A", "B", "C", "D"],
+            "correcta": "A"
+        }
+    return preguntas
+
+
+def jugar_partida(preguntas: dict, indice) -> int:
+    """Selecciona todas las preguntas de una partida y retorna cuántas obtuvo."""
+    preguntas_usadas = []
+    for nivel in PREGUNTAS_POR_NIVEL:
+        for _ in range(PREGUNTAS_POR_NIVEL[nivel]):
+            pregunta = obtener_pregunta_para_nivel(preguntas, nivel, preguntas_usadas, indice)
+            if pregunta:
+                preguntas_usadas.append(pregunta["id"])
+    return len(preguntas_usadas)
+
+
+def main() -> None:
+    """Ejecuta el benchmark y muestra los resultados."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    partidas = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print(f"📊 Banco sintético de {cantidad} preguntas ({partidas} partidas)")
+    preguntas = crear_banco_sintetico(cantidad)
+
+    inicio = time.perf_counter()
+    for _ in range(partidas):
+        jugar_partida(preguntas, None)
+    ms_anterior = (time.perf_counter() - inicio) * 1000 / partidas
+    print(f"  Camino anterior (filtrar + seleccionar): {ms_anterior:10.3f} ms/partida")
+
+    inicio = time.perf_counter()
+    indice = preparar_indice_partida(preguntas)
+    ms_construccion = (time.perf_counter() - inicio) * 1000
+    print(f"  Construir índice (una vez por banco):    {ms_construccion:10.3f} ms")
+
+    inicio = time.perf_counter()
+    for _ in range(partidas):
+        indice = preparar_indice_partida(preguntas, indice)
+        jugar_partida(preguntas, indice)
+    ms_indice = (time.perf_counter() - inicio) * 1000 / partidas
+    print(f"  Con índice (preparar + seleccionar):     {ms_indice:10.3f} ms/partida")
+
+    if ms_indice > 0:
+        print(f"  Aceleración por partida:                 {ms_anterior / ms_indice:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
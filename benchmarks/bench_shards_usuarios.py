@@ -0,0 +1,130 @@
+# =============================================================================
+# BENCHMARK - USUARIOS EN UN ARCHIVO ÚNICO VS. REPARTIDOS EN SHARDS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Crea un Usuarios.json sintético, lo reparte en shards con
+#    migrar_usuarios_a_shards y compara:
+#      1. guardar una partida reescribiendo el archivo único
+#      2. guardar una partida con guardar_estadisticas_shards (1/N de los datos)
+#      3. top-K global fusionando los top-K de cada shard
+#      4. ranking completo calculado shard por shard
+#
+#    Uso: python -m benchmarks.bench_shards_usuarios [usuarios] [partidas]
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno (script)
+#
+# 🔗 DEPENDENCIAS:
+#    - data/repositorio_usuarios: funciones del backend por shards
+#    - data/shards_usuarios: rutas de los shards
+#    - data/archivos_json: guardar_json (archivo único)
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Los bytes escritos por guardado bajan ~N veces con N shards
+#    - El top-K fusionado lee S tablas de K entradas, no a los jugadores
+# =============================================================================
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+from data.archivos_json import guardar_json
+from data.repositorio_usuarios import (
+    crear_agregados_vacios,
+    migrar_usuarios_a_shards,
+    guardar_estadisticas_shards,
+    obtener_top_ranking_shards,
+    obtener_ranking_shards
+)
+from data.shards_usuarios import listar_rutas_shards, obtener_ruta_shard_usuario
+from utils.algoritmos import actualizar_agregado
+
+
+# =============================================================================
+# CREAR_USUARIOS_SINTETICOS
+# =============================================================================
+# Descripción: Genera usuarios con el formato de Usuarios.json
+#
+# Parámetros:
+#   - cantidad (int): Cantidad de perfiles
+#
+# Retorna:
+#   - dict: {nombre: datos}
+# =============================================================================
+def crear_usuarios_sinteticos(cantidad: int) -> dict:
+    """Genera usuarios de prueba con sus agregados."""
+    usuarios = {}
+    for i in range(cantidad):
+        listas = {
+            "puntajes": [i % 40, (i * 7) % 40, (i * 13) % 40],
+            "tiempos": [60.0, 55.5, 70.2],
+            "aciertos": [6, 7, 8],
+            "total_preguntas": [10, 10, 10],
+            "porcentajes": [60.0, 70.0, 80.0]
+        }
+        agregados = crear_agregados_vacios()
+        for campo in listas:
+            for valor in listas[campo]:
+                agregados[campo] = actualizar_agregado(agregados[campo], valor)
+        usuario = {"intentos": 3, "historial": ["a", "b", "c"], "agregados": agregados}
+        usuario.update(listas)
+        usuarios["jugador_" + str(i)] = usuario
+    return usuarios
+
+
+def medir(nombre: str, repeticiones: int, funcion) -> float:
+    """Ejecuta la función 'repeticiones' veces y muestra ms por llamada."""
+    inicio = time.perf_counter()
+    for i in range(repeticiones):
+        funcion(i)
+    ms = (time.perf_counter() - inicio) * 1000 / repeticiones
+    print(f"  {nombre:<44} {ms:10.3f} ms")
+    return ms
+
+
+def main() -> None:
+    """Ejecuta el benchmark y muestra los resultados."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    partidas = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    directorio = tempfile.mkdtemp(prefix="bench_shards_")
+    ruta_usuarios = os.path.join(directorio, "Usuarios.json")
+    usuarios = crear_usuarios_sinteticos(cantidad)
+    resultado = {
+        "puntos_totales": 35,
+        "tiempo_total_segundos": 40.0,
+        "respuestas_correctas": 9,
+        "total_preguntas": 10,
+        "detalle": []
+    }
+
+    print(f"📊 {cantidad} usuarios ({partidas} partidas)")
+    try:
+        guardar_json(ruta_usuarios, usuarios)
+        tamano_total = os.path.getsize(ruta_usuarios)
+
+        def guardar_archivo_unico(i):
+            usuarios["jugador_" + str(i)]["intentos"] += 1
+            guardar_json(ruta_usuarios, usuarios)
+
+        def guardar_en_shard(i):
+            guardar_estadisticas_shards("jugador_" + str(i), resultado, ruta_usuarios)
+
+        inicio = time.perf_counter()
+        migrar_usuarios_a_shards(ruta_usuarios)
+        print(f"  Migración a shards (una vez):                {(time.perf_counter() - inicio) * 1000:10.3f} ms")
+        tamano_shard = os.path.getsize(obtener_ruta_shard_usuario(ruta_usuarios, "jugador_0"))
+        rutas = listar_rutas_shards(ruta_usuarios)
+
+        medir("1. Guardar reescribiendo el archivo único", partidas, guardar_archivo_unico)
+        medir("2. Guardar en el shard del jugador", partidas, guardar_en_shard)
+        medir("3. Top-10 fusionando top-K por shard", partidas, lambda i: obtener_top_ranking_shards(ruta_usuarios, 10))
+        medir("4. Ranking completo por shards", 1, lambda i: obtener_ranking_shards(ruta_usuarios))
+        print(f"  Bytes por guardado: {tamano_total} → {tamano_shard} ({len(rutas)} shards)")
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
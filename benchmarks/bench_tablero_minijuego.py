@@ -0,0 +1,87 @@
+# =============================================================================
+# BENCHMARK - GENERACIÓN DE TABLEROS DEL MINIJUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Compara la generación del tablero de "Guardianes de Piedra" con listas
+#    (inicializar_matriz_vacia + camino + relleno celda por celda)
+#    contra la versión vectorizada de core/logica_tablero_vectorizado, para
+#    varios tamaños. Verifica además que cada tablero vectorizado tenga el
+#    camino creciente hasta la esquina.
+#
+#    Uso: python -m benchmarks.bench_tablero_minijuego [tamaño ...]
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno (script)
+#
+# 🔗 DEPENDENCIAS:
+#    - core/logica_minijuego: versión de listas
+#    - core/logica_tablero_vectorizado: versión con numpy
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - La versión de listas es O(N²) con muchas operaciones de Python por
+#      celda; la vectorizada hace un puñado de operaciones sobre arreglos
+# =============================================================================
+
+import sys
+import time
+from core.logica_minijuego import (
+    inicializar_matriz_vacia,
+    generar_camino_garantizado,
+    asignar_valores_a_camino,
+    rellenar_matriz_con_valores_seguro
+)
+from core.logica_tablero_vectorizado import (
+    numpy_disponible,
+    generar_tablero_resoluble,
+    generar_camino_vectorizado,
+    tablero_a_lista
+)
+
+
+def generar_matriz_listas(tamano: int) -> list:
+    """Genera el tablero con la versión de listas (sin numpy)."""
+    matriz = inicializar_matriz_vacia(tamano)
+    camino = generar_camino_garantizado(tamano)
+    asignar_valores_a_camino(matriz, camino)
+    rellenar_matriz_con_valores_seguro(matriz, camino)
+    return matriz
+
+
+def medir_ms(funcion, tamano: int, repeticiones: int) -> float:
+    """Tiempo medio en milisegundos de funcion(tamano)."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion(tamano)
+    return (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def verificar_camino_creciente(tamano: int) -> bool:
+    """Genera un tablero con semilla y comprueba que su camino sea creciente."""
+    import numpy as np
+    tablero = generar_tablero_resoluble(tamano, np.random.default_rng(tamano))
+    filas, columnas = generar_camino_vectorizado(tamano, np.random.default_rng(tamano))
+    valores = tablero[filas, columnas]
+    return bool(filas[-1] == tamano - 1 and columnas[-1] == tamano - 1 and (valores[1:] > valores[:-1]).all())
+
+
+def main() -> None:
+    """Ejecuta el benchmark y muestra los resultados."""
+    tamanos = [int(arg) for arg in sys.argv[1:]] or [5, 50, 200, 500]
+
+    if not numpy_disponible():
+        print("❌ numpy no está instalado: solo existe la versión de listas")
+        return
+
+    print("📊 Generación de tableros del minijuego")
+    for tamano in tamanos:
+        repeticiones = 200 if tamano <= 50 else 5
+        ms_listas = medir_ms(generar_matriz_listas, tamano, repeticiones)
+        ms_vectorizado = medir_ms(generar_tablero_resoluble, tamano, repeticiones)
+        ms_adaptado = medir_ms(lambda n: tablero_a_lista(generar_tablero_resoluble(n)), tamano, repeticiones)
+        correcto = "✅" if verificar_camino_creciente(tamano) else "❌"
+        print(f"  {tamano:4d}x{tamano:<4d} listas: {ms_listas:9.2f} ms   numpy: {ms_vectorizado:7.2f} ms"
+              f"   numpy + lista: {ms_adaptado:7.2f} ms   camino {correcto}")
+
+
+if __name__ == "__main__":
+    main()
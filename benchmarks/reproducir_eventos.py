@@ -0,0 +1,80 @@
+# =============================================================================
+# REPRODUCCIÓN DE EVENTOS - VERIFICAR Y MEDIR EL REGISTRO DE PARTIDAS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Reproduce todas las partidas de assets/EventosPartidas.jsonl (o del
+#    archivo indicado) con core/reproduccion_partidas y muestra:
+#      - partidas reproducidas por segundo
+#      - partidas cuya reproducción no coincide con lo registrado
+#    Con --regenerar también vuelve a sortear las preguntas con la semilla.
+#    Con --reconstruir ARCHIVO guarda las estadísticas reproducidas en ese
+#    archivo de usuarios.
+#
+#    Uso: python -m benchmarks.reproducir_eventos [eventos.jsonl] [--regenerar] [--reconstruir Usuarios.json]
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno (script)
+#
+# 🔗 DEPENDENCIAS:
+#    - core/reproduccion_partidas: motor de reproducción
+#    - data/repositorio_eventos: lectura de los registros
+#    - data/repositorio_preguntas: leer_preguntas_csv (solo lectura)
+#    - data/archivos_json: para verificar_y_obtener_ruta
+#    - config/constantes: para RUTA_PREGUNTAS
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Sin --reconstruir no escribe ningún archivo
+# =============================================================================
+
+import sys
+import time
+from core.reproduccion_partidas import reproducir_partida, reconstruir_estadisticas
+from data.repositorio_eventos import leer_registros_eventos
+from data.repositorio_preguntas import leer_preguntas_csv
+from data.archivos_json import verificar_y_obtener_ruta
+from config.constantes import RUTA_PREGUNTAS
+
+# Diferencias que se muestran por partida
+MAX_DIFERENCIAS_MOSTRADAS = 3
+
+
+def main() -> None:
+    """Reproduce el archivo de eventos y muestra el resultado."""
+    argumentos = sys.argv[1:]
+    regenerar = "--regenerar" in argumentos
+    archivo_usuarios = None
+    if "--reconstruir" in argumentos:
+        posicion = argumentos.index("--reconstruir")
+        archivo_usuarios = argumentos[posicion + 1]
+        del argumentos[posicion:posicion + 2]
+    argumentos = [a for a in argumentos if not a.startswith("--")]
+    ruta_eventos = argumentos[0] if argumentos else None
+
+    preguntas = leer_preguntas_csv(verificar_y_obtener_ruta(RUTA_PREGUNTAS))
+    registros = leer_registros_eventos(ruta_eventos)
+    if not registros:
+        print("📭 No hay partidas registradas")
+        return None
+
+    inicio = time.perf_counter()
+    con_diferencias = 0
+    for registro in registros:
+        reproduccion = reproducir_partida(registro, preguntas, regenerar)
+        if reproduccion["diferencias"]:
+            con_diferencias += 1
+            print(f"⚠️ Partida {reproduccion['id_partida']} ({reproduccion['usuario']}): {len(reproduccion['diferencias'])} diferencias")
+            for diferencia in reproduccion["diferencias"][:MAX_DIFERENCIAS_MOSTRADAS]:
+                print(f"      {diferencia}")
+    segundos = time.perf_counter() - inicio
+
+    print(f"🎬 {len(registros)} partidas reproducidas en {segundos:.3f}s ({len(registros) / segundos:,.0f} partidas/s)")
+    print(f"✅ Coinciden: {len(registros) - con_diferencias}   ⚠️ Con diferencias: {con_diferencias}")
+
+    if archivo_usuarios:
+        resumen = reconstruir_estadisticas(registros, preguntas, archivo_usuarios)
+        print(f"💾 Estadísticas reconstruidas en {archivo_usuarios}: {resumen}")
+    return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# =============================================================================
+# SIMULACIÓN DE BALANCE - DISTRIBUCIONES CON MUCHAS PARTIDAS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Corre core/simulador_partidas con el banco de preguntas real y varios
+#    jugadores modelo, para la configuración actual y algunas alternativas
+#    de PUNTOS_BUFFEO_POR_RACHA / PUNTOS_POR_VIDA_EXTRA, y muestra:
+#      - puntos por partida (promedio y percentiles)
+#      - vidas extra ganadas por partida y acumuladas entre partidas
+#      - % de partidas que terminan por errores y que ganan objeto
+#
+#    Uso: python -m benchmarks.simular_balance [partidas] [procesos] [partidas_por_jugador]
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno (script)
+#
+# 🔗 DEPENDENCIAS:
+#    - core/simulador_partidas: motor de simulación
+#    - data/repositorio_preguntas: leer_preguntas_csv (solo lectura: no
+#      regenera el banco compilado)
+#    - data/archivos_json: para verificar_y_obtener_ruta
+#    - config/constantes: para RUTA_PREGUNTAS
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - No escribe ningún archivo: perfiles y buffs no se tocan
+#    - Para probar otra configuración alcanza con agregarla a CONFIGURACIONES
+# =============================================================================
+
+import sys
+import time
+from core.simulador_partidas import simular_partidas, describir_histograma
+from data.repositorio_preguntas import leer_preguntas_csv
+from data.archivos_json import verificar_y_obtener_ruta
+from config.constantes import RUTA_PREGUNTAS
+
+# Jugadores modelo a simular
+MODELOS = [
+    ("Acierta 60%", {"tipo": "fijo", "acierto": 0.6}),
+    ("Acierta 85%", {"tipo": "fijo", "acierto": 0.85}),
+    ("Según dificultad", {"tipo": "por_dificultad", "acierto": {1: 0.9, 2: 0.7, 3: 0.5}})
+]
+
+# Configuraciones de balance a comparar ({} = constantes actuales)
+CONFIGURACIONES = [
+    ("Actual", {}),
+    ("Vida cada 20 pts", {"puntos_por_vida_extra": 20}),
+    ("Rachas 1/2/3", {"puntos_buffeo_por_racha": {3: 1, 5: 2, 7: 3}})
+]
+
+
+def mostrar_resumen(resumen: dict) -> None:
+    """Muestra los indicadores principales de un resumen."""
+    partidas = resumen["partidas"]
+    puntos = describir_histograma(resumen["puntos"])
+    ganadas = describir_histograma(resumen["vidas_ganadas"])
+    acumuladas = describir_histograma(resumen["vidas_extra"])
+
+    print(f"      Puntos:        prom {puntos['promedio']:6.2f}  p10 {puntos['p10']:3}  p50 {puntos['p50']:3}  p90 {puntos['p90']:3}  p99 {puntos['p99']:3}  máx {puntos['maximo']}")
+    print(f"      Vidas ganadas: prom {ganadas['promedio']:6.2f}  p50 {ganadas['p50']:3}  p90 {ganadas['p90']:3}  máx {ganadas['maximo']}")
+    print(f"      Vidas al final:prom {acumuladas['promedio']:6.2f}  p50 {acumuladas['p50']:3}  p90 {acumuladas['p90']:3}")
+    print(f"      Game over: {resumen['game_over'] * 100 / partidas:5.1f}%   Objeto ganado: {resumen['objetos_merecidos'] * 100 / partidas:5.1f}%   Objetos usados: {resumen['objetos_usados']}")
+    return None
+
+
+def main() -> None:
+    """Ejecuta la simulación y muestra las distribuciones."""
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    procesos = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    partidas_por_jugador = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    ruta = verificar_y_obtener_ruta(RUTA_PREGUNTAS)
+    preguntas = leer_preguntas_csv(ruta)
+
+    print(f"🎲 {partidas} partidas por caso ({partidas_por_jugador} seguidas por jugador)")
+    for nombre_configuracion, configuracion in CONFIGURACIONES:
+        print(f"\n⚙️  {nombre_configuracion} {configuracion}")
+        for nombre_modelo, modelo in MODELOS:
+            inicio = time.perf_counter()
+            resumen = simular_partidas(preguntas, modelo, partidas, configuracion, partidas_por_jugador, procesos)
+            segundos = time.perf_counter() - inicio
+            print(f"   {nombre_modelo} ({partidas / segundos:,.0f} partidas/s)")
+            mostrar_resumen(resumen)
+    return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+# =============================================================================
+# PRUEBA DE ESTRÉS - VARIOS PROCESOS TERMINANDO PARTIDAS A LA VEZ
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Lanza N procesos que arrancan juntos (barrera) y cada uno guarda M
+#    partidas sobre los mismos archivos temporales (Usuarios.json, diario,
+#    historial, ranking y EstadoBuff.json). El diario se compacta muy seguido
+#    para forzar compactaciones concurrentes. Al final verifica que no se
+#    perdió ningún resultado:
+#      - intentos de cada usuario == partidas guardadas para ese usuario
+#      - el ranking materializado coincide con los datos
+#      - un contador en EstadoBuff.json (transacción) vale N*M
+#      - la clave que cada proceso escribió con volcado diferido sigue ahí
+#    y muestra las métricas de contención de los bloqueos.
+#
+#    Uso: python -m benchmarks.stress_multiproceso [procesos] [partidas] [usuarios]
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno (script)
+#
+# 🔗 DEPENDENCIAS:
+#    - multiprocessing: procesos independientes (contexto "spawn")
+#    - data/repositorio_usuarios, data/estado_buff, data/bloqueo_archivos
+#    - data/diario_partidas: se achica TAMANO_MAXIMO_DIARIO_PARTIDAS
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Sale con código 1 si falta cualquier resultado
+#    - "con_espera" y "segundos_espera" miden cuánto costó la contención
+# =============================================================================
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import multiprocessing
+
+
+# =============================================================================
+# TRABAJADOR
+# =============================================================================
+# Descripción: Cuerpo de cada proceso: guarda sus partidas y cambia buffs
+#
+# Parámetros:
+#   - indice (int): Número de proceso
+#   - directorio (str): Carpeta temporal compartida
+#   - partidas (int): Partidas que guarda este proceso
+#   - usuarios (int): Usuarios compartidos entre los procesos
+#   - barrera: multiprocessing.Barrier para arrancar todos juntos
+#
+# Retorna:
+#   - dict: Métricas de bloqueo del proceso
+# =============================================================================
+def trabajador(indice: int, directorio: str, partidas: int, usuarios: int, barrera) -> dict:
+    """Guarda partidas y modifica buffs desde un proceso independiente."""
+    from data import diario_partidas
+    from data.repositorio_usuarios import guardar_estadisticas_usuario
+    from data.estado_buff import (
+        obtener_estado_usuario_buff,
+        actualizar_estado_usuario_buff,
+        transaccion_estado_buff,
+        volcar_estados_pendientes
+    )
+    from data.bloqueo_archivos import obtener_metricas_bloqueo
+
+    # Compactaciones frecuentes: el caso más delicado (leer diario + vaciarlo)
+    diario_partidas.TAMANO_MAXIMO_DIARIO_PARTIDAS = 2048
+    ruta_usuarios = os.path.join(directorio, "Usuarios.json")
+    ruta_buff = os.path.join(directorio, "EstadoBuff.json")
+
+    barrera.wait()
+    for j in range(partidas):
+        resultado = {
+            "puntos_totales": (indice * partidas + j) % 50,
+            "tiempo_total_segundos": 30.0,
+            "respuestas_correctas": j % 10,
+            "total_preguntas": 10,
+            "detalle": [{"pregunta_id": j, "es_correcta": True, "puntos": 1}]
+        }
+        guardar_estadisticas_usuario("jugador_" + str(j % usuarios), resultado, ruta_usuarios)
+
+        # Leer-modificar-escribir compartido por todos los procesos
+        with transaccion_estado_buff(ruta_buff):
+            contador = obtener_estado_usuario_buff("contador", ruta_buff).get("partidas", 0)
+            actualizar_estado_usuario_buff("contador", {"partidas": contador + 1}, ruta=ruta_buff)
+
+        # Escritura diferida de una clave propia: se fusiona al volcar
+        actualizar_estado_usuario_buff("proceso_" + str(indice), {"vidas_extra": j + 1}, ruta=ruta_buff)
+
+    volcar_estados_pendientes()
+    return obtener_metricas_bloqueo()
+
+
+# =============================================================================
+# VERIFICAR_RESULTADOS
+# =============================================================================
+# Descripción: Comprueba que estén todas las partidas y todos los cambios
+#
+# Parámetros:
+#   - directorio (str): Carpeta temporal compartida
+#   - procesos, partidas, usuarios (int): Parámetros de la prueba
+#
+# Retorna:
+#   - list: Mensajes de error (vacía si no se perdió nada)
+# =============================================================================
+def verificar_resultados(directorio: str, procesos: int, partidas: int, usuarios: int) -> list:
+    """Comprueba que no se haya perdido ningún resultado."""
+    from data.archivos_json import cargar_json
+    from data.repositorio_usuarios import cargar_usuarios, compactar_diario_usuarios, obtener_ranking, obtener_top_ranking
+    from data.repositorio_historial import leer_historial_usuario
+
+    ruta_usuarios = os.path.join(directorio, "Usuarios.json")
+    errores = []
+
+    esperados = {}
+    for j in range(partidas):
+        nombre = "jugador_" + str(j % usuarios)
+        esperados[nombre] = esperados.get(nombre, 0) + procesos
+
+    compactar_diario_usuarios(ruta_usuarios)
+    datos = cargar_usuarios(ruta_usuarios)
+    for nombre in esperados:
+        intentos = datos.get(nombre, {}).get("intentos", 0)
+        if intentos != esperados[nombre]:
+            errores.append(f"{nombre}: {intentos} intentos, se esperaban {esperados[nombre]}")
+        historial = leer_historial_usuario(ruta_usuarios, nombre)
+        if len(historial) != esperados[nombre]:
+            errores.append(f"{nombre}: {len(historial)} partidas en el historial, se esperaban {esperados[nombre]}")
+
+    top = obtener_top_ranking(ruta_usuarios)
+    completo = obtener_ranking(ruta_usuarios)[:len(top)]
+    if top != completo:
+        errores.append("el ranking materializado no coincide con los datos")
+
+    estado = cargar_json(os.path.join(directorio, "EstadoBuff.json"), {})
+    contador = estado.get("contador", {}).get("partidas", 0)
+    if contador != procesos * partidas:
+        errores.append(f"contador de EstadoBuff: {contador}, se esperaba {procesos * partidas}")
+    for i in range(procesos):
+        vidas = estado.get("proceso_" + str(i), {}).get("vidas_extra", 0)
+        if vidas != partidas:
+            errores.append(f"proceso_{i}: vidas_extra {vidas}, se esperaba {partidas}")
+
+    return errores
+
+
+def main() -> None:
+    """Ejecuta la prueba de estrés y muestra resultados y contención."""
+    procesos = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    partidas = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    usuarios = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    directorio = tempfile.mkdtemp(prefix="stress_usuarios_")
+    contexto = multiprocessing.get_context("spawn")
+    barrera = contexto.Manager().Barrier(procesos)
+
+    print(f"🧪 {procesos} procesos x {partidas} partidas sobre {usuarios} usuarios compartidos")
+    try:
+        inicio = time.perf_counter()
+        with contexto.Pool(procesos) as pool:
+            pendientes = []
+            for i in range(procesos):
+                pendientes.append(pool.apply_async(trabajador, (i, directorio, partidas, usuarios, barrera)))
+            metricas = []
+            for pendiente in pendientes:
+                metricas.append(pendiente.get())
+        segundos = time.perf_counter() - inicio
+
+        total = {"adquisiciones": 0, "con_espera": 0, "reintentos": 0, "segundos_espera": 0.0, "expirados": 0}
+        espera_maxima = 0.0
+        for m in metricas:
+            for clave in total:
+                total[clave] += m[clave]
+            espera_maxima = max(espera_maxima, m["espera_maxima"])
+
+        print(f"  Tiempo total:            {segundos:8.3f} s ({procesos * partidas / segundos:.1f} partidas/s)")
+        print(f"  Bloqueos tomados:        {total['adquisiciones']:8d}")
+        print(f"  Con espera:              {total['con_espera']:8d} ({total['reintentos']} reintentos)")
+        print(f"  Espera acumulada:        {total['segundos_espera'] * 1000:8.1f} ms (máxima {espera_maxima * 1000:.1f} ms)")
+        print(f"  Bloqueos expirados:      {total['expirados']:8d}")
+
+        errores = verificar_resultados(directorio, procesos, partidas, usuarios)
+        if errores:
+            print("❌ Se perdieron resultados:")
+            for error in errores:
+                print("   - " + error)
+        else:
+            print(f"✅ Las {procesos * partidas} partidas y todos los cambios de buffs están guardados")
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+    if errores:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,9 +11,22 @@
 #    - core/logica_juego.py (línea 29) - para PREGUNTAS_POR_NIVEL, MAX_ERRORES_PERMITIDOS, RUTA_PREGUNTAS, RUTA_USUARIOS
 #    - core/logica_buffeos.py (línea ~7) - para RACHA_BUFFEO_MINIMA, PUNTOS_BUFFEO_POR_RACHA, OBJETOS_ESPECIALES, RUTA_ESTADO_BUFF
 #    - core/logica_puntaje.py (línea ~4) - para PUNTOS_POR_DIFICULTAD
-#    - core/logica_minijuego.py (línea ~5) - para TAMAÑO_MATRIZ_MINIJUEGO
+#    - core/logica_minijuego.py (línea ~5) - para TAMAÑO_MATRIZ_MINIJUEGO, TAMAÑO_MINIMO_TABLERO_NUMPY
+#    - core/pool_tableros.py - para TAMAÑO_MATRIZ_MINIJUEGO, DIFICULTAD_MINIMA_MINIJUEGO,
+#      DIFICULTAD_MAXIMA_MINIJUEGO, CAPACIDAD_POOL_TABLEROS, PROCESOS_POOL_TABLEROS, INTENTOS_TABLERO_EN_BANDA,
+#      ESPERA_REINTENTO_POOL_TABLEROS
 #    - data/repositorio_usuarios.py (línea ~6) - para RUTA_USUARIOS
 #    - data/repositorio_preguntas.py (línea ~6) - para RUTA_PREGUNTAS
+#    - data/estado_buff.py - para RUTA_ESTADO_BUFF, RETARDO_ESCRITURA_ESTADO_BUFF
+#    - data/diario_partidas.py - para TAMANO_MAXIMO_DIARIO_PARTIDAS
+#    - data/repositorio_usuarios.py, data/estado_buff.py - para BACKEND_USUARIOS, RUTA_BASE_DATOS_USUARIOS
+#    - data/repositorio_eventos.py - para RUTA_EVENTOS_PARTIDAS
+#    - data/repositorio_usuarios.py, ui/Pygame/Estados/Rankings.py - para TAMANO_RANKING
+#    - data/bloqueo_archivos.py - para TIEMPO_MAXIMO_ESPERA_BLOQUEO, ESPERA_INICIAL_BLOQUEO, ESPERA_MAXIMA_BLOQUEO
+#    - data/shards_usuarios.py - para CANTIDAD_SHARDS_USUARIOS, TAMANO_MINIMO_RANKING_PARALELO
+#    - models/filtro_vistas.py - para FILTRO_VISTAS_CAPACIDAD, FILTRO_VISTAS_TASA_FALSOS
+#    - data/indice_preguntas.py, data/indice_ponderado.py, core/logica_juego.py - para INTENTOS_PREGUNTA_NO_VISTA
+#    - core/logica_juego.py - para PONDERAR_CATEGORIAS_POR_VISTAS, PESOS_CATEGORIA
 #    - ui/Pygame/Estados/Gameplay.py (línea 9, 23) - para ALTO, ANCHO, PREGUNTAS_POR_NIVEL, MAX_ERRORES_PERMITIDOS, RUTA_PREGUNTAS
 #    - ui/Pygame/main.py - para ANCHO, ALTO, FPS
 #    - ui/Pygame/Juego.py - para FPS, ANCHO, ALTO
@@ -42,6 +55,29 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 RUTA_USUARIOS = os.path.join(BASE_DIR, "assets", "Usuarios.json")
 RUTA_PREGUNTAS = os.path.join(BASE_DIR, "assets", "preguntas.csv")
 RUTA_ESTADO_BUFF = os.path.join(BASE_DIR, "assets", "EstadoBuff.json")
+RUTA_BASE_DATOS_USUARIOS = os.path.join(BASE_DIR, "assets", "Usuarios.db")
+RUTA_EVENTOS_PARTIDAS = os.path.join(BASE_DIR, "assets", "EventosPartidas.jsonl")  # Registro de eventos (una partida por línea)
+
+# Backend de persistencia de usuarios: "json" (Usuarios.json + EstadoBuff.json),
+# "sqlite" (RUTA_BASE_DATOS_USUARIOS, pensado para miles de perfiles) o
+# "shards" (Usuarios_shards/: usuarios repartidos por hash del nombre)
+BACKEND_USUARIOS = "json"
+CANTIDAD_SHARDS_USUARIOS = 16  # Archivos de usuarios con el backend "shards"
+TAMANO_MINIMO_RANKING_PARALELO = 4 * 1024 * 1024  # Bytes de shards para calcular el ranking en varios procesos
+
+# =============================================================================
+# CONFIGURACIÓN DE PERSISTENCIA
+# =============================================================================
+# Descripción: Parámetros de escritura diferida de los archivos de estado
+# Uso en Pygame: Evita escribir a disco en medio de un frame
+# =============================================================================
+
+RETARDO_ESCRITURA_ESTADO_BUFF = 0.5  # Segundos de espera antes de volcar EstadoBuff.json
+TAMANO_MAXIMO_DIARIO_PARTIDAS = 256 * 1024  # Bytes del diario antes de compactarlo en Usuarios.json
+TAMANO_RANKING = 10  # Jugadores guardados en el ranking materializado (top-K)
+TIEMPO_MAXIMO_ESPERA_BLOQUEO = 10.0  # Segundos esperando el bloqueo de un archivo compartido (después: BloqueoNoDisponibleError)
+ESPERA_INICIAL_BLOQUEO = 0.001  # Primera pausa entre reintentos (se duplica hasta el máximo)
+ESPERA_MAXIMA_BLOQUEO = 0.05  # Pausa máxima entre reintentos de bloqueo
 
 # =============================================================================
 # CONFIGURACIÓN DE NIVELES
@@ -129,6 +165,22 @@ OBJETOS_ESPECIALES = {
 
 TAMAÑO_MATRIZ_MINIJUEGO = 5
 
+# Desde este tamaño el tablero se genera con numpy (si está instalado); en
+# tableros chicos la versión de listas es más rápida
+TAMAÑO_MINIMO_TABLERO_NUMPY = 16
+
+# Banda de dificultad aceptada (core/solucionador_minijuego.calcular_dificultad_tablero:
+# proporción de celdas alcanzables sin salida). Con 5x5 ~20% de los
+# tableros tiene 0 (cualquier movimiento gana): la banda los descarta
+DIFICULTAD_MINIMA_MINIJUEGO = 0.1
+DIFICULTAD_MAXIMA_MINIJUEGO = 0.6
+
+# Pool de tableros pre-generados en segundo plano (core/pool_tableros)
+CAPACIDAD_POOL_TABLEROS = 4
+PROCESOS_POOL_TABLEROS = 0         # 0 = un hilo; > 0 = lotes en procesos
+INTENTOS_TABLERO_EN_BANDA = 50     # después se usa el más cercano a la banda (marcado "en_banda": False)
+ESPERA_REINTENTO_POOL_TABLEROS = 1.0  # segundos antes de reintentar si falla la generación
+
 # =============================================================================
 # CONFIGURACIÓN DE RECOMPENSAS
 # =============================================================================
@@ -176,4 +228,30 @@ BLANCO = (255, 255, 255) # Colores como tuplas [7]
 # =============================================================================
 
 PUNTOS_POR_VIDA_EXTRA = 30  # Cada 30 puntos = 1 vida extra
-MAX_VIDAS_EXTRA = 4  # Máximo de vidas extra acumulables (total: 2 base + 4 extra = 6)
\ No newline at end of file
+MAX_VIDAS_EXTRA = 4  # Máximo de vidas extra acumulables (total: 2 base + 4 extra = 6)
+
+# =============================================================================
+# PREGUNTAS VISTAS ENTRE PARTIDAS
+# =============================================================================
+# Descripción: Filtro por jugador (models/filtro_vistas) para no repetir
+#              preguntas vistas en partidas recientes
+# =============================================================================
+
+FILTRO_VISTAS_CAPACIDAD = 200  # Preguntas por generación del filtro (recuerda entre 200 y 400)
+FILTRO_VISTAS_TASA_FALSOS = 0.01  # Falsos positivos con una generación llena
+INTENTOS_PREGUNTA_NO_VISTA = 8  # Sorteos buscando una no vista antes de aceptar una vista
+
+# =============================================================================
+# SELECCIÓN PONDERADA DE PREGUNTAS
+# =============================================================================
+# Descripción: Peso de cada categoría al elegir preguntas (data/indice_ponderado).
+#              Con PONDERAR_CATEGORIAS_POR_VISTAS cada categoría pesa
+#              1 / (1 + preguntas suyas en el filtro de vistas del jugador):
+#              se favorecen las categorías que vio menos. PESOS_CATEGORIA
+#              multiplica ese peso (una categoría que no figura pesa 1; con
+#              peso 0 no sale nunca). Si todas pesan 1 se usa la selección
+#              uniforme de data/indice_preguntas
+# =============================================================================
+
+PONDERAR_CATEGORIAS_POR_VISTAS = True  # Favorecer las categorías menos vistas por el jugador
+PESOS_CATEGORIA = {}  # Pesos fijos extra, ej: {"nordica": 3, "griega": 1}
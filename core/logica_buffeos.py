@@ -7,26 +7,33 @@
 #    Gestiona persistencia de objetos equipados sin dependencias de UI.
 #
 # 📥 IMPORTADO EN:
-#    - core/logica_juego.py (líneas 20-26) - para calcular_puntos_buffeo, puede_usar_reintento, usar_raciones, usar_bolsa_monedas, verificar_merecimiento_objeto, verificar_objeto_equipado
-#    - core/logica_preguntas.py (línea 9) - para verificar_objeto_equipado, usar_armadura
-#    - ui/Pygame/Estados/Gameplay.py (línea 22) - para verificar_objeto_equipado, verificar_merecimiento_objeto
+#    - core/logica_juego.py (líneas 20-26) - para calcular_puntos_buffeo, puede_usar_reintento, usar_raciones, usar_bolsa_monedas, verificar_merecimiento_objeto, obtener_objeto_actual
+#    - core/logica_preguntas.py (línea 9) - para obtener_objeto_actual, usar_armadura
+#    - ui/Pygame/Estados/Gameplay.py (línea 22) - para verificar_merecimiento_objeto, calcular_vidas_ganadas
 #    - ui/Pygame/Estados/SeleccionObjeto.py - para obtener_opciones_objetos, guardar_objeto_equipado
 #
 # 🔗 DEPENDENCIAS:
-#    - data/archivos_json: para cargar_json, guardar_json
-#    - config.constantes: para RUTA_ESTADO_BUFF, PUNTOS_BUFFEO_POR_RACHA, OBJETOS_ESPECIALES, RESPUESTAS_CORRECTAS_PARA_OBJETO, TOTAL_PREGUNTAS_PARA_OBJETO
+#    - data/estado_buff: para consultar y modificar el estado de buffs en memoria
+#    - core/sesion_juego: objeto de la partida en curso (sin leer el almacén)
+#    - config.constantes: para PUNTOS_BUFFEO_POR_RACHA, OBJETOS_ESPECIALES, RESPUESTAS_CORRECTAS_PARA_OBJETO, TOTAL_PREGUNTAS_PARA_OBJETO
 #
 # 💡 NOTAS PARA LA DEFENSA:
 #    - Sistema complejo de gameplay sin mezclar con UI
 #    - Objetos consumibles (armadura, raciones, bolsa) vs permanentes (espada)
 #    - Persistencia de estado en JSON separado de estadísticas
+#    - El estado se lee desde memoria; las escrituras a disco son diferidas
+#    - Sumar/consumir vidas y consumir objetos van en transaccion_estado_buff:
+#      otro proceso del juego no puede intercalar su escritura
+#    - Con una sesión de juego (core/sesion_juego) los objetos se consultan
+#      y consumen en memoria; se confirman al terminar la partida
 #    - Lógica de rachas y buffeos configurable desde constantes
 #    - UN SOLO return por función en todas las funciones
 # =============================================================================
 
-from data.archivos_json import cargar_json, guardar_json
+from data.estado_buff import obtener_estado_usuario_buff, actualizar_estado_usuario_buff, transaccion_estado_buff
+from data.bloqueo_archivos import BloqueoNoDisponibleError
+from core.sesion_juego import obtener_objeto_sesion, consumir_objeto_sesion
 from config.constantes import (
-    RUTA_ESTADO_BUFF, 
     PUNTOS_BUFFEO_POR_RACHA,
     OBJETOS_ESPECIALES,
     RESPUESTAS_CORRECTAS_PARA_OBJETO,
@@ -156,33 +163,12 @@ def obtener_datos_reintento(racha: int, objeto: str) -> dict:
 # =============================================================================
 def verificar_objeto_equipado(nombre_usuario: str, estado_path: str = None) -> str:
     """Verifica qué objeto especial tiene equipado un usuario."""
-    if estado_path is None:
-        estado_path = RUTA_ESTADO_BUFF
-    
     resultado = None
     
-    try:
-        estado = cargar_json(estado_path, {})
-        
-        # Verificar si el usuario existe en el estado
-        usuario_existe = False
-        for usuario in estado:
-            if usuario == nombre_usuario:
-                usuario_existe = True
-                break
-        
-        if usuario_existe:
-            # Verificar si tiene objeto_excepcional
-            objeto_excepcional_existe = False
-            for clave in estado[nombre_usuario]:
-                if clave == "objeto_excepcional":
-                    objeto_excepcional_existe = True
-                    break
-            
-            if objeto_excepcional_existe:
-                resultado = estado[nombre_usuario]["objeto_excepcional"]
-    except:
-        pass
+    # Se consulta el estado en memoria, sin leer el archivo en cada llamada
+    estado_usuario = obtener_estado_usuario_buff(nombre_usuario, estado_path)
+    if "objeto_excepcional" in estado_usuario:
+        resultado = estado_usuario["objeto_excepcional"]
     
     return resultado
 
@@ -207,22 +193,7 @@ def verificar_objeto_equipado(nombre_usuario: str, estado_path: str = None) -> s
 # =============================================================================
 def guardar_objeto_equipado(nombre_usuario: str, objeto: str, estado_path: str = None) -> None:
     """Guarda el objeto especial equipado para un usuario."""
-    if estado_path is None:
-        estado_path = RUTA_ESTADO_BUFF
-    
-    estado = cargar_json(estado_path, {})
-
-    existe = False
-    for usuario in estado:
-        if usuario == nombre_usuario:
-            existe = True
-            break
-
-    if not existe:
-        estado[nombre_usuario] = {}
-
-    estado[nombre_usuario]["objeto_excepcional"] = objeto
-    guardar_json(estado_path, estado)
+    actualizar_estado_usuario_buff(nombre_usuario, {"objeto_excepcional": objeto}, ruta=estado_path)
     return None
 
 
@@ -238,47 +209,61 @@ def guardar_objeto_equipado(nombre_usuario: str, objeto: str, estado_path: str =
 #   - estado_path (str): Ruta al archivo de estado
 #
 # Retorna:
-#   - bool: True si se eliminó correctamente
+#   - bool: True si se eliminó correctamente (False también si no se
+#           obtuvo el bloqueo del estado de buffs a tiempo)
 #
 # Ejemplo de uso:
 #   eliminado = eliminar_objeto_equipado("Juan", ruta_estado)
 # =============================================================================
 def eliminar_objeto_equipado(nombre_usuario: str, estado_path: str = None) -> bool:
     """Elimina el objeto equipado de un usuario."""
-    if estado_path is None:
-        estado_path = RUTA_ESTADO_BUFF
+    eliminado = False
     
     try:
-        estado = cargar_json(estado_path, {})
-        
-        # Verificar si el usuario existe en el estado
-        usuario_existe = False
-        for usuario in estado:
-            if usuario == nombre_usuario:
-                usuario_existe = True
-                break
-        
-        if usuario_existe:
-            # Verificar si tiene objeto_excepcional
-            objeto_excepcional_existe = False
-            for clave in estado[nombre_usuario]:
-                if clave == "objeto_excepcional":
-                    objeto_excepcional_existe = True
-                    break
-            
-            if objeto_excepcional_existe:
-                # Crear nuevo diccionario sin objeto_excepcional
-                nuevo_usuario_estado = {}
-                for clave in estado[nombre_usuario]:
-                    if clave != "objeto_excepcional":
-                        nuevo_usuario_estado[clave] = estado[nombre_usuario][clave]
-                estado[nombre_usuario] = nuevo_usuario_estado
-                guardar_json(estado_path, estado)
-                return True
-    except:
-        pass
+        with transaccion_estado_buff(estado_path):
+            estado_usuario = obtener_estado_usuario_buff(nombre_usuario, estado_path)
+            if "objeto_excepcional" in estado_usuario:
+                actualizar_estado_usuario_buff(nombre_usuario, {}, ["objeto_excepcional"], estado_path)
+                eliminado = True
+    except BloqueoNoDisponibleError as e:
+        print(f"❌ No se pudo quitar el objeto de {nombre_usuario}: {e}")
     
-    return False
+    return eliminado
+
+
+# =============================================================================
+# OBTENER_OBJETO_ACTUAL
+# =============================================================================
+# Descripción: Objeto del usuario, desde la sesión de juego si hay una
+# 
+# Uso en Pygame: Lo usan las funciones de objetos durante una respuesta
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - sesion (dict): Sesión de juego (opcional, ver core/sesion_juego)
+#
+# Retorna:
+#   - str: Tipo de objeto o None
+#
+# Ejemplo de uso:
+#   objeto = obtener_objeto_actual("Juan", sesion)
+# =============================================================================
+def obtener_objeto_actual(nombre_usuario: str, sesion: dict = None) -> str:
+    """Retorna el objeto del usuario desde la sesión o desde el almacén."""
+    if sesion is not None:
+        objeto = obtener_objeto_sesion(sesion)
+    else:
+        objeto = verificar_objeto_equipado(nombre_usuario)
+    return objeto
+
+
+def retirar_objeto_actual(nombre_usuario: str, sesion: dict = None) -> bool:
+    """Consume el objeto en la sesión (si hay) o lo elimina del almacén."""
+    if sesion is not None:
+        eliminado = consumir_objeto_sesion(sesion)
+    else:
+        eliminado = eliminar_objeto_equipado(nombre_usuario)
+    return eliminado
 
 
 # =============================================================================
@@ -291,6 +276,7 @@ def eliminar_objeto_equipado(nombre_usuario: str, estado_path: str = None) -> bo
 # Parámetros:
 #   - nombre_usuario (str): Nombre del usuario
 #   - es_correcta (bool): Si la respuesta fue correcta
+#   - sesion (dict): Sesión de juego (opcional, consume en memoria)
 #
 # Retorna:
 #   - dict: {"protegido": bool, "objeto_usado": bool}
@@ -298,7 +284,7 @@ def eliminar_objeto_equipado(nombre_usuario: str, estado_path: str = None) -> bo
 # Ejemplo de uso:
 #   resultado = usar_armadura("Juan", False)
 # =============================================================================
-def usar_armadura(nombre_usuario: str, es_correcta: bool) -> dict:
+def usar_armadura(nombre_usuario: str, es_correcta: bool, sesion: dict = None) -> dict:
     """Usa la armadura si está disponible y es necesario."""
     resultado = {
         "protegido": False,
@@ -306,9 +292,9 @@ def usar_armadura(nombre_usuario: str, es_correcta: bool) -> dict:
     }
     
     if not es_correcta:
-        objeto = verificar_objeto_equipado(nombre_usuario)
+        objeto = obtener_objeto_actual(nombre_usuario, sesion)
         if objeto == "armadura":
-            eliminado = eliminar_objeto_equipado(nombre_usuario)
+            eliminado = retirar_objeto_actual(nombre_usuario, sesion)
             resultado["protegido"] = True
             resultado["objeto_usado"] = eliminado
     
@@ -325,6 +311,7 @@ def usar_armadura(nombre_usuario: str, es_correcta: bool) -> dict:
 # Parámetros:
 #   - nombre_usuario (str): Nombre del usuario
 #   - es_correcta (bool): Si la respuesta fue correcta
+#   - sesion (dict): Sesión de juego (opcional, consume en memoria)
 #
 # Retorna:
 #   - dict: {"puntos_recuperados": int, "objeto_usado": bool}
@@ -332,7 +319,7 @@ def usar_armadura(nombre_usuario: str, es_correcta: bool) -> dict:
 # Ejemplo de uso:
 #   resultado = usar_raciones("Juan", False)
 # =============================================================================
-def usar_raciones(nombre_usuario: str, es_correcta: bool) -> dict:
+def usar_raciones(nombre_usuario: str, es_correcta: bool, sesion: dict = None) -> dict:
     """Usa las raciones si están disponibles y la respuesta es incorrecta."""
     resultado = {
         "puntos_recuperados": 0,
@@ -340,10 +327,10 @@ def usar_raciones(nombre_usuario: str, es_correcta: bool) -> dict:
     }
     
     if not es_correcta:
-        objeto = verificar_objeto_equipado(nombre_usuario)
+        objeto = obtener_objeto_actual(nombre_usuario, sesion)
         if objeto == "raciones":
             puntos = OBJETOS_ESPECIALES["raciones"]["recuperacion_vida"]
-            eliminado = eliminar_objeto_equipado(nombre_usuario)
+            eliminado = retirar_objeto_actual(nombre_usuario, sesion)
             resultado["puntos_recuperados"] = puntos
             resultado["objeto_usado"] = eliminado
     
@@ -361,6 +348,7 @@ def usar_raciones(nombre_usuario: str, es_correcta: bool) -> dict:
 #   - nombre_usuario (str): Nombre del usuario
 #   - es_correcta (bool): Si la respuesta fue correcta
 #   - puntos_base (int): Puntos base obtenidos
+#   - sesion (dict): Sesión de juego (opcional, consume en memoria)
 #
 # Retorna:
 #   - dict: {"puntos_extra": int, "objeto_usado": bool}
@@ -368,7 +356,7 @@ def usar_raciones(nombre_usuario: str, es_correcta: bool) -> dict:
 # Ejemplo de uso:
 #   resultado = usar_bolsa_monedas("Juan", True, 3)
 # =============================================================================
-def usar_bolsa_monedas(nombre_usuario: str, es_correcta: bool, puntos_base: int) -> dict:
+def usar_bolsa_monedas(nombre_usuario: str, es_correcta: bool, puntos_base: int, sesion: dict = None) -> dict:
     """Usa la bolsa de monedas si está disponible y la respuesta es correcta."""
     resultado = {
         "puntos_extra": 0,
@@ -376,9 +364,9 @@ def usar_bolsa_monedas(nombre_usuario: str, es_correcta: bool, puntos_base: int)
     }
     
     if es_correcta:
-        objeto = verificar_objeto_equipado(nombre_usuario)
+        objeto = obtener_objeto_actual(nombre_usuario, sesion)
         if objeto == "bolsa_monedas":
-            eliminado = eliminar_objeto_equipado(nombre_usuario)
+            eliminado = retirar_objeto_actual(nombre_usuario, sesion)
             resultado["puntos_extra"] = puntos_base
             resultado["objeto_usado"] = eliminado
     
@@ -412,10 +400,12 @@ def verificar_merecimiento_objeto(nombre_usuario: str, respuestas_correctas: int
         return False
     
     # Verifica si cumple los requisitos
-    if respuestas_correctas >= RESPUESTAS_CORRECTAS_PARA_OBJETO and total_preguntas == TOTAL_PREGUNTAS_PARA_OBJETO:
-        return True
-    
-    return False
+    return cumple_requisitos_objeto(respuestas_correctas, total_preguntas)
+
+
+def cumple_requisitos_objeto(respuestas_correctas: int, total_preguntas: int) -> bool:
+    """Verifica solo los requisitos de aciertos (sin consultar el almacén)."""
+    return respuestas_correctas >= RESPUESTAS_CORRECTAS_PARA_OBJETO and total_preguntas == TOTAL_PREGUNTAS_PARA_OBJETO
 
 
 # =============================================================================
@@ -503,18 +493,19 @@ def guardar_vidas_extra_usuario(nombre_usuario: str, vidas_ganadas: int):
     from data.repositorio_usuarios import obtener_vidas_extra, guardar_vidas_extra
     from config.constantes import MAX_VIDAS_EXTRA, RUTA_ESTADO_BUFF
     
-    # Obtener vidas actuales
-    vidas_actuales = obtener_vidas_extra(nombre_usuario, RUTA_ESTADO_BUFF)
-    
-    # Sumar las nuevas vidas
-    vidas_totales = vidas_actuales + vidas_ganadas
-    
-    # Aplicar límite máximo
-    if vidas_totales > MAX_VIDAS_EXTRA:
-        vidas_totales = MAX_VIDAS_EXTRA
-    
-    # Guardar
-    guardar_vidas_extra(nombre_usuario, vidas_totales, RUTA_ESTADO_BUFF)
+    with transaccion_estado_buff(RUTA_ESTADO_BUFF):
+        # Obtener vidas actuales
+        vidas_actuales = obtener_vidas_extra(nombre_usuario, RUTA_ESTADO_BUFF)
+        
+        # Sumar las nuevas vidas
+        vidas_totales = vidas_actuales + vidas_ganadas
+        
+        # Aplicar límite máximo
+        if vidas_totales > MAX_VIDAS_EXTRA:
+            vidas_totales = MAX_VIDAS_EXTRA
+        
+        # Guardar
+        guardar_vidas_extra(nombre_usuario, vidas_totales, RUTA_ESTADO_BUFF)
     
     print(f"💚 {nombre_usuario}: Vidas ganadas +{vidas_ganadas} | Total acumulado: {vidas_totales}/{MAX_VIDAS_EXTRA}")
 
@@ -530,16 +521,17 @@ def consumir_vidas_extra_usuario(nombre_usuario: str, vidas_usadas: int):
     from data.repositorio_usuarios import obtener_vidas_extra, guardar_vidas_extra
     from config.constantes import RUTA_ESTADO_BUFF
     
-    # Obtener vidas actuales
-    vidas_actuales = obtener_vidas_extra(nombre_usuario, RUTA_ESTADO_BUFF)
-    
-    # Restar las usadas
-    vidas_restantes = vidas_actuales - vidas_usadas
-    if vidas_restantes < 0:
-        vidas_restantes = 0
-    
-    # Guardar
-    guardar_vidas_extra(nombre_usuario, vidas_restantes, RUTA_ESTADO_BUFF)
+    with transaccion_estado_buff(RUTA_ESTADO_BUFF):
+        # Obtener vidas actuales
+        vidas_actuales = obtener_vidas_extra(nombre_usuario, RUTA_ESTADO_BUFF)
+        
+        # Restar las usadas
+        vidas_restantes = vidas_actuales - vidas_usadas
+        if vidas_restantes < 0:
+            vidas_restantes = 0
+        
+        # Guardar
+        guardar_vidas_extra(nombre_usuario, vidas_restantes, RUTA_ESTADO_BUFF)
     
     print(f"💔 {nombre_usuario}: Vidas usadas -{vidas_usadas} | Restantes: {vidas_restantes}")
 
@@ -571,10 +563,11 @@ def consumir_objeto_equipado(nombre_usuario: str):
     from data.repositorio_usuarios import guardar_objeto_equipado, obtener_vidas_extra
     from config.constantes import RUTA_ESTADO_BUFF
     
-    # Obtener vidas actuales para no perderlas
-    vidas_actuales = obtener_vidas_extra(nombre_usuario, RUTA_ESTADO_BUFF)
-    
-    # Guardar None como objeto (eliminarlo), manteniendo las vidas
-    guardar_objeto_equipado(nombre_usuario, None, vidas_actuales, RUTA_ESTADO_BUFF)
+    with transaccion_estado_buff(RUTA_ESTADO_BUFF):
+        # Obtener vidas actuales para no perderlas
+        vidas_actuales = obtener_vidas_extra(nombre_usuario, RUTA_ESTADO_BUFF)
+        
+        # Guardar None como objeto (eliminarlo), manteniendo las vidas
+        guardar_objeto_equipado(nombre_usuario, None, vidas_actuales, RUTA_ESTADO_BUFF)
     
     print(f"⚔️ Objeto consumido para {nombre_usuario}")
\ No newline at end of file
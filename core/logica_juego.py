@@ -9,14 +9,21 @@
 # 📥 IMPORTADO EN:
 #    - ui/consola/juego_consola.py - para ejecutar juego en modo consola
 #    - ui/Pygame/Estados/Gameplay.py (líneas 14-19) - para ejecutar juego en modo gráfico
+#    - core/reproduccion_partidas.py - para reproducir partidas registradas
 #
 # 🔗 DEPENDENCIAS:
 #    - data/repositorio_preguntas: para cargar_preguntas_desde_csv, filtrar_preguntas_por_nivel, seleccionar_pregunta_aleatoria
+#    - data/indice_preguntas: para seleccionar_pregunta_indice, preparar_indice_partida
+#    - data/indice_ponderado: para seleccionar_pregunta_ponderada, es_indice_ponderado, preparar_indice_ponderado,
+#      contar_vistas_por_categoria, calcular_pesos_por_vistas
 #    - data/repositorio_usuarios: para guardar_estadisticas_usuario
 #    - core/logica_preguntas: para evaluar_respuesta, construir_resultado_respuesta, calcular_racha_actual, determinar_intentos_maximos, contar_errores_totales
-#    - core/logica_buffeos: para calcular_puntos_buffeo, puede_usar_reintento, usar_raciones, usar_bolsa_monedas, verificar_merecimiento_objeto, verificar_objeto_equipado
+#    - core/logica_buffeos: para calcular_puntos_buffeo, puede_usar_reintento, usar_raciones, usar_bolsa_monedas, verificar_merecimiento_objeto, obtener_objeto_actual
 #    - core/logica_puntaje: para calcular_puntos_base
-#    - config.constantes: para PREGUNTAS_POR_NIVEL, MAX_ERRORES_PERMITIDOS, RUTA_PREGUNTAS, RUTA_USUARIOS
+#    - models/registro_respuestas: para es_registro_respuestas
+#    - models/filtro_vistas: para fue_vista (camino sin índice)
+#    - config.constantes: para PREGUNTAS_POR_NIVEL, MAX_ERRORES_PERMITIDOS, RUTA_PREGUNTAS, RUTA_USUARIOS,
+#      PONDERAR_CATEGORIAS_POR_VISTAS, PESOS_CATEGORIA
 #
 # 💡 NOTAS PARA LA DEFENSA:
 #    - Patrón Facade: simplifica interacción con múltiples subsistemas
@@ -31,6 +38,14 @@ from data.repositorio_preguntas import (
     filtrar_preguntas_por_nivel,
     seleccionar_pregunta_aleatoria
 )
+from data.indice_preguntas import seleccionar_pregunta_indice, preparar_indice_partida
+from data.indice_ponderado import (
+    seleccionar_pregunta_ponderada,
+    es_indice_ponderado,
+    preparar_indice_ponderado,
+    contar_vistas_por_categoria,
+    calcular_pesos_por_vistas
+)
 from data.repositorio_usuarios import guardar_estadisticas_usuario
 from core.logica_preguntas import (
     evaluar_respuesta,
@@ -45,14 +60,18 @@ from core.logica_buffeos import (
     usar_raciones,
     usar_bolsa_monedas,
     verificar_merecimiento_objeto,
-    verificar_objeto_equipado
+    obtener_objeto_actual
 )
 from core.logica_puntaje import calcular_puntos_base
+from models.registro_respuestas import es_registro_respuestas
+from models.filtro_vistas import fue_vista
 from config.constantes import (
     PREGUNTAS_POR_NIVEL,
     MAX_ERRORES_PERMITIDOS,
     RUTA_PREGUNTAS,
-    RUTA_USUARIOS
+    RUTA_USUARIOS,
+    PONDERAR_CATEGORIAS_POR_VISTAS,
+    PESOS_CATEGORIA
 )
 
 # =============================================================================
@@ -69,6 +88,8 @@ from config.constantes import (
 #   - respuesta_usuario (str): Respuesta del usuario
 #   - numero_intento (int): Número de intento actual
 #   - max_intentos (int): Máximo de intentos permitidos
+#   - sesion (dict): Sesión de juego (opcional): el objeto se consulta y se
+#                    consume en memoria, sin acceso al almacén de buffs
 #
 # Retorna:
 #   - dict: Resultado de procesar la respuesta
@@ -76,14 +97,15 @@ from config.constantes import (
 # Ejemplo de uso:
 #   resultado = procesar_pregunta_completa(pregunta, "Juan", 3, "A", 1, 2)
 # =============================================================================
-def procesar_pregunta_completa(pregunta: dict, nombre_usuario: str, racha_actual: int,respuesta_usuario: str, numero_intento: int, max_intentos: int) -> dict:
+def procesar_pregunta_completa(pregunta: dict, nombre_usuario: str, racha_actual: int,respuesta_usuario: str, numero_intento: int, max_intentos: int, sesion: dict = None) -> dict:
     """Procesa una pregunta completa con lógica de intentos."""
     # Evaluar respuesta
     evaluacion = evaluar_respuesta(
         respuesta_usuario,
         pregunta["opciones"],
         pregunta["correcta"],
-        nombre_usuario
+        nombre_usuario,
+        sesion
     )
     
     if not evaluacion["valida"]:
@@ -95,7 +117,7 @@ def procesar_pregunta_completa(pregunta: dict, nombre_usuario: str, racha_actual
     # Calcular buffeo si es correcta
     puntos_buffeo = 0
     if evaluacion["es_correcta"]:
-        objeto = verificar_objeto_equipado(nombre_usuario)
+        objeto = obtener_objeto_actual(nombre_usuario, sesion)
         buffeo_data = calcular_puntos_buffeo(racha_actual, objeto)
         puntos_buffeo = buffeo_data["puntos"]
     
@@ -104,10 +126,10 @@ def procesar_pregunta_completa(pregunta: dict, nombre_usuario: str, racha_actual
     puntos_bolsa = 0
     
     if not evaluacion["es_correcta"]:
-        resultado_raciones = usar_raciones(nombre_usuario, evaluacion["es_correcta"])
+        resultado_raciones = usar_raciones(nombre_usuario, evaluacion["es_correcta"], sesion)
         puntos_raciones = resultado_raciones["puntos_recuperados"]
     else:
-        resultado_bolsa = usar_bolsa_monedas(nombre_usuario, evaluacion["es_correcta"], abs(puntos_base))
+        resultado_bolsa = usar_bolsa_monedas(nombre_usuario, evaluacion["es_correcta"], abs(puntos_base), sesion)
         puntos_bolsa = resultado_bolsa["puntos_extra"]
     
     # Construir puntos totales
@@ -120,7 +142,7 @@ def procesar_pregunta_completa(pregunta: dict, nombre_usuario: str, racha_actual
     }
     
     # Verificar si debe mostrar la respuesta correcta
-    puede_reintentar = puede_usar_reintento(racha_actual, verificar_objeto_equipado(nombre_usuario))
+    puede_reintentar = puede_usar_reintento(racha_actual, obtener_objeto_actual(nombre_usuario, sesion))
     es_ultimo_intento = (numero_intento >= max_intentos - 1) and not puede_reintentar
     mostrar_correcta = es_ultimo_intento and not evaluacion["es_correcta"]
     
@@ -177,6 +199,76 @@ def procesar_nivel_completo(nivel: int, preguntas: dict, preguntas_usadas: list,
     return resultado_nivel
 
 
+# =============================================================================
+# PREPARAR_INDICE_JUEGO
+# =============================================================================
+# Descripción: Prepara el índice de preguntas de una partida: ponderado por
+#              categoría (calcular_pesos_categoria_juego) si alguna pesa
+#              distinto de 1, uniforme si no
+#
+# Uso en Pygame: Se llama en startup junto con cargar_preguntas_desde_csv
+#
+# Parámetros:
+#   - preguntas (dict): Banco de preguntas indexado por ID
+#   - indice_anterior (dict): Índice de la partida anterior del mismo
+#                             consumidor (opcional, se restaura si sirve)
+#   - vistas (dict): Filtro de vistas del jugador al empezar la partida
+#                    (opcional). La reproducción usa el guardado en el
+#                    registro, así arma el mismo índice
+#
+# Retorna:
+#   - dict: Índice listo para obtener_pregunta_para_nivel
+#
+# Ejemplo de uso:
+#   indice = preparar_indice_juego(preguntas, indice, sesion["vistas"])
+# =============================================================================
+def preparar_indice_juego(preguntas: dict, indice_anterior: dict = None, vistas: dict = None) -> dict:
+    """Prepara el índice uniforme o ponderado según los pesos de categoría."""
+    pesos_categoria = calcular_pesos_categoria_juego(preguntas, vistas)
+    if pesos_categoria:
+        indice = preparar_indice_ponderado(preguntas, None, pesos_categoria, indice_anterior)
+    else:
+        if es_indice_ponderado(indice_anterior):
+            indice_anterior = None
+        indice = preparar_indice_partida(preguntas, indice_anterior)
+    return indice
+
+
+# =============================================================================
+# CALCULAR_PESOS_CATEGORIA_JUEGO
+# =============================================================================
+# Descripción: Combina los pesos por vistas del jugador (si
+#              PONDERAR_CATEGORIAS_POR_VISTAS) con los fijos de PESOS_CATEGORIA
+#
+# Uso en Pygame: Desde preparar_indice_juego al empezar la partida
+#
+# Parámetros:
+#   - preguntas (dict): Banco de preguntas indexado por ID
+#   - vistas (dict): Filtro de vistas del jugador (opcional)
+#
+# Retorna:
+#   - dict: {categoria: peso}, o {} si todas las categorías pesan 1
+#
+# Ejemplo de uso:
+#   pesos = calcular_pesos_categoria_juego(preguntas, sesion["vistas"])
+# =============================================================================
+def calcular_pesos_categoria_juego(preguntas: dict, vistas: dict = None) -> dict:
+    """Combina los pesos por vistas con PESOS_CATEGORIA; {} si todas pesan 1."""
+    pesos = {}
+    if PONDERAR_CATEGORIAS_POR_VISTAS and vistas is not None:
+        pesos = calcular_pesos_por_vistas(contar_vistas_por_categoria(preguntas, vistas))
+    for categoria, peso in PESOS_CATEGORIA.items():
+        pesos[categoria] = pesos.get(categoria, 1.0) * peso
+
+    todas_uno = True
+    for peso in pesos.values():
+        if peso != 1.0:
+            todas_uno = False
+    if todas_uno:
+        pesos = {}
+    return pesos
+
+
 # =============================================================================
 # OBTENER_PREGUNTA_PARA_NIVEL
 # =============================================================================
@@ -188,21 +280,49 @@ def procesar_nivel_completo(nivel: int, preguntas: dict, preguntas_usadas: list,
 #   - preguntas (dict): Todas las preguntas
 #   - nivel (int): Nivel actual
 #   - preguntas_usadas (list): IDs ya usados
+#   - indice (dict): Índice de data/indice_preguntas (opcional). Si se pasa,
+#                    la selección es O(1) y la pregunta se retira del índice;
+#                    preguntas_usadas ya no se recorre. Acepta también un
+#                    índice de data/indice_ponderado (selección con pesos)
+#   - rng (random.Random): Generador con semilla (opcional): con la misma
+#                          semilla salen las mismas preguntas y opciones
+#   - vistas (dict): Filtro de preguntas vistas en partidas anteriores
+#                    (models/filtro_vistas, opcional). Se prefieren las no
+#                    vistas; si el nivel no tiene, se usa una vista
 #
 # Retorna:
 #   - dict: Pregunta seleccionada o None si no hay disponibles
 #
 # Ejemplo de uso:
 #   pregunta = obtener_pregunta_para_nivel(preguntas, 1, [])
+#   pregunta = obtener_pregunta_para_nivel(preguntas, 1, usadas, indice)
+#   pregunta = obtener_pregunta_para_nivel(preguntas, 1, usadas, indice, rng, sesion["vistas"])
 # =============================================================================
-def obtener_pregunta_para_nivel(preguntas: dict, nivel: int, preguntas_usadas: list) -> dict:
+def obtener_pregunta_para_nivel(preguntas: dict, nivel: int, preguntas_usadas: list, indice: dict = None, rng=None,
+                                vistas: dict = None) -> dict:
     """Obtiene una pregunta disponible para un nivel."""
-    preguntas_disponibles = filtrar_preguntas_por_nivel(preguntas, nivel, preguntas_usadas)
+    pregunta = None
     
-    if not preguntas_disponibles:
-        return None
+    if indice is not None:
+        if es_indice_ponderado(indice):
+            seleccionada = seleccionar_pregunta_ponderada(indice, nivel, rng, vistas)
+        else:
+            seleccionada = seleccionar_pregunta_indice(indice, nivel, rng, vistas)
+        if seleccionada:
+            pregunta = seleccionada
+    else:
+        preguntas_disponibles = filtrar_preguntas_por_nivel(preguntas, nivel, preguntas_usadas)
+        if vistas is not None:
+            no_vistas = {}
+            for pid, datos in preguntas_disponibles.items():
+                if not fue_vista(vistas, pid):
+                    no_vistas[pid] = datos
+            # Si todas fueron vistas se sigue con las disponibles
+            if no_vistas:
+                preguntas_disponibles = no_vistas
+        if preguntas_disponibles:
+            pregunta = seleccionar_pregunta_aleatoria(preguntas_disponibles, rng)
     
-    pregunta = seleccionar_pregunta_aleatoria(preguntas_disponibles)
     return pregunta
 
 
@@ -214,7 +334,8 @@ def obtener_pregunta_para_nivel(preguntas: dict, nivel: int, preguntas_usadas: l
 # Uso en Pygame: Se usa para guardar y mostrar resumen final
 #
 # Parámetros:
-#   - respuestas (list): Todas las respuestas de la partida
+#   - respuestas (list o dict): Todas las respuestas de la partida, o su
+#     registro (models/registro_respuestas): usa el contador de correctas
 #   - puntos_totales (int): Puntos totales obtenidos
 #   - puntos_buffeo (int): Puntos de buffeo obtenidos
 #   - tiempo_total (float): Tiempo total en segundos
@@ -225,14 +346,19 @@ def obtener_pregunta_para_nivel(preguntas: dict, nivel: int, preguntas_usadas: l
 # Ejemplo de uso:
 #   stats = construir_estadisticas_partida(respuestas, 45, 10, 120.5)
 # =============================================================================
-def construir_estadisticas_partida(respuestas: list, puntos_totales: int, puntos_buffeo: int, tiempo_total: float) -> dict:
+def construir_estadisticas_partida(respuestas, puntos_totales: int, puntos_buffeo: int, tiempo_total: float) -> dict:
     """Construye las estadísticas finales de una partida."""
-    total_preguntas = len(respuestas)
     respuestas_correctas = 0
     
-    for respuesta in respuestas:
-        if respuesta.get("es_correcta", False):
-            respuestas_correctas = respuestas_correctas + 1
+    if es_registro_respuestas(respuestas):
+        respuestas_correctas = respuestas["correctas"]
+        respuestas = respuestas["respuestas"]
+    else:
+        for respuesta in respuestas:
+            if respuesta.get("es_correcta", False):
+                respuestas_correctas = respuestas_correctas + 1
+    
+    total_preguntas = len(respuestas)
     
     estadisticas = {
         "puntos_totales": puntos_totales,
@@ -254,7 +380,7 @@ def construir_estadisticas_partida(respuestas: list, puntos_totales: int, puntos
 # Uso en Pygame: Se usa después de cada respuesta
 #
 # Parámetros:
-#   - respuestas (list): Respuestas de la partida
+#   - respuestas (list o dict): Respuestas de la partida o su registro
 #
 # Retorna:
 #   - bool: True si debe terminar la partida
@@ -263,7 +389,7 @@ def construir_estadisticas_partida(respuestas: list, puntos_totales: int, puntos
 #   if verificar_condicion_fin_partida(respuestas):
 #       # terminar partida
 # =============================================================================
-def verificar_condicion_fin_partida(respuestas: list) -> bool:
+def verificar_condicion_fin_partida(respuestas) -> bool:
     """Verifica si la partida debe terminar."""
     errores = contar_errores_totales(respuestas)
     return errores >= MAX_ERRORES_PERMITIDOS
@@ -316,6 +442,7 @@ def preparar_datos_pregunta_para_ui(pregunta: dict, racha_actual: int, numero_pr
 # Parámetros:
 #   - racha_actual (int): Racha actual
 #   - nombre_usuario (str): Nombre del usuario
+#   - sesion (dict): Sesión de juego (opcional, ver core/sesion_juego)
 #
 # Retorna:
 #   - dict: Datos del buffeo para mostrar
@@ -323,9 +450,9 @@ def preparar_datos_pregunta_para_ui(pregunta: dict, racha_actual: int, numero_pr
 # Ejemplo de uso:
 #   buffeo_ui = calcular_datos_buffeo_para_ui(5, "Juan")
 # =============================================================================
-def calcular_datos_buffeo_para_ui(racha_actual: int, nombre_usuario: str) -> dict:
+def calcular_datos_buffeo_para_ui(racha_actual: int, nombre_usuario: str, sesion: dict = None) -> dict:
     """Calcula datos de buffeo para mostrar en la UI."""
-    objeto = verificar_objeto_equipado(nombre_usuario)
+    objeto = obtener_objeto_actual(nombre_usuario, sesion)
     buffeo_data = calcular_puntos_buffeo(racha_actual, objeto)
     
     datos_ui = {
@@ -10,19 +10,42 @@
 #    - ui/Pygame/Estados/Minijuego.py - para jugar en modo gráfico
 #
 # 🔗 DEPENDENCIAS:
-#    - random: para generar caminos aleatorios
-#    - config.constantes: para TAMAÑO_MATRIZ_MINIJUEGO
+#    - random: para generar caminos aleatorios (o un random.Random con semilla)
+#    - core/logica_tablero_vectorizado: tablero con numpy (si está instalado)
+#    - core/solucionador_minijuego: mapa de alcance del tablero
+#    - config.constantes: para TAMAÑO_MATRIZ_MINIJUEGO, TAMAÑO_MINIMO_TABLERO_NUMPY
 #
 # 💡 NOTAS PARA LA DEFENSA:
-#    - Generación garantizada de matriz resoluble usando algoritmo recursivo
+#    - Generación garantizada de matriz resoluble a partir de un camino
 #    - Validación de movimientos sin usar funciones built-in
 #    - Separación total entre lógica del juego y presentación
-#    - Algoritmo recursivo para generar camino (técnica avanzada)
+#    - El camino se genera con un bucle (antes era recursivo y superaba el
+#      límite de recursión de Python en tableros grandes)
+#    - Todo el azar sale de un rng inyectable: con random.Random(semilla)
+#      el mismo tablero se repite
+#    - entero_aleatorio reemplaza a randint en la generación: randint pasa
+#      por varias funciones de Python por número, rng.random() es una sola
+#      llamada en C (10.000+ tableros de 5x5 por segundo)
 #    - UN SOLO return por función
+#    - Con numpy, desde TAMAÑO_MINIMO_TABLERO_NUMPY el tablero se genera
+#      vectorizado y se adapta a lista de listas; si no, se usa la versión de
+#      listas (camino como set: rellenar es O(N²) y no O(N⁴))
 # =============================================================================
 
 import random
-from config.constantes import TAMAÑO_MATRIZ_MINIJUEGO
+from core.logica_tablero_vectorizado import (
+    numpy_disponible,
+    crear_generador_numpy,
+    generar_tablero_resoluble,
+    tablero_a_lista
+)
+from core.solucionador_minijuego import crear_mapa_alcance
+from config.constantes import TAMAÑO_MATRIZ_MINIJUEGO, TAMAÑO_MINIMO_TABLERO_NUMPY
+
+def entero_aleatorio(rng, minimo: int, maximo: int) -> int:
+    """Entero uniforme en [minimo, maximo] como randint, con una sola llamada a rng.random()."""
+    return minimo + int(rng.random() * (maximo - minimo + 1))
+
 
 # =============================================================================
 # GENERAR_MATRIZ_RESOLUBLE
@@ -33,19 +56,26 @@ from config.constantes import TAMAÑO_MATRIZ_MINIJUEGO
 #
 # Parámetros:
 #   - tamano (int): Tamaño de la matriz (NxN)
+#   - rng (random.Random): Generador con semilla (opcional, default: random)
 #
 # Retorna:
 #   - list: Matriz 2D con valores
 #
 # Ejemplo de uso:
 #   matriz = generar_matriz_resoluble(5)
+#   matriz = generar_matriz_resoluble(5, random.Random(42))  # reproducible
 # =============================================================================
-def generar_matriz_resoluble(tamano: int) -> list:
+def generar_matriz_resoluble(tamano: int, rng=None) -> list:
     """Genera una matriz con solución garantizada."""
-    matriz = inicializar_matriz_vacia(tamano)
-    camino = generar_camino_garantizado(tamano)
-    asignar_valores_a_camino(matriz, camino)
-    rellenar_matriz_con_valores_seguro(matriz, camino)
+    if rng is None:
+        rng = random
+    if numpy_disponible() and tamano >= TAMAÑO_MINIMO_TABLERO_NUMPY:
+        matriz = tablero_a_lista(generar_tablero_resoluble(tamano, crear_generador_numpy(rng)))
+    else:
+        matriz = inicializar_matriz_vacia(tamano)
+        camino = generar_camino_garantizado(tamano, rng)
+        asignar_valores_a_camino(matriz, camino, rng)
+        rellenar_matriz_con_valores_seguro(matriz, camino, rng)
     matriz_final = matriz
     return matriz_final
 
@@ -68,16 +98,7 @@ def generar_matriz_resoluble(tamano: int) -> list:
 # =============================================================================
 def inicializar_matriz_vacia(tamano: int) -> list:
     """Crea una matriz NxN llena de ceros."""
-    matriz = []
-    fila_idx = 0
-    while fila_idx < tamano:
-        fila = []
-        col_idx = 0
-        while col_idx < tamano:
-            fila.append(0)
-            col_idx += 1
-        matriz.append(fila)
-        fila_idx += 1
+    matriz = [[0] * tamano for _ in range(tamano)]
     return matriz
 
 
@@ -90,35 +111,43 @@ def inicializar_matriz_vacia(tamano: int) -> list:
 #
 # Parámetros:
 #   - tamano (int): Tamaño de la matriz
-#   - fila (int): Fila actual (default: 0)
-#   - col (int): Columna actual (default: 0)
-#   - camino (list): Camino acumulado (default: [])
+#   - rng (random.Random): Generador con semilla (opcional, default: random)
 #
 # Retorna:
 #   - list: Lista de tuplas (fila, col) que forman el camino
 #
 # Ejemplo de uso:
 #   camino = generar_camino_garantizado(5)
-# =============================================================================
-def generar_camino_garantizado(tamano: int, fila=0, col=0, camino=[]) -> list:
-    """Genera un camino garantizado recursivamente."""
-    if not camino:  
-        camino = []
-    
-    camino.append((fila, col))
-    
-    if (fila, col) == (tamano - 1, tamano - 1):
-        return camino
-    opciones = []
-    if fila + 1 < tamano:
-        opciones.append((fila + 1, col))
-    if col + 1 < tamano:
-        opciones.append((fila, col + 1))
-    if fila + 1 < tamano and col + 1 < tamano:
-        opciones.append((fila + 1, col + 1))
-    
-    nueva_fila, nueva_col = random.choice(opciones)
-    return generar_camino_garantizado(tamano, nueva_fila, nueva_col, camino)
+#   camino = generar_camino_garantizado(5, random.Random(42))
+# =============================================================================
+def generar_camino_garantizado(tamano: int, rng=None) -> list:
+    """Genera un camino garantizado con un bucle (sin recursión)."""
+    if rng is None:
+        rng = random
+    ultimo = tamano - 1
+    fila = 0
+    col = 0
+    camino = [(0, 0)]
+
+    # Mismas opciones que antes: abajo, derecha y diagonal mientras no se
+    # toque un borde
+    while fila < ultimo and col < ultimo:
+        paso = entero_aleatorio(rng, 0, 2)
+        if paso != 1:
+            fila += 1
+        if paso != 0:
+            col += 1
+        camino.append((fila, col))
+
+    # En el borde solo queda una dirección: línea recta hasta la esquina
+    while fila < ultimo:
+        fila += 1
+        camino.append((fila, col))
+    while col < ultimo:
+        col += 1
+        camino.append((fila, col))
+
+    return camino
 
 
 # =============================================================================
@@ -131,6 +160,7 @@ def generar_camino_garantizado(tamano: int, fila=0, col=0, camino=[]) -> list:
 # Parámetros:
 #   - matriz (list): Matriz a modificar
 #   - camino (list): Camino garantizado
+#   - rng (random.Random): Generador con semilla (opcional, default: random)
 #
 # Retorna:
 #   - None (modifica la matriz in-place)
@@ -138,12 +168,14 @@ def generar_camino_garantizado(tamano: int, fila=0, col=0, camino=[]) -> list:
 # Ejemplo de uso:
 #   asignar_valores_a_camino(matriz, camino)
 # =============================================================================
-def asignar_valores_a_camino(matriz: list, camino: list):
+def asignar_valores_a_camino(matriz: list, camino: list, rng=None):
     """Asigna valores crecientes a las celdas del camino."""
-    valor = random.randint(10, 20)
+    if rng is None:
+        rng = random
+    valor = entero_aleatorio(rng, 10, 20)
     for fila, col in camino:
         matriz[fila][col] = valor
-        valor += random.randint(1, 5)
+        valor += entero_aleatorio(rng, 1, 5)
 
 
 # =============================================================================
@@ -156,6 +188,7 @@ def asignar_valores_a_camino(matriz: list, camino: list):
 # Parámetros:
 #   - matriz (list): Matriz a rellenar
 #   - camino (list): Camino garantizado (no modificar)
+#   - rng (random.Random): Generador con semilla (opcional, default: random)
 #
 # Retorna:
 #   - None (modifica la matriz in-place)
@@ -163,18 +196,21 @@ def asignar_valores_a_camino(matriz: list, camino: list):
 # Ejemplo de uso:
 #   rellenar_matriz_con_valores_seguro(matriz, camino)
 # =============================================================================
-def rellenar_matriz_con_valores_seguro(matriz: list, camino: list):
+def rellenar_matriz_con_valores_seguro(matriz: list, camino: list, rng=None):
     """Rellena el resto de la matriz con valores seguros."""
+    if rng is None:
+        rng = random
     tamano = len(matriz)
+    celdas_camino = set(camino)
     for i in range(tamano):
         for j in range(tamano):
-            if (i, j) not in camino:
+            if (i, j) not in celdas_camino:
                 vecinos = obtener_valores_vecinos_no_nulos(matriz, i, j)
                 if vecinos:
                     min_vecino = min(vecinos)
-                    matriz[i][j] = random.randint(10, min_vecino + 10)
+                    matriz[i][j] = entero_aleatorio(rng, 10, min_vecino + 10)
                 else:
-                    matriz[i][j] = random.randint(10, 50)
+                    matriz[i][j] = entero_aleatorio(rng, 10, 50)
 
 
 # =============================================================================
@@ -306,12 +342,15 @@ def verificar_victoria(pos_actual: tuple, tamano: int) -> bool:
 # =============================================================================
 # INICIALIZAR_ESTADO_MINIJUEGO
 # =============================================================================
-# Descripción: Inicializa el estado del minijuego
+# Descripción: Inicializa el estado del minijuego. Incluye el mapa de
+#              alcance (core/solucionador_minijuego), calculado una sola vez
+#              por tablero: movimientos legales y celdas sin salida en O(1)
 # 
 # Uso en Pygame: Se usa al comenzar una partida del minijuego
 #
 # Parámetros:
 #   - tamano (int): Tamaño de la matriz (default: constante)
+#   - rng (random.Random): Generador con semilla (opcional, default: random)
 #
 # Retorna:
 #   - dict: Estado inicial del minijuego
@@ -319,18 +358,19 @@ def verificar_victoria(pos_actual: tuple, tamano: int) -> bool:
 # Ejemplo de uso:
 #   estado = inicializar_estado_minijuego()
 # =============================================================================
-def inicializar_estado_minijuego(tamano: int = None) -> dict:
+def inicializar_estado_minijuego(tamano: int = None, rng=None) -> dict:
     """Inicializa el estado del minijuego."""
     if tamano is None:
         tamano = TAMAÑO_MATRIZ_MINIJUEGO
     
-    matriz = generar_matriz_resoluble(tamano)
+    matriz = generar_matriz_resoluble(tamano, rng)
     
     estado = {
         "matriz": matriz,
         "jugador_pos": (0, 0),
         "objetivo": (tamano - 1, tamano - 1),
         "camino_recorrido": set(),
+        "mapa_alcance": crear_mapa_alcance(matriz),
         "valor_actual": matriz[0][0],
         "tamano": tamano,
         "terminado": False,
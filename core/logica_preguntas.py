@@ -12,19 +12,23 @@
 # 🔗 DEPENDENCIAS:
 #    - utils/formateadores: para obtener_indice_letra, quitar_espacios_extremos, convertir_a_mayusculas
 #    - utils/validaciones: para validar_indice_opcion
-#    - core/logica_buffeos: para verificar_objeto_equipado, usar_armadura
+#    - core/logica_buffeos: para obtener_objeto_actual, usar_armadura
+#    - models/registro_respuestas: para es_registro_respuestas
 #
 # 💡 NOTAS PARA LA DEFENSA:
 #    - Evaluación de respuestas sin efectos secundarios (sin prints)
 #    - Integración con sistema de objetos (armadura protege respuestas)
 #    - Cálculo manual de rachas con bucle while (sin usar funciones built-in)
+#    - Con un registro de respuestas (models/registro_respuestas) la racha y
+#      los errores se leen del contador en O(1) en lugar de recorrer la lista
 #    - Mensajes personalizados por nivel para mejor experiencia
 #    - UN SOLO return por función en todas las funciones
 # =============================================================================
 
 from utils.formateadores import obtener_indice_letra, quitar_espacios_extremos, convertir_a_mayusculas
 from utils.validaciones import validar_indice_opcion
-from core.logica_buffeos import verificar_objeto_equipado, usar_armadura
+from core.logica_buffeos import obtener_objeto_actual, usar_armadura
+from models.registro_respuestas import es_registro_respuestas
 
 # =============================================================================
 # EVALUAR_RESPUESTA
@@ -38,6 +42,7 @@ from core.logica_buffeos import verificar_objeto_equipado, usar_armadura
 #   - opciones (list): Lista de opciones de la pregunta
 #   - respuesta_correcta (str): Respuesta correcta
 #   - nombre_usuario (str): Nombre del usuario
+#   - sesion (dict): Sesión de juego (opcional, ver core/sesion_juego)
 #
 # Retorna:
 #   - dict: {"valida": bool, "es_correcta": bool, "seleccion": str, 
@@ -46,7 +51,7 @@ from core.logica_buffeos import verificar_objeto_equipado, usar_armadura
 # Ejemplo de uso:
 #   resultado = evaluar_respuesta("B", opciones, correcta, "Juan")
 # =============================================================================
-def evaluar_respuesta(respuesta_usuario: str, opciones: list, respuesta_correcta: str, nombre_usuario: str) -> dict:
+def evaluar_respuesta(respuesta_usuario: str, opciones: list, respuesta_correcta: str, nombre_usuario: str, sesion: dict = None) -> dict:
     """Evalúa una respuesta del usuario sin hacer prints."""
     respuesta_limpia = convertir_a_mayusculas(quitar_espacios_extremos(respuesta_usuario))
     indice = obtener_indice_letra(respuesta_limpia)
@@ -65,7 +70,7 @@ def evaluar_respuesta(respuesta_usuario: str, opciones: list, respuesta_correcta
         
         # Verificar si usa armadura
         if not es_correcta:
-            resultado_armadura = usar_armadura(nombre_usuario, es_correcta)
+            resultado_armadura = usar_armadura(nombre_usuario, es_correcta, sesion)
             if resultado_armadura["protegido"]:
                 es_correcta = True
                 resultado["protegido_por_armadura"] = True
@@ -131,36 +136,39 @@ def construir_mensaje_resultado(nivel: int, es_correcta: bool, respuesta_correct
 # Uso en Pygame: Se usa para mostrar indicador de racha
 #
 # Parámetros:
-#   - respuestas_actuales (list): Lista de respuestas hasta el momento
+#   - respuestas_actuales (list o dict): Lista de respuestas hasta el
+#     momento, o registro de models/registro_respuestas (O(1))
 #
 # Retorna:
 #   - int: Número de respuestas correctas consecutivas
 #
 # Ejemplo de uso:
 #   racha = calcular_racha_actual(respuestas)
+#   racha = calcular_racha_actual(registro)
 # =============================================================================
-def calcular_racha_actual(respuestas_actuales: list) -> int:
+def calcular_racha_actual(respuestas_actuales) -> int:
     """Calcula la racha actual de respuestas correctas."""
-    if not respuestas_actuales:
-        return 0
-    
     racha_actual = 0
-    i = len(respuestas_actuales) - 1
     
-    while i >= 0:
-        respuesta = respuestas_actuales[i]
-        es_correcta = False
-        for clave in respuesta:
-            if clave == "es_correcta":
-                es_correcta = respuesta[clave]
-                break
-        
-        if es_correcta:
-            racha_actual += 1
-        else:
-            break
+    if es_registro_respuestas(respuestas_actuales):
+        racha_actual = respuestas_actuales["racha"]
+    else:
+        i = len(respuestas_actuales) - 1
         
-        i -= 1
+        while i >= 0:
+            respuesta = respuestas_actuales[i]
+            es_correcta = False
+            for clave in respuesta:
+                if clave == "es_correcta":
+                    es_correcta = respuesta[clave]
+                    break
+            
+            if es_correcta:
+                racha_actual += 1
+            else:
+                break
+            
+            i -= 1
     
     return racha_actual
 
@@ -174,6 +182,7 @@ def calcular_racha_actual(respuestas_actuales: list) -> int:
 #
 # Parámetros:
 #   - nombre_usuario (str): Nombre del usuario
+#   - sesion (dict): Sesión de juego (opcional, ver core/sesion_juego)
 #
 # Retorna:
 #   - int: Número máximo de intentos (1 normal, 2 con espada)
@@ -181,9 +190,9 @@ def calcular_racha_actual(respuestas_actuales: list) -> int:
 # Ejemplo de uso:
 #   max_intentos = determinar_intentos_maximos("Juan")
 # =============================================================================
-def determinar_intentos_maximos(nombre_usuario: str) -> int:
+def determinar_intentos_maximos(nombre_usuario: str, sesion: dict = None) -> int:
     """Determina cuántos intentos tiene el usuario según su objeto."""
-    objeto = verificar_objeto_equipado(nombre_usuario)
+    objeto = obtener_objeto_actual(nombre_usuario, sesion)
     if objeto == "espada":
         return 2
     return 1
@@ -252,7 +261,8 @@ def construir_resultado_respuesta(evaluacion: dict, nivel: int, respuesta_correc
 # Uso en Pygame: Se usa para verificar condición de game over
 #
 # Parámetros:
-#   - respuestas (list): Lista de respuestas
+#   - respuestas (list o dict): Lista de respuestas, o registro de
+#     models/registro_respuestas (O(1))
 #
 # Retorna:
 #   - int: Cantidad de respuestas incorrectas
@@ -260,18 +270,21 @@ def construir_resultado_respuesta(evaluacion: dict, nivel: int, respuesta_correc
 # Ejemplo de uso:
 #   errores = contar_errores_totales(respuestas)
 # =============================================================================
-def contar_errores_totales(respuestas: list) -> int:
+def contar_errores_totales(respuestas) -> int:
     """Cuenta el total de errores en una lista de respuestas."""
     errores = 0
-    for respuesta in respuestas:
-        # Buscar la clave "es_correcta"
-        es_correcta = False
-        for clave in respuesta:
-            if clave == "es_correcta":
-                es_correcta = respuesta[clave]
-                break
-        
-        if not es_correcta:
-            errores += 1
+    if es_registro_respuestas(respuestas):
+        errores = respuestas["errores"]
+    else:
+        for respuesta in respuestas:
+            # Buscar la clave "es_correcta"
+            es_correcta = False
+            for clave in respuesta:
+                if clave == "es_correcta":
+                    es_correcta = respuesta[clave]
+                    break
+            
+            if not es_correcta:
+                errores += 1
     
     return errores
@@ -0,0 +1,257 @@
+# =============================================================================
+# LÓGICA DE PUNTAJE POR LOTES
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Versión por lotes de calcular_puntos_base, calcular_puntos_buffeo y
+#    calcular_puntaje_con_buffeo: reciben arreglos (correctas, dificultades,
+#    rachas, objetos) y devuelven arreglos de puntos con exactamente los
+#    mismos valores que las funciones de a una respuesta. Sirve para
+#    recalcular historiales completos después de cambiar las reglas y para
+#    simulaciones grandes.
+#
+# 📥 IMPORTADO EN:
+#    - Ninguno por ahora (API para scripts de simulación y recálculo)
+#
+# 🔗 DEPENDENCIAS:
+#    - numpy (opcional): cálculo vectorizado. Si no está instalado se usan
+#      las funciones escalares en un bucle y se devuelven listas
+#    - core/logica_puntaje: para calcular_puntos_base (camino sin numpy)
+#    - core/logica_buffeos: para calcular_puntos_buffeo (camino sin numpy)
+#    - config/constantes: para PUNTOS_POR_DIFICULTAD, PUNTOS_BUFFEO_POR_RACHA,
+#      OBJETOS_ESPECIALES
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Las tablas (dificultad -> puntos, umbrales de racha) se leen de las
+#      constantes en cada llamada: un cambio de reglas se refleja solo
+#    - Dificultad desconocida = 0 puntos, igual que el bucle de
+#      calcular_puntos_base
+#    - Los umbrales de racha son estrictos (> 3, > 5, > 7) como en
+#      calcular_puntos_buffeo
+#    - Con numpy cada llamada es un puñado de operaciones sobre arreglos,
+#      sin bucles de Python por respuesta
+# =============================================================================
+
+from core.logica_puntaje import calcular_puntos_base
+from core.logica_buffeos import calcular_puntos_buffeo
+from config.constantes import PUNTOS_POR_DIFICULTAD, PUNTOS_BUFFEO_POR_RACHA, OBJETOS_ESPECIALES
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def numpy_disponible() -> bool:
+    """Indica si el cálculo por lotes usa numpy."""
+    return np is not None
+
+
+# =============================================================================
+# CALCULAR_PUNTOS_BASE_LOTE
+# =============================================================================
+# Descripción: calcular_puntos_base para muchas respuestas a la vez
+#
+# Uso en Pygame: No se usa (recálculo y simulación)
+#
+# Parámetros:
+#   - correctas (secuencia de bool): Si cada respuesta fue correcta
+#   - dificultades (secuencia de int): Dificultad de cada pregunta
+#
+# Retorna:
+#   - numpy.ndarray de int (o list sin numpy): Puntos base de cada respuesta
+#
+# Ejemplo de uso:
+#   base = calcular_puntos_base_lote([True, False], [3, 2])  # [3, -2]
+# =============================================================================
+def calcular_puntos_base_lote(correctas, dificultades):
+    """Calcula los puntos base de un lote de respuestas."""
+    if np is None:
+        puntos = []
+        for es_correcta, dificultad in zip(correctas, dificultades):
+            puntos.append(calcular_puntos_base(es_correcta, dificultad))
+    else:
+        correctas = np.asarray(correctas, dtype=bool)
+        dificultades = np.asarray(dificultades, dtype=np.int64)
+
+        # Tabla dificultad -> puntos; las dificultades fuera de la tabla valen 0
+        tabla = np.zeros(max(PUNTOS_POR_DIFICULTAD) + 1, dtype=np.int64)
+        for dificultad, pts in PUNTOS_POR_DIFICULTAD.items():
+            tabla[dificultad] = pts
+        en_tabla = (dificultades >= 0) & (dificultades < len(tabla))
+        absolutos = np.where(en_tabla, tabla[np.clip(dificultades, 0, len(tabla) - 1)], 0)
+        puntos = np.where(correctas, absolutos, -absolutos)
+
+    return puntos
+
+
+# =============================================================================
+# CALCULAR_PUNTOS_BUFFEO_LOTE
+# =============================================================================
+# Descripción: calcular_puntos_buffeo para muchas respuestas a la vez
+#
+# Uso en Pygame: No se usa (recálculo y simulación)
+#
+# Parámetros:
+#   - rachas (secuencia de int): Racha al momento de cada respuesta
+#   - objetos (secuencia de str o None): Objeto equipado en cada respuesta
+#
+# Retorna:
+#   - dict: {"puntos", "por_racha", "por_objeto"}, cada uno un arreglo
+#           (o list sin numpy) con un valor por respuesta
+#
+# Ejemplo de uso:
+#   buffeo = calcular_puntos_buffeo_lote([8, 2], ["espada", None])
+#   buffeo["puntos"]  # [7, 0]
+# =============================================================================
+def calcular_puntos_buffeo_lote(rachas, objetos) -> dict:
+    """Calcula los puntos de buffeo de un lote de respuestas."""
+    resultado = {"puntos": [], "por_racha": [], "por_objeto": []}
+
+    if np is None:
+        for racha, objeto in zip(rachas, objetos):
+            buffeo = calcular_puntos_buffeo(racha, objeto)
+            resultado["puntos"].append(buffeo["puntos"])
+            resultado["por_racha"].append(buffeo["por_racha"])
+            resultado["por_objeto"].append(buffeo["por_objeto"])
+    else:
+        rachas = np.asarray(rachas, dtype=np.int64)
+        es_espada = np.asarray(objetos, dtype=object) == "espada"
+
+        por_racha = np.select(
+            [rachas > 7, rachas > 5, rachas > 3],
+            [PUNTOS_BUFFEO_POR_RACHA[7], PUNTOS_BUFFEO_POR_RACHA[5], PUNTOS_BUFFEO_POR_RACHA[3]],
+            0
+        ).astype(np.int64)
+        por_objeto = np.where(es_espada, OBJETOS_ESPECIALES["espada"]["puntos_extra"], 0).astype(np.int64)
+
+        resultado["puntos"] = por_racha + por_objeto
+        resultado["por_racha"] = por_racha
+        resultado["por_objeto"] = por_objeto
+
+    return resultado
+
+
+# =============================================================================
+# CALCULAR_PUNTAJE_CON_BUFFEO_LOTE
+# =============================================================================
+# Descripción: calcular_puntaje_con_buffeo para muchas respuestas a la vez
+#
+# Uso en Pygame: No se usa (recálculo y simulación)
+#
+# Parámetros:
+#   - puntos_base, puntos_buffeo, puntos_raciones, puntos_bolsa
+#     (secuencias de int del mismo largo)
+#
+# Retorna:
+#   - dict: {"total", "base", "buffeo", "raciones", "bolsa"} con arreglos
+#           (o listas sin numpy)
+#
+# Ejemplo de uso:
+#   puntaje = calcular_puntaje_con_buffeo_lote(base, buffeo["puntos"], [0, 0], [0, 0])
+# =============================================================================
+def calcular_puntaje_con_buffeo_lote(puntos_base, puntos_buffeo, puntos_raciones, puntos_bolsa) -> dict:
+    """Suma los puntos de un lote de respuestas con su desglose."""
+    if np is None:
+        base = list(puntos_base)
+        buffeo = list(puntos_buffeo)
+        raciones = list(puntos_raciones)
+        bolsa = list(puntos_bolsa)
+        total = []
+        for i in range(len(base)):
+            total.append(base[i] + buffeo[i] + raciones[i] + bolsa[i])
+    else:
+        base = np.asarray(puntos_base, dtype=np.int64)
+        buffeo = np.asarray(puntos_buffeo, dtype=np.int64)
+        raciones = np.asarray(puntos_raciones, dtype=np.int64)
+        bolsa = np.asarray(puntos_bolsa, dtype=np.int64)
+        total = base + buffeo + raciones + bolsa
+
+    resultado = {
+        "total": total,
+        "base": base,
+        "buffeo": buffeo,
+        "raciones": raciones,
+        "bolsa": bolsa
+    }
+    return resultado
+
+
+# =============================================================================
+# CALCULAR_RACHAS_PREVIAS_LOTE
+# =============================================================================
+# Descripción: Racha con la que se respondió cada respuesta de una partida
+#              (correctas consecutivas inmediatamente anteriores), que es la
+#              racha que recibe calcular_puntos_buffeo
+#
+# Uso en Pygame: No se usa (recálculo de historiales, que no guardan racha)
+#
+# Parámetros:
+#   - correctas (secuencia de bool): Respuestas de UNA partida, en orden
+#
+# Retorna:
+#   - numpy.ndarray de int (o list sin numpy)
+#
+# Ejemplo de uso:
+#   calcular_rachas_previas_lote([True, True, False, True])  # [0, 1, 2, 0]
+# =============================================================================
+def calcular_rachas_previas_lote(correctas):
+    """Calcula la racha previa a cada respuesta de una partida."""
+    if np is None:
+        rachas = []
+        racha = 0
+        for es_correcta in correctas:
+            rachas.append(racha)
+            racha = racha + 1 if es_correcta else 0
+    else:
+        correctas = np.asarray(correctas, dtype=bool)
+        posiciones = np.arange(len(correctas), dtype=np.int64)
+
+        # Posición del último error hasta cada respuesta (incluida), -1 si no hubo
+        ultimo_error = np.maximum.accumulate(np.where(correctas, -1, posiciones)) if len(correctas) else posiciones
+        racha_incluida = posiciones - ultimo_error
+        rachas = np.zeros(len(correctas), dtype=np.int64)
+        rachas[1:] = racha_incluida[:-1]
+
+    return rachas
+
+
+# =============================================================================
+# PUNTUAR_RESPUESTAS_LOTE
+# =============================================================================
+# Descripción: Puntos base + buffeo de cada respuesta como en
+#              procesar_pregunta_completa (el buffeo solo suma si la
+#              respuesta es correcta). Raciones y bolsa de monedas no se
+#              incluyen: dependen de cuándo se consumió el objeto
+#
+# Uso en Pygame: No se usa (recálculo y simulación)
+#
+# Parámetros:
+#   - correctas (secuencia de bool)
+#   - dificultades (secuencia de int)
+#   - rachas (secuencia de int): Racha previa a cada respuesta
+#   - objetos (secuencia de str o None)
+#
+# Retorna:
+#   - dict: Igual que calcular_puntaje_con_buffeo_lote (raciones y bolsa en 0)
+#
+# Ejemplo de uso:
+#   correctas = [r["es_correcta"] for r in detalle]
+#   puntaje = puntuar_respuestas_lote(correctas, dificultades,
+#                                     calcular_rachas_previas_lote(correctas),
+#                                     [None] * len(correctas))
+# =============================================================================
+def puntuar_respuestas_lote(correctas, dificultades, rachas, objetos) -> dict:
+    """Calcula base y buffeo de un lote como procesar_pregunta_completa."""
+    base = calcular_puntos_base_lote(correctas, dificultades)
+    buffeo = calcular_puntos_buffeo_lote(rachas, objetos)["puntos"]
+
+    if np is None:
+        ceros = [0] * len(base)
+        buffeo_aplicado = []
+        for es_correcta, puntos in zip(correctas, buffeo):
+            buffeo_aplicado.append(puntos if es_correcta else 0)
+    else:
+        ceros = np.zeros(len(base), dtype=np.int64)
+        buffeo_aplicado = np.where(np.asarray(correctas, dtype=bool), buffeo, 0)
+
+    return calcular_puntaje_con_buffeo_lote(base, buffeo_aplicado, ceros, ceros)
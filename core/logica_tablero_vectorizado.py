@@ -0,0 +1,155 @@
+# =============================================================================
+# GENERADOR VECTORIZADO DE TABLEROS DEL MINIJUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Versión con numpy de generar_matriz_resoluble: el mismo tipo de tablero
+#    de "Guardianes de Piedra" (un camino con valores estrictamente
+#    crecientes de (0,0) a la esquina final y el resto relleno con valores
+#    bajos) pero construido como numpy.ndarray con operaciones sobre
+#    arreglos. Un tablero de 200x200 sale en milisegundos.
+#
+# 📥 IMPORTADO EN:
+#    - core/logica_minijuego.py - generar_matriz_resoluble (si hay numpy)
+#    - benchmarks/bench_tablero_minijuego.py - comparación con la versión de listas
+#
+# 🔗 DEPENDENCIAS:
+#    - numpy (opcional): si no está instalado numpy_disponible() es False y
+#      logica_minijuego usa la versión de listas
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - El camino se sortea de una vez: 2N-2 pasos (abajo, derecha, diagonal)
+#      acumulados con cumsum; al tocar el borde se completa en línea recta.
+#      Es la misma distribución que generar_camino_garantizado
+#    - Valores del camino: inicio en [10, 20] y saltos en [1, 5] (cumsum)
+#    - Relleno: la versión de listas acota cada celda por el menor vecino
+#      ya rellenado + 10, recorriendo fila por fila (secuencial). Aquí el
+#      tope sale del menor vecino del camino (8 desplazamientos del
+#      tablero) y, sin vecinos del camino, de VALOR_VECINO_RELLENO: misma
+#      media de relleno (~16) sin depender del orden de recorrido
+#    - Resoluble por construcción: el camino no depende del relleno
+#    - crear_generador_numpy deriva la semilla del random.Random de
+#      logica_minijuego: un tablero con semilla es reproducible en ambas
+#      versiones
+#    - tablero_a_lista adapta el resultado a la lista de listas que usan
+#      Minijuego y minijuego_consola
+# =============================================================================
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Menor vecino típico de una celda rellenada en la versión secuencial
+VALOR_VECINO_RELLENO = 12
+
+
+def numpy_disponible() -> bool:
+    """Indica si se pueden generar tableros vectorizados."""
+    return np is not None
+
+
+# =============================================================================
+# GENERAR_CAMINO_VECTORIZADO
+# =============================================================================
+# Descripción: Sortea el camino garantizado de (0,0) a (N-1,N-1) con pasos
+#              abajo, derecha o diagonal
+#
+# Uso en Pygame: Se usa internamente desde generar_tablero_resoluble
+#
+# Parámetros:
+#   - tamano (int): Tamaño del tablero (NxN)
+#   - rng (numpy.random.Generator): Generador de números aleatorios
+#
+# Retorna:
+#   - tuple: (filas, columnas) como arreglos de int, en orden de recorrido
+#
+# Ejemplo de uso:
+#   filas, columnas = generar_camino_vectorizado(200, np.random.default_rng(1))
+# =============================================================================
+def generar_camino_vectorizado(tamano: int, rng) -> tuple:
+    """Sortea el camino garantizado con operaciones sobre arreglos."""
+    ultimo = tamano - 1
+    filas = np.zeros(1, dtype=np.int64)
+    columnas = np.zeros(1, dtype=np.int64)
+
+    if ultimo > 0:
+        # 0 = abajo, 1 = derecha, 2 = diagonal; mientras no se toque un borde
+        # las tres opciones son válidas, como en la versión recursiva
+        pasos = rng.integers(0, 3, size=2 * ultimo)
+        filas = np.concatenate(([0], np.cumsum(pasos != 1)))
+        columnas = np.concatenate(([0], np.cumsum(pasos != 0)))
+
+        # Primer punto en el borde inferior o derecho (siempre existe: cada
+        # paso avanza al menos una fila o una columna)
+        borde = int(np.argmax((filas == ultimo) | (columnas == ultimo)))
+        filas = filas[:borde + 1]
+        columnas = columnas[:borde + 1]
+
+        # Desde el borde solo queda una dirección posible: línea recta
+        if filas[-1] == ultimo:
+            resto_columnas = np.arange(columnas[-1] + 1, ultimo + 1)
+            resto_filas = np.full(len(resto_columnas), ultimo)
+        else:
+            resto_filas = np.arange(filas[-1] + 1, ultimo + 1)
+            resto_columnas = np.full(len(resto_filas), ultimo)
+        filas = np.concatenate((filas, resto_filas))
+        columnas = np.concatenate((columnas, resto_columnas))
+
+    return filas, columnas
+
+
+# =============================================================================
+# GENERAR_TABLERO_RESOLUBLE
+# =============================================================================
+# Descripción: Genera un tablero NxN con solución garantizada como ndarray
+#
+# Uso en Pygame: Minijuego, a través de generar_matriz_resoluble
+#
+# Parámetros:
+#   - tamano (int): Tamaño del tablero (NxN)
+#   - rng (numpy.random.Generator): Generador con semilla (opcional)
+#
+# Retorna:
+#   - numpy.ndarray: Tablero de int (tamano x tamano)
+#
+# Ejemplo de uso:
+#   tablero = generar_tablero_resoluble(200)
+# =============================================================================
+def generar_tablero_resoluble(tamano: int, rng=None) -> "np.ndarray":
+    """Genera un tablero resoluble con operaciones vectorizadas."""
+    if rng is None:
+        rng = np.random.default_rng()
+
+    filas, columnas = generar_camino_vectorizado(tamano, rng)
+    valores_camino = rng.integers(10, 21) + np.concatenate(
+        ([0], np.cumsum(rng.integers(1, 6, size=len(filas) - 1)))
+    )
+
+    # Tablero con borde: el camino con sus valores y "infinito" en el resto
+    sin_valor = np.iinfo(np.int64).max
+    con_borde = np.full((tamano + 2, tamano + 2), sin_valor, dtype=np.int64)
+    con_borde[filas + 1, columnas + 1] = valores_camino
+
+    # Menor vecino del camino de cada celda (8 desplazamientos)
+    menor_vecino = np.full((tamano, tamano), sin_valor, dtype=np.int64)
+    for delta_fila in (0, 1, 2):
+        for delta_col in (0, 1, 2):
+            if delta_fila != 1 or delta_col != 1:
+                np.minimum(menor_vecino,
+                           con_borde[delta_fila:delta_fila + tamano, delta_col:delta_col + tamano],
+                           out=menor_vecino)
+
+    tope = np.minimum(menor_vecino, VALOR_VECINO_RELLENO) + 10
+    tablero = rng.integers(10, tope + 1)
+    tablero[filas, columnas] = valores_camino
+    return tablero
+
+
+def crear_generador_numpy(rng):
+    """Deriva un numpy.random.Generator de un random.Random (misma semilla, mismo tablero)."""
+    return np.random.default_rng(rng.getrandbits(64))
+
+
+def tablero_a_lista(tablero) -> list:
+    """Convierte el tablero a la lista de listas de int que usa la UI."""
+    return tablero.tolist()
@@ -0,0 +1,303 @@
+# =============================================================================
+# POOL DE TABLEROS DEL MINIJUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Mantiene tableros de "Guardianes de Piedra" ya generados y validados
+#    por dificultad, listos para usar. Un hilo en segundo plano rellena el
+#    pool cada vez que se toma un tablero; entrar o reiniciar el minijuego
+#    solo saca uno de la cola. Cada pool tiene su tamaño y su banda de
+#    dificultad.
+#
+# 📥 IMPORTADO EN:
+#    - ui/Pygame/Estados/Minijuego.py - para tomar el tablero al (re)iniciar
+#
+# 🔗 DEPENDENCIAS:
+#    - threading: hilo de recarga y condición de espera
+#    - collections.deque: cola de tableros listos
+#    - concurrent.futures: lotes de tableros en otros procesos (opcional)
+#    - core/logica_minijuego: inicializar_estado_minijuego
+#    - core/solucionador_minijuego: analizar_tablero_minijuego, calcular_dificultad_tablero
+#    - config/constantes: tamaño, banda de dificultad y parámetros del pool
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Los pools se comparten por (tamaño, banda): reiniciar el estado no
+#      crea otro hilo
+#    - Si el pool está vacío (p. ej. reiniciar muy rápido) el tablero se
+#      genera en el momento con la misma validación: nunca se bloquea
+#      esperando al hilo
+#    - Una banda imposible no deja al hilo girando para siempre: después de
+#      INTENTOS_TABLERO_EN_BANDA se usa el tablero más cercano a la banda,
+#      marcado con "en_banda": False y contado en "fuera_de_banda"
+#    - Si generar un lote falla (p. ej. murió un proceso) el hilo lo informa,
+#      cuenta el error, espera ESPERA_REINTENTO_POOL_TABLEROS y sigue: el
+#      pool no se queda sin recarga en silencio
+#    - Con procesos > 0 el hilo solo coordina: los lotes se generan en otros
+#      procesos y no compiten por el GIL con el bucle de Pygame
+#      (con "spawn" cada proceso importa el script principal: ui/Pygame/main.py
+#      solo arranca el juego bajo __main__, así no se abren otras ventanas)
+#    - Cada tablero es el estado de inicializar_estado_minijuego (con su mapa
+#      de alcance) más "dificultad" y "en_banda"
+#
+# Estructura del pool:
+#    {
+#        "tamano": int,
+#        "dificultad_minima": float,
+#        "dificultad_maxima": float,
+#        "capacidad": int,
+#        "procesos": int,
+#        "tableros": deque([estado, ...]),
+#        "condicion": threading.Condition,
+#        "hilo": threading.Thread o None,
+#        "detenido": bool,
+#        "generados": int,       # tableros analizados
+#        "descartados": int,     # analizados y no usados (fuera de la banda)
+#        "fuera_de_banda": int,  # usados fuera de la banda (banda no alcanzada)
+#        "errores": int          # lotes que fallaron al generarse
+#    }
+# =============================================================================
+
+import random
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from core.logica_minijuego import inicializar_estado_minijuego
+from core.solucionador_minijuego import analizar_tablero_minijuego, calcular_dificultad_tablero
+from config.constantes import (
+    TAMAÑO_MATRIZ_MINIJUEGO,
+    DIFICULTAD_MINIMA_MINIJUEGO,
+    DIFICULTAD_MAXIMA_MINIJUEGO,
+    CAPACIDAD_POOL_TABLEROS,
+    PROCESOS_POOL_TABLEROS,
+    INTENTOS_TABLERO_EN_BANDA,
+    ESPERA_REINTENTO_POOL_TABLEROS
+)
+
+# Pools activos: {(tamano, dificultad_minima, dificultad_maxima): pool}
+_pools = {}
+_candado_pools = threading.Lock()
+
+
+# =============================================================================
+# GENERAR_TABLERO_VALIDADO
+# =============================================================================
+# Descripción: Genera tableros hasta obtener uno dentro de la banda de
+#              dificultad (o, tras INTENTOS_TABLERO_EN_BANDA, el más
+#              cercano, con "en_banda": False)
+#
+# Uso en Pygame: Lo usa el hilo del pool y tomar_tablero si el pool está vacío
+#
+# Parámetros:
+#   - tamano (int): Tamaño del tablero
+#   - dificultad_minima (float): Límite inferior de la banda
+#   - dificultad_maxima (float): Límite superior de la banda
+#   - rng (random.Random): Generador con semilla (opcional)
+#
+# Retorna:
+#   - tuple: (estado del minijuego con "dificultad" y "en_banda",
+#             tableros descartados)
+#
+# Ejemplo de uso:
+#   estado, descartados = generar_tablero_validado(5, 0.1, 0.6)
+# =============================================================================
+def generar_tablero_validado(tamano: int, dificultad_minima: float, dificultad_maxima: float, rng=None) -> tuple:
+    """Genera un tablero con la dificultad pedida."""
+    mejor = None
+    mejor_distancia = None
+    intentos = 0
+    while intentos < INTENTOS_TABLERO_EN_BANDA and mejor_distancia != 0:
+        estado = inicializar_estado_minijuego(tamano, rng)
+        estado["dificultad"] = calcular_dificultad_tablero(analizar_tablero_minijuego(estado["matriz"]))
+        distancia = max(dificultad_minima - estado["dificultad"], estado["dificultad"] - dificultad_maxima, 0)
+        if mejor is None or distancia < mejor_distancia:
+            mejor = estado
+            mejor_distancia = distancia
+        intentos += 1
+    mejor["en_banda"] = mejor_distancia == 0
+    return mejor, intentos - 1
+
+
+def generar_lote_tableros(tamano: int, dificultad_minima: float, dificultad_maxima: float,
+                          cantidad: int, semilla: int) -> list:
+    """Genera 'cantidad' tableros validados (se ejecuta en otro proceso)."""
+    rng = random.Random(semilla)
+    lote = []
+    for _ in range(cantidad):
+        lote.append(generar_tablero_validado(tamano, dificultad_minima, dificultad_maxima, rng))
+    return lote
+
+
+# =============================================================================
+# INICIAR_POOL_TABLEROS
+# =============================================================================
+# Descripción: Obtiene el pool de un tamaño y banda de dificultad; la
+#              primera vez lo crea y arranca su hilo de recarga
+#
+# Uso en Pygame: Al crear el estado Minijuego (se llena mientras se juega
+#                el resto)
+#
+# Parámetros:
+#   - tamano (int): Tamaño del tablero (default: TAMAÑO_MATRIZ_MINIJUEGO)
+#   - dificultad_minima (float): default DIFICULTAD_MINIMA_MINIJUEGO
+#   - dificultad_maxima (float): default DIFICULTAD_MAXIMA_MINIJUEGO
+#   - capacidad (int): Tableros listos a mantener (default: CAPACIDAD_POOL_TABLEROS)
+#   - procesos (int): 0 = generar en el hilo; > 0 = lotes en procesos
+#
+# Retorna:
+#   - dict: Pool (ver Estructura del pool)
+#
+# Ejemplo de uso:
+#   pool = iniciar_pool_tableros()
+#   pool_grande = iniciar_pool_tableros(10, 0.2, 0.5)
+# =============================================================================
+def iniciar_pool_tableros(tamano: int = TAMAÑO_MATRIZ_MINIJUEGO,
+                          dificultad_minima: float = DIFICULTAD_MINIMA_MINIJUEGO,
+                          dificultad_maxima: float = DIFICULTAD_MAXIMA_MINIJUEGO,
+                          capacidad: int = CAPACIDAD_POOL_TABLEROS,
+                          procesos: int = PROCESOS_POOL_TABLEROS) -> dict:
+    """Obtiene (o crea y arranca) el pool de tableros pedido."""
+    clave = (tamano, dificultad_minima, dificultad_maxima)
+    with _candado_pools:
+        pool = _pools.get(clave)
+        if pool is None or pool["detenido"]:
+            pool = {
+                "tamano": tamano,
+                "dificultad_minima": dificultad_minima,
+                "dificultad_maxima": dificultad_maxima,
+                "capacidad": capacidad,
+                "procesos": procesos,
+                "tableros": deque(),
+                "condicion": threading.Condition(),
+                "hilo": None,
+                "detenido": False,
+                "generados": 0,
+                "descartados": 0,
+                "fuera_de_banda": 0,
+                "errores": 0
+            }
+            pool["hilo"] = threading.Thread(target=rellenar_pool_tableros, args=(pool,), daemon=True)
+            pool["hilo"].start()
+            _pools[clave] = pool
+    return pool
+
+
+# =============================================================================
+# RELLENAR_POOL_TABLEROS
+# =============================================================================
+# Descripción: Bucle del hilo de recarga: espera a que falten tableros y
+#              los genera fuera del candado (en el hilo o en procesos). Un
+#              error al generar se informa y se reintenta
+#
+# Uso en Pygame: Se usa internamente (hilo daemon de cada pool)
+#
+# Parámetros:
+#   - pool (dict): Pool a rellenar
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   threading.Thread(target=rellenar_pool_tableros, args=(pool,), daemon=True).start()
+# =============================================================================
+def rellenar_pool_tableros(pool: dict) -> None:
+    """Mantiene el pool lleno hasta que se detenga."""
+    rng = random.Random()
+    ejecutor = None
+    if pool["procesos"] > 0:
+        ejecutor = ProcessPoolExecutor(max_workers=pool["procesos"])
+
+    try:
+        while not pool["detenido"]:
+            with pool["condicion"]:
+                while len(pool["tableros"]) >= pool["capacidad"] and not pool["detenido"]:
+                    pool["condicion"].wait()
+                faltan = pool["capacidad"] - len(pool["tableros"])
+
+            if not pool["detenido"]:
+                nuevos = []
+                try:
+                    if ejecutor is None:
+                        nuevos.append(generar_tablero_validado(pool["tamano"], pool["dificultad_minima"],
+                                                               pool["dificultad_maxima"], rng))
+                    else:
+                        # Un lote por proceso, con semillas distintas
+                        futuros = []
+                        for i in range(pool["procesos"]):
+                            cantidad = faltan // pool["procesos"] + (1 if i < faltan % pool["procesos"] else 0)
+                            if cantidad > 0:
+                                futuros.append(ejecutor.submit(
+                                    generar_lote_tableros, pool["tamano"], pool["dificultad_minima"],
+                                    pool["dificultad_maxima"], cantidad, rng.getrandbits(64)
+                                ))
+                        for futuro in futuros:
+                            nuevos.extend(futuro.result())
+                except Exception as e:
+                    print(f"⚠️ Error al generar tableros del minijuego: {e}")
+                    if ejecutor is not None:
+                        # Un proceso caído deja el ejecutor inutilizable: se crea otro
+                        ejecutor.shutdown(wait=False, cancel_futures=True)
+                        ejecutor = ProcessPoolExecutor(max_workers=pool["procesos"])
+                    with pool["condicion"]:
+                        pool["errores"] += 1
+                        pool["condicion"].wait(ESPERA_REINTENTO_POOL_TABLEROS)
+
+                with pool["condicion"]:
+                    for estado, descartados in nuevos:
+                        pool["tableros"].append(estado)
+                        contar_tablero(pool, estado, descartados)
+                    pool["condicion"].notify_all()
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown(wait=False, cancel_futures=True)
+
+    return None
+
+
+# =============================================================================
+# TOMAR_TABLERO
+# =============================================================================
+# Descripción: Saca un tablero listo del pool y avisa al hilo que lo
+#              reponga. Si no hay ninguno listo lo genera en el momento
+#
+# Uso en Pygame: Minijuego.iniciar_nuevo_juego (entrar o reintentar)
+#
+# Parámetros:
+#   - pool (dict): Pool de tableros
+#
+# Retorna:
+#   - dict: Estado del minijuego (inicializar_estado_minijuego) con "dificultad"
+#
+# Ejemplo de uso:
+#   estado = tomar_tablero(pool)
+#   matriz = estado["matriz"]
+# =============================================================================
+def tomar_tablero(pool: dict) -> dict:
+    """Toma un tablero listo del pool (o lo genera si está vacío)."""
+    estado = None
+    with pool["condicion"]:
+        if pool["tableros"]:
+            estado = pool["tableros"].popleft()
+        pool["condicion"].notify_all()
+
+    if estado is None:
+        estado, descartados = generar_tablero_validado(pool["tamano"], pool["dificultad_minima"], pool["dificultad_maxima"])
+        with pool["condicion"]:
+            contar_tablero(pool, estado, descartados)
+    return estado
+
+
+def contar_tablero(pool: dict, estado: dict, descartados: int) -> None:
+    """Suma un tablero generado a los contadores del pool (con la condición tomada)."""
+    pool["generados"] += descartados + 1
+    pool["descartados"] += descartados
+    if not estado["en_banda"]:
+        pool["fuera_de_banda"] += 1
+    return None
+
+
+def detener_pool_tableros(pool: dict) -> None:
+    """Detiene el hilo de recarga del pool (los tableros listos se descartan)."""
+    with pool["condicion"]:
+        pool["detenido"] = True
+        pool["tableros"].clear()
+        pool["condicion"].notify_all()
+    return None
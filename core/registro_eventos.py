@@ -0,0 +1,248 @@
+# =============================================================================
+# REGISTRO DE EVENTOS DE UNA PARTIDA
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Cada partida arma en memoria un registro con la semilla de su
+#    generador aleatorio, el estado inicial del jugador (objeto, vidas
+#    extra y filtro de preguntas vistas) y la secuencia de eventos: pregunta sorteada, respuesta dada,
+#    buffeo aplicado, objeto consumido, vida extra usada/ganada y fin de
+#    partida. Al terminar se guarda con data/repositorio_eventos y
+#    core/reproduccion_partidas lo puede volver a ejecutar.
+#
+# 📥 IMPORTADO EN:
+#    - ui/Pygame/Estados/Gameplay/gameplay.py - emite los eventos de la partida
+#    - ui/consola/juego_consola.py - emite los eventos de la partida
+#    - core/reproduccion_partidas.py - tipos de evento y generador con semilla
+#
+# 🔗 DEPENDENCIAS:
+#    - random: generador con semilla de la partida
+#    - time, uuid: momento de inicio e id de la partida
+#    - models/filtro_vistas: para serializar_filtro_vistas
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - La misma semilla y el mismo banco sortean las mismas preguntas con
+#      las mismas opciones (el índice se restaura al orden original). El
+#      filtro de vistas cambia qué se sortea (y cuántos números consume el
+#      generador), por eso se guarda tal como estaba al empezar
+#    - Igual se guardan id y orden de opciones de cada pregunta: se puede
+#      reproducir aunque el banco haya cambiado de orden
+#    - Los eventos son dicts simples: el registro se serializa tal cual
+#
+# Estructura:
+#    {
+#        "version": 1,
+#        "id_partida": str,
+#        "modo": "pygame" o "consola",
+#        "usuario": str,
+#        "semilla": int,
+#        "inicio": float,                 # time.time()
+#        "estado_inicial": {"objeto": str o None, "vidas_extra": int,
+#                           "vistas": dict o None},  # serializar_filtro_vistas
+#        "eventos": [{"tipo": str, ...}, ...]
+#    }
+# =============================================================================
+
+import time
+import uuid
+import random
+from models.filtro_vistas import serializar_filtro_vistas
+
+VERSION_REGISTRO_EVENTOS = 1
+
+# Tipos de evento
+EVENTO_PREGUNTA_SORTEADA = "pregunta_sorteada"  # pregunta_id, nivel, opciones
+EVENTO_RESPUESTA_DADA = "respuesta_dada"        # pregunta_id, respuesta, racha, intento, max_intentos, final, es_correcta, puntos
+EVENTO_BUFFEO_APLICADO = "buffeo_aplicado"      # racha, objeto, puntos_buffeo
+EVENTO_OBJETO_CONSUMIDO = "objeto_consumido"    # objeto
+EVENTO_VIDA_EXTRA_USADA = "vida_extra_usada"    # cantidad
+EVENTO_VIDA_EXTRA_GANADA = "vida_extra_ganada"  # cantidad
+EVENTO_FIN_PARTIDA = "fin_partida"              # puntos_totales, respuestas_correctas, total_preguntas, tiempo_total_segundos, merece_objeto
+
+
+def generar_semilla_partida() -> int:
+    """Genera una semilla nueva para el generador de una partida."""
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+def crear_generador_partida(semilla: int):
+    """Crea el generador aleatorio de la partida a partir de su semilla."""
+    return random.Random(semilla)
+
+
+# =============================================================================
+# CREAR_REGISTRO_EVENTOS
+# =============================================================================
+# Descripción: Crea el registro vacío de una partida que empieza
+#
+# Uso en Pygame: Se usa en Gameplay.startup, junto con la sesión de juego
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del jugador
+#   - semilla (int): Semilla del generador de la partida
+#   - objeto (str): Objeto equipado al empezar (o None)
+#   - vidas_extra (int): Vidas extra al empezar
+#   - modo (str): "pygame" o "consola" (cambia cómo se suman los puntos)
+#   - vistas (dict): Filtro de preguntas vistas al empezar (opcional); se
+#                    guarda serializado, antes de agregarle las de la partida
+#
+# Retorna:
+#   - dict: Registro de eventos (ver Estructura)
+#
+# Ejemplo de uso:
+#   registro = crear_registro_eventos("Juan", semilla, "espada", 1, "pygame", sesion["vistas"])
+# =============================================================================
+def crear_registro_eventos(nombre_usuario: str, semilla: int, objeto: str = None,
+                           vidas_extra: int = 0, modo: str = "pygame", vistas: dict = None) -> dict:
+    """Crea el registro de eventos de una partida nueva."""
+    vistas_iniciales = None
+    if vistas is not None:
+        vistas_iniciales = serializar_filtro_vistas(vistas)
+
+    registro = {
+        "version": VERSION_REGISTRO_EVENTOS,
+        "id_partida": uuid.uuid4().hex,
+        "modo": modo,
+        "usuario": nombre_usuario,
+        "semilla": semilla,
+        "inicio": time.time(),
+        "estado_inicial": {"objeto": objeto, "vidas_extra": vidas_extra, "vistas": vistas_iniciales},
+        "eventos": []
+    }
+    return registro
+
+
+def emitir_evento(registro: dict, tipo: str, datos: dict) -> dict:
+    """Agrega un evento al registro y lo retorna."""
+    evento = {"tipo": tipo}
+    evento.update(datos)
+    registro["eventos"].append(evento)
+    return evento
+
+
+def registrar_pregunta_sorteada(registro: dict, pregunta: dict) -> None:
+    """Emite el evento de la pregunta sorteada (id, nivel y orden de opciones)."""
+    emitir_evento(registro, EVENTO_PREGUNTA_SORTEADA, {
+        "pregunta_id": pregunta["id"],
+        "nivel": pregunta["nivel"],
+        "opciones": list(pregunta["opciones"])
+    })
+    return None
+
+
+# =============================================================================
+# REGISTRAR_RESPUESTA_EVENTOS
+# =============================================================================
+# Descripción: Emite la respuesta dada y, si corresponde, el buffeo
+#              aplicado y el objeto consumido por esa respuesta
+#
+# Uso en Pygame: Después de procesar_pregunta_completa
+#
+# Parámetros:
+#   - registro (dict): Registro de eventos
+#   - pregunta (dict): Pregunta respondida
+#   - respuesta (str): Letra elegida
+#   - racha (int): Racha con la que se respondió
+#   - resultado (dict): Resultado de procesar_pregunta_completa
+#   - objeto_antes (str): Objeto disponible antes de responder
+#   - objeto_despues (str): Objeto disponible después de responder
+#   - final (bool): False si al jugador le queda un reintento de la misma
+#                   pregunta (consola); la respuesta final es la que se
+#                   registra en la partida
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   registrar_respuesta_eventos(registro, pregunta, "B", 3, resultado, "armadura", None)
+# =============================================================================
+def registrar_respuesta_eventos(registro: dict, pregunta: dict, respuesta: str, racha: int, resultado: dict,
+                                objeto_antes: str, objeto_despues: str, final: bool = True) -> None:
+    """Emite los eventos de una respuesta."""
+    emitir_evento(registro, EVENTO_RESPUESTA_DADA, {
+        "pregunta_id": pregunta["id"],
+        "respuesta": respuesta,
+        "racha": racha,
+        "intento": resultado.get("numero_intento", 0),
+        "max_intentos": resultado.get("max_intentos", 1),
+        "final": final,
+        "es_correcta": resultado["es_correcta"],
+        "puntos": resultado["puntos"]
+    })
+
+    if resultado.get("puntos_buffeo", 0) > 0:
+        emitir_evento(registro, EVENTO_BUFFEO_APLICADO, {
+            "racha": racha,
+            "objeto": objeto_antes,
+            "puntos_buffeo": resultado["puntos_buffeo"]
+        })
+
+    if objeto_antes is not None and objeto_despues is None:
+        emitir_evento(registro, EVENTO_OBJETO_CONSUMIDO, {"objeto": objeto_antes})
+
+    return None
+
+
+# =============================================================================
+# REGISTRAR_FIN_EVENTOS
+# =============================================================================
+# Descripción: Emite las vidas extra usadas/ganadas y el fin de partida
+#
+# Uso en Pygame: Se usa en Gameplay.terminar_juego
+#
+# Parámetros:
+#   - registro (dict): Registro de eventos
+#   - estadisticas (dict): puntos_totales, respuestas_correctas,
+#                          total_preguntas y tiempo_total_segundos
+#   - vidas_usadas (int): Vidas extra gastadas
+#   - vidas_ganadas (int): Vidas extra ganadas
+#   - merece_objeto (bool): Si la partida ganó un objeto especial
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   registrar_fin_eventos(registro, estadisticas, 1, 2, False)
+# =============================================================================
+def registrar_fin_eventos(registro: dict, estadisticas: dict, vidas_usadas: int,
+                          vidas_ganadas: int, merece_objeto: bool) -> None:
+    """Emite los eventos de cierre de la partida."""
+    if vidas_usadas > 0:
+        emitir_evento(registro, EVENTO_VIDA_EXTRA_USADA, {"cantidad": vidas_usadas})
+    if vidas_ganadas > 0:
+        emitir_evento(registro, EVENTO_VIDA_EXTRA_GANADA, {"cantidad": vidas_ganadas})
+
+    emitir_evento(registro, EVENTO_FIN_PARTIDA, {
+        "puntos_totales": estadisticas["puntos_totales"],
+        "respuestas_correctas": estadisticas["respuestas_correctas"],
+        "total_preguntas": estadisticas["total_preguntas"],
+        "tiempo_total_segundos": estadisticas.get("tiempo_total_segundos", 0),
+        "merece_objeto": merece_objeto
+    })
+    return None
+
+
+# =============================================================================
+# CONTAR_PREGUNTAS_SORTEADAS
+# =============================================================================
+# Descripción: Cuenta cuántas veces salió cada pregunta en los registros
+#
+# Uso en Pygame: Para armar pesos de data/indice_ponderado (favorecer las
+#                preguntas que el jugador vio menos)
+#
+# Parámetros:
+#   - registros (list): Registros de eventos (data/repositorio_eventos)
+#
+# Retorna:
+#   - dict: {pregunta_id: veces sorteada}
+#
+# Ejemplo de uso:
+#   vistas = contar_preguntas_sorteadas(leer_registros_eventos(usuario="Juan"))
+# =============================================================================
+def contar_preguntas_sorteadas(registros: list) -> dict:
+    """Cuenta las veces que se sorteó cada pregunta."""
+    vistas = {}
+    for registro in registros:
+        for evento in registro["eventos"]:
+            if evento["tipo"] == EVENTO_PREGUNTA_SORTEADA:
+                vistas[evento["pregunta_id"]] = vistas.get(evento["pregunta_id"], 0) + 1
+    return vistas
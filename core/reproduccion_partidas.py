@@ -0,0 +1,255 @@
+# =============================================================================
+# REPRODUCCIÓN DE PARTIDAS DESDE SU REGISTRO DE EVENTOS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Vuelve a ejecutar una partida registrada (core/registro_eventos) a
+#    través de la lógica de core/, sin UI: mismas preguntas, mismas
+#    respuestas, mismo estado inicial. Los eventos que produce la
+#    reproducción se comparan con los registrados; cualquier diferencia
+#    indica que cambió la lógica, el banco de preguntas o que hubo un bug.
+#    También reconstruye las estadísticas de los usuarios a partir de los
+#    registros en lugar de Usuarios.json.
+#
+# 📥 IMPORTADO EN:
+#    - benchmarks/reproducir_eventos.py - reproduce y mide el archivo de eventos
+#
+# 🔗 DEPENDENCIAS:
+#    - core/logica_juego: obtener_pregunta_para_nivel, procesar_pregunta_completa, construir_estadisticas_partida,
+#      preparar_indice_juego (mismo índice y orden que la partida original)
+#    - core/logica_preguntas: calcular_racha_actual, determinar_intentos_maximos, contar_errores_totales
+#    - core/logica_buffeos: calcular_vidas_ganadas, cumple_requisitos_objeto
+#    - core/sesion_juego: objetos y preguntas vistas en memoria (nunca toca el almacén de buffs)
+#    - core/registro_eventos: vuelve a emitir los eventos para compararlos
+#    - data/repositorio_usuarios: guardar_estadisticas_usuario (reconstrucción)
+#    - models/registro_respuestas: respuestas de la partida reproducida
+#    - models/filtro_vistas: filtro de vistas guardado en estado_inicial
+#    - config/constantes: para MAX_ERRORES_PERMITIDOS
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Por defecto la pregunta sale del evento (id + orden de opciones); con
+#      regenerar_preguntas=True se vuelve a sortear con la semilla y se
+#      compara también el sorteo
+#    - Pygame y consola suman puntos y vidas distinto: las reglas de cada
+#      modo están en _REGLAS_MODO
+#    - Reproducir no escribe nada salvo en reconstruir_estadisticas, que
+#      escribe en el archivo de usuarios que se le indique
+# =============================================================================
+
+from core.logica_juego import obtener_pregunta_para_nivel, procesar_pregunta_completa, construir_estadisticas_partida, preparar_indice_juego
+from core.logica_preguntas import calcular_racha_actual, determinar_intentos_maximos, contar_errores_totales
+from core.logica_buffeos import calcular_vidas_ganadas, cumple_requisitos_objeto
+from core.sesion_juego import crear_sesion_en_memoria, obtener_objeto_sesion, registrar_pregunta_vista
+from core.registro_eventos import (
+    EVENTO_PREGUNTA_SORTEADA,
+    EVENTO_RESPUESTA_DADA,
+    EVENTO_FIN_PARTIDA,
+    crear_generador_partida,
+    crear_registro_eventos,
+    registrar_pregunta_sorteada,
+    registrar_respuesta_eventos,
+    registrar_fin_eventos
+)
+from data.repositorio_usuarios import guardar_estadisticas_usuario
+from models.registro_respuestas import crear_registro_respuestas, registrar_respuesta
+from models.filtro_vistas import deserializar_filtro_vistas
+from config.constantes import MAX_ERRORES_PERMITIDOS
+
+# Diferencias entre interfaces al cerrar la partida
+_REGLAS_MODO = {
+    # Gameplay: solo las correctas suman, hay vidas extra y el objeto con
+    # que se empezó se consume al terminar (confirmar_sesion_juego)
+    "pygame": {"solo_correctas_suman": True, "vidas_extra": True, "objeto_se_consume_al_final": True},
+    # Consola: suman todas (también las negativas), sin vidas extra, y solo
+    # merece objeto si no le queda uno (verificar_merecimiento_objeto)
+    "consola": {"solo_correctas_suman": False, "vidas_extra": False, "objeto_se_consume_al_final": False}
+}
+
+
+def construir_pregunta_registrada(preguntas: dict, evento: dict) -> dict:
+    """Arma la pregunta de un evento: datos del banco + orden registrado."""
+    pregunta = {}
+    if evento["pregunta_id"] in preguntas:
+        pregunta = {"id": evento["pregunta_id"]}
+        pregunta.update(preguntas[evento["pregunta_id"]])
+        pregunta["opciones"] = list(evento["opciones"])
+    return pregunta
+
+
+# =============================================================================
+# REPRODUCIR_PARTIDA
+# =============================================================================
+# Descripción: Vuelve a ejecutar una partida registrada y compara los
+#              eventos obtenidos con los registrados
+#
+# Uso en Pygame: No se usa (diagnóstico y reconstrucción)
+#
+# Parámetros:
+#   - registro (dict): Registro de eventos de la partida
+#   - preguntas (dict): Banco de preguntas
+#   - regenerar_preguntas (bool): Volver a sortear con la semilla en lugar
+#                                 de tomar la pregunta del evento
+#
+# Retorna:
+#   - dict: {"id_partida", "usuario", "terminada": bool,
+#            "estadisticas": dict (como construir_estadisticas_partida),
+#            "eventos": list (reproducidos), "diferencias": list}
+#
+# Ejemplo de uso:
+#   reproduccion = reproducir_partida(registro, preguntas)
+#   if reproduccion["diferencias"]: ...
+# =============================================================================
+def reproducir_partida(registro: dict, preguntas: dict, regenerar_preguntas: bool = False) -> dict:
+    """Reproduce una partida registrada a través de core/."""
+    usuario = registro["usuario"]
+    reglas = _REGLAS_MODO.get(registro.get("modo", "pygame"), _REGLAS_MODO["pygame"])
+    estado_inicial = registro["estado_inicial"]
+    # Filtro de vistas al empezar (los registros anteriores no lo tienen)
+    vistas = None
+    if estado_inicial.get("vistas") is not None:
+        vistas = deserializar_filtro_vistas(estado_inicial["vistas"])
+    sesion = crear_sesion_en_memoria(usuario, estado_inicial["objeto"], estado_inicial["vidas_extra"], None, vistas)
+    reproducido = crear_registro_eventos(usuario, registro["semilla"], estado_inicial["objeto"],
+                                         estado_inicial["vidas_extra"], registro.get("modo", "pygame"), vistas)
+    respuestas = crear_registro_respuestas()
+    rng = crear_generador_partida(registro["semilla"])
+    # Con el filtro inicial los pesos por categoría son los de la partida original
+    indice = preparar_indice_juego(preguntas, None, vistas) if regenerar_preguntas else None
+
+    diferencias = []
+    pregunta = {}
+    max_intentos = 1
+    puntos_totales = 0
+    puntos_buffeo = 0
+    tiempo_total = 0
+    terminada = False
+
+    for evento in registro["eventos"]:
+        if evento["tipo"] == EVENTO_PREGUNTA_SORTEADA:
+            if regenerar_preguntas:
+                pregunta = obtener_pregunta_para_nivel(preguntas, evento["nivel"], [], indice, rng, sesion["vistas"])
+            else:
+                pregunta = construir_pregunta_registrada(preguntas, evento)
+            if pregunta:
+                registrar_pregunta_sorteada(reproducido, pregunta)
+                # Igual que las interfaces: la pregunta mostrada pasa a vista
+                registrar_pregunta_vista(sesion, pregunta["id"])
+                # Las interfaces calculan los intentos al mostrar la pregunta
+                max_intentos = determinar_intentos_maximos(usuario, sesion)
+            else:
+                diferencias.append(f"pregunta {evento['pregunta_id']} no está en el banco")
+
+        elif evento["tipo"] == EVENTO_RESPUESTA_DADA and pregunta:
+            racha = calcular_racha_actual(respuestas)
+            objeto_antes = obtener_objeto_sesion(sesion)
+            resultado = procesar_pregunta_completa(
+                pregunta, usuario, racha, evento["respuesta"], evento["intento"], max_intentos, sesion
+            )
+            registrar_respuesta_eventos(reproducido, pregunta, evento["respuesta"], racha, resultado,
+                                        objeto_antes, obtener_objeto_sesion(sesion), evento["final"])
+            if evento["final"]:
+                registrar_respuesta(respuestas, resultado)
+                if resultado["es_correcta"] or not reglas["solo_correctas_suman"]:
+                    puntos_totales += resultado["puntos"]
+                puntos_buffeo += resultado.get("puntos_buffeo", 0)
+
+        elif evento["tipo"] == EVENTO_FIN_PARTIDA:
+            terminada = True
+            tiempo_total = evento.get("tiempo_total_segundos", 0)
+
+    estadisticas = construir_estadisticas_partida(respuestas, puntos_totales, puntos_buffeo, tiempo_total)
+
+    if terminada:
+        vidas_usadas = 0
+        vidas_ganadas = 0
+        if reglas["vidas_extra"]:
+            vidas_usadas = max(0, contar_errores_totales(respuestas) - MAX_ERRORES_PERMITIDOS)
+            vidas_ganadas = calcular_vidas_ganadas(puntos_totales)
+        merece_objeto = cumple_requisitos_objeto(estadisticas["respuestas_correctas"], estadisticas["total_preguntas"])
+        if not reglas["objeto_se_consume_al_final"] and obtener_objeto_sesion(sesion) is not None:
+            merece_objeto = False
+        registrar_fin_eventos(reproducido, estadisticas, vidas_usadas, vidas_ganadas, merece_objeto)
+
+    diferencias.extend(comparar_eventos(registro["eventos"], reproducido["eventos"]))
+
+    reproduccion = {
+        "id_partida": registro["id_partida"],
+        "usuario": usuario,
+        "terminada": terminada,
+        "estadisticas": estadisticas,
+        "eventos": reproducido["eventos"],
+        "diferencias": diferencias
+    }
+    return reproduccion
+
+
+# =============================================================================
+# COMPARAR_EVENTOS
+# =============================================================================
+# Descripción: Compara dos secuencias de eventos posición por posición
+#
+# Uso en Pygame: No se usa
+#
+# Parámetros:
+#   - registrados (list): Eventos del registro original
+#   - reproducidos (list): Eventos de la reproducción
+#
+# Retorna:
+#   - list: Mensajes con cada diferencia (vacía si coinciden)
+#
+# Ejemplo de uso:
+#   diferencias = comparar_eventos(registro["eventos"], reproduccion["eventos"])
+# =============================================================================
+def comparar_eventos(registrados: list, reproducidos: list) -> list:
+    """Lista las diferencias entre los eventos registrados y reproducidos."""
+    diferencias = []
+    i = 0
+    while i < len(registrados) and i < len(reproducidos):
+        if registrados[i] != reproducidos[i]:
+            diferencias.append(f"evento {i}: registrado {registrados[i]} / reproducido {reproducidos[i]}")
+        i += 1
+
+    if len(registrados) != len(reproducidos):
+        diferencias.append(f"cantidad de eventos: registrados {len(registrados)} / reproducidos {len(reproducidos)}")
+
+    return diferencias
+
+
+# =============================================================================
+# RECONSTRUIR_ESTADISTICAS
+# =============================================================================
+# Descripción: Reproduce partidas terminadas y guarda sus estadísticas en
+#              un archivo de usuarios (normalmente uno nuevo), en el orden
+#              en que se jugaron
+#
+# Uso en Pygame: No se usa (recuperación de Usuarios.json)
+#
+# Parámetros:
+#   - registros (list): Registros de eventos (data/repositorio_eventos)
+#   - preguntas (dict): Banco de preguntas
+#   - archivo_usuarios (str): Archivo de usuarios donde guardar
+#
+# Retorna:
+#   - dict: {"partidas": int, "con_diferencias": int, "sin_terminar": int,
+#            "sin_guardar": int} ("sin_guardar": el bloqueo del archivo de
+#            usuarios no se obtuvo a tiempo)
+#
+# Ejemplo de uso:
+#   resumen = reconstruir_estadisticas(leer_registros_eventos(), preguntas, "Usuarios_reconstruido.json")
+# =============================================================================
+def reconstruir_estadisticas(registros: list, preguntas: dict, archivo_usuarios: str) -> dict:
+    """Reconstruye las estadísticas de los usuarios desde los eventos."""
+    resumen = {"partidas": 0, "con_diferencias": 0, "sin_terminar": 0, "sin_guardar": 0}
+
+    for registro in registros:
+        reproduccion = reproducir_partida(registro, preguntas)
+        if not reproduccion["terminada"]:
+            resumen["sin_terminar"] += 1
+        else:
+            if reproduccion["diferencias"]:
+                resumen["con_diferencias"] += 1
+            if guardar_estadisticas_usuario(reproduccion["usuario"], reproduccion["estadisticas"], archivo_usuarios):
+                resumen["partidas"] += 1
+            else:
+                resumen["sin_guardar"] += 1
+
+    return resumen
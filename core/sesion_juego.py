@@ -0,0 +1,237 @@
+# =============================================================================
+# SESIÓN DE JUEGO EN MEMORIA
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Foto del estado de buffs del jugador (objeto equipado, vidas extra y
+#    filtro de preguntas vistas) tomada al empezar la partida. Durante la
+#    partida los objetos se consumen y las preguntas se marcan como vistas
+#    sobre la sesión, sin tocar el almacén de buffs ni el disco, y al
+#    terminar se confirma todo junto en una sola transacción.
+#
+# 📥 IMPORTADO EN:
+#    - core/logica_buffeos.py - para consultar/consumir el objeto de la sesión
+#    - ui/Pygame/Estados/Gameplay/gameplay.py - crea y confirma la sesión
+#    - ui/consola/juego_consola.py - filtro de preguntas vistas
+#    - core/simulador_partidas.py - sesiones en memoria para partidas simuladas
+#    - core/reproduccion_partidas.py - sesiones en memoria para partidas reproducidas
+#
+# 🔗 DEPENDENCIAS:
+#    - data/estado_buff: lectura inicial y transacción de confirmación
+#    - models/filtro_vistas: preguntas vistas en partidas anteriores
+#    - config/constantes: para MAX_VIDAS_EXTRA
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Antes cada respuesta consultaba el objeto 4-6 veces (armadura,
+#      buffeo, raciones/bolsa, reintento, intentos máximos) y el HUD una vez
+#      por frame; ahora todo eso lee un diccionario
+#    - La sesión es un dict, como el resto de los modelos del juego
+#    - Las vidas se confirman como diferencia (usadas/ganadas) sobre el valor
+#      actual del disco, no pisando lo que haya cambiado otro proceso
+#    - El filtro de vistas se guarda en la clave "preguntas_vistas" del
+#      jugador; las sesiones armadas en memoria (simulación, reproducción)
+#      no tienen filtro: vistas = None
+#
+# Estructura:
+#    {
+#        "nombre_usuario": str,
+#        "estado_path": str o None,
+#        "objeto": str o None,          # objeto disponible ahora
+#        "objeto_inicial": str o None,  # objeto con el que empezó
+#        "vidas_extra_iniciales": int,
+#        "vistas": dict o None          # models/filtro_vistas
+#    }
+# =============================================================================
+
+from data.estado_buff import obtener_estado_usuario_buff, actualizar_estado_usuario_buff, transaccion_estado_buff
+from data.bloqueo_archivos import BloqueoNoDisponibleError
+from models.filtro_vistas import agregar_vista, serializar_filtro_vistas, deserializar_filtro_vistas
+from config.constantes import MAX_VIDAS_EXTRA
+
+
+# =============================================================================
+# CREAR_SESION_JUEGO
+# =============================================================================
+# Descripción: Toma la foto del objeto equipado, las vidas extra y el
+#              filtro de preguntas vistas del jugador
+#
+# Uso en Pygame: Se llama una vez en Gameplay.startup
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - estado_path (str): Ruta al archivo de estado (default: RUTA_ESTADO_BUFF)
+#
+# Retorna:
+#   - dict: Sesión (ver Estructura)
+#
+# Ejemplo de uso:
+#   sesion = crear_sesion_juego("Juan")
+# =============================================================================
+def crear_sesion_juego(nombre_usuario: str, estado_path: str = None) -> dict:
+    """Crea la sesión con el objeto equipado y las vidas extra actuales."""
+    estado_usuario = obtener_estado_usuario_buff(nombre_usuario, estado_path)
+
+    objeto = None
+    if "objeto_excepcional" in estado_usuario:
+        objeto = estado_usuario["objeto_excepcional"]
+
+    vidas_extra = 0
+    if "vidas_extra" in estado_usuario:
+        vidas_extra = estado_usuario["vidas_extra"]
+
+    vistas = deserializar_filtro_vistas(estado_usuario.get("preguntas_vistas"))
+
+    sesion = crear_sesion_en_memoria(nombre_usuario, objeto, vidas_extra, estado_path, vistas)
+    return sesion
+
+
+def crear_sesion_en_memoria(nombre_usuario: str, objeto: str, vidas_extra: int, estado_path: str = None,
+                            vistas: dict = None) -> dict:
+    """Arma la sesión con valores dados (sin leer el almacén de buffs)."""
+    sesion = {
+        "nombre_usuario": nombre_usuario,
+        "estado_path": estado_path,
+        "objeto": objeto,
+        "objeto_inicial": objeto,
+        "vidas_extra_iniciales": vidas_extra,
+        "vistas": vistas
+    }
+    return sesion
+
+
+def registrar_pregunta_vista(sesion: dict, pregunta_id) -> None:
+    """Marca una pregunta como vista en el filtro de la sesión (si tiene)."""
+    if sesion["vistas"] is not None:
+        agregar_vista(sesion["vistas"], pregunta_id)
+    return None
+
+
+# =============================================================================
+# CARGAR_FILTRO_VISTAS / GUARDAR_FILTRO_VISTAS
+# =============================================================================
+# Descripción: Leen y escriben solo el filtro de preguntas vistas de un
+#              jugador, para la interfaz de consola (que no usa sesión)
+#
+# Ejemplo de uso:
+#   vistas = cargar_filtro_vistas("Juan")
+#   guardar_filtro_vistas("Juan", vistas)
+# =============================================================================
+def cargar_filtro_vistas(nombre_usuario: str, estado_path: str = None) -> dict:
+    """Lee el filtro de preguntas vistas del jugador."""
+    estado_usuario = obtener_estado_usuario_buff(nombre_usuario, estado_path)
+    return deserializar_filtro_vistas(estado_usuario.get("preguntas_vistas"))
+
+
+def guardar_filtro_vistas(nombre_usuario: str, vistas: dict, estado_path: str = None) -> None:
+    """Guarda el filtro de preguntas vistas del jugador."""
+    actualizar_estado_usuario_buff(nombre_usuario, {"preguntas_vistas": serializar_filtro_vistas(vistas)}, None, estado_path)
+    return None
+
+
+# =============================================================================
+# OBTENER_OBJETO_SESION
+# =============================================================================
+# Descripción: Objeto que el jugador tiene disponible en este momento
+#
+# Uso en Pygame: Respuestas, buffeo y HUD (sin acceso a disco)
+#
+# Parámetros:
+#   - sesion (dict): Sesión de juego
+#
+# Retorna:
+#   - str: Tipo de objeto o None
+#
+# Ejemplo de uso:
+#   objeto = obtener_objeto_sesion(sesion)
+# =============================================================================
+def obtener_objeto_sesion(sesion: dict) -> str:
+    """Retorna el objeto disponible en la sesión."""
+    return sesion["objeto"]
+
+
+# =============================================================================
+# CONSUMIR_OBJETO_SESION
+# =============================================================================
+# Descripción: Marca el objeto como usado dentro de la partida
+#
+# Uso en Pygame: Armadura, raciones y bolsa de monedas al activarse
+#
+# Parámetros:
+#   - sesion (dict): Sesión de juego (se modifica)
+#
+# Retorna:
+#   - bool: True si había un objeto para consumir
+#
+# Ejemplo de uso:
+#   consumido = consumir_objeto_sesion(sesion)
+# =============================================================================
+def consumir_objeto_sesion(sesion: dict) -> bool:
+    """Marca el objeto de la sesión como consumido."""
+    consumido = sesion["objeto"] is not None
+    sesion["objeto"] = None
+    return consumido
+
+
+# =============================================================================
+# CONFIRMAR_SESION_JUEGO
+# =============================================================================
+# Descripción: Escribe el resultado de la partida en el estado de buffs:
+#              quita el objeto con el que se empezó, aplica vidas usadas y
+#              ganadas y guarda el filtro de vistas, todo en una sola
+#              transacción
+#
+# Uso en Pygame: Se llama una vez en Gameplay.terminar_juego
+#
+# Parámetros:
+#   - sesion (dict): Sesión de juego
+#   - vidas_usadas (int): Vidas extra gastadas en la partida
+#   - vidas_ganadas (int): Vidas extra ganadas por puntos
+#
+# Retorna:
+#   - dict: {"objeto_consumido": str o None, "vidas_extra": int,
+#            "guardado": bool}. Si no se obtuvo el bloqueo del estado de
+#           buffs a tiempo, "guardado" es False, no se escribe nada y
+#           "vidas_extra" se calcula con las vidas del inicio de la partida
+#
+# Ejemplo de uso:
+#   confirmacion = confirmar_sesion_juego(sesion, 1, 2)
+# =============================================================================
+def confirmar_sesion_juego(sesion: dict, vidas_usadas: int, vidas_ganadas: int) -> dict:
+    """Confirma objeto y vidas de la partida en una sola transacción."""
+    nombre_usuario = sesion["nombre_usuario"]
+    estado_path = sesion["estado_path"]
+
+    guardado = True
+    try:
+        with transaccion_estado_buff(estado_path):
+            estado_usuario = obtener_estado_usuario_buff(nombre_usuario, estado_path)
+            vidas_extra = 0
+            if "vidas_extra" in estado_usuario:
+                vidas_extra = estado_usuario["vidas_extra"]
+            vidas_extra = calcular_vidas_confirmadas(vidas_extra, vidas_usadas, vidas_ganadas)
+
+            cambios = {}
+            claves_a_eliminar = []
+            if sesion["objeto_inicial"] is not None:
+                claves_a_eliminar.append("objeto_excepcional")
+            if vidas_usadas > 0 or vidas_ganadas > 0 or claves_a_eliminar:
+                cambios["vidas_extra"] = vidas_extra
+            if sesion["vistas"] is not None:
+                cambios["preguntas_vistas"] = serializar_filtro_vistas(sesion["vistas"])
+
+            if cambios or claves_a_eliminar:
+                actualizar_estado_usuario_buff(nombre_usuario, cambios, claves_a_eliminar, estado_path)
+    except BloqueoNoDisponibleError as e:
+        print(f"❌ No se guardaron los buffs de {nombre_usuario}: {e}")
+        guardado = False
+        vidas_extra = calcular_vidas_confirmadas(sesion["vidas_extra_iniciales"], vidas_usadas, vidas_ganadas)
+
+    sesion["objeto"] = None
+    return {"objeto_consumido": sesion["objeto_inicial"], "vidas_extra": vidas_extra, "guardado": guardado}
+
+
+def calcular_vidas_confirmadas(vidas_extra: int, vidas_usadas: int, vidas_ganadas: int) -> int:
+    """Aplica las vidas usadas y ganadas con el tope MAX_VIDAS_EXTRA."""
+    # Mismo orden que antes: primero se restan las usadas, después se suman
+    # las ganadas con el tope MAX_VIDAS_EXTRA
+    vidas_extra = max(0, vidas_extra - vidas_usadas)
+    return min(MAX_VIDAS_EXTRA, vidas_extra + vidas_ganadas)
@@ -0,0 +1,492 @@
+# =============================================================================
+# SIMULADOR DE PARTIDAS (MONTE CARLO)
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Juega partidas completas sin UI con un "jugador modelo" que acierta con
+#    cierta probabilidad, usando la misma lógica que el juego real
+#    (procesar_pregunta_completa, buffeos, objetos, vidas extra y
+#    PREGUNTAS_POR_NIVEL). Todo ocurre en memoria: no se escribe ningún
+#    archivo. Los bloques de partidas se reparten entre procesos y se
+#    devuelven como histogramas (puntos, vidas ganadas, vidas acumuladas,
+#    objetos merecidos) para ajustar PUNTOS_BUFFEO_POR_RACHA y
+#    PUNTOS_POR_VIDA_EXTRA con datos en lugar de a mano.
+#
+# 📥 IMPORTADO EN:
+#    - benchmarks/simular_balance.py - reporte de distribuciones
+#
+# 🔗 DEPENDENCIAS:
+#    - random: jugador modelo y selección de preguntas (con semilla)
+#    - concurrent.futures: bloques de partidas en varios procesos
+#    - core/logica_juego: para obtener_pregunta_para_nivel, procesar_pregunta_completa, preparar_indice_juego
+#    - core/logica_preguntas: para calcular_racha_actual, determinar_intentos_maximos, contar_errores_totales
+#    - core/logica_buffeos: para calcular_vidas_ganadas, cumple_requisitos_objeto
+#    - core/sesion_juego: objeto de la partida en memoria
+#    - models/registro_respuestas: racha y errores en O(1)
+#    - config/constantes: niveles, errores, vidas y objetos
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Las partidas siguen el flujo de Gameplay: un intento por pregunta,
+#      fin por errores (MAX_ERRORES_PERMITIDOS + vidas extra) o por niveles
+#    - Un jugador puede jugar varias partidas seguidas arrastrando vidas y
+#      objeto, como pasa entre partidas reales
+#    - Cada bloque tiene su semilla: la misma simulación da el mismo
+#      resultado con 1 o con N procesos
+#    - Los procesos devuelven histogramas (no partidas): se fusionan
+#      sumando conteos y el tráfico entre procesos es mínimo
+#    - Los modelos de jugador son funciones en un diccionario: agregar uno
+#      nuevo es registrar_modelo_jugador(tipo, funcion)
+#
+# Estructura:
+#    modelo = {"tipo": "fijo", "acierto": 0.7}
+#    modelo = {"tipo": "por_dificultad", "acierto": {1: 0.9, 2: 0.7, 3: 0.5}}
+#    (opcional "objeto_preferido": "espada"; si no, elige uno al azar)
+#
+#    configuracion = {"puntos_buffeo_por_racha": {3: 1, 5: 3, 7: 5},
+#                     "puntos_por_vida_extra": 30}   (claves opcionales)
+#
+#    resumen = {
+#        "partidas": int, "game_over": int, "objetos_merecidos": int,
+#        "puntos": {valor: cantidad}, "vidas_ganadas": {...},
+#        "vidas_extra": {...}, "preguntas": {...},
+#        "objetos_usados": {objeto: cantidad}
+#    }
+# =============================================================================
+
+import os
+import random
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+import config.constantes as constantes
+from core.logica_juego import obtener_pregunta_para_nivel, procesar_pregunta_completa, preparar_indice_juego
+from core.logica_preguntas import calcular_racha_actual, determinar_intentos_maximos, contar_errores_totales
+from core.logica_buffeos import calcular_vidas_ganadas, cumple_requisitos_objeto
+from core.sesion_juego import crear_sesion_en_memoria
+from models.registro_respuestas import crear_registro_respuestas, registrar_respuesta
+from config.constantes import PREGUNTAS_POR_NIVEL, MAX_ERRORES_PERMITIDOS, OBJETOS_ESPECIALES
+
+# Nombre usado en las sesiones simuladas (nunca se consulta el almacén)
+NOMBRE_JUGADOR_SIMULADO = "__simulado__"
+
+# Partidas por bloque de trabajo (unidad que se manda a cada proceso)
+PARTIDAS_POR_BLOQUE = 20000
+
+# Banco de preguntas del proceso (lo fija iniciar_trabajador_simulacion)
+_preguntas_simulacion = {}
+
+
+def probabilidad_fija(modelo: dict, pregunta: dict) -> float:
+    """Modelo 'fijo': misma probabilidad de acierto para toda pregunta."""
+    return modelo["acierto"]
+
+
+def probabilidad_por_dificultad(modelo: dict, pregunta: dict) -> float:
+    """Modelo 'por_dificultad': probabilidad según la dificultad."""
+    return modelo["acierto"].get(pregunta["dificultad"], 0.0)
+
+
+# Modelos de jugador disponibles: {tipo: funcion(modelo, pregunta) -> float}
+_modelos_jugador = {
+    "fijo": probabilidad_fija,
+    "por_dificultad": probabilidad_por_dificultad
+}
+
+
+# =============================================================================
+# REGISTRAR_MODELO_JUGADOR
+# =============================================================================
+# Descripción: Agrega un modelo de jugador nuevo
+#
+# Uso en Pygame: No se usa (herramienta de balance)
+#
+# Parámetros:
+#   - tipo (str): Nombre del modelo (clave "tipo" del dict de modelo)
+#   - funcion: funcion(modelo, pregunta) -> probabilidad de acierto. Tiene
+#              que ser de nivel de módulo y registrarse al importar su
+#              módulo para que exista también en los otros procesos
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   registrar_modelo_jugador("por_nivel", probabilidad_por_nivel)
+# =============================================================================
+def registrar_modelo_jugador(tipo: str, funcion) -> None:
+    """Agrega un modelo de jugador al simulador."""
+    _modelos_jugador[tipo] = funcion
+    return None
+
+
+# =============================================================================
+# ELEGIR_RESPUESTA_SIMULADA
+# =============================================================================
+# Descripción: Elige la letra que responde el jugador modelo: la correcta
+#              con la probabilidad del modelo, si no una incorrecta al azar
+#
+# Uso en Pygame: No se usa
+#
+# Parámetros:
+#   - modelo (dict): Modelo de jugador (ver Estructura)
+#   - pregunta (dict): Pregunta con opciones ya mezcladas
+#   - rng (random.Random): Generador del bloque
+#
+# Retorna:
+#   - str: Letra elegida ("A", "B", ...)
+#
+# Ejemplo de uso:
+#   letra = elegir_respuesta_simulada({"tipo": "fijo", "acierto": 0.7}, pregunta, rng)
+# =============================================================================
+def elegir_respuesta_simulada(modelo: dict, pregunta: dict, rng) -> str:
+    """Elige la respuesta del jugador modelo."""
+    opciones = pregunta["opciones"]
+    indice_correcta = opciones.index(pregunta["correcta"])
+    probabilidad = _modelos_jugador[modelo["tipo"]](modelo, pregunta)
+
+    indice = indice_correcta
+    if rng.random() >= probabilidad and len(opciones) > 1:
+        indice = rng.randrange(len(opciones) - 1)
+        if indice >= indice_correcta:
+            indice += 1
+
+    return chr(ord("A") + indice)
+
+
+# =============================================================================
+# SIMULAR_PARTIDA
+# =============================================================================
+# Descripción: Juega una partida completa igual que Gameplay, en memoria
+#
+# Uso en Pygame: No se usa
+#
+# Parámetros:
+#   - preguntas (dict): Banco de preguntas
+#   - modelo (dict): Modelo de jugador
+#   - objeto (str): Objeto con que empieza la partida (o None)
+#   - vidas_extra (int): Vidas extra con que empieza
+#   - rng (random.Random): Generador del bloque (preguntas y respuestas)
+#   - indice (dict): Índice de preguntas ya preparado para esta partida
+#                    (opcional; sin él se prepara uno propio)
+#
+# Retorna:
+#   - dict: {"puntos", "correctas", "preguntas", "errores", "game_over",
+#            "vidas_usadas", "vidas_ganadas", "merece_objeto", "objeto_usado"}
+#
+# Ejemplo de uso:
+#   partida = simular_partida(preguntas, modelo, None, 0, random.Random(1))
+# =============================================================================
+def simular_partida(preguntas: dict, modelo: dict, objeto: str, vidas_extra: int, rng, indice: dict = None) -> dict:
+    """Juega una partida completa con el jugador modelo."""
+    sesion = crear_sesion_en_memoria(NOMBRE_JUGADOR_SIMULADO, objeto, vidas_extra)
+    if indice is None:
+        indice = preparar_indice_juego(preguntas)
+    registro = crear_registro_respuestas()
+    max_errores = MAX_ERRORES_PERMITIDOS + vidas_extra
+    puntos_totales = 0
+    game_over = False
+    sin_preguntas = False
+
+    nivel = 1
+    while nivel <= 3 and not game_over and not sin_preguntas:
+        numero = 0
+        while numero < PREGUNTAS_POR_NIVEL.get(nivel, 0) and not game_over and not sin_preguntas:
+            pregunta = obtener_pregunta_para_nivel(preguntas, nivel, [], indice, rng)
+            if not pregunta:
+                sin_preguntas = True
+            else:
+                letra = elegir_respuesta_simulada(modelo, pregunta, rng)
+                resultado = procesar_pregunta_completa(
+                    pregunta,
+                    NOMBRE_JUGADOR_SIMULADO,
+                    calcular_racha_actual(registro),
+                    letra,
+                    0,
+                    determinar_intentos_maximos(NOMBRE_JUGADOR_SIMULADO, sesion),
+                    sesion
+                )
+                registrar_respuesta(registro, resultado)
+
+                # Igual que Gameplay: solo las correctas suman al total
+                if resultado["es_correcta"]:
+                    puntos_totales += resultado["puntos"]
+
+                game_over = contar_errores_totales(registro) >= max_errores
+                numero += 1
+        nivel += 1
+
+    errores = contar_errores_totales(registro)
+    total_preguntas = len(registro["respuestas"])
+    objeto_usado = None
+    if objeto is not None and sesion["objeto"] is None:
+        objeto_usado = objeto
+
+    partida = {
+        "puntos": puntos_totales,
+        "correctas": registro["correctas"],
+        "preguntas": total_preguntas,
+        "errores": errores,
+        "game_over": game_over,
+        "vidas_usadas": max(0, errores - MAX_ERRORES_PERMITIDOS),
+        "vidas_ganadas": calcular_vidas_ganadas(puntos_totales),
+        "merece_objeto": cumple_requisitos_objeto(registro["correctas"], total_preguntas),
+        "objeto_usado": objeto_usado
+    }
+    return partida
+
+
+def crear_resumen_vacio() -> dict:
+    """Crea un resumen de simulación sin partidas."""
+    resumen = {
+        "partidas": 0,
+        "game_over": 0,
+        "objetos_merecidos": 0,
+        "puntos": {},
+        "vidas_ganadas": {},
+        "vidas_extra": {},
+        "preguntas": {},
+        "objetos_usados": {}
+    }
+    return resumen
+
+
+def sumar_histograma(histograma: dict, valor, cantidad: int = 1) -> None:
+    """Suma 'cantidad' apariciones de 'valor' al histograma."""
+    histograma[valor] = histograma.get(valor, 0) + cantidad
+    return None
+
+
+# =============================================================================
+# SIMULAR_BLOQUE
+# =============================================================================
+# Descripción: Simula un bloque de partidas. Los jugadores juegan
+#              'partidas_por_jugador' partidas seguidas: las vidas extra y
+#              el objeto pasan de una partida a la siguiente como en
+#              confirmar_sesion_juego y SeleccionObjeto
+#
+# Uso en Pygame: No se usa (unidad de trabajo de cada proceso)
+#
+# Parámetros:
+#   - bloque (dict): {"partidas", "semilla", "modelo", "configuracion",
+#                     "partidas_por_jugador"}
+#
+# Retorna:
+#   - dict: Resumen del bloque (ver Estructura)
+#
+# Ejemplo de uso:
+#   resumen = simular_bloque({"partidas": 1000, "semilla": 1, "modelo": modelo,
+#                             "configuracion": {}, "partidas_por_jugador": 5})
+# =============================================================================
+def simular_bloque(bloque: dict) -> dict:
+    """Simula un bloque de partidas y devuelve sus histogramas."""
+    # Un solo generador para preguntas y jugador: no toca el estado global de random
+    rng = random.Random(bloque["semilla"])
+    modelo = bloque["modelo"]
+    resumen = crear_resumen_vacio()
+
+    with configuracion_simulacion(bloque["configuracion"]):
+        # Un índice propio del bloque, restaurado en O(U) antes de cada partida
+        indice = None
+        jugadas = 0
+        while jugadas < bloque["partidas"]:
+            objeto = None
+            vidas_extra = 0
+            seguidas = 0
+            while seguidas < bloque["partidas_por_jugador"] and jugadas < bloque["partidas"]:
+                indice = preparar_indice_juego(_preguntas_simulacion, indice)
+                partida = simular_partida(_preguntas_simulacion, modelo, objeto, vidas_extra, rng, indice)
+
+                # Fin de partida: mismo orden que confirmar_sesion_juego
+                vidas_extra = max(0, vidas_extra - partida["vidas_usadas"])
+                vidas_extra = min(constantes.MAX_VIDAS_EXTRA, vidas_extra + partida["vidas_ganadas"])
+                objeto = None
+                if partida["merece_objeto"]:
+                    objeto = modelo.get("objeto_preferido") or rng.choice(list(OBJETOS_ESPECIALES))
+                    resumen["objetos_merecidos"] += 1
+
+                resumen["partidas"] += 1
+                if partida["game_over"]:
+                    resumen["game_over"] += 1
+                sumar_histograma(resumen["puntos"], partida["puntos"])
+                sumar_histograma(resumen["vidas_ganadas"], partida["vidas_ganadas"])
+                sumar_histograma(resumen["vidas_extra"], vidas_extra)
+                sumar_histograma(resumen["preguntas"], partida["preguntas"])
+                if partida["objeto_usado"] is not None:
+                    sumar_histograma(resumen["objetos_usados"], partida["objeto_usado"])
+
+                seguidas += 1
+                jugadas += 1
+
+    return resumen
+
+
+# =============================================================================
+# CONFIGURACION_SIMULACION
+# =============================================================================
+# Descripción: Context manager que cambia las constantes de balance
+#              mientras dura el bloque y después las restaura
+#
+# Uso en Pygame: No se usa
+#
+# Parámetros:
+#   - configuracion (dict): "puntos_buffeo_por_racha" (mismas claves 3, 5
+#                           y 7 que usa calcular_puntos_buffeo) y/o
+#                           "puntos_por_vida_extra"
+#
+# Retorna:
+#   - Context manager (no devuelve valor)
+#
+# Ejemplo de uso:
+#   with configuracion_simulacion({"puntos_por_vida_extra": 25}):
+#       ...
+# =============================================================================
+@contextmanager
+def configuracion_simulacion(configuracion: dict):
+    """Aplica una configuración de balance durante el bloque with."""
+    # El dict se modifica en el lugar: logica_buffeos lo importó por nombre
+    racha_original = dict(constantes.PUNTOS_BUFFEO_POR_RACHA)
+    vida_original = constantes.PUNTOS_POR_VIDA_EXTRA
+
+    if "puntos_buffeo_por_racha" in configuracion:
+        constantes.PUNTOS_BUFFEO_POR_RACHA.update(configuracion["puntos_buffeo_por_racha"])
+    if "puntos_por_vida_extra" in configuracion:
+        constantes.PUNTOS_POR_VIDA_EXTRA = configuracion["puntos_por_vida_extra"]
+
+    try:
+        yield
+    finally:
+        constantes.PUNTOS_BUFFEO_POR_RACHA.clear()
+        constantes.PUNTOS_BUFFEO_POR_RACHA.update(racha_original)
+        constantes.PUNTOS_POR_VIDA_EXTRA = vida_original
+
+
+def iniciar_trabajador_simulacion(preguntas: dict) -> None:
+    """Fija el banco de preguntas del proceso (initializer del pool)."""
+    global _preguntas_simulacion
+    _preguntas_simulacion = preguntas
+    return None
+
+
+# =============================================================================
+# FUSIONAR_RESUMENES
+# =============================================================================
+# Descripción: Suma dos resúmenes de simulación
+#
+# Uso en Pygame: No se usa
+#
+# Parámetros:
+#   - acumulado (dict): Resumen que se modifica
+#   - resumen (dict): Resumen a sumar
+#
+# Retorna:
+#   - dict: El resumen acumulado
+#
+# Ejemplo de uso:
+#   total = fusionar_resumenes(total, resumen_bloque)
+# =============================================================================
+def fusionar_resumenes(acumulado: dict, resumen: dict) -> dict:
+    """Suma los conteos e histogramas de un resumen al acumulado."""
+    for clave in resumen:
+        if isinstance(resumen[clave], dict):
+            for valor in resumen[clave]:
+                sumar_histograma(acumulado[clave], valor, resumen[clave][valor])
+        else:
+            acumulado[clave] += resumen[clave]
+    return acumulado
+
+
+# =============================================================================
+# SIMULAR_PARTIDAS
+# =============================================================================
+# Descripción: Simula muchas partidas repartidas en bloques y procesos
+#
+# Uso en Pygame: No se usa (ver benchmarks/simular_balance.py)
+#
+# Parámetros:
+#   - preguntas (dict): Banco de preguntas (data/repositorio_preguntas)
+#   - modelo (dict): Modelo de jugador
+#   - partidas (int): Cantidad total de partidas
+#   - configuracion (dict): Constantes de balance a probar (default: las actuales)
+#   - partidas_por_jugador (int): Partidas seguidas de cada jugador
+#   - procesos (int): Procesos a usar (default: os.cpu_count())
+#   - semilla (int): Semilla base (bloque i usa semilla + i)
+#
+# Retorna:
+#   - dict: Resumen de todas las partidas (ver Estructura)
+#
+# Ejemplo de uso:
+#   resumen = simular_partidas(preguntas, {"tipo": "fijo", "acierto": 0.7}, 1000000)
+# =============================================================================
+def simular_partidas(preguntas: dict, modelo: dict, partidas: int, configuracion: dict = None,
+                     partidas_por_jugador: int = 1, procesos: int = None, semilla: int = 0) -> dict:
+    """Simula partidas en varios procesos y devuelve los histogramas."""
+    if configuracion is None:
+        configuracion = {}
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+
+    bloques = []
+    restantes = partidas
+    while restantes > 0:
+        cantidad = min(PARTIDAS_POR_BLOQUE, restantes)
+        bloques.append({
+            "partidas": cantidad,
+            "semilla": semilla + len(bloques),
+            "modelo": modelo,
+            "configuracion": configuracion,
+            "partidas_por_jugador": max(1, partidas_por_jugador)
+        })
+        restantes -= cantidad
+
+    total = crear_resumen_vacio()
+    if procesos > 1 and len(bloques) > 1:
+        with ProcessPoolExecutor(max_workers=min(procesos, len(bloques)),
+                                 initializer=iniciar_trabajador_simulacion,
+                                 initargs=(preguntas,)) as ejecutor:
+            for resumen in ejecutor.map(simular_bloque, bloques):
+                fusionar_resumenes(total, resumen)
+    else:
+        iniciar_trabajador_simulacion(preguntas)
+        for bloque in bloques:
+            fusionar_resumenes(total, simular_bloque(bloque))
+
+    return total
+
+
+# =============================================================================
+# DESCRIBIR_HISTOGRAMA
+# =============================================================================
+# Descripción: Promedio, mínimo, percentiles y máximo de un histograma
+#
+# Uso en Pygame: No se usa
+#
+# Parámetros:
+#   - histograma (dict): {valor: cantidad}
+#
+# Retorna:
+#   - dict: {"promedio", "minimo", "p10", "p50", "p90", "p99", "maximo"}
+#
+# Ejemplo de uso:
+#   descripcion = describir_histograma(resumen["puntos"])
+# =============================================================================
+def describir_histograma(histograma: dict) -> dict:
+    """Calcula promedio y percentiles de un histograma."""
+    valores = sorted(histograma)
+    total = 0
+    suma = 0
+    for valor in valores:
+        total += histograma[valor]
+        suma += valor * histograma[valor]
+
+    descripcion = {"promedio": 0.0, "minimo": 0, "p10": 0, "p50": 0, "p90": 0, "p99": 0, "maximo": 0}
+    if total > 0:
+        descripcion["promedio"] = suma / total
+        descripcion["minimo"] = valores[0]
+        descripcion["maximo"] = valores[-1]
+        percentiles = [("p10", 0.10), ("p50", 0.50), ("p90", 0.90), ("p99", 0.99)]
+        acumulado = 0
+        i = 0
+        for valor in valores:
+            acumulado += histograma[valor]
+            while i < len(percentiles) and acumulado >= percentiles[i][1] * total:
+                descripcion[percentiles[i][0]] = valor
+                i += 1
+
+    return descripcion
@@ -0,0 +1,299 @@
+# =============================================================================
+# SOLUCIONADOR DEL MINIJUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Analiza un tablero de "Guardianes de Piedra" con las reglas de
+#    obtener_movimientos_validos (8 direcciones, solo hacia valores
+#    estrictamente mayores). Como cada movimiento sube de valor, los
+#    movimientos forman un grafo sin ciclos (DAG) y se resuelve con
+#    programación dinámica: desde qué celdas se llega al objetivo, el
+#    camino ganador más corto y el más largo, y cuántas celdas son
+#    callejones sin salida.
+#
+#    También arma el mapa de alcance del tablero (movimientos de cada celda
+#    y si desde ella todavía se llega al objetivo) que la partida consulta
+#    en O(1) por celda.
+#
+# 📥 IMPORTADO EN:
+#    - benchmarks/analizar_tableros.py - dificultad de tableros generados en lote
+#    - core/logica_minijuego.py - crear_mapa_alcance en inicializar_estado_minijuego
+#    - ui/Pygame/Estados/Minijuego.py - consultas al mapa al mover y dibujar
+#
+# 🔗 DEPENDENCIAS:
+#    - Ninguna (recibe la matriz como lista de listas)
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - O(N²): cada celda se visita una vez y tiene a lo sumo 8 movimientos
+#    - Sin recursión: DFS con pila explícita (sirve para tableros grandes)
+#    - El DFS termina cada celda después que todas sus sucesoras: recorrer
+#      las celdas en ese orden (topológico inverso) resuelve la DP
+#    - Al llegar al objetivo la partida termina: sus movimientos no cuentan
+#    - Empates en el camino más corto/largo: gana la primera dirección en el
+#      orden de obtener_movimientos_validos
+#
+# Estructura del análisis:
+#    {
+#        "tamano": int,
+#        "resoluble": bool,                   # se gana desde (0, 0)
+#        "alcanza_objetivo": [[bool, ...]],   # por celda
+#        "camino_mas_corto": [(fila, col)],   # desde (0, 0); [] si no hay
+#        "camino_mas_largo": [(fila, col)],
+#        "celdas_sin_movimientos": int,       # sin ningún movimiento válido
+#        "callejones": int,                   # celdas sin camino al objetivo
+#        "callejones_alcanzables": int,       # ... a las que se llega desde (0, 0)
+#        "celdas_alcanzables": int            # celdas a las que se llega desde (0, 0)
+#    }
+#
+# Estructura del mapa de alcance (celdas como índice fila * N + col):
+#    {
+#        "tamano": int,
+#        "sucesores": [[int, ...], ...],   # movimientos válidos de cada celda
+#        "alcanza_objetivo": [bool, ...]   # si desde la celda se puede ganar
+#    }
+# =============================================================================
+
+# Mismo orden que obtener_movimientos_validos
+DIRECCIONES_MINIJUEGO = [
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1)
+]
+
+
+def calcular_sucesores(matriz: list, fila: int, col: int) -> list:
+    """Celdas (como índice fila * N + col) a las que se puede mover desde (fila, col)."""
+    tamano = len(matriz)
+    valor = matriz[fila][col]
+    sucesores = []
+    for delta_fila, delta_col in DIRECCIONES_MINIJUEGO:
+        nueva_fila = fila + delta_fila
+        nueva_col = col + delta_col
+        if 0 <= nueva_fila < tamano and 0 <= nueva_col < tamano and matriz[nueva_fila][nueva_col] > valor:
+            sucesores.append(nueva_fila * tamano + nueva_col)
+    return sucesores
+
+
+def reconstruir_camino(siguiente: list, tamano: int) -> list:
+    """Sigue 'siguiente' desde (0, 0) hasta el objetivo."""
+    camino = []
+    celda = 0
+    objetivo = tamano * tamano - 1
+    if siguiente[0] >= 0 or objetivo == 0:
+        camino.append((0, 0))
+        while celda != objetivo:
+            celda = siguiente[celda]
+            camino.append((celda // tamano, celda % tamano))
+    return camino
+
+
+# =============================================================================
+# ORDENAR_CELDAS_MINIJUEGO
+# =============================================================================
+# Descripción: Recorre el DAG de movimientos con un DFS iterativo y devuelve
+#              las celdas en orden de terminación: cada celda aparece después
+#              de todas sus sucesoras
+#
+# Uso en Pygame: Se usa internamente (análisis y mapa de alcance)
+#
+# Parámetros:
+#   - matriz (list): Tablero NxN
+#
+# Retorna:
+#   - tuple: (sucesores, orden) con sucesores[celda] = lista de celdas
+#
+# Ejemplo de uso:
+#   sucesores, orden = ordenar_celdas_minijuego(matriz)
+# =============================================================================
+def ordenar_celdas_minijuego(matriz: list) -> tuple:
+    """Sucesores de cada celda y orden topológico inverso del tablero."""
+    tamano = len(matriz)
+    total = tamano * tamano
+    sucesores = [None] * total
+    orden = []
+    estado = [0] * total  # 0 = sin visitar, 1 = en la pila, 2 = terminada
+
+    for raiz in range(total):
+        pila = [raiz]
+        while pila:
+            celda = pila[-1]
+            if estado[celda] == 0:
+                estado[celda] = 1
+                sucesores[celda] = calcular_sucesores(matriz, celda // tamano, celda % tamano)
+                for sucesora in sucesores[celda]:
+                    if estado[sucesora] == 0:
+                        pila.append(sucesora)
+            else:
+                pila.pop()
+                if estado[celda] == 1:
+                    estado[celda] = 2
+                    orden.append(celda)
+
+    return sucesores, orden
+
+
+# =============================================================================
+# CREAR_MAPA_ALCANCE
+# =============================================================================
+# Descripción: Arma el mapa de alcance del tablero: movimientos válidos de
+#              cada celda y si desde ella todavía se llega al objetivo
+#
+# Uso en Pygame: Una vez por tablero, en inicializar_estado_minijuego; al
+#                mover y al dibujar solo se consulta
+#
+# Parámetros:
+#   - matriz (list): Tablero NxN
+#
+# Retorna:
+#   - dict: Mapa de alcance (ver Estructura del mapa de alcance)
+#
+# Ejemplo de uso:
+#   mapa = crear_mapa_alcance(matriz)
+# =============================================================================
+def crear_mapa_alcance(matriz: list) -> dict:
+    """Precalcula movimientos y alcance al objetivo de cada celda."""
+    tamano = len(matriz)
+    objetivo = tamano * tamano - 1
+    sucesores, orden = ordenar_celdas_minijuego(matriz)
+
+    alcanza = [False] * len(orden)
+    for celda in orden:
+        if celda == objetivo:
+            alcanza[celda] = True
+        else:
+            for sucesora in sucesores[celda]:
+                if alcanza[sucesora]:
+                    alcanza[celda] = True
+                    break
+
+    mapa = {
+        "tamano": tamano,
+        "sucesores": sucesores,
+        "alcanza_objetivo": alcanza
+    }
+    return mapa
+
+
+def es_movimiento_legal(mapa: dict, desde: tuple, hacia: tuple) -> bool:
+    """Indica si se puede mover de 'desde' a 'hacia' (a lo sumo 8 comparaciones)."""
+    tamano = mapa["tamano"]
+    return hacia[0] * tamano + hacia[1] in mapa["sucesores"][desde[0] * tamano + desde[1]]
+
+
+def tiene_movimientos(mapa: dict, pos: tuple) -> bool:
+    """Indica si desde 'pos' queda algún movimiento válido."""
+    return len(mapa["sucesores"][pos[0] * mapa["tamano"] + pos[1]]) > 0
+
+
+def lleva_al_objetivo(mapa: dict, pos: tuple) -> bool:
+    """Indica si desde 'pos' todavía se puede llegar al objetivo."""
+    return mapa["alcanza_objetivo"][pos[0] * mapa["tamano"] + pos[1]]
+
+
+# =============================================================================
+# ANALIZAR_TABLERO_MINIJUEGO
+# =============================================================================
+# Descripción: Resuelve el tablero con DP sobre el DAG de movimientos
+#              crecientes
+#
+# Uso en Pygame: No se usa en la partida (análisis de tableros)
+#
+# Parámetros:
+#   - matriz (list): Tablero NxN (lista de listas de int)
+#
+# Retorna:
+#   - dict: Análisis (ver Estructura del análisis)
+#
+# Ejemplo de uso:
+#   analisis = analizar_tablero_minijuego(generar_matriz_resoluble(5))
+#   if analisis["resoluble"]: ...
+# =============================================================================
+def analizar_tablero_minijuego(matriz: list) -> dict:
+    """Analiza alcanzabilidad, caminos ganadores y callejones del tablero."""
+    tamano = len(matriz)
+    total = tamano * tamano
+    objetivo = total - 1
+
+    sucesores, orden = ordenar_celdas_minijuego(matriz)
+    alcanza = [False] * total
+    mas_corto = [0] * total
+    mas_largo = [0] * total
+    siguiente_corto = [-1] * total
+    siguiente_largo = [-1] * total
+
+    # Cada celda después de sus sucesoras: la DP ya tiene todo lo que necesita
+    for celda in orden:
+        if celda == objetivo:
+            alcanza[celda] = True
+        else:
+            for sucesora in sucesores[celda]:
+                if alcanza[sucesora]:
+                    if not alcanza[celda] or mas_corto[sucesora] + 1 < mas_corto[celda]:
+                        mas_corto[celda] = mas_corto[sucesora] + 1
+                        siguiente_corto[celda] = sucesora
+                    if not alcanza[celda] or mas_largo[sucesora] + 1 > mas_largo[celda]:
+                        mas_largo[celda] = mas_largo[sucesora] + 1
+                        siguiente_largo[celda] = sucesora
+                    alcanza[celda] = True
+
+    # Celdas a las que llega el jugador desde (0, 0)
+    alcanzable = [False] * total
+    alcanzable[0] = True
+    pila = [0]
+    while pila:
+        celda = pila.pop()
+        if celda != objetivo:
+            for sucesora in sucesores[celda]:
+                if not alcanzable[sucesora]:
+                    alcanzable[sucesora] = True
+                    pila.append(sucesora)
+
+    sin_movimientos = 0
+    callejones = 0
+    callejones_alcanzables = 0
+    for celda in range(total):
+        if celda != objetivo:
+            if not sucesores[celda]:
+                sin_movimientos += 1
+            if not alcanza[celda]:
+                callejones += 1
+                if alcanzable[celda]:
+                    callejones_alcanzables += 1
+
+    analisis = {
+        "tamano": tamano,
+        "resoluble": alcanza[0],
+        "alcanza_objetivo": [alcanza[fila * tamano:(fila + 1) * tamano] for fila in range(tamano)],
+        "camino_mas_corto": reconstruir_camino(siguiente_corto, tamano),
+        "camino_mas_largo": reconstruir_camino(siguiente_largo, tamano),
+        "celdas_sin_movimientos": sin_movimientos,
+        "callejones": callejones,
+        "callejones_alcanzables": callejones_alcanzables,
+        "celdas_alcanzables": sum(alcanzable)
+    }
+    return analisis
+
+
+# =============================================================================
+# CALCULAR_DIFICULTAD_TABLERO
+# =============================================================================
+# Descripción: Puntaje de dificultad de 0 a 1: proporción de las celdas a
+#              las que puede llegar el jugador que son callejones (no
+#              llevan al objetivo). 1.0 si el tablero no tiene solución
+#
+# Uso en Pygame: No se usa en la partida (comparar generadores de tableros)
+#
+# Parámetros:
+#   - analisis (dict): Resultado de analizar_tablero_minijuego
+#
+# Retorna:
+#   - float: Dificultad entre 0.0 y 1.0
+#
+# Ejemplo de uso:
+#   dificultad = calcular_dificultad_tablero(analizar_tablero_minijuego(matriz))
+# =============================================================================
+def calcular_dificultad_tablero(analisis: dict) -> float:
+    """Proporción de celdas alcanzables que son callejones."""
+    dificultad = 1.0
+    if analisis["resoluble"]:
+        dificultad = analisis["callejones_alcanzables"] / analisis["celdas_alcanzables"]
+    return dificultad
@@ -9,10 +9,15 @@
 #    - data/repositorio_usuarios.py (línea 7) - para cargar_json, guardar_json, verificar_archivo_existe
 #    - data/repositorio_preguntas.py (línea 8) - para verificar_y_obtener_ruta
 #    - core/logica_buffeos.py - para cargar/guardar estado de buffs
+#    - data/estado_buff.py - para volcar EstadoBuff.json
+#    - data/indice_usuarios.py - para escribir_archivo_atomico
+#    - data/repositorio_preguntas.py - para guardar el banco compilado
 #
 # 🔗 DEPENDENCIAS:
 #    - os: para operaciones de archivos y directorios
 #    - json: para serialización/deserialización de datos
+#    - tempfile: archivo temporal para la escritura atómica
+#    - stat: permisos del archivo reemplazado
 #
 # 💡 NOTAS PARA LA DEFENSA:
 #    - Centraliza operaciones de I/O para reducir código duplicado
@@ -20,10 +25,14 @@
 #    - Creación automática de directorios si no existen
 #    - Encoding UTF-8 para soportar caracteres especiales
 #    - Separación de responsabilidades: este módulo solo maneja archivos
+#    - Escritura atómica (temporal + fsync + rename): un corte de luz deja el
+#      archivo anterior o el nuevo, nunca uno truncado
 # =============================================================================
 
 import os
 import json
+import stat
+import tempfile
 
 # =============================================================================
 # VERIFICAR_ARCHIVO_EXISTE
@@ -100,7 +109,7 @@ def cargar_json(archivo: str, default=None):
 # GUARDAR_JSON
 # =============================================================================
 # 📄 Descripción: 
-#    Guarda datos en un archivo JSON con formato legible
+#    Guarda datos en un archivo JSON con formato legible, de forma atómica
 # 
 # 📥 Parámetros:
 #    - archivo (str): Ruta del archivo JSON
@@ -114,28 +123,123 @@ def cargar_json(archivo: str, default=None):
 #    - core/logica_buffeos.py - para guardar estado de buffs
 #
 # 💡 Algoritmo:
-#    - Paso 1: Crear directorio padre si no existe (os.makedirs)
-#    - Paso 2: Abrir archivo con encoding UTF-8
-#    - Paso 3: Usar json.dump con indent=2 para formato legible
-#    - Paso 4: Retornar True si éxito, False si hay excepción (un solo return)
+#    - Escribir con escribir_json_atomico: el archivo queda en disco al
+#      retornar (importa dentro de bloqueo_archivo: se escribe antes de
+#      liberar el bloqueo)
 #
 # 📝 Ejemplo de uso:
 #    guardar_json("usuarios.json", datos_usuarios)
 # =============================================================================
 def guardar_json(archivo: str, datos) -> bool:
     """Guarda datos en un archivo JSON."""
+    return escribir_json_atomico(archivo, datos)
+
+
+# =============================================================================
+# ESCRIBIR_JSON_ATOMICO
+# =============================================================================
+# 📄 Descripción: 
+#    Serializa los datos y los escribe con escribir_archivo_atomico
+# 
+# 📥 Parámetros:
+#    - archivo (str): Ruta del archivo JSON
+#    - datos: Datos a guardar (dict o list)
+#    - sincronizar (bool): Si es True hace fsync antes de renombrar
+#
+# 📤 Retorna:
+#    - bool: True si se guardó correctamente, False en caso de error
+#
+# 🔧 Importado en:
+#    - data/archivos_json.py - desde guardar_json
+#    - benchmarks/bench_guardar_json.py - para medir el costo de fsync
+#
+# 📝 Ejemplo de uso:
+#    escribir_json_atomico("usuarios.json", datos_usuarios)
+# =============================================================================
+def escribir_json_atomico(archivo: str, datos, sincronizar: bool = True) -> bool:
+    """Guarda datos en un archivo JSON mediante temporal + rename."""
+    try:
+        contenido = json.dumps(datos, ensure_ascii=False, indent=2).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        print(f"Error al guardar JSON: {e}")
+        return False
+    return escribir_archivo_atomico(archivo, contenido, sincronizar)
+
+
+# =============================================================================
+# ESCRIBIR_ARCHIVO_ATOMICO
+# =============================================================================
+# 📄 Descripción: 
+#    Escribe bytes en un archivo temporal del mismo directorio, lo
+#    sincroniza a disco y lo renombra sobre el destino
+# 
+# 📥 Parámetros:
+#    - archivo (str): Ruta del archivo destino
+#    - contenido (bytes): Contenido completo del archivo
+#    - sincronizar (bool): Si es True hace fsync antes de renombrar
+#
+# 📤 Retorna:
+#    - bool: True si se guardó correctamente, False en caso de error
+#
+# 🔧 Importado en:
+#    - data/archivos_json.py - desde escribir_json_atomico
+#    - data/indice_usuarios.py - para Usuarios.json indexado y su índice
+#    - data/repositorio_preguntas.py - para el banco compilado (pickle)
+#
+# 💡 Algoritmo:
+#    - Paso 1: Crear directorio padre si no existe (os.makedirs)
+#    - Paso 2: Crear temporal en el mismo directorio (mismo sistema de archivos)
+#    - Paso 3: Escribir, flush y os.fsync
+#    - Paso 4: Copiar los permisos del archivo existente al temporal
+#      (mkstemp lo crea 0600); 0644 si el archivo es nuevo
+#    - Paso 5: os.replace (atómico) y fsync del directorio en POSIX
+#    - Paso 6: Si algo falla, borrar el temporal; el archivo original queda intacto
+#
+# 📝 Ejemplo de uso:
+#    escribir_archivo_atomico("datos.txt", b"hola")
+# =============================================================================
+def escribir_archivo_atomico(archivo: str, contenido: bytes, sincronizar: bool = True) -> bool:
+    """Escribe un archivo completo mediante temporal + rename."""
+    ruta_temporal = None
     try:
         # Crear directorio si no existe
         directorio = os.path.dirname(archivo)
         if directorio and not os.path.exists(directorio):
             os.makedirs(directorio)
         
-        with open(archivo, "w", encoding="utf-8") as f:
-            json.dump(datos, f, ensure_ascii=False, indent=2)
+        descriptor, ruta_temporal = tempfile.mkstemp(
+            prefix="." + os.path.basename(archivo) + ".",
+            suffix=".tmp",
+            dir=directorio or "."
+        )
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(contenido)
+            f.flush()
+            if sincronizar:
+                os.fsync(f.fileno())
+        
+        permisos = 0o644
+        if os.path.exists(archivo):
+            permisos = stat.S_IMODE(os.stat(archivo).st_mode)
+        os.chmod(ruta_temporal, permisos)
+        
+        os.replace(ruta_temporal, archivo)
+        ruta_temporal = None
+        
+        # Sincronizar la entrada de directorio para que el rename persista
+        if sincronizar and os.name == "posix":
+            descriptor_dir = os.open(directorio or ".", os.O_RDONLY)
+            try:
+                os.fsync(descriptor_dir)
+            finally:
+                os.close(descriptor_dir)
         return True
     except Exception as e:
-        print(f"Error al guardar JSON: {e}")
+        print(f"Error al guardar archivo: {e}")
         return False
+    finally:
+        if ruta_temporal is not None and os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
 
 
 # =============================================================================
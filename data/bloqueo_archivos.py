@@ -0,0 +1,322 @@
+# =============================================================================
+# BLOQUEO DE ARCHIVOS ENTRE PROCESOS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Bloqueo consultivo (advisory lock) sobre un archivo "<archivo>.lock" para
+#    que varios procesos del juego (consola y Pygame abiertos a la vez, o
+#    varias partidas terminando juntas) no pisen sus ciclos de
+#    leer-modificar-escribir sobre Usuarios.json, el diario, el ranking y
+#    EstadoBuff.json.
+#
+# 📥 IMPORTADO EN:
+#    - data/repositorio_usuarios.py - guardar partidas, compactar, ranking
+#    - data/estado_buff.py - volcado con fusión y transacciones de buffs
+#    - benchmarks/stress_multiproceso.py - métricas de contención
+#
+# 🔗 DEPENDENCIAS:
+#    - fcntl (POSIX) o msvcrt (Windows): bloqueo del sistema operativo
+#    - threading: el bloqueo también serializa hilos del mismo proceso
+#    - config/constantes: para TIEMPO_MAXIMO_ESPERA_BLOQUEO,
+#      ESPERA_INICIAL_BLOQUEO, ESPERA_MAXIMA_BLOQUEO
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Sin competencia el costo es abrir el .lock y un flock no bloqueante
+#    - Con competencia se reintenta con espera exponencial y algo de azar
+#      (evita que todos los procesos reintenten en el mismo instante)
+#    - Reentrante por hilo: compactar dentro de guardar no se autobloquea
+#    - tiempo_maximo cuenta también la espera a otro hilo del mismo proceso
+#    - Las métricas permiten medir cuánta espera agrega la concurrencia
+#    - Si se agota el tiempo se lanza BloqueoNoDisponibleError y el bloque
+#      no se ejecuta: quien guarda informa que no pudo guardar en lugar de
+#      escribir sin protección
+#    - Un .lock abandonado no cuelga el juego: el bloqueo es del descriptor
+#      y el sistema operativo lo libera cuando el proceso termina
+# =============================================================================
+
+import os
+import time
+import random
+import threading
+from contextlib import contextmanager
+from config.constantes import TIEMPO_MAXIMO_ESPERA_BLOQUEO, ESPERA_INICIAL_BLOQUEO, ESPERA_MAXIMA_BLOQUEO
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# =============================================================================
+# BLOQUEONODISPONIBLEERROR
+# =============================================================================
+# Descripción: Se lanza cuando otro proceso mantiene el bloqueo más de
+#              TIEMPO_MAXIMO_ESPERA_BLOQUEO segundos. Hereda de TimeoutError
+#              (y por lo tanto de OSError): los "except OSError" que ya
+#              rodean escrituras también lo informan
+#
+# Ejemplo de uso:
+#   try:
+#       with bloqueo_archivo(RUTA_USUARIOS):
+#           ...
+#   except BloqueoNoDisponibleError as e:
+#       print(f"❌ No se pudo guardar: {e}")
+# =============================================================================
+class BloqueoNoDisponibleError(TimeoutError):
+    """No se obtuvo el bloqueo de un archivo compartido a tiempo."""
+
+
+# Candado local por archivo de bloqueo: {ruta_lock: RLock}
+_candados_locales = {}
+
+# Bloqueos tomados por este proceso: {ruta_lock: [descriptor, profundidad]}
+_bloqueos_tomados = {}
+
+_candado_registro = threading.Lock()
+
+# Métricas de contención acumuladas en este proceso
+_metricas_bloqueo = {
+    "adquisiciones": 0,
+    "con_espera": 0,
+    "reintentos": 0,
+    "segundos_espera": 0.0,
+    "espera_maxima": 0.0,
+    "expirados": 0
+}
+
+
+# =============================================================================
+# OBTENER_RUTA_BLOQUEO
+# =============================================================================
+# Descripción: Obtiene la ruta del archivo de bloqueo asociado a un archivo
+#
+# Uso en Pygame: Se usa internamente
+#
+# Parámetros:
+#   - archivo (str): Ruta del archivo protegido
+#
+# Retorna:
+#   - str: Ruta absoluta del .lock (ej: assets/Usuarios.json.lock)
+#
+# Ejemplo de uso:
+#   ruta = obtener_ruta_bloqueo("assets/Usuarios.json")
+# =============================================================================
+def obtener_ruta_bloqueo(archivo: str) -> str:
+    """Obtiene la ruta del archivo de bloqueo asociado a un archivo."""
+    return os.path.abspath(archivo) + ".lock"
+
+
+# =============================================================================
+# INTENTAR_BLOQUEO
+# =============================================================================
+# Descripción: Intenta tomar el bloqueo exclusivo sin esperar
+#
+# Uso en Pygame: Se usa internamente en cada reintento
+#
+# Parámetros:
+#   - descriptor (int): Descriptor abierto del archivo .lock
+#
+# Retorna:
+#   - bool: True si se obtuvo el bloqueo
+#
+# Ejemplo de uso:
+#   if intentar_bloqueo(descriptor): ...
+# =============================================================================
+def intentar_bloqueo(descriptor: int) -> bool:
+    """Intenta tomar el bloqueo exclusivo del archivo sin esperar."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            os.lseek(descriptor, 0, os.SEEK_SET)
+            msvcrt.locking(descriptor, msvcrt.LK_NBLCK, 1)
+        adquirido = True
+    except OSError:
+        adquirido = False
+
+    return adquirido
+
+
+# =============================================================================
+# LIBERAR_BLOQUEO
+# =============================================================================
+# Descripción: Libera el bloqueo y cierra el descriptor
+#
+# Uso en Pygame: Se usa internamente al salir de bloqueo_archivo
+#
+# Parámetros:
+#   - descriptor (int): Descriptor del archivo .lock
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   liberar_bloqueo(descriptor)
+# =============================================================================
+def liberar_bloqueo(descriptor: int) -> None:
+    """Libera el bloqueo del archivo y cierra el descriptor."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            os.lseek(descriptor, 0, os.SEEK_SET)
+            msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+    except OSError as e:
+        print(f"⚠️ Error al liberar el bloqueo: {e}")
+    os.close(descriptor)
+    return None
+
+
+# =============================================================================
+# ADQUIRIR_BLOQUEO
+# =============================================================================
+# Descripción: Abre el .lock y reintenta el bloqueo con espera exponencial
+#
+# Uso en Pygame: Se usa internamente desde bloqueo_archivo
+#
+# Parámetros:
+#   - ruta_bloqueo (str): Ruta del archivo .lock
+#   - tiempo_maximo (float): Segundos máximos de espera
+#
+# Retorna:
+#   - int: Descriptor con el bloqueo tomado
+#
+# Errores:
+#   - BloqueoNoDisponibleError: si se agota tiempo_maximo
+#
+# Ejemplo de uso:
+#   descriptor = adquirir_bloqueo("assets/Usuarios.json.lock", 10.0)
+# =============================================================================
+def adquirir_bloqueo(ruta_bloqueo: str, tiempo_maximo: float):
+    """Abre el archivo de bloqueo y lo toma, reintentando con espera."""
+    directorio = os.path.dirname(ruta_bloqueo)
+    if directorio and not os.path.exists(directorio):
+        os.makedirs(directorio)
+
+    descriptor = os.open(ruta_bloqueo, os.O_RDWR | os.O_CREAT, 0o644)
+    inicio = time.perf_counter()
+    espera = ESPERA_INICIAL_BLOQUEO
+    reintentos = 0
+    adquirido = intentar_bloqueo(descriptor)
+
+    while not adquirido and time.perf_counter() - inicio < tiempo_maximo:
+        time.sleep(espera * random.uniform(0.5, 1.5))
+        espera = min(espera * 2, ESPERA_MAXIMA_BLOQUEO)
+        reintentos += 1
+        adquirido = intentar_bloqueo(descriptor)
+
+    segundos = time.perf_counter() - inicio
+    with _candado_registro:
+        _metricas_bloqueo["adquisiciones"] += 1
+        _metricas_bloqueo["reintentos"] += reintentos
+        if reintentos > 0:
+            _metricas_bloqueo["con_espera"] += 1
+            _metricas_bloqueo["segundos_espera"] += segundos
+            _metricas_bloqueo["espera_maxima"] = max(_metricas_bloqueo["espera_maxima"], segundos)
+        if not adquirido:
+            _metricas_bloqueo["expirados"] += 1
+
+    if not adquirido:
+        os.close(descriptor)
+        raise BloqueoNoDisponibleError(f"No se pudo bloquear {ruta_bloqueo} en {tiempo_maximo} s")
+
+    return descriptor
+
+
+# =============================================================================
+# BLOQUEO_ARCHIVO
+# =============================================================================
+# Descripción: Context manager que mantiene el bloqueo exclusivo de un
+#              archivo compartido mientras dura el bloque "with"
+#
+# Uso en Pygame: Envuelve cada ciclo leer-modificar-escribir sobre archivos
+#                que otro proceso del juego puede estar modificando
+#
+# Parámetros:
+#   - archivo (str): Ruta del archivo protegido (no el .lock)
+#   - tiempo_maximo (float): Segundos máximos de espera
+#                            (default: TIEMPO_MAXIMO_ESPERA_BLOQUEO)
+#
+# Retorna:
+#   - Context manager (no devuelve valor)
+#
+# Errores:
+#   - BloqueoNoDisponibleError: al entrar, si se agota tiempo_maximo
+#     esperando a otro proceso o a otro hilo (el bloque no se ejecuta)
+#
+# Ejemplo de uso:
+#   with bloqueo_archivo(RUTA_USUARIOS):
+#       datos = cargar_json(RUTA_USUARIOS, {})
+#       ...
+#       guardar_json(RUTA_USUARIOS, datos)
+# =============================================================================
+@contextmanager
+def bloqueo_archivo(archivo: str, tiempo_maximo: float = TIEMPO_MAXIMO_ESPERA_BLOQUEO):
+    """Mantiene el bloqueo exclusivo de un archivo durante el bloque with."""
+    ruta_bloqueo = obtener_ruta_bloqueo(archivo)
+    with _candado_registro:
+        if ruta_bloqueo not in _candados_locales:
+            _candados_locales[ruta_bloqueo] = threading.RLock()
+        candado_local = _candados_locales[ruta_bloqueo]
+
+    # El RLock ordena a los hilos del proceso; solo el primer nivel toca el SO.
+    # La espera a otro hilo descuenta del tiempo máximo del bloqueo del SO
+    inicio = time.perf_counter()
+    if not candado_local.acquire(timeout=tiempo_maximo):
+        with _candado_registro:
+            _metricas_bloqueo["expirados"] += 1
+        raise BloqueoNoDisponibleError(f"No se pudo bloquear {ruta_bloqueo} en {tiempo_maximo} s (otro hilo)")
+    try:
+        if ruta_bloqueo not in _bloqueos_tomados:
+            restante = max(0.0, tiempo_maximo - (time.perf_counter() - inicio))
+            _bloqueos_tomados[ruta_bloqueo] = [adquirir_bloqueo(ruta_bloqueo, restante), 0]
+        registro = _bloqueos_tomados[ruta_bloqueo]
+        registro[1] += 1
+        try:
+            yield
+        finally:
+            registro[1] -= 1
+            if registro[1] == 0:
+                del _bloqueos_tomados[ruta_bloqueo]
+                liberar_bloqueo(registro[0])
+    finally:
+        candado_local.release()
+
+
+# =============================================================================
+# OBTENER_METRICAS_BLOQUEO
+# =============================================================================
+# Descripción: Devuelve las métricas de contención de este proceso
+#
+# Uso en Pygame: Diagnóstico (benchmarks/stress_multiproceso.py)
+#
+# Parámetros:
+#   Ninguno
+#
+# Retorna:
+#   - dict: adquisiciones, con_espera, reintentos, segundos_espera,
+#           espera_maxima, espera_promedio y expirados
+#
+# Ejemplo de uso:
+#   metricas = obtener_metricas_bloqueo()
+# =============================================================================
+def obtener_metricas_bloqueo() -> dict:
+    """Devuelve una copia de las métricas de contención del proceso."""
+    with _candado_registro:
+        metricas = dict(_metricas_bloqueo)
+
+    metricas["espera_promedio"] = 0.0
+    if metricas["con_espera"] > 0:
+        metricas["espera_promedio"] = metricas["segundos_espera"] / metricas["con_espera"]
+    return metricas
+
+
+def reiniciar_metricas_bloqueo() -> None:
+    """Pone en cero las métricas de contención del proceso."""
+    with _candado_registro:
+        for clave in _metricas_bloqueo:
+            _metricas_bloqueo[clave] = 0
+    return None
@@ -0,0 +1,174 @@
+# =============================================================================
+# DIARIO DE PARTIDAS (APPEND-ONLY)
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Registro de solo-agregado con una línea JSON por partida terminada.
+#    Guardar una partida ya no reescribe Usuarios.json completo: solo agrega
+#    una línea al final del diario. Periódicamente (o al iniciar el programa)
+#    el diario se compacta dentro de Usuarios.json.
+#
+# 📥 IMPORTADO EN:
+#    - data/repositorio_usuarios.py - para registrar, leer y vaciar el diario
+#
+# 🔗 DEPENDENCIAS:
+#    - os: para rutas, tamaño y sincronización del archivo
+#    - json: para serializar cada línea
+#    - config/constantes: para TAMANO_MAXIMO_DIARIO_PARTIDAS
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Costo de guardar O(1): no depende de la cantidad de usuarios
+#    - Formato JSON Lines: una línea corrupta (corte de luz) no invalida el resto
+#    - Cada entrada lleva un id_partida para que la compactación sea idempotente
+# =============================================================================
+
+import os
+import json
+from config.constantes import TAMANO_MAXIMO_DIARIO_PARTIDAS
+
+# =============================================================================
+# OBTENER_RUTA_DIARIO
+# =============================================================================
+# Descripción: Obtiene la ruta del diario asociado a un archivo de usuarios
+#
+# Uso en Pygame: Se usa internamente
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - str: Ruta del diario (ej: Usuarios_diario.jsonl)
+#
+# Ejemplo de uso:
+#   ruta = obtener_ruta_diario("assets/Usuarios.json")
+# =============================================================================
+def obtener_ruta_diario(archivo_usuarios: str) -> str:
+    """Obtiene la ruta del diario asociado a un archivo de usuarios."""
+    base, _ = os.path.splitext(archivo_usuarios)
+    return base + "_diario.jsonl"
+
+
+# =============================================================================
+# REGISTRAR_ENTRADA_DIARIO
+# =============================================================================
+# Descripción: Agrega una entrada (una línea JSON) al final del diario
+#
+# Uso en Pygame: Se usa al terminar cada partida
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#   - entrada (dict): Datos a registrar (usuario, id_partida, resultado)
+#
+# Retorna:
+#   - bool: True si se escribió correctamente
+#
+# Ejemplo de uso:
+#   registrar_entrada_diario(ruta, {"usuario": "Juan", "id_partida": "...", "resultado": {...}})
+# =============================================================================
+def registrar_entrada_diario(archivo_usuarios: str, entrada: dict) -> bool:
+    """Agrega una entrada al final del diario de partidas."""
+    ruta = obtener_ruta_diario(archivo_usuarios)
+    linea = json.dumps(entrada, ensure_ascii=False) + "\n"
+
+    try:
+        directorio = os.path.dirname(ruta)
+        if directorio and not os.path.exists(directorio):
+            os.makedirs(directorio)
+
+        with open(ruta, "a", encoding="utf-8") as f:
+            f.write(linea)
+            f.flush()
+            os.fsync(f.fileno())
+        exito = True
+    except OSError as e:
+        print(f"Error al escribir el diario de partidas: {e}")
+        exito = False
+
+    return exito
+
+
+# =============================================================================
+# LEER_DIARIO
+# =============================================================================
+# Descripción: Lee todas las entradas válidas del diario, en orden
+#
+# Uso en Pygame: Se usa al cargar usuarios y al compactar
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - list: Lista de entradas (dict); las líneas corruptas se ignoran
+#
+# Ejemplo de uso:
+#   entradas = leer_diario(RUTA_USUARIOS)
+# =============================================================================
+def leer_diario(archivo_usuarios: str) -> list:
+    """Lee todas las entradas válidas del diario de partidas."""
+    entradas = []
+    ruta = obtener_ruta_diario(archivo_usuarios)
+
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            for linea in f:
+                linea = linea.strip()
+                if not linea:
+                    continue
+                try:
+                    entradas.append(json.loads(linea))
+                except json.JSONDecodeError:
+                    # Línea incompleta (p. ej. corte durante la escritura)
+                    pass
+    except FileNotFoundError:
+        pass
+
+    return entradas
+
+
+# =============================================================================
+# VACIAR_DIARIO
+# =============================================================================
+# Descripción: Borra el diario después de compactarlo
+#
+# Uso en Pygame: Se usa internamente al compactar
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   vaciar_diario(RUTA_USUARIOS)
+# =============================================================================
+def vaciar_diario(archivo_usuarios: str) -> None:
+    """Borra el diario de partidas."""
+    ruta = obtener_ruta_diario(archivo_usuarios)
+    if os.path.exists(ruta):
+        os.remove(ruta)
+    return None
+
+
+# =============================================================================
+# DIARIO_REQUIERE_COMPACTACION
+# =============================================================================
+# Descripción: Indica si el diario superó el tamaño máximo configurado
+#
+# Uso en Pygame: Se consulta después de guardar cada partida
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - bool: True si conviene compactar
+#
+# Ejemplo de uso:
+#   if diario_requiere_compactacion(RUTA_USUARIOS):
+#       compactar_diario_usuarios(RUTA_USUARIOS)
+# =============================================================================
+def diario_requiere_compactacion(archivo_usuarios: str) -> bool:
+    """Indica si el diario superó el tamaño máximo configurado."""
+    ruta = obtener_ruta_diario(archivo_usuarios)
+    requiere = False
+    if os.path.exists(ruta):
+        requiere = os.path.getsize(ruta) > TAMANO_MAXIMO_DIARIO_PARTIDAS
+    return requiere
@@ -0,0 +1,534 @@
+# =============================================================================
+# ALMACÉN EN MEMORIA DEL ESTADO DE BUFFS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Mantiene en memoria el contenido de EstadoBuff.json (objetos equipados
+#    y vidas extra de cada jugador). El archivo se lee una sola vez por
+#    proceso; las lecturas posteriores se sirven desde memoria y las
+#    modificaciones se vuelcan a disco con escritura diferida (write-behind).
+#
+# 📥 IMPORTADO EN:
+#    - core/logica_buffeos.py - para verificar/guardar/eliminar objeto equipado
+#    - data/repositorio_usuarios.py - para vidas extra y objeto equipado
+#
+#    Con BACKEND_USUARIOS == "sqlite" la ruta por defecto se redirige a la
+#    base de datos: cada usuario se carga al consultarlo y solo se escriben
+#    los usuarios modificados.
+#
+#    Varios procesos pueden compartir el archivo: cada proceso anota qué
+#    claves cambió de qué usuario y al volcar las fusiona sobre la versión
+#    en disco (bajo bloqueo), sin pisar lo que escribieron los demás.
+#
+# 🔗 DEPENDENCIAS:
+#    - os: firma (mtime, tamaño) para detectar cambios de otros procesos
+#    - threading: temporizador de volcado y candado de acceso
+#    - atexit: volcado final al cerrar el programa
+#    - contextlib: para transaccion_estado_buff
+#    - data/archivos_json: para cargar_json, escribir_json_atomico
+#    - data/bloqueo_archivos: bloqueo entre procesos al volcar
+#    - data/repositorio_usuarios_sqlite: estado por usuario en la base de datos
+#    - config/constantes: para RUTA_ESTADO_BUFF, RETARDO_ESCRITURA_ESTADO_BUFF,
+#      BACKEND_USUARIOS, RUTA_BASE_DATOS_USUARIOS
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - verificar_objeto_equipado se llama varias veces por respuesta y una
+#      vez por frame en el HUD: leer el JSON cada vez era el cuello de botella
+#    - Varias modificaciones seguidas se agrupan en una sola escritura
+#    - Un único diccionario por ruta: todas las funciones ven el mismo estado
+#    - atexit garantiza que los cambios pendientes no se pierdan al salir
+#    - Fusión optimista por clave: dos procesos que cambian usuarios (o
+#      claves) distintos nunca se pierden cambios entre sí
+#    - Los ciclos leer-modificar-escribir (sumar o consumir vidas) usan
+#      transaccion_estado_buff: releen el disco y escriben bajo bloqueo
+# =============================================================================
+
+import os
+import threading
+import atexit
+from contextlib import contextmanager
+from data.archivos_json import cargar_json, escribir_json_atomico
+from data.bloqueo_archivos import bloqueo_archivo, BloqueoNoDisponibleError
+from data.repositorio_usuarios_sqlite import obtener_estado_buff_usuario, guardar_estado_buff_usuario
+from config.constantes import (
+    RUTA_ESTADO_BUFF,
+    RETARDO_ESCRITURA_ESTADO_BUFF,
+    BACKEND_USUARIOS,
+    RUTA_BASE_DATOS_USUARIOS
+)
+
+# Estado cargado por ruta de archivo: {ruta: {usuario: {...}}}
+_estados_cargados = {}
+
+# Rutas con cambios que todavía no se escribieron a disco
+_rutas_pendientes = set()
+
+# Claves modificadas y todavía no escritas: {ruta: {usuario: {clave: valor}}}
+# (CLAVE_ELIMINADA marca una clave borrada)
+_cambios_pendientes = {}
+
+# Firma del archivo JSON la última vez que se leyó o escribió: {ruta: (mtime_ns, tamaño)}
+_firmas_cargadas = {}
+
+CLAVE_ELIMINADA = object()
+
+_temporizador_volcado = None
+_candado = threading.RLock()
+
+
+# =============================================================================
+# RESOLVER_RUTA_ESTADO
+# =============================================================================
+# Descripción: Traduce la ruta pedida a la ruta real según el backend
+#
+# Uso en Pygame: Se usa internamente en todas las funciones del módulo
+#
+# Parámetros:
+#   - ruta (str): Ruta de EstadoBuff.json o None
+#
+# Retorna:
+#   - str: Ruta efectiva (RUTA_BASE_DATOS_USUARIOS con backend "sqlite")
+#
+# Ejemplo de uso:
+#   ruta = resolver_ruta_estado(None)
+# =============================================================================
+def resolver_ruta_estado(ruta: str = None) -> str:
+    """Traduce la ruta pedida a la ruta real según el backend configurado."""
+    if ruta is None:
+        ruta = RUTA_ESTADO_BUFF
+    if BACKEND_USUARIOS == "sqlite" and ruta == RUTA_ESTADO_BUFF:
+        ruta = RUTA_BASE_DATOS_USUARIOS
+    return ruta
+
+
+def es_ruta_base_datos(ruta: str) -> bool:
+    """Indica si la ruta corresponde a una base SQLite y no a un JSON."""
+    return ruta.endswith(".db")
+
+
+# =============================================================================
+# OBTENER_ESTADO_BUFF
+# =============================================================================
+# Descripción: Retorna el estado completo en memoria (lo carga la primera vez)
+#
+# Uso en Pygame: Se usa internamente, no requiere acceso a disco por frame
+#
+# Parámetros:
+#   - ruta (str): Ruta de EstadoBuff.json (default: RUTA_ESTADO_BUFF)
+#
+# Retorna:
+#   - dict: Estado de todos los usuarios (referencia compartida, no modificar).
+#           Con una base SQLite solo contiene los usuarios ya consultados.
+#
+# Ejemplo de uso:
+#   estado = obtener_estado_buff()
+#
+# Nota: con un JSON se compara la firma del archivo (un os.stat, sin leerlo);
+#       si otro proceso lo cambió se recarga conservando los cambios propios
+# =============================================================================
+def obtener_estado_buff(ruta: str = None) -> dict:
+    """Retorna el estado de buffs en memoria, cargándolo si hace falta."""
+    ruta = resolver_ruta_estado(ruta)
+
+    with _candado:
+        if ruta not in _estados_cargados:
+            _estados_cargados[ruta] = {}
+            if not es_ruta_base_datos(ruta):
+                refrescar_estado_buff(ruta)
+        elif not es_ruta_base_datos(ruta) and obtener_firma_estado(ruta) != _firmas_cargadas.get(ruta):
+            refrescar_estado_buff(ruta)
+        estado = _estados_cargados[ruta]
+
+    return estado
+
+
+# =============================================================================
+# OBTENER_ESTADO_USUARIO_BUFF
+# =============================================================================
+# Descripción: Obtiene una copia del estado de buffs de un usuario
+#
+# Uso en Pygame: Se usa para consultar objeto equipado y vidas extra
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - ruta (str): Ruta de EstadoBuff.json (default: RUTA_ESTADO_BUFF)
+#
+# Retorna:
+#   - dict: Copia del estado del usuario ({} si no tiene entrada)
+#
+# Ejemplo de uso:
+#   estado_usuario = obtener_estado_usuario_buff("Juan")
+# =============================================================================
+def obtener_estado_usuario_buff(nombre_usuario: str, ruta: str = None) -> dict:
+    """Obtiene una copia del estado de buffs de un usuario."""
+    estado = obtener_estado_buff(ruta)
+    resultado = {}
+
+    with _candado:
+        cargar_usuario_base_datos(nombre_usuario, resolver_ruta_estado(ruta))
+        if nombre_usuario in estado and isinstance(estado[nombre_usuario], dict):
+            resultado = dict(estado[nombre_usuario])
+
+    return resultado
+
+
+# =============================================================================
+# ACTUALIZAR_ESTADO_USUARIO_BUFF
+# =============================================================================
+# Descripción: Modifica el estado de un usuario y programa el volcado a disco
+#
+# Uso en Pygame: Se usa al equipar, consumir objetos o cambiar vidas extra
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - cambios (dict): Claves a asignar (ej: {"vidas_extra": 2})
+#   - claves_a_eliminar (list): Claves a quitar del usuario (opcional)
+#   - ruta (str): Ruta de EstadoBuff.json (default: RUTA_ESTADO_BUFF)
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   actualizar_estado_usuario_buff("Juan", {"objeto_excepcional": "espada"})
+#   actualizar_estado_usuario_buff("Juan", {}, ["objeto_excepcional"])
+# =============================================================================
+def actualizar_estado_usuario_buff(nombre_usuario: str, cambios: dict, claves_a_eliminar: list = None, ruta: str = None) -> None:
+    """Modifica el estado de un usuario y programa su escritura diferida."""
+    ruta = resolver_ruta_estado(ruta)
+    if claves_a_eliminar is None:
+        claves_a_eliminar = []
+
+    estado = obtener_estado_buff(ruta)
+
+    with _candado:
+        if es_ruta_base_datos(ruta):
+            cargar_usuario_base_datos(nombre_usuario, ruta)
+
+        # Se anota cada clave tocada para fusionarla luego con el disco
+        pendientes = _cambios_pendientes.setdefault(ruta, {}).setdefault(nombre_usuario, {})
+        for clave in cambios:
+            pendientes[clave] = cambios[clave]
+        for clave in claves_a_eliminar:
+            pendientes[clave] = CLAVE_ELIMINADA
+
+        aplicar_cambios_usuario(estado, nombre_usuario, pendientes)
+        programar_volcado(ruta)
+
+    return None
+
+
+# =============================================================================
+# CARGAR_USUARIO_BASE_DATOS
+# =============================================================================
+# Descripción: Trae a memoria el estado de un usuario desde SQLite si todavía
+#              no estaba cargado (no hace nada con rutas JSON)
+#
+# Uso en Pygame: Se usa internamente; una consulta por usuario y proceso
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - ruta (str): Ruta efectiva (ver resolver_ruta_estado)
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   cargar_usuario_base_datos("Juan", RUTA_BASE_DATOS_USUARIOS)
+# =============================================================================
+def cargar_usuario_base_datos(nombre_usuario: str, ruta: str) -> None:
+    """Carga en memoria el estado de un usuario guardado en SQLite."""
+    if es_ruta_base_datos(ruta):
+        with _candado:
+            estado = _estados_cargados.setdefault(ruta, {})
+            if nombre_usuario not in estado:
+                estado[nombre_usuario] = obtener_estado_buff_usuario(nombre_usuario, ruta)
+    return None
+
+
+# =============================================================================
+# APLICAR_CAMBIOS_USUARIO
+# =============================================================================
+# Descripción: Aplica cambios por clave sobre el estado de un usuario
+#
+# Uso en Pygame: Se usa internamente al modificar y al fusionar con el disco
+#
+# Parámetros:
+#   - estado (dict): Estado de todos los usuarios (se modifica)
+#   - nombre_usuario (str): Nombre del usuario
+#   - cambios (dict): {clave: valor} o {clave: CLAVE_ELIMINADA}
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   aplicar_cambios_usuario(estado, "Juan", {"vidas_extra": 2})
+# =============================================================================
+def aplicar_cambios_usuario(estado: dict, nombre_usuario: str, cambios: dict) -> None:
+    """Aplica cambios por clave sobre el estado de un usuario."""
+    if nombre_usuario not in estado or not isinstance(estado[nombre_usuario], dict):
+        estado[nombre_usuario] = {}
+
+    usuario = estado[nombre_usuario]
+    for clave in cambios:
+        if cambios[clave] is CLAVE_ELIMINADA:
+            if clave in usuario:
+                del usuario[clave]
+        else:
+            usuario[clave] = cambios[clave]
+    return None
+
+
+def obtener_firma_estado(ruta: str):
+    """Retorna (mtime_ns, tamaño) del archivo o None si no existe."""
+    try:
+        info = os.stat(ruta)
+        firma = (info.st_mtime_ns, info.st_size)
+    except OSError:
+        firma = None
+    return firma
+
+
+# =============================================================================
+# REFRESCAR_ESTADO_BUFF
+# =============================================================================
+# Descripción: Relee el estado desde disco y vuelve a aplicar encima los
+#              cambios propios que todavía no se escribieron
+#
+# Uso en Pygame: Se usa internamente cuando otro proceso modificó el archivo
+#                y al empezar una transacción
+#
+# Parámetros:
+#   - ruta (str): Ruta efectiva (ver resolver_ruta_estado)
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   refrescar_estado_buff(RUTA_ESTADO_BUFF)
+# =============================================================================
+def refrescar_estado_buff(ruta: str) -> None:
+    """Relee el estado desde disco conservando los cambios pendientes."""
+    with _candado:
+        estado = _estados_cargados.setdefault(ruta, {})
+        pendientes = _cambios_pendientes.get(ruta, {})
+
+        if es_ruta_base_datos(ruta):
+            # Se olvidan los usuarios cacheados: se vuelven a consultar al usarlos
+            estado.clear()
+            for nombre_usuario in pendientes:
+                cargar_usuario_base_datos(nombre_usuario, ruta)
+        else:
+            _firmas_cargadas[ruta] = obtener_firma_estado(ruta)
+            en_disco = cargar_json(ruta, {})
+            # Se actualiza el mismo diccionario: las referencias siguen válidas
+            estado.clear()
+            estado.update(en_disco)
+
+        for nombre_usuario in pendientes:
+            aplicar_cambios_usuario(estado, nombre_usuario, pendientes[nombre_usuario])
+
+    return None
+
+
+# =============================================================================
+# PROGRAMAR_VOLCADO
+# =============================================================================
+# Descripción: Marca una ruta como pendiente y arranca el temporizador
+#
+# Uso en Pygame: Se usa internamente tras cada modificación
+#
+# Parámetros:
+#   - ruta (str): Ruta con cambios pendientes
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   programar_volcado(RUTA_ESTADO_BUFF)
+# =============================================================================
+def programar_volcado(ruta: str) -> None:
+    """Marca la ruta como pendiente y programa el volcado diferido."""
+    global _temporizador_volcado
+
+    with _candado:
+        _rutas_pendientes.add(ruta)
+        if _temporizador_volcado is None:
+            _temporizador_volcado = threading.Timer(RETARDO_ESCRITURA_ESTADO_BUFF, volcar_estados_pendientes)
+            _temporizador_volcado.daemon = True
+            _temporizador_volcado.start()
+
+    return None
+
+
+# =============================================================================
+# VOLCAR_ESTADOS_PENDIENTES
+# =============================================================================
+# Descripción: Escribe a disco todos los estados con cambios pendientes
+#
+# Uso en Pygame: Lo llama el temporizador y atexit; también puede llamarse
+#                a mano antes de cambiar de proceso o de pantalla
+#
+# Parámetros:
+#   Ninguno
+#
+# Retorna:
+#   - bool: True si todas las escrituras fueron exitosas
+#
+# Ejemplo de uso:
+#   volcar_estados_pendientes()
+# =============================================================================
+def volcar_estados_pendientes() -> bool:
+    """Escribe a disco todos los estados con cambios pendientes."""
+    global _temporizador_volcado
+    exito = True
+
+    with _candado:
+        if _temporizador_volcado is not None:
+            _temporizador_volcado.cancel()
+            _temporizador_volcado = None
+        rutas = list(_rutas_pendientes)
+
+    # El bloqueo del archivo se toma antes que _candado (mismo orden que
+    # transaccion_estado_buff) para no cruzarse con otro hilo
+    for ruta in rutas:
+        if not volcar_ruta_estado(ruta):
+            exito = False
+
+    return exito
+
+
+# =============================================================================
+# VOLCAR_RUTA_ESTADO
+# =============================================================================
+# Descripción: Fusiona los cambios pendientes de una ruta con lo que hay en
+#              disco y los escribe, todo bajo el bloqueo del archivo
+#
+# Uso en Pygame: Se usa internamente desde volcar_estados_pendientes y al
+#                cerrar una transacción
+#
+# Parámetros:
+#   - ruta (str): Ruta efectiva (ver resolver_ruta_estado)
+#
+# Retorna:
+#   - bool: True si la escritura fue exitosa; False si falló o si no se
+#           obtuvo el bloqueo a tiempo (los cambios quedan pendientes)
+#
+# Ejemplo de uso:
+#   volcar_ruta_estado(RUTA_ESTADO_BUFF)
+# =============================================================================
+def volcar_ruta_estado(ruta: str) -> bool:
+    """Fusiona los cambios pendientes de una ruta con el disco y los escribe."""
+    try:
+        exito = volcar_ruta_estado_bloqueada(ruta)
+    except BloqueoNoDisponibleError as e:
+        # Los cambios siguen pendientes: se reintentan en el próximo volcado
+        print(f"❌ No se guardó el estado de buffs: {e}")
+        exito = False
+    return exito
+
+
+def volcar_ruta_estado_bloqueada(ruta: str) -> bool:
+    """Vuelca una ruta tomando su bloqueo; lanza BloqueoNoDisponibleError."""
+    exito = True
+
+    with bloqueo_archivo(ruta):
+        with _candado:
+            pendientes = _cambios_pendientes.get(ruta, {})
+            if es_ruta_base_datos(ruta):
+                # Solo se escriben las columnas modificadas de cada usuario
+                try:
+                    for nombre_usuario in list(pendientes):
+                        guardar_estado_buff_usuario(
+                            nombre_usuario, _estados_cargados[ruta][nombre_usuario], ruta, list(pendientes[nombre_usuario])
+                        )
+                        del pendientes[nombre_usuario]
+                except Exception as e:
+                    print(f"Error al guardar estado de buffs en la base de datos: {e}")
+                    exito = False
+            else:
+                # Versión actual del disco (puede tener cambios de otro proceso)
+                # + solo las claves que cambió este proceso
+                en_disco = cargar_json(ruta, {})
+                for nombre_usuario in pendientes:
+                    aplicar_cambios_usuario(en_disco, nombre_usuario, pendientes[nombre_usuario])
+                exito = escribir_json_atomico(ruta, en_disco)
+                if exito:
+                    pendientes.clear()
+                    _firmas_cargadas[ruta] = obtener_firma_estado(ruta)
+                    estado = _estados_cargados.setdefault(ruta, {})
+                    estado.clear()
+                    estado.update(en_disco)
+
+            if exito:
+                _rutas_pendientes.discard(ruta)
+
+    return exito
+
+
+# =============================================================================
+# TRANSACCION_ESTADO_BUFF
+# =============================================================================
+# Descripción: Context manager para leer-modificar-escribir el estado de
+#              buffs sin que otro proceso intercale sus cambios
+#
+# Uso en Pygame: Sumar o consumir vidas extra y consumir objetos
+#                (el valor nuevo depende del valor leído)
+#
+# Parámetros:
+#   - ruta (str): Ruta de EstadoBuff.json (default: RUTA_ESTADO_BUFF)
+#
+# Retorna:
+#   - Context manager (no devuelve valor)
+#
+# Ejemplo de uso:
+#   with transaccion_estado_buff():
+#       vidas = obtener_estado_usuario_buff("Juan").get("vidas_extra", 0)
+#       actualizar_estado_usuario_buff("Juan", {"vidas_extra": vidas + 1})
+#
+# Nota: al entrar se relee el disco y al salir se escribe de inmediato,
+#       todo con el bloqueo del archivo tomado. Si el bloqueo no se obtiene
+#       a tiempo se lanza BloqueoNoDisponibleError y el bloque no se ejecuta
+# =============================================================================
+@contextmanager
+def transaccion_estado_buff(ruta: str = None):
+    """Lee y escribe el estado de buffs bajo el bloqueo del archivo."""
+    ruta = resolver_ruta_estado(ruta)
+
+    with bloqueo_archivo(ruta):
+        refrescar_estado_buff(ruta)
+        try:
+            yield
+        finally:
+            volcar_ruta_estado(ruta)
+
+
+# =============================================================================
+# DESCARTAR_CACHE_ESTADO_BUFF
+# =============================================================================
+# Descripción: Vuelca lo pendiente y olvida el estado cargado en memoria
+#
+# Uso en Pygame: Útil si otro programa modificó EstadoBuff.json
+#
+# Parámetros:
+#   - ruta (str): Ruta a descartar (None descarta todas)
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   descartar_cache_estado_buff()
+# =============================================================================
+def descartar_cache_estado_buff(ruta: str = None) -> None:
+    """Vuelca los cambios pendientes y descarta el estado en memoria."""
+    volcar_estados_pendientes()
+    with _candado:
+        if ruta is None:
+            _estados_cargados.clear()
+            _firmas_cargadas.clear()
+        elif resolver_ruta_estado(ruta) in _estados_cargados:
+            del _estados_cargados[resolver_ruta_estado(ruta)]
+            _firmas_cargadas.pop(resolver_ruta_estado(ruta), None)
+
+    return None
+
+
+atexit.register(volcar_estados_pendientes)
@@ -0,0 +1,465 @@
+# =============================================================================
+# ÍNDICE PONDERADO DE PREGUNTAS (TABLAS ALIAS DE WALKER)
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Variante de data/indice_preguntas para elegir preguntas con pesos (por
+#    ejemplo, favorecer categorías o preguntas poco vistas). Por cada nivel
+#    hay una tabla alias sobre sus categorías y por cada (nivel, categoría)
+#    una tabla alias sobre sus preguntas: cada elección es O(1) sin importar
+#    cuántas preguntas tenga el nivel. Como en el índice uniforme, las
+#    preguntas usadas se retiran y se restauran al empezar otra partida.
+#
+# 📥 IMPORTADO EN:
+#    - core/logica_juego.py - preparar_indice_juego (pesos por vistas y
+#      PESOS_CATEGORIA) y obtener_pregunta_para_nivel con índice ponderado
+#    - benchmarks/bench_seleccion_ponderada.py - tiempos y distribución
+#
+# 🔗 DEPENDENCIAS:
+#    - random: para muestrear las tablas
+#    - data/repositorio_preguntas: para construir_pregunta_seleccionada
+#    - models/filtro_vistas: para fue_vista (preguntas de partidas anteriores)
+#    - config/constantes: para INTENTOS_PREGUNTA_NO_VISTA
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Tabla alias (método de Vose): construirla es O(k); muestrear es un
+#      randrange + un random, O(1)
+#    - Retirar es perezoso: la pregunta se marca inactiva y si sale se
+#      vuelve a sortear. Cuando lo retirado supera la mitad del peso de la
+#      tabla, se reconstruye solo con las activas: en promedio nunca hacen
+#      falta más de dos sorteos
+#    - Peso 0 (o negativo) = la pregunta/categoría no se elige nunca
+#    - Sin pesos (todos 1) da la misma distribución que el índice uniforme:
+#      categoría uniforme, luego pregunta uniforme
+#    - Filtro de vistas: igual que en data/indice_preguntas (hasta
+#      INTENTOS_PREGUNTA_NO_VISTA sorteos, después se acepta una vista)
+#
+# Estructura de un grupo (uno por nivel y uno por (nivel, categoría)):
+#    {
+#        "elementos": [categoria o pid, ...],
+#        "pesos": [float, ...],          # fijos, mismo orden que elementos
+#        "activo": [bool, ...],
+#        "disponibles": int,             # elementos activos
+#        "candidatos": [posicion, ...],  # posiciones que están en la tabla
+#        "tabla": {"prob": [...], "alias": [...]},
+#        "peso_tabla": float,            # peso total de los candidatos
+#        "peso_retirado": float          # peso de candidatos ya inactivos
+#    }
+#
+# Estructura del índice:
+#    {
+#        "preguntas": dict,                         # banco original
+#        "pesos_pregunta": dict o None,             # pesos con que se construyó
+#        "pesos_categoria": dict o None,
+#        "niveles": {nivel: grupo de categorías},
+#        "grupos": {(nivel, categoria): grupo de pids},
+#        "posicion": {pid: posicion en su grupo},
+#        "retirados": [(grupo, posicion), ...]      # para restaurar
+#    }
+# =============================================================================
+
+import random
+from data.repositorio_preguntas import construir_pregunta_seleccionada
+from models.filtro_vistas import fue_vista
+from config.constantes import INTENTOS_PREGUNTA_NO_VISTA
+
+# Índices recién construidos (sin tocar; cada consumidor usa una copia):
+# {id(preguntas): (preguntas, pesos_pregunta, pesos_categoria, indice)}
+_indices_ponderados = {}
+
+
+# =============================================================================
+# CREAR_TABLA_ALIAS
+# =============================================================================
+# Descripción: Construye la tabla alias de Walker para una lista de pesos
+#              (método de Vose, O(k))
+#
+# Uso en Pygame: Se usa internamente al crear o reconstruir un grupo
+#
+# Parámetros:
+#   - pesos (list): Pesos positivos
+#
+# Retorna:
+#   - dict: {"prob": [float, ...], "alias": [int, ...]}
+#
+# Ejemplo de uso:
+#   tabla = crear_tabla_alias([1, 1, 2])
+# =============================================================================
+def crear_tabla_alias(pesos: list) -> dict:
+    """Construye la tabla alias de una lista de pesos."""
+    cantidad = len(pesos)
+    prob = [1.0] * cantidad
+    alias = list(range(cantidad))
+    total = sum(pesos)
+
+    if cantidad > 0 and total > 0:
+        escalados = [peso * cantidad / total for peso in pesos]
+        pequenos = []
+        grandes = []
+        for i, escalado in enumerate(escalados):
+            if escalado < 1.0:
+                pequenos.append(i)
+            else:
+                grandes.append(i)
+
+        while pequenos and grandes:
+            menor = pequenos.pop()
+            mayor = grandes.pop()
+            prob[menor] = escalados[menor]
+            alias[menor] = mayor
+            escalados[mayor] = escalados[mayor] + escalados[menor] - 1.0
+            if escalados[mayor] < 1.0:
+                pequenos.append(mayor)
+            else:
+                grandes.append(mayor)
+        # Los que quedan valen 1 (salvo error de redondeo): prob y alias por defecto
+
+    return {"prob": prob, "alias": alias}
+
+
+def muestrear_alias(tabla: dict, rng) -> int:
+    """Devuelve una posición de la tabla según sus pesos, en O(1)."""
+    i = rng.randrange(len(tabla["prob"]))
+    if rng.random() >= tabla["prob"][i]:
+        i = tabla["alias"][i]
+    return i
+
+
+def crear_grupo_alias(elementos: list, pesos: list) -> dict:
+    """Crea un grupo con todos sus elementos activos y su tabla alias."""
+    grupo = {
+        "elementos": elementos,
+        "pesos": pesos,
+        "activo": [True] * len(elementos),
+        "disponibles": len(elementos)
+    }
+    reconstruir_grupo_alias(grupo)
+    return grupo
+
+
+def reconstruir_grupo_alias(grupo: dict) -> None:
+    """Rehace la tabla del grupo solo con los elementos activos."""
+    candidatos = []
+    for posicion, activo in enumerate(grupo["activo"]):
+        if activo:
+            candidatos.append(posicion)
+    pesos = [grupo["pesos"][posicion] for posicion in candidatos]
+
+    grupo["candidatos"] = candidatos
+    grupo["tabla"] = crear_tabla_alias(pesos)
+    grupo["peso_tabla"] = sum(pesos)
+    grupo["peso_retirado"] = 0.0
+    return None
+
+
+def elegir_en_grupo(grupo: dict, rng) -> int:
+    """Elige la posición de un elemento activo según su peso."""
+    posicion = grupo["candidatos"][muestrear_alias(grupo["tabla"], rng)]
+    while not grupo["activo"][posicion]:
+        # Retirado pero todavía en la tabla: se vuelve a sortear
+        posicion = grupo["candidatos"][muestrear_alias(grupo["tabla"], rng)]
+    return posicion
+
+
+def desactivar_en_grupo(grupo: dict, posicion: int) -> None:
+    """Marca un elemento como retirado; reconstruye si la tabla quedó a medias."""
+    grupo["activo"][posicion] = False
+    grupo["disponibles"] -= 1
+    grupo["peso_retirado"] += grupo["pesos"][posicion]
+    if grupo["disponibles"] > 0 and grupo["peso_retirado"] * 2 > grupo["peso_tabla"]:
+        reconstruir_grupo_alias(grupo)
+    return None
+
+
+# =============================================================================
+# CREAR_INDICE_PONDERADO
+# =============================================================================
+# Descripción: Construye las tablas alias por nivel y por (nivel, categoría)
+#
+# Uso en Pygame: Se usa internamente desde preparar_indice_ponderado
+#
+# Parámetros:
+#   - preguntas (dict): Banco de preguntas indexado por ID
+#   - pesos_pregunta (dict): {pid: peso} (opcional, default 1)
+#   - pesos_categoria (dict): {categoria: peso} (opcional, default 1)
+#
+# Retorna:
+#   - dict: Índice con la estructura descrita en el encabezado
+#
+# Ejemplo de uso:
+#   indice = crear_indice_ponderado(preguntas, pesos_categoria={"nordica": 3})
+# =============================================================================
+def crear_indice_ponderado(preguntas: dict, pesos_pregunta: dict = None, pesos_categoria: dict = None) -> dict:
+    """Construye el índice ponderado de un banco de preguntas."""
+    indice = {
+        "preguntas": preguntas,
+        "pesos_pregunta": pesos_pregunta,
+        "pesos_categoria": pesos_categoria,
+        "niveles": {},
+        "grupos": {},
+        "posicion": {},
+        "retirados": []
+    }
+    if pesos_pregunta is None:
+        pesos_pregunta = {}
+    if pesos_categoria is None:
+        pesos_categoria = {}
+
+    # Agrupar IDs con peso positivo por (nivel, categoría)
+    ids_por_clave = {}
+    pesos_por_clave = {}
+    for pid, pregunta in preguntas.items():
+        peso = pesos_pregunta.get(pid, 1.0)
+        if peso > 0:
+            clave = (pregunta["nivel"], pregunta["categoria"])
+            ids_por_clave.setdefault(clave, []).append(pid)
+            pesos_por_clave.setdefault(clave, []).append(peso)
+
+    categorias_por_nivel = {}
+    for clave, ids in ids_por_clave.items():
+        nivel, categoria = clave
+        if pesos_categoria.get(categoria, 1.0) > 0:
+            indice["grupos"][clave] = crear_grupo_alias(ids, pesos_por_clave[clave])
+            for posicion, pid in enumerate(ids):
+                indice["posicion"][pid] = posicion
+            categorias_por_nivel.setdefault(nivel, []).append(categoria)
+
+    for nivel, categorias in categorias_por_nivel.items():
+        pesos = [pesos_categoria.get(categoria, 1.0) for categoria in categorias]
+        indice["niveles"][nivel] = crear_grupo_alias(categorias, pesos)
+
+    return indice
+
+
+def es_indice_ponderado(indice: dict) -> bool:
+    """Indica si un índice es ponderado (y no el de data/indice_preguntas)."""
+    return isinstance(indice, dict) and "niveles" in indice
+
+
+# =============================================================================
+# RESTAURAR_INDICE_PONDERADO
+# =============================================================================
+# Descripción: Vuelve a activar todo lo retirado en la partida anterior.
+#              Los grupos que se reconstruyeron recuperan la tabla completa,
+#              así el índice queda igual que recién construido
+#
+# Uso en Pygame: Se usa al comenzar una partida nueva
+#
+# Parámetros:
+#   - indice (dict): Índice ponderado
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   restaurar_indice_ponderado(indice)
+# =============================================================================
+def restaurar_indice_ponderado(indice: dict) -> None:
+    """Reactiva las preguntas y categorías retiradas, en O(U) más reconstrucciones."""
+    tocados = {}
+    for grupo, posicion in indice["retirados"]:
+        grupo["activo"][posicion] = True
+        grupo["disponibles"] += 1
+        tocados[id(grupo)] = grupo
+    indice["retirados"] = []
+
+    for grupo in tocados.values():
+        if len(grupo["candidatos"]) != len(grupo["elementos"]):
+            reconstruir_grupo_alias(grupo)
+        else:
+            grupo["peso_retirado"] = 0.0
+    return None
+
+
+def copiar_grupo_alias(grupo: dict) -> dict:
+    """Copia las listas mutables de un grupo (elementos y pesos se comparten)."""
+    copia = {
+        "elementos": grupo["elementos"],
+        "pesos": grupo["pesos"],
+        "activo": list(grupo["activo"]),
+        "disponibles": grupo["disponibles"],
+        "candidatos": grupo["candidatos"],
+        "tabla": grupo["tabla"],
+        "peso_tabla": grupo["peso_tabla"],
+        "peso_retirado": grupo["peso_retirado"]
+    }
+    return copia
+
+
+def copiar_indice_ponderado(indice: dict) -> dict:
+    """Copia un índice ponderado sin retiradas (el banco se comparte)."""
+    niveles = {}
+    for nivel, grupo in indice["niveles"].items():
+        niveles[nivel] = copiar_grupo_alias(grupo)
+    grupos = {}
+    for clave, grupo in indice["grupos"].items():
+        grupos[clave] = copiar_grupo_alias(grupo)
+
+    copia = {
+        "preguntas": indice["preguntas"],
+        "pesos_pregunta": indice["pesos_pregunta"],
+        "pesos_categoria": indice["pesos_categoria"],
+        "niveles": niveles,
+        "grupos": grupos,
+        "posicion": indice["posicion"],
+        "retirados": []
+    }
+    return copia
+
+
+def mismos_pesos(pesos_a: dict, pesos_b: dict) -> bool:
+    """Indica si dos juegos de pesos son iguales (los pesos por vistas cambian de dict en cada partida)."""
+    return pesos_a is pesos_b or pesos_a == pesos_b
+
+
+# =============================================================================
+# PREPARAR_INDICE_PONDERADO
+# =============================================================================
+# Descripción: Obtiene un índice ponderado del banco listo para una partida
+#              nueva. Igual que preparar_indice_partida, el índice recién
+#              construido queda guardado sin tocar y cada consumidor recibe
+#              su propia copia
+#
+# Uso en Pygame: En startup, desde core/logica_juego.preparar_indice_juego
+#                cuando alguna categoría pesa distinto de 1
+#
+# Parámetros:
+#   - preguntas (dict): Banco de preguntas indexado por ID
+#   - pesos_pregunta (dict): {pid: peso} (opcional)
+#   - pesos_categoria (dict): {categoria: peso} (opcional)
+#   - indice_anterior (dict): Índice que este consumidor usó en su partida
+#                             anterior (opcional); si es del mismo banco y
+#                             pesos iguales se restaura en lugar de copiarlo
+#
+# Retorna:
+#   - dict: Índice ponderado sin preguntas retiradas
+#
+# Ejemplo de uso:
+#   indice = preparar_indice_ponderado(preguntas, None, pesos, indice)
+# =============================================================================
+def preparar_indice_ponderado(preguntas: dict, pesos_pregunta: dict = None, pesos_categoria: dict = None,
+                              indice_anterior: dict = None) -> dict:
+    """Obtiene un índice ponderado propio del banco listo para una partida nueva."""
+    if (es_indice_ponderado(indice_anterior) and indice_anterior["preguntas"] is preguntas
+            and mismos_pesos(indice_anterior["pesos_pregunta"], pesos_pregunta)
+            and mismos_pesos(indice_anterior["pesos_categoria"], pesos_categoria)):
+        indice = indice_anterior
+        restaurar_indice_ponderado(indice)
+    else:
+        clave = id(preguntas)
+        cargado = _indices_ponderados.get(clave)
+        if (cargado is None or cargado[0] is not preguntas
+                or not mismos_pesos(cargado[1], pesos_pregunta) or not mismos_pesos(cargado[2], pesos_categoria)):
+            cargado = (preguntas, pesos_pregunta, pesos_categoria,
+                       crear_indice_ponderado(preguntas, pesos_pregunta, pesos_categoria))
+            _indices_ponderados.clear()
+            _indices_ponderados[clave] = cargado
+        indice = copiar_indice_ponderado(cargado[3])
+    return indice
+
+
+# =============================================================================
+# SELECCIONAR_PREGUNTA_PONDERADA
+# =============================================================================
+# Descripción: Elige una categoría del nivel según su peso, luego una
+#              pregunta de esa categoría según su peso, y la retira
+#
+# Uso en Pygame: Se usa desde core/logica_juego.obtener_pregunta_para_nivel
+#
+# Parámetros:
+#   - indice (dict): Índice ponderado
+#   - nivel (int): Nivel actual
+#   - rng (random.Random): Generador con semilla (opcional, default: random)
+#   - vistas (dict): Filtro de preguntas vistas del jugador (opcional)
+#
+# Retorna:
+#   - dict: Copia de la pregunta con "id" y opciones mezcladas, o dict vacío
+#
+# Ejemplo de uso:
+#   pregunta = seleccionar_pregunta_ponderada(indice, 1)
+# =============================================================================
+def seleccionar_pregunta_ponderada(indice: dict, nivel: int, rng=None, vistas: dict = None) -> dict:
+    """Selecciona en O(1) una pregunta del nivel según los pesos y la retira."""
+    if rng is None:
+        rng = random
+    pregunta = {}
+    categorias = indice["niveles"].get(nivel)
+
+    if categorias is not None and categorias["disponibles"] > 0:
+        posicion_cat = elegir_en_grupo(categorias, rng)
+        grupo = indice["grupos"][(nivel, categorias["elementos"][posicion_cat])]
+        posicion = elegir_en_grupo(grupo, rng)
+        intentos = 1
+        while vistas is not None and intentos < INTENTOS_PREGUNTA_NO_VISTA and fue_vista(vistas, grupo["elementos"][posicion]):
+            posicion_cat = elegir_en_grupo(categorias, rng)
+            grupo = indice["grupos"][(nivel, categorias["elementos"][posicion_cat])]
+            posicion = elegir_en_grupo(grupo, rng)
+            intentos += 1
+        id_pregunta = grupo["elementos"][posicion]
+
+        desactivar_en_grupo(grupo, posicion)
+        indice["retirados"].append((grupo, posicion))
+        if grupo["disponibles"] == 0:
+            # La categoría se quedó sin preguntas en este nivel
+            desactivar_en_grupo(categorias, posicion_cat)
+            indice["retirados"].append((categorias, posicion_cat))
+
+        pregunta = construir_pregunta_seleccionada(indice["preguntas"], id_pregunta, rng)
+
+    return pregunta
+
+
+# =============================================================================
+# CALCULAR_PESOS_POR_VISTAS
+# =============================================================================
+# Descripción: Convierte conteos de veces vistas en pesos que favorecen lo
+#              menos visto: peso = 1 / (1 + vistas)
+#
+# Uso en Pygame: core/logica_juego.preparar_indice_juego, con los conteos de
+#                contar_vistas_por_categoria (también sirve con el historial,
+#                por ejemplo core/registro_eventos.contar_preguntas_sorteadas)
+#
+# Parámetros:
+#   - vistas (dict): {clave: veces vista}
+#
+# Retorna:
+#   - dict: {clave: peso}
+#
+# Ejemplo de uso:
+#   pesos = calcular_pesos_por_vistas({"griega": 12, "nordica": 2})
+# =============================================================================
+def calcular_pesos_por_vistas(vistas: dict) -> dict:
+    """Calcula pesos inversos a la cantidad de veces vista."""
+    pesos = {}
+    for clave, cantidad in vistas.items():
+        pesos[clave] = 1.0 / (1 + cantidad)
+    return pesos
+
+
+# =============================================================================
+# CONTAR_VISTAS_POR_CATEGORIA
+# =============================================================================
+# Descripción: Cuenta cuántas preguntas de cada categoría están en el filtro
+#              de vistas del jugador (incluye los falsos positivos del filtro)
+#
+# Uso en Pygame: Al empezar la partida, para calcular_pesos_por_vistas
+#
+# Parámetros:
+#   - preguntas (dict): Banco de preguntas indexado por ID
+#   - vistas (dict): Filtro de preguntas vistas (models/filtro_vistas)
+#
+# Retorna:
+#   - dict: {categoria: preguntas vistas} (0 para las categorías sin vistas)
+#
+# Ejemplo de uso:
+#   pesos = calcular_pesos_por_vistas(contar_vistas_por_categoria(preguntas, vistas))
+# =============================================================================
+def contar_vistas_por_categoria(preguntas: dict, vistas: dict) -> dict:
+    """Cuenta las preguntas vistas de cada categoría."""
+    conteo = {}
+    for pid, pregunta in preguntas.items():
+        categoria = pregunta["categoria"]
+        if categoria not in conteo:
+            conteo[categoria] = 0
+        if fue_vista(vistas, pid):
+            conteo[categoria] += 1
+    return conteo
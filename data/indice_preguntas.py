@@ -0,0 +1,328 @@
+# =============================================================================
+# ÍNDICE DE PREGUNTAS POR (NIVEL, CATEGORÍA)
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Estructura auxiliar que agrupa los IDs de preguntas por (nivel, categoría)
+#    para seleccionar una pregunta no usada en tiempo constante. Las preguntas
+#    elegidas se retiran del índice (removal-on-use) y se restauran al empezar
+#    la siguiente partida.
+#
+# 📥 IMPORTADO EN:
+#    - core/logica_juego.py - para obtener_pregunta_para_nivel con índice
+#    - ui/Pygame/Estados/Gameplay/gameplay.py - para preparar_indice_partida
+#    - ui/Pygame/Estados/Gameplay/gestor_preguntas.py - para preparar_indice_partida
+#    - ui/consola/juego_consola.py - para preparar_indice_partida
+#    - core/reproduccion_partidas.py - para preparar_indice_partida (re-sorteo con semilla)
+#
+# 🔗 DEPENDENCIAS:
+#    - random: para elegir categoría y pregunta
+#    - data/repositorio_preguntas: para construir_pregunta_seleccionada
+#    - models/filtro_vistas: para fue_vista (preguntas de partidas anteriores)
+#    - config/constantes: para INTENTOS_PREGUNTA_NO_VISTA
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - filtrar_preguntas_por_nivel es O(N·U) por pregunta; aquí cada
+#      selección es O(1): elegir categoría, elegir posición, swap-remove
+#    - Misma distribución que seleccionar_pregunta_aleatoria: primero una
+#      categoría uniforme entre las que tienen preguntas, luego una pregunta
+#    - El índice se construye una vez por banco (O(N)) y nunca se entrega:
+#      cada consumidor (partida, reproducción, simulación) recibe una copia.
+#      Si pasa su índice anterior, restaurar las preguntas retiradas cuesta
+#      O(U), no O(N)
+#    - Restaurar deshace los swap-remove en orden inverso: el índice queda
+#      igual que recién construido, así una partida con semilla (rng)
+#      saca siempre las mismas preguntas sin importar las anteriores
+#    - Con un filtro de vistas se sortea hasta INTENTOS_PREGUNTA_NO_VISTA
+#      veces buscando una no vista; si el nivel ya no tiene (o no apareció)
+#      se usa la última sorteada: nunca se queda sin pregunta por el filtro
+#
+# Estructura del índice:
+#    {
+#        "preguntas": dict,                       # banco original
+#        "ids": {(nivel, categoria): [pid, ...]}, # preguntas disponibles
+#        "posicion": {pid: int},                  # posición en su lista
+#        "categorias": {nivel: [categoria, ...]}, # categorías con preguntas
+#        "posicion_categoria": {(nivel, categoria): int},
+#        "retirados": [(pid, posicion, posicion_categoria), ...]
+#                     # usadas en la partida; posicion_categoria es -1 si la
+#                     # categoría no se quedó vacía al retirar
+#    }
+# =============================================================================
+
+import random
+from data.repositorio_preguntas import construir_pregunta_seleccionada
+from models.filtro_vistas import fue_vista
+from config.constantes import INTENTOS_PREGUNTA_NO_VISTA
+
+# Índices recién construidos (nunca se modifican): {id(preguntas): (preguntas, indice)}
+_indices_cargados = {}
+
+
+# =============================================================================
+# CREAR_INDICE_PREGUNTAS
+# =============================================================================
+# Descripción: Construye el índice (nivel, categoría) de un banco de preguntas
+#
+# Uso en Pygame: Se usa internamente desde preparar_indice_partida
+#
+# Parámetros:
+#   - preguntas (dict): Banco de preguntas indexado por ID
+#
+# Retorna:
+#   - dict: Índice con la estructura descrita en el encabezado
+#
+# Ejemplo de uso:
+#   indice = crear_indice_preguntas(preguntas)
+# =============================================================================
+def crear_indice_preguntas(preguntas: dict) -> dict:
+    """Construye el índice (nivel, categoría) de un banco de preguntas."""
+    indice = {
+        "preguntas": preguntas,
+        "ids": {},
+        "posicion": {},
+        "categorias": {},
+        "posicion_categoria": {},
+        "retirados": []
+    }
+
+    for pid, pregunta in preguntas.items():
+        agregar_pregunta_indice(indice, pid, pregunta["nivel"], pregunta["categoria"])
+
+    return indice
+
+
+# =============================================================================
+# AGREGAR_PREGUNTA_INDICE
+# =============================================================================
+# Descripción: Agrega un ID al final de la lista de su (nivel, categoría)
+#
+# Uso en Pygame: Se usa internamente al crear y al restaurar el índice
+#
+# Parámetros:
+#   - indice (dict): Índice de preguntas
+#   - pid (int): ID de la pregunta
+#   - nivel (int): Nivel de la pregunta
+#   - categoria (str): Categoría de la pregunta
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   agregar_pregunta_indice(indice, 7, 1, "griega")
+# =============================================================================
+def agregar_pregunta_indice(indice: dict, pid: int, nivel: int, categoria: str) -> None:
+    """Agrega un ID a la lista de su (nivel, categoría) en O(1)."""
+    clave = (nivel, categoria)
+    if clave not in indice["ids"]:
+        indice["ids"][clave] = []
+
+    ids = indice["ids"][clave]
+    if not ids:
+        # La categoría vuelve a tener preguntas disponibles en este nivel
+        categorias = indice["categorias"].setdefault(nivel, [])
+        indice["posicion_categoria"][clave] = len(categorias)
+        categorias.append(categoria)
+
+    indice["posicion"][pid] = len(ids)
+    ids.append(pid)
+    return None
+
+
+# =============================================================================
+# RETIRAR_PREGUNTA_INDICE
+# =============================================================================
+# Descripción: Quita un ID del índice intercambiándolo con el último (O(1))
+#
+# Uso en Pygame: Se usa al seleccionar una pregunta
+#
+# Parámetros:
+#   - indice (dict): Índice de preguntas
+#   - pid (int): ID de la pregunta a retirar
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   retirar_pregunta_indice(indice, 7)
+# =============================================================================
+def retirar_pregunta_indice(indice: dict, pid: int) -> None:
+    """Quita un ID del índice con swap-remove."""
+    if pid in indice["posicion"]:
+        pregunta = indice["preguntas"][pid]
+        nivel = pregunta["nivel"]
+        clave = (nivel, pregunta["categoria"])
+        ids = indice["ids"][clave]
+
+        posicion = indice["posicion"].pop(pid)
+        ultimo = ids.pop()
+        if ultimo != pid:
+            ids[posicion] = ultimo
+            indice["posicion"][ultimo] = posicion
+
+        posicion_cat = -1
+        if not ids:
+            # La categoría se quedó sin preguntas: también se retira (swap-remove)
+            categorias = indice["categorias"][nivel]
+            posicion_cat = indice["posicion_categoria"].pop(clave)
+            ultima_cat = categorias.pop()
+            if ultima_cat != clave[1]:
+                categorias[posicion_cat] = ultima_cat
+                indice["posicion_categoria"][(nivel, ultima_cat)] = posicion_cat
+
+        indice["retirados"].append((pid, posicion, posicion_cat))
+    return None
+
+
+def deshacer_swap_remove(lista: list, posiciones: dict, clave_posicion, elemento, posicion: int) -> None:
+    """Vuelve a poner 'elemento' en 'posicion' y el desplazado al final."""
+    if posicion < len(lista):
+        desplazado = lista[posicion]
+        posiciones[clave_posicion(desplazado)] = len(lista)
+        lista.append(desplazado)
+        lista[posicion] = elemento
+    else:
+        lista.append(elemento)
+    posiciones[clave_posicion(elemento)] = posicion
+    return None
+
+
+# =============================================================================
+# RESTAURAR_INDICE
+# =============================================================================
+# Descripción: Vuelve a agregar todas las preguntas retiradas deshaciendo
+#              los retiros en orden inverso: el índice queda en el mismo
+#              orden que al construirlo
+#
+# Uso en Pygame: Se usa al comenzar una partida nueva
+#
+# Parámetros:
+#   - indice (dict): Índice de preguntas
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   restaurar_indice(indice)
+# =============================================================================
+def restaurar_indice(indice: dict) -> None:
+    """Vuelve a agregar al índice todas las preguntas retiradas."""
+    retirados = indice["retirados"]
+    indice["retirados"] = []
+    i = len(retirados) - 1
+    while i >= 0:
+        pid, posicion, posicion_cat = retirados[i]
+        pregunta = indice["preguntas"][pid]
+        nivel = pregunta["nivel"]
+        categoria = pregunta["categoria"]
+
+        # Se deshace en orden inverso al retiro: primero la categoría
+        if posicion_cat >= 0:
+            deshacer_swap_remove(indice["categorias"][nivel], indice["posicion_categoria"],
+                                 lambda cat: (nivel, cat), categoria, posicion_cat)
+        deshacer_swap_remove(indice["ids"][(nivel, categoria)], indice["posicion"],
+                             lambda pid_movido: pid_movido, pid, posicion)
+        i -= 1
+    return None
+
+
+def copiar_indice(indice: dict) -> dict:
+    """Copia las listas y posiciones del índice (el banco se comparte)."""
+    ids = {}
+    for clave, lista in indice["ids"].items():
+        ids[clave] = list(lista)
+    categorias = {}
+    for nivel, lista in indice["categorias"].items():
+        categorias[nivel] = list(lista)
+
+    copia = {
+        "preguntas": indice["preguntas"],
+        "ids": ids,
+        "posicion": dict(indice["posicion"]),
+        "categorias": categorias,
+        "posicion_categoria": dict(indice["posicion_categoria"]),
+        "retirados": []
+    }
+    return copia
+
+
+# =============================================================================
+# PREPARAR_INDICE_PARTIDA
+# =============================================================================
+# Descripción: Obtiene un índice del banco con todas las preguntas
+#              disponibles, listo para una partida nueva. El índice recién
+#              construido queda guardado sin tocar y cada consumidor recibe
+#              su propia copia: una reproducción o simulación en el mismo
+#              proceso no altera el índice de la partida en curso
+#
+# Uso en Pygame: Se llama en startup junto con cargar_preguntas_desde_csv
+#
+# Parámetros:
+#   - preguntas (dict): Banco de preguntas indexado por ID
+#   - indice_anterior (dict): Índice que este consumidor usó en su partida
+#                             anterior (opcional); si es del mismo banco se
+#                             restaura en O(U) en lugar de copiarlo
+#
+# Retorna:
+#   - dict: Índice de preguntas sin preguntas retiradas
+#
+# Ejemplo de uso:
+#   preguntas = cargar_preguntas_desde_csv(RUTA_PREGUNTAS)
+#   indice = preparar_indice_partida(preguntas, indice)
+# =============================================================================
+def preparar_indice_partida(preguntas: dict, indice_anterior: dict = None) -> dict:
+    """Obtiene un índice propio del banco listo para una partida nueva."""
+    if indice_anterior is not None and indice_anterior["preguntas"] is preguntas:
+        indice = indice_anterior
+        restaurar_indice(indice)
+    else:
+        clave = id(preguntas)
+        if clave not in _indices_cargados or _indices_cargados[clave][0] is not preguntas:
+            _indices_cargados.clear()
+            _indices_cargados[clave] = (preguntas, crear_indice_preguntas(preguntas))
+        indice = copiar_indice(_indices_cargados[clave][1])
+    return indice
+
+
+def elegir_id_indice(indice: dict, nivel: int, rng) -> int:
+    """Sortea un ID disponible del nivel (categoría uniforme) sin retirarlo."""
+    categoria = rng.choice(indice["categorias"][nivel])
+    return rng.choice(indice["ids"][(nivel, categoria)])
+
+
+# =============================================================================
+# SELECCIONAR_PREGUNTA_INDICE
+# =============================================================================
+# Descripción: Selecciona una pregunta no usada del nivel (categoría
+#              uniforme, luego pregunta uniforme) y la retira del índice
+#
+# Uso en Pygame: Se usa desde core/logica_juego.obtener_pregunta_para_nivel
+#
+# Parámetros:
+#   - indice (dict): Índice de preguntas
+#   - nivel (int): Nivel actual
+#   - rng (random.Random): Generador con semilla (opcional, default: random)
+#   - vistas (dict): Filtro de preguntas vistas del jugador (opcional)
+#
+# Retorna:
+#   - dict: Copia de la pregunta con "id" y opciones mezcladas, o dict vacío
+#
+# Ejemplo de uso:
+#   pregunta = seleccionar_pregunta_indice(indice, 1)
+# =============================================================================
+def seleccionar_pregunta_indice(indice: dict, nivel: int, rng=None, vistas: dict = None) -> dict:
+    """Selecciona en O(1) una pregunta no usada del nivel y la retira."""
+    if rng is None:
+        rng = random
+    pregunta = {}
+    categorias = indice["categorias"].get(nivel, [])
+
+    if categorias:
+        id_pregunta = elegir_id_indice(indice, nivel, rng)
+        intentos = 1
+        while vistas is not None and intentos < INTENTOS_PREGUNTA_NO_VISTA and fue_vista(vistas, id_pregunta):
+            id_pregunta = elegir_id_indice(indice, nivel, rng)
+            intentos += 1
+        retirar_pregunta_indice(indice, id_pregunta)
+        pregunta = construir_pregunta_seleccionada(indice["preguntas"], id_pregunta, rng)
+
+    return pregunta
@@ -0,0 +1,241 @@
+# =============================================================================
+# ÍNDICE DE USUARIOS (NOMBRE → RANGO DE BYTES)
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Escribe Usuarios.json con un usuario por línea y, junto a él, un índice
+#    ordenado con la posición (inicio, fin) en bytes del registro de cada
+#    usuario. Así un perfil se lee con una búsqueda binaria en el índice,
+#    un seek en Usuarios.json y un json.loads de un solo registro.
+#
+# 📥 IMPORTADO EN:
+#    - data/repositorio_usuarios.py - para guardar el snapshot y leer perfiles
+#
+# 🔗 DEPENDENCIAS:
+#    - os: para tamaño y fecha de modificación (validez del índice)
+#    - json: para serializar registros y nombres
+#    - data/archivos_json: para escribir_archivo_atomico
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Usuarios.json sigue siendo JSON válido: json.load lo lee completo igual
+#    - El índice guarda tamaño y mtime de Usuarios.json: si alguien modificó
+#      el archivo por otro medio, el índice se considera viejo y se usa la
+#      carga completa (fallback)
+#    - Búsqueda binaria sobre el archivo del índice: O(log n) lecturas
+#      cortas, sin cargar el índice entero en memoria
+#
+# Formato del índice (Usuarios_indice.txt):
+#    #{"tamano": <bytes de Usuarios.json>, "mtime_ns": <int>}
+#    "Ana"<TAB>15<TAB>402
+#    "Juan"<TAB>408<TAB>977
+#    ...   (ordenado por el nombre codificado en JSON)
+# =============================================================================
+
+import os
+import json
+from data.archivos_json import escribir_archivo_atomico
+
+
+# =============================================================================
+# OBTENER_RUTA_INDICE_USUARIOS
+# =============================================================================
+# Descripción: Obtiene la ruta del índice asociado a un archivo de usuarios
+#
+# Uso en Pygame: Se usa internamente
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - str: Ruta del índice (ej: Usuarios_indice.txt)
+#
+# Ejemplo de uso:
+#   ruta = obtener_ruta_indice_usuarios("assets/Usuarios.json")
+# =============================================================================
+def obtener_ruta_indice_usuarios(archivo_usuarios: str) -> str:
+    """Obtiene la ruta del índice asociado a un archivo de usuarios."""
+    base, _ = os.path.splitext(archivo_usuarios)
+    return base + "_indice.txt"
+
+
+def codificar_clave_usuario(nombre: str) -> bytes:
+    """Codifica el nombre como JSON ASCII (sin tabs ni saltos de línea)."""
+    return json.dumps(nombre, ensure_ascii=True).encode("ascii")
+
+
+def obtener_firma_archivo(archivo: str) -> dict:
+    """Obtiene tamaño y fecha de modificación de un archivo."""
+    estado = os.stat(archivo)
+    return {"tamano": estado.st_size, "mtime_ns": estado.st_mtime_ns}
+
+
+# =============================================================================
+# GUARDAR_USUARIOS_INDEXADO
+# =============================================================================
+# Descripción: Guarda todos los usuarios (un registro por línea) y su índice
+#
+# Uso en Pygame: Se usa al compactar el diario de partidas
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#   - datos (dict): Diccionario de todos los usuarios
+#
+# Retorna:
+#   - bool: True si se guardó Usuarios.json (el índice es opcional: si
+#           falla, las lecturas usan la carga completa)
+#
+# Ejemplo de uso:
+#   guardar_usuarios_indexado(RUTA_USUARIOS, datos)
+# =============================================================================
+def guardar_usuarios_indexado(archivo_usuarios: str, datos: dict) -> bool:
+    """Guarda Usuarios.json con un registro por línea y su índice de offsets."""
+    partes = [b"{\n"]
+    posicion = 2
+    entradas_indice = []
+
+    nombres = list(datos)
+    i = 0
+    while i < len(nombres):
+        nombre = nombres[i]
+        prefijo = b"  " + json.dumps(nombre, ensure_ascii=False).encode("utf-8") + b": "
+        registro = json.dumps(datos[nombre], ensure_ascii=False).encode("utf-8")
+        separador = b",\n" if i < len(nombres) - 1 else b"\n"
+
+        inicio = posicion + len(prefijo)
+        fin = inicio + len(registro)
+        entradas_indice.append((codificar_clave_usuario(nombre), inicio, fin))
+
+        partes.append(prefijo)
+        partes.append(registro)
+        partes.append(separador)
+        posicion = fin + len(separador)
+        i += 1
+    partes.append(b"}\n")
+
+    exito = escribir_archivo_atomico(archivo_usuarios, b"".join(partes))
+    if exito:
+        entradas_indice.sort()
+        lineas = [b"#" + json.dumps(obtener_firma_archivo(archivo_usuarios)).encode("ascii") + b"\n"]
+        for clave, inicio, fin in entradas_indice:
+            lineas.append(clave + b"\t" + str(inicio).encode("ascii") + b"\t" + str(fin).encode("ascii") + b"\n")
+        escribir_archivo_atomico(obtener_ruta_indice_usuarios(archivo_usuarios), b"".join(lineas))
+
+    return exito
+
+
+# =============================================================================
+# INDICE_USUARIOS_VIGENTE
+# =============================================================================
+# Descripción: Indica si el índice corresponde al Usuarios.json actual
+#
+# Uso en Pygame: Se usa al iniciar para decidir si hay que reindexar
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - bool: True si existe y su firma coincide con la del archivo
+#
+# Ejemplo de uso:
+#   if not indice_usuarios_vigente(RUTA_USUARIOS): ...
+# =============================================================================
+def indice_usuarios_vigente(archivo_usuarios: str) -> bool:
+    """Indica si el índice corresponde al Usuarios.json actual."""
+    vigente = False
+    try:
+        with open(obtener_ruta_indice_usuarios(archivo_usuarios), "rb") as f:
+            encabezado = f.readline()
+        if encabezado.startswith(b"#"):
+            vigente = json.loads(encabezado[1:]) == obtener_firma_archivo(archivo_usuarios)
+    except (OSError, ValueError):
+        vigente = False
+    return vigente
+
+
+# =============================================================================
+# BUSCAR_RANGO_USUARIO
+# =============================================================================
+# Descripción: Búsqueda binaria del nombre en el archivo del índice
+#
+# Uso en Pygame: Se usa internamente desde leer_usuario_indexado
+#
+# Parámetros:
+#   - f: Archivo del índice abierto en modo binario
+#   - clave (bytes): Nombre codificado (codificar_clave_usuario)
+#   - inicio (int): Byte donde empiezan las líneas (después del encabezado)
+#   - fin (int): Tamaño del archivo del índice
+#
+# Retorna:
+#   - tuple: (inicio, fin) del registro en Usuarios.json, o None
+#
+# Ejemplo de uso:
+#   rango = buscar_rango_usuario(f, b'"Juan"', 40, 9000)
+# =============================================================================
+def buscar_rango_usuario(f, clave: bytes, inicio: int, fin: int):
+    """Busca el rango de bytes de un usuario con búsqueda binaria."""
+    # Invariante: las líneas que empiezan antes de 'bajo' tienen clave menor;
+    # la primera línea que empieza en 'alto' o después tiene clave >= buscada
+    bajo = inicio
+    alto = fin
+    while bajo < alto:
+        medio = (bajo + alto) // 2
+        f.seek(medio - 1)
+        f.readline()  # Avanzar al comienzo de la primera línea en medio o después
+        comienzo = f.tell()
+        if comienzo >= alto:
+            alto = medio
+        else:
+            linea = f.readline()
+            if linea.split(b"\t", 1)[0] < clave:
+                bajo = f.tell()
+            else:
+                alto = medio
+
+    rango = None
+    f.seek(bajo)
+    campos = f.readline().rstrip(b"\n").split(b"\t")
+    if len(campos) == 3 and campos[0] == clave:
+        rango = (int(campos[1]), int(campos[2]))
+    return rango
+
+
+# =============================================================================
+# LEER_USUARIO_INDEXADO
+# =============================================================================
+# Descripción: Lee el registro de un usuario con el índice (seek + parse)
+#
+# Uso en Pygame: Se usa desde obtener_usuario
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#   - nombre_usuario (str): Nombre del usuario
+#
+# Retorna:
+#   - dict: {"vigente": bool, "usuario": dict o None}
+#           vigente=False indica que hay que usar la carga completa
+#
+# Ejemplo de uso:
+#   lectura = leer_usuario_indexado(RUTA_USUARIOS, "Juan")
+#   if lectura["vigente"] and lectura["usuario"] is not None: ...
+# =============================================================================
+def leer_usuario_indexado(archivo_usuarios: str, nombre_usuario: str) -> dict:
+    """Lee el registro de un usuario usando el índice de offsets."""
+    lectura = {"vigente": False, "usuario": None}
+    try:
+        with open(obtener_ruta_indice_usuarios(archivo_usuarios), "rb") as f:
+            encabezado = f.readline()
+            if not encabezado.startswith(b"#"):
+                return lectura
+            if json.loads(encabezado[1:]) != obtener_firma_archivo(archivo_usuarios):
+                return lectura
+            rango = buscar_rango_usuario(
+                f, codificar_clave_usuario(nombre_usuario), f.tell(), os.fstat(f.fileno()).st_size
+            )
+
+        lectura["vigente"] = True
+        if rango is not None:
+            with open(archivo_usuarios, "rb") as datos:
+                datos.seek(rango[0])
+                lectura["usuario"] = json.loads(datos.read(rango[1] - rango[0]).decode("utf-8"))
+    except (OSError, ValueError):
+        lectura = {"vigente": False, "usuario": None}
+    return lectura
@@ -0,0 +1,315 @@
+# =============================================================================
+# RANKING MATERIALIZADO (TOP-K)
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Tabla persistida con los K mejores jugadores, ordenada por mejor puntaje.
+#    Se actualiza de forma incremental cada vez que se guarda una partida,
+#    así la pantalla de Rankings la lee sin cargar todos los usuarios.
+#
+# 📥 IMPORTADO EN:
+#    - data/repositorio_usuarios.py - para actualizar y leer el top-K
+#      (también uno por shard con BACKEND_USUARIOS == "shards")
+#
+# 🔗 DEPENDENCIAS:
+#    - os: para derivar la ruta del archivo de ranking
+#    - data/archivos_json: para cargar_json, guardar_json
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Leer el ranking es O(K), sin importar cuántos jugadores existan
+#    - Actualizar es O(K): quitar la entrada vieja e insertar la nueva en orden
+#    - Cada entrada guarda las sumas de puntajes y porcentajes para poder
+#      recalcular los promedios sin recorrer el historial del jugador
+#    - Con usuarios repartidos en shards, el top-K global es la fusión de los
+#      top-K de cada shard (cada jugador está en un solo shard)
+#
+# Formato del archivo (Usuarios_ranking.json):
+#    {
+#        "capacidad": K,
+#        "entradas": [
+#            {"nombre", "mejor_puntaje", "promedio_puntaje", "mejor_porcentaje",
+#             "promedio_porcentaje", "intentos", "suma_puntaje", "suma_porcentaje"},
+#            ...
+#        ]
+#    }
+# =============================================================================
+
+import os
+from data.archivos_json import cargar_json, guardar_json
+
+# Claves internas que no se muestran en pantalla
+CLAVES_INTERNAS_RANKING = ("suma_puntaje", "suma_porcentaje")
+
+
+# =============================================================================
+# OBTENER_RUTA_RANKING
+# =============================================================================
+# Descripción: Obtiene la ruta del ranking asociado a un archivo de usuarios
+#
+# Uso en Pygame: Se usa internamente
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - str: Ruta del ranking (ej: Usuarios_ranking.json)
+#
+# Ejemplo de uso:
+#   ruta = obtener_ruta_ranking("assets/Usuarios.json")
+# =============================================================================
+def obtener_ruta_ranking(archivo_usuarios: str) -> str:
+    """Obtiene la ruta del ranking asociado a un archivo de usuarios."""
+    base, _ = os.path.splitext(archivo_usuarios)
+    return base + "_ranking.json"
+
+
+# =============================================================================
+# CARGAR_RANKING_MATERIALIZADO
+# =============================================================================
+# Descripción: Carga la tabla top-K desde disco
+#
+# Uso en Pygame: Se usa al abrir Rankings y al guardar una partida
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - dict: Tabla {"capacidad", "entradas"} o None si no existe o es inválida
+#
+# Ejemplo de uso:
+#   tabla = cargar_ranking_materializado(RUTA_USUARIOS)
+# =============================================================================
+def cargar_ranking_materializado(archivo_usuarios: str):
+    """Carga la tabla top-K desde disco."""
+    tabla = cargar_json(obtener_ruta_ranking(archivo_usuarios), {})
+    if not isinstance(tabla, dict) or "capacidad" not in tabla or "entradas" not in tabla:
+        tabla = None
+    return tabla
+
+
+# =============================================================================
+# GUARDAR_RANKING_MATERIALIZADO
+# =============================================================================
+# Descripción: Guarda la tabla top-K (escritura atómica de guardar_json)
+#
+# Uso en Pygame: Se usa internamente tras actualizar la tabla
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#   - tabla (dict): Tabla {"capacidad", "entradas"}
+#
+# Retorna:
+#   - bool: True si se guardó correctamente
+#
+# Ejemplo de uso:
+#   guardar_ranking_materializado(RUTA_USUARIOS, tabla)
+# =============================================================================
+def guardar_ranking_materializado(archivo_usuarios: str, tabla: dict) -> bool:
+    """Guarda la tabla top-K."""
+    return guardar_json(obtener_ruta_ranking(archivo_usuarios), tabla)
+
+
+# =============================================================================
+# CREAR_TABLA_RANKING
+# =============================================================================
+# Descripción: Crea una tabla top-K vacía
+#
+# Uso en Pygame: Se usa al reconstruir el ranking
+#
+# Parámetros:
+#   - capacidad (int): Cantidad máxima de jugadores (K)
+#
+# Retorna:
+#   - dict: Tabla vacía
+#
+# Ejemplo de uso:
+#   tabla = crear_tabla_ranking(10)
+# =============================================================================
+def crear_tabla_ranking(capacidad: int) -> dict:
+    """Crea una tabla top-K vacía."""
+    return {"capacidad": capacidad, "entradas": []}
+
+
+# =============================================================================
+# CONSTRUIR_ENTRADA_RANKING
+# =============================================================================
+# Descripción: Arma una entrada del ranking a partir de los agregados
+#
+# Uso en Pygame: Se usa al guardar partidas y al reconstruir
+#
+# Parámetros:
+#   - nombre (str): Nombre del jugador
+#   - intentos (int): Partidas jugadas
+#   - mejor_puntaje (int): Mejor puntaje
+#   - suma_puntaje (int): Suma de todos los puntajes
+#   - mejor_porcentaje (float): Mejor porcentaje de aciertos
+#   - suma_porcentaje (float): Suma de todos los porcentajes
+#
+# Retorna:
+#   - dict: Entrada con los campos de obtener_ranking más las sumas
+#
+# Ejemplo de uso:
+#   entrada = construir_entrada_ranking("Juan", 2, 20, 32, 80.0, 150.0)
+# =============================================================================
+def construir_entrada_ranking(nombre: str, intentos: int, mejor_puntaje, suma_puntaje, mejor_porcentaje, suma_porcentaje) -> dict:
+    """Arma una entrada del ranking a partir de los agregados del jugador."""
+    promedio_puntaje = 0
+    promedio_porcentaje = 0
+    if intentos > 0:
+        promedio_puntaje = suma_puntaje / intentos
+        promedio_porcentaje = suma_porcentaje / intentos
+
+    return {
+        "nombre": nombre,
+        "mejor_puntaje": mejor_puntaje,
+        "promedio_puntaje": round(promedio_puntaje, 2),
+        "mejor_porcentaje": mejor_porcentaje,
+        "promedio_porcentaje": round(promedio_porcentaje, 1),
+        "intentos": intentos,
+        "suma_puntaje": suma_puntaje,
+        "suma_porcentaje": suma_porcentaje
+    }
+
+
+# =============================================================================
+# BUSCAR_ENTRADA_RANKING
+# =============================================================================
+# Descripción: Busca la entrada de un jugador en la tabla (O(K))
+#
+# Uso en Pygame: Se usa al guardar una partida
+#
+# Parámetros:
+#   - tabla (dict): Tabla top-K
+#   - nombre (str): Nombre del jugador
+#
+# Retorna:
+#   - dict: Entrada del jugador o None si no está en el top-K
+#
+# Ejemplo de uso:
+#   entrada = buscar_entrada_ranking(tabla, "Juan")
+# =============================================================================
+def buscar_entrada_ranking(tabla: dict, nombre: str):
+    """Busca la entrada de un jugador en la tabla top-K."""
+    encontrada = None
+    for entrada in tabla["entradas"]:
+        if entrada["nombre"] == nombre:
+            encontrada = entrada
+            break
+    return encontrada
+
+
+# =============================================================================
+# PUEDE_ENTRAR_AL_RANKING
+# =============================================================================
+# Descripción: Indica si un puntaje alcanza para entrar al top-K
+#
+# Uso en Pygame: Se usa al guardar una partida de un jugador fuera del top-K
+#
+# Parámetros:
+#   - tabla (dict): Tabla top-K
+#   - puntaje (int): Mejor puntaje del jugador
+#
+# Retorna:
+#   - bool: True si hay lugar libre o supera al último
+#
+# Ejemplo de uso:
+#   if puede_entrar_al_ranking(tabla, 25): ...
+# =============================================================================
+def puede_entrar_al_ranking(tabla: dict, puntaje) -> bool:
+    """Indica si un puntaje alcanza para entrar al top-K."""
+    entradas = tabla["entradas"]
+    return len(entradas) < tabla["capacidad"] or puntaje > entradas[-1]["mejor_puntaje"]
+
+
+# =============================================================================
+# ACTUALIZAR_ENTRADA_RANKING
+# =============================================================================
+# Descripción: Reemplaza o inserta la entrada de un jugador manteniendo el
+#              orden por mejor puntaje y la capacidad K (O(K))
+#
+# Uso en Pygame: Se usa al guardar partidas y al reconstruir
+#
+# Parámetros:
+#   - tabla (dict): Tabla top-K (se modifica)
+#   - entrada (dict): Entrada nueva del jugador
+#
+# Retorna:
+#   - dict: Tabla actualizada
+#
+# Ejemplo de uso:
+#   tabla = actualizar_entrada_ranking(tabla, entrada)
+# =============================================================================
+def actualizar_entrada_ranking(tabla: dict, entrada: dict) -> dict:
+    """Reemplaza o inserta la entrada de un jugador en el top-K."""
+    entradas = []
+    for existente in tabla["entradas"]:
+        if existente["nombre"] != entrada["nombre"]:
+            entradas.append(existente)
+
+    # Posición: después de los que tienen igual o mayor puntaje (orden estable)
+    posicion = 0
+    while posicion < len(entradas) and entradas[posicion]["mejor_puntaje"] >= entrada["mejor_puntaje"]:
+        posicion += 1
+    entradas.insert(posicion, entrada)
+
+    tabla["entradas"] = entradas[:tabla["capacidad"]]
+    return tabla
+
+
+# =============================================================================
+# FUSIONAR_TABLAS_RANKING
+# =============================================================================
+# Descripción: Une varias tablas top-K de jugadores disjuntos en una sola
+#
+# Uso en Pygame: Ranking global con BACKEND_USUARIOS == "shards"
+#
+# Parámetros:
+#   - tablas (list): Tablas top-K (una por shard)
+#   - capacidad (int): K de la tabla resultante
+#
+# Retorna:
+#   - dict: Tabla con los K mejores de todas las tablas
+#
+# Ejemplo de uso:
+#   tabla = fusionar_tablas_ranking([tabla_0, tabla_1], 10)
+#
+# Nota: cada tabla está ordenada, así que al primer jugador que no entra
+#       se pasa a la siguiente tabla. Costo O(S * K * K) con S tablas.
+# =============================================================================
+def fusionar_tablas_ranking(tablas: list, capacidad: int) -> dict:
+    """Une varias tablas top-K de jugadores disjuntos en una sola."""
+    fusionada = crear_tabla_ranking(capacidad)
+    for tabla in tablas:
+        for entrada in tabla["entradas"]:
+            if not puede_entrar_al_ranking(fusionada, entrada["mejor_puntaje"]):
+                break
+            fusionada = actualizar_entrada_ranking(fusionada, entrada)
+    return fusionada
+
+
+# =============================================================================
+# OBTENER_ENTRADAS_VISIBLES
+# =============================================================================
+# Descripción: Retorna las primeras entradas sin los campos internos
+#
+# Uso en Pygame: Lo que recibe la pantalla de Rankings
+#
+# Parámetros:
+#   - tabla (dict): Tabla top-K
+#   - limite (int): Cantidad de jugadores a retornar
+#
+# Retorna:
+#   - list: Entradas con el mismo formato que obtener_ranking
+#
+# Ejemplo de uso:
+#   top_10 = obtener_entradas_visibles(tabla, 10)
+# =============================================================================
+def obtener_entradas_visibles(tabla: dict, limite: int) -> list:
+    """Retorna las primeras entradas del top-K sin los campos internos."""
+    visibles = []
+    for entrada in tabla["entradas"][:limite]:
+        visible = {}
+        for clave in entrada:
+            if clave not in CLAVES_INTERNAS_RANKING:
+                visible[clave] = entrada[clave]
+        visibles.append(visible)
+    return visibles
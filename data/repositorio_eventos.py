@@ -0,0 +1,120 @@
+# =============================================================================
+# REPOSITORIO DE EVENTOS DE PARTIDAS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Guarda el registro de eventos de cada partida (core/registro_eventos)
+#    en un archivo JSON Lines de solo-agregado: una línea por partida con
+#    la semilla, el estado inicial y todos sus eventos. Es la fuente para
+#    reproducir partidas (core/reproduccion_partidas) y para reconstruir
+#    estadísticas sin depender de Usuarios.json.
+#
+# 📥 IMPORTADO EN:
+#    - ui/Pygame/Estados/Gameplay/gameplay.py - guarda el registro al terminar
+#    - ui/consola/juego_consola.py - guarda el registro al terminar
+#    - core/reproduccion_partidas.py - lee los registros a reproducir
+#
+# 🔗 DEPENDENCIAS:
+#    - os, json: escritura por líneas
+#    - data/bloqueo_archivos: varios procesos (kiosco) agregan al mismo archivo
+#    - config/constantes: para RUTA_EVENTOS_PARTIDAS
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Durante la partida los eventos quedan en memoria; se escribe una sola
+#      línea al final (no vuelve el acceso a disco por respuesta)
+#    - Solo-agregado: un corte a mitad de escritura deja una línea
+#      incompleta que la lectura ignora
+#
+# Estructura:
+#    assets/EventosPartidas.jsonl
+#    {"version": 1, "id_partida": "...", "usuario": "Juan", "semilla": 123,
+#     "estado_inicial": {...}, "eventos": [{"tipo": ..., ...}, ...]}
+# =============================================================================
+
+import os
+import json
+from data.bloqueo_archivos import bloqueo_archivo
+from config.constantes import RUTA_EVENTOS_PARTIDAS
+
+
+# =============================================================================
+# GUARDAR_REGISTRO_EVENTOS
+# =============================================================================
+# Descripción: Agrega el registro de una partida al archivo de eventos
+#
+# Uso en Pygame: Se usa una vez al terminar la partida
+#
+# Parámetros:
+#   - registro (dict): Registro de eventos de la partida
+#   - ruta (str): Archivo de eventos (default: RUTA_EVENTOS_PARTIDAS)
+#
+# Retorna:
+#   - bool: True si se escribió correctamente
+#
+# Ejemplo de uso:
+#   guardar_registro_eventos(registro_eventos)
+# =============================================================================
+def guardar_registro_eventos(registro: dict, ruta: str = None) -> bool:
+    """Agrega el registro de eventos de una partida al archivo."""
+    if ruta is None:
+        ruta = RUTA_EVENTOS_PARTIDAS
+    linea = json.dumps(registro, ensure_ascii=False) + "\n"
+
+    try:
+        directorio = os.path.dirname(ruta)
+        if directorio and not os.path.exists(directorio):
+            os.makedirs(directorio)
+
+        with bloqueo_archivo(ruta):
+            with open(ruta, "a", encoding="utf-8") as f:
+                f.write(linea)
+                f.flush()
+                os.fsync(f.fileno())
+        exito = True
+    except OSError as e:
+        print(f"⚠️ Error al guardar los eventos de la partida: {e}")
+        exito = False
+
+    return exito
+
+
+# =============================================================================
+# LEER_REGISTROS_EVENTOS
+# =============================================================================
+# Descripción: Lee los registros de partidas del archivo de eventos
+#
+# Uso en Pygame: No se usa (reproducción y reconstrucción de estadísticas)
+#
+# Parámetros:
+#   - ruta (str): Archivo de eventos (default: RUTA_EVENTOS_PARTIDAS)
+#   - usuario (str): Solo las partidas de este usuario (opcional)
+#
+# Retorna:
+#   - list: Registros en el orden en que se jugaron; las líneas corruptas
+#           se ignoran
+#
+# Ejemplo de uso:
+#   registros = leer_registros_eventos(usuario="Juan")
+# =============================================================================
+def leer_registros_eventos(ruta: str = None, usuario: str = None) -> list:
+    """Lee los registros de eventos de las partidas."""
+    if ruta is None:
+        ruta = RUTA_EVENTOS_PARTIDAS
+    registros = []
+
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            for linea in f:
+                linea = linea.strip()
+                if not linea:
+                    continue
+                try:
+                    registro = json.loads(linea)
+                except json.JSONDecodeError:
+                    # Línea incompleta (p. ej. corte durante la escritura)
+                    continue
+                if usuario is None or registro.get("usuario") == usuario:
+                    registros.append(registro)
+    except FileNotFoundError:
+        pass
+
+    return registros
@@ -0,0 +1,173 @@
+# =============================================================================
+# REPOSITORIO DE HISTORIAL DE PARTIDAS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Guarda el detalle respuesta por respuesta de cada partida fuera de
+#    Usuarios.json. Cada usuario tiene su propio archivo de solo-agregado
+#    (una línea JSON por partida) y Usuarios.json solo guarda el id de la
+#    partida en "historial".
+#
+# 📥 IMPORTADO EN:
+#    - data/repositorio_usuarios.py - para registrar y migrar el detalle
+#
+# 🔗 DEPENDENCIAS:
+#    - os: para rutas y sincronización de archivos
+#    - json: para serializar cada línea
+#    - hashlib: para un nombre de archivo seguro por usuario
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Rankings y perfiles ya no parsean el detalle de todas las respuestas
+#    - Un archivo por usuario (shard): leer el historial de uno no lee al resto
+#    - Formato JSON Lines: agregar una partida es O(1), igual que el diario
+#
+# Estructura:
+#    assets/Usuarios_historial/<hash_usuario>.jsonl
+#    {"usuario": "Juan", "id_partida": "...", "detalle": [...]}
+# =============================================================================
+
+import os
+import json
+import hashlib
+
+
+# =============================================================================
+# OBTENER_RUTA_HISTORIAL_USUARIO
+# =============================================================================
+# Descripción: Obtiene el archivo de historial de un usuario
+#
+# Uso en Pygame: Se usa internamente
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#   - nombre_usuario (str): Nombre del usuario
+#
+# Retorna:
+#   - str: Ruta del shard (ej: Usuarios_historial/3f2a....jsonl)
+#
+# Ejemplo de uso:
+#   ruta = obtener_ruta_historial_usuario(RUTA_USUARIOS, "Juan")
+# =============================================================================
+def obtener_ruta_historial_usuario(archivo_usuarios: str, nombre_usuario: str) -> str:
+    """Obtiene el archivo de historial de un usuario."""
+    base, _ = os.path.splitext(archivo_usuarios)
+    # El nombre puede tener caracteres no válidos en rutas: se usa un hash
+    clave = hashlib.sha1(nombre_usuario.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(base + "_historial", clave + ".jsonl")
+
+
+# =============================================================================
+# REGISTRAR_PARTIDAS_HISTORIAL
+# =============================================================================
+# Descripción: Agrega el detalle de una o más partidas al historial del usuario
+#
+# Uso en Pygame: Se usa al guardar cada partida
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#   - nombre_usuario (str): Nombre del usuario
+#   - partidas (list): Lista de (id_partida, detalle)
+#
+# Retorna:
+#   - bool: True si se escribió correctamente
+#
+# Ejemplo de uso:
+#   registrar_partidas_historial(RUTA_USUARIOS, "Juan", [(id_partida, detalle)])
+# =============================================================================
+def registrar_partidas_historial(archivo_usuarios: str, nombre_usuario: str, partidas: list) -> bool:
+    """Agrega el detalle de partidas al historial del usuario."""
+    ruta = obtener_ruta_historial_usuario(archivo_usuarios, nombre_usuario)
+    lineas = []
+    for id_partida, detalle in partidas:
+        lineas.append(json.dumps({
+            "usuario": nombre_usuario,
+            "id_partida": id_partida,
+            "detalle": detalle
+        }, ensure_ascii=False) + "\n")
+
+    try:
+        directorio = os.path.dirname(ruta)
+        if not os.path.exists(directorio):
+            os.makedirs(directorio)
+
+        with open(ruta, "a", encoding="utf-8") as f:
+            f.writelines(lineas)
+            f.flush()
+            os.fsync(f.fileno())
+        exito = True
+    except OSError as e:
+        print(f"Error al escribir el historial de partidas: {e}")
+        exito = False
+
+    return exito
+
+
+# =============================================================================
+# LEER_HISTORIAL_USUARIO
+# =============================================================================
+# Descripción: Lee todas las partidas del historial de un usuario, en orden
+#
+# Uso en Pygame: Para una futura pantalla de detalle de partidas
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#   - nombre_usuario (str): Nombre del usuario
+#
+# Retorna:
+#   - list: Lista de {"id_partida", "detalle"}; las líneas corruptas se ignoran
+#
+# Ejemplo de uso:
+#   partidas = leer_historial_usuario(RUTA_USUARIOS, "Juan")
+# =============================================================================
+def leer_historial_usuario(archivo_usuarios: str, nombre_usuario: str) -> list:
+    """Lee todas las partidas del historial de un usuario."""
+    partidas = []
+    ya_leidas = set()
+    ruta = obtener_ruta_historial_usuario(archivo_usuarios, nombre_usuario)
+
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            for linea in f:
+                linea = linea.strip()
+                if not linea:
+                    continue
+                try:
+                    registro = json.loads(linea)
+                except json.JSONDecodeError:
+                    # Línea incompleta (p. ej. corte durante la escritura)
+                    continue
+                # Una migración repetida puede duplicar un id: vale el primero
+                if registro.get("usuario") == nombre_usuario and registro["id_partida"] not in ya_leidas:
+                    ya_leidas.add(registro["id_partida"])
+                    partidas.append({"id_partida": registro["id_partida"], "detalle": registro["detalle"]})
+    except FileNotFoundError:
+        pass
+
+    return partidas
+
+
+# =============================================================================
+# OBTENER_DETALLE_PARTIDA
+# =============================================================================
+# Descripción: Obtiene el detalle de una partida por su id
+#
+# Uso en Pygame: Para una futura pantalla de detalle de partidas
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#   - nombre_usuario (str): Nombre del usuario
+#   - id_partida (str): Id guardado en usuario["historial"]
+#
+# Retorna:
+#   - list: Detalle de respuestas, o None si no se encontró
+#
+# Ejemplo de uso:
+#   detalle = obtener_detalle_partida(RUTA_USUARIOS, "Juan", usuario["historial"][-1])
+# =============================================================================
+def obtener_detalle_partida(archivo_usuarios: str, nombre_usuario: str, id_partida: str):
+    """Obtiene el detalle de una partida por su id."""
+    detalle = None
+    for partida in leer_historial_usuario(archivo_usuarios, nombre_usuario):
+        if partida["id_partida"] == id_partida:
+            detalle = partida["detalle"]
+            break
+    return detalle
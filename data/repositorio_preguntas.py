@@ -9,10 +9,12 @@
 #    - core/logica_juego.py (líneas 7-10) - para cargar_preguntas_desde_csv, filtrar_preguntas_por_nivel, seleccionar_pregunta_aleatoria
 #    - ui/Pygame/Estados/Gameplay.py (línea 13) - para cargar_preguntas_desde_csv
 #    - ui/consola/juego_consola.py - para cargar preguntas en UI de consola
+#    - data/indice_preguntas.py - para construir_pregunta_seleccionada
 #
 # 🔗 DEPENDENCIAS:
 #    - random: para selección aleatoria y mezcla de opciones
-#    - data/archivos_json: para verificar_y_obtener_ruta
+#    - os, pickle: para el banco compilado (caché binaria del CSV)
+#    - data/archivos_json: para verificar_y_obtener_ruta, escribir_archivo_atomico
 #    - models/pregunta: para crear_pregunta
 #    - config/constantes: para RUTA_PREGUNTAS
 #
@@ -22,52 +24,181 @@
 #    - Filtrado manual de preguntas sin usar filter()
 #    - Selección aleatoria por categoría para variedad
 #    - Búsqueda manual de preguntas usadas sin usar 'in'
+#    - Banco compilado: el CSV solo se vuelve a parsear si cambió (mtime y
+#      tamaño); si no, se usa la caché en memoria o el archivo pickle
+#    - Las opciones se mezclan al seleccionar la pregunta, no al cargarla,
+#      así el banco compilado se puede compartir entre partidas
+#    - Las funciones aleatorias aceptan un rng con semilla: una partida
+#      registrada (core/registro_eventos) se puede volver a sortear igual
 # =============================================================================
 
+import os
 import random
-from data.archivos_json import verificar_y_obtener_ruta
+import pickle
+from data.archivos_json import verificar_y_obtener_ruta, escribir_archivo_atomico
 from models.pregunta import crear_pregunta
 from config.constantes import RUTA_PREGUNTAS
 
+# Versión del formato del banco compilado (cambiarla invalida las cachés)
+VERSION_BANCO_COMPILADO = 1
+
+# Bancos ya cargados en este proceso: {ruta_csv: (firma, preguntas)}
+_bancos_cargados = {}
+
 # =============================================================================
 # CARGAR_PREGUNTAS_DESDE_CSV
 # =============================================================================
-# Descripción: Carga todas las preguntas desde el archivo CSV
+# Descripción: Carga todas las preguntas del banco, usando el banco
+#              compilado si el CSV no cambió desde la última compilación
 # 
-# Uso en Pygame: Se usa igual al iniciar el juego
+# Uso en Pygame: Se usa igual al iniciar el juego (Pygame y consola)
 #
 # Parámetros:
 #   - path (str): Ruta al archivo CSV de preguntas
 #
 # Retorna:
-#   - dict: Diccionario de preguntas indexadas por ID
+#   - dict: Diccionario de preguntas indexadas por ID (compartido entre
+#           partidas: no modificar, seleccionar_pregunta_aleatoria copia)
 #
 # Ejemplo de uso:
 #   preguntas = cargar_preguntas_desde_csv("preguntas.csv")
 # =============================================================================
 def cargar_preguntas_desde_csv(path: str) -> dict:
-    """Carga todas las preguntas desde el archivo CSV."""
+    """Carga todas las preguntas desde el banco compilado o el archivo CSV."""
     preguntas = {}
     abs_path = verificar_y_obtener_ruta(path)
     if abs_path != "":
-        with open(abs_path, encoding="utf-8") as f:
-            encabezado = f.readline()
-            for linea in f:
-                fila = linea.strip().split(",")
-                if len(fila) >= 10:
-                    pregunta = procesar_linea_csv(fila)
-                    if "id" in pregunta:
-                        preguntas[pregunta["id"]] = {
-                            "nivel": pregunta["nivel"],
-                            "descripcion": pregunta["descripcion"],
-                            "dificultad": pregunta["dificultad"],
-                            "categoria": pregunta["categoria"],
-                            "opciones": pregunta["opciones"],
-                            "correcta": pregunta["correcta"]
-                        }
+        estado = os.stat(abs_path)
+        firma = (VERSION_BANCO_COMPILADO, estado.st_mtime_ns, estado.st_size)
+        
+        if abs_path in _bancos_cargados and _bancos_cargados[abs_path][0] == firma:
+            preguntas = _bancos_cargados[abs_path][1]
+        else:
+            preguntas = cargar_banco_compilado(abs_path, firma)
+            if preguntas is None:
+                preguntas = leer_preguntas_csv(abs_path)
+                guardar_banco_compilado(abs_path, firma, preguntas)
+            _bancos_cargados[abs_path] = (firma, preguntas)
     return preguntas
 
 
+# =============================================================================
+# LEER_PREGUNTAS_CSV
+# =============================================================================
+# Descripción: Parsea el CSV de preguntas línea por línea
+# 
+# Uso en Pygame: Se usa internamente solo cuando el CSV cambió
+#
+# Parámetros:
+#   - abs_path (str): Ruta absoluta al archivo CSV
+#
+# Retorna:
+#   - dict: Diccionario de preguntas indexadas por ID
+#
+# Ejemplo de uso:
+#   preguntas = leer_preguntas_csv("/ruta/preguntas.csv")
+# =============================================================================
+def leer_preguntas_csv(abs_path: str) -> dict:
+    """Parsea el CSV de preguntas línea por línea."""
+    preguntas = {}
+    with open(abs_path, encoding="utf-8") as f:
+        encabezado = f.readline()
+        for linea in f:
+            fila = linea.strip().split(",")
+            if len(fila) >= 10:
+                pregunta = procesar_linea_csv(fila)
+                if "id" in pregunta:
+                    preguntas[pregunta["id"]] = {
+                        "nivel": pregunta["nivel"],
+                        "descripcion": pregunta["descripcion"],
+                        "dificultad": pregunta["dificultad"],
+                        "categoria": pregunta["categoria"],
+                        "opciones": pregunta["opciones"],
+                        "correcta": pregunta["correcta"]
+                    }
+    return preguntas
+
+
+# =============================================================================
+# OBTENER_RUTA_BANCO_COMPILADO
+# =============================================================================
+# Descripción: Obtiene la ruta del banco compilado asociado a un CSV
+# 
+# Uso en Pygame: Se usa internamente
+#
+# Parámetros:
+#   - abs_path (str): Ruta absoluta al archivo CSV
+#
+# Retorna:
+#   - str: Ruta del banco compilado (ej: preguntas_compilado.pickle)
+#
+# Ejemplo de uso:
+#   ruta = obtener_ruta_banco_compilado("/ruta/preguntas.csv")
+# =============================================================================
+def obtener_ruta_banco_compilado(abs_path: str) -> str:
+    """Obtiene la ruta del banco compilado asociado a un CSV."""
+    base, _ = os.path.splitext(abs_path)
+    return base + "_compilado.pickle"
+
+
+# =============================================================================
+# CARGAR_BANCO_COMPILADO
+# =============================================================================
+# Descripción: Carga el banco compilado si corresponde a la firma del CSV
+# 
+# Uso en Pygame: Se usa internamente al iniciar el juego
+#
+# Parámetros:
+#   - abs_path (str): Ruta absoluta al archivo CSV
+#   - firma (tuple): (versión, mtime_ns, tamaño) del CSV actual
+#
+# Retorna:
+#   - dict: Preguntas, o None si no existe, está desactualizado o corrupto
+#
+# Ejemplo de uso:
+#   preguntas = cargar_banco_compilado(abs_path, firma)
+# =============================================================================
+def cargar_banco_compilado(abs_path: str, firma: tuple):
+    """Carga el banco compilado si corresponde a la firma del CSV."""
+    preguntas = None
+    try:
+        with open(obtener_ruta_banco_compilado(abs_path), "rb") as f:
+            banco = pickle.load(f)
+        if isinstance(banco, dict) and tuple(banco.get("firma", ())) == firma:
+            preguntas = banco["preguntas"]
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError, ValueError):
+        preguntas = None
+    return preguntas
+
+
+# =============================================================================
+# GUARDAR_BANCO_COMPILADO
+# =============================================================================
+# Descripción: Guarda el banco compilado con escribir_archivo_atomico
+#              (temporal único + fsync + rename)
+# 
+# Uso en Pygame: Se usa internamente después de parsear el CSV
+#
+# Parámetros:
+#   - abs_path (str): Ruta absoluta al archivo CSV
+#   - firma (tuple): (versión, mtime_ns, tamaño) del CSV parseado
+#   - preguntas (dict): Preguntas parseadas
+#
+# Retorna:
+#   - bool: True si se guardó (si falla, el juego sigue usando el CSV)
+#
+# Ejemplo de uso:
+#   guardar_banco_compilado(abs_path, firma, preguntas)
+# =============================================================================
+def guardar_banco_compilado(abs_path: str, firma: tuple, preguntas: dict) -> bool:
+    """Guarda el banco compilado de preguntas."""
+    contenido = pickle.dumps({"firma": firma, "preguntas": preguntas}, protocol=pickle.HIGHEST_PROTOCOL)
+    exito = escribir_archivo_atomico(obtener_ruta_banco_compilado(abs_path), contenido)
+    if not exito:
+        print("No se pudo guardar el banco compilado de preguntas")
+    return exito
+
+
 # =============================================================================
 # PROCESAR_LINEA_CSV
 # =============================================================================
@@ -98,14 +229,13 @@ def procesar_linea_csv(fila: list) -> dict:
             respuesta_correcta = opciones[opcion_correcta - 1]
         else:
             respuesta_correcta = opciones[0]
-        opciones_mezcladas = mezclar_opciones(list(opciones))
         pregunta = {
             "id": pid,
             "nivel": nivel,
             "descripcion": descripcion,
             "dificultad": dificultad,
             "categoria": categoria,
-            "opciones": opciones_mezcladas,
+            "opciones": list(opciones),
             "correcta": respuesta_correcta
         }
         return pregunta
@@ -122,6 +252,7 @@ def procesar_linea_csv(fila: list) -> dict:
 #
 # Parámetros:
 #   - opciones (list): Lista de opciones a mezclar
+#   - rng (random.Random): Generador con semilla (opcional, default: random)
 #
 # Retorna:
 #   - list: Lista de opciones mezcladas
@@ -129,12 +260,14 @@ def procesar_linea_csv(fila: list) -> dict:
 # Ejemplo de uso:
 #   opciones_mezcladas = mezclar_opciones(["A", "B", "C", "D"])
 # =============================================================================
-def mezclar_opciones(opciones: list) -> list:
+def mezclar_opciones(opciones: list, rng=None) -> list:
     """Mezcla las opciones de una pregunta usando Fisher-Yates."""
+    if rng is None:
+        rng = random
     mezcladas = opciones[:]
     i = len(mezcladas) - 1
     while i > 0:
-        j = random.randint(0, i)
+        j = rng.randint(0, i)
         temp = mezcladas[i]
         mezcladas[i] = mezcladas[j]
         mezcladas[j] = temp
@@ -188,17 +321,21 @@ def filtrar_preguntas_por_nivel(preguntas: dict, nivel: int, preguntas_usadas: l
 #
 # Parámetros:
 #   - preguntas_disponibles (dict): Preguntas disponibles para elegir
+#   - rng (random.Random): Generador con semilla (opcional, default: random)
 #
 # Retorna:
-#   - dict: Pregunta seleccionada con su ID, o dict vacío si no hay
+#   - dict: Copia de la pregunta seleccionada con su ID y las opciones
+#           mezcladas, o dict vacío si no hay
 #
 # Ejemplo de uso:
 #   pregunta = seleccionar_pregunta_aleatoria(preguntas_nivel_1)
 # =============================================================================
-def seleccionar_pregunta_aleatoria(preguntas_disponibles: dict) -> dict:
+def seleccionar_pregunta_aleatoria(preguntas_disponibles: dict, rng=None) -> dict:
     """Selecciona una pregunta aleatoria de las disponibles."""
     if not preguntas_disponibles:
         return {}
+    if rng is None:
+        rng = random
 
     categorias = []
     for p in preguntas_disponibles.values():
@@ -210,17 +347,42 @@ def seleccionar_pregunta_aleatoria(preguntas_disponibles: dict) -> dict:
         if not ya_esta:
             categorias.append(p['categoria'])
 
-    categoria = random.choice(categorias)
+    categoria = rng.choice(categorias)
 
     candidatas = []
     for pid, p in preguntas_disponibles.items():
         if p['categoria'] == categoria:
             candidatas.append(pid)
 
-    id_pregunta = random.choice(candidatas)
+    id_pregunta = rng.choice(candidatas)
 
+    return construir_pregunta_seleccionada(preguntas_disponibles, id_pregunta, rng)
+
+
+# =============================================================================
+# CONSTRUIR_PREGUNTA_SELECCIONADA
+# =============================================================================
+# Descripción: Copia una pregunta del banco agregando su ID y mezclando
+#              las opciones (el banco compartido no se modifica)
+# 
+# Uso en Pygame: Se usa internamente al seleccionar una pregunta
+#
+# Parámetros:
+#   - preguntas (dict): Diccionario de preguntas
+#   - id_pregunta (int): ID de la pregunta elegida
+#   - rng (random.Random): Generador con semilla (opcional, default: random)
+#
+# Retorna:
+#   - dict: Copia de la pregunta con su ID y opciones mezcladas
+#
+# Ejemplo de uso:
+#   pregunta = construir_pregunta_seleccionada(preguntas, 7)
+# =============================================================================
+def construir_pregunta_seleccionada(preguntas: dict, id_pregunta: int, rng=None) -> dict:
+    """Copia una pregunta del banco con su ID y las opciones mezcladas."""
     dicc = {"id": id_pregunta}
-    for k in preguntas_disponibles[id_pregunta]:
-        dicc[k] = preguntas_disponibles[id_pregunta][k]
+    for k in preguntas[id_pregunta]:
+        dicc[k] = preguntas[id_pregunta][k]
+    dicc["opciones"] = mezclar_opciones(dicc["opciones"], rng)
 
     return dicc
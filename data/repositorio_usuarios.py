@@ -9,26 +9,120 @@
 #    - core/logica_juego.py (línea 12) - para guardar_estadisticas_usuario
 #    - ui/consola/menu_consola.py - para obtener_usuario, obtener_ranking
 #    - ui/Pygame/Estados/Game_Over.py - para guardar_estadisticas_usuario
-#    - ui/Pygame/Estados/Rankings.py - para obtener_ranking
+#    - ui/Pygame/Estados/Rankings.py - para obtener_top_ranking
 #    - ui/Pygame/Estados/SeleccionObjeto.py - para guardar_objeto_equipado
 #
 # 🔗 DEPENDENCIAS:
 #    - data/archivos_json: para operaciones de lectura/escritura JSON
+#    - data/diario_partidas: para el diario append-only de partidas
+#    - data/estado_buff: para vidas extra y objetos equipados en memoria
+#    - data/bloqueo_archivos: bloqueo entre procesos al guardar y compactar
+#    - data/ranking_materializado: para el top-K persistido
+#    - data/indice_usuarios: índice nombre → bytes para leer un solo perfil
+#    - data/repositorio_historial: detalle de respuestas por partida (fuera de Usuarios.json)
+#    - data/repositorio_usuarios_sqlite: backend alternativo (BACKEND_USUARIOS)
+#    - data/shards_usuarios: usuarios repartidos en N archivos (BACKEND_USUARIOS)
 #    - models/usuario: para crear_usuario_nuevo, actualizar_estadisticas_usuario
-#    - utils/algoritmos: para calcular_estadisticas_lista
-#    - config/constantes: para RUTA_USUARIOS, RUTA_ESTADO_BUFF
+#    - utils/algoritmos: para los agregados incrementales por usuario
+#    - config/constantes: para RUTA_USUARIOS, RUTA_ESTADO_BUFF, BACKEND_USUARIOS
 #
 # 💡 NOTAS PARA LA DEFENSA:
 #    - Patrón Repository para separar lógica de persistencia de lógica de negocio
 #    - Búsqueda manual de usuarios sin usar .get() para cumplir principios
 #    - Ordenamiento manual del ranking con insertion sort
+#    - Guardar una partida solo agrega una línea al diario (O(1)); los lectores
+#      ven Usuarios.json (snapshot) + diario
+#    - El top-K (Usuarios_ranking.json) se actualiza en cada guardado, así la
+#      pantalla de Rankings no recorre a todos los jugadores
+#    - obtener_usuario lee un solo registro con el índice de offsets (seek)
+#      y solo hace la carga completa si el índice está desactualizado
+#    - "historial" solo guarda ids de partida; el detalle vive en
+#      Usuarios_historial/ (un archivo por usuario)
+#    - Cada usuario guarda "agregados" (cantidad, total, mejor, peor, promedio)
+#      de sus listas: ranking y estadísticas se leen en O(1) por usuario
+#    - Guardar, compactar y reconstruir el ranking toman el bloqueo de
+#      Usuarios.json: varios procesos pueden terminar partidas a la vez sin
+#      perder resultados. Los lectores no bloquean: leen el diario antes que
+#      el snapshot y la aplicación idempotente cubre una compactación en medio
 #    - Sistema de vidas extra y objetos equipados para gameplay mejorado
+#    - Con BACKEND_USUARIOS == "sqlite" las funciones públicas delegan en
+#      repositorio_usuarios_sqlite sin cambiar su firma ni su resultado; al
+#      iniciar con la base vacía se importan Usuarios.json y EstadoBuff.json
+#    - Con BACKEND_USUARIOS == "shards" cada jugador vive en uno de N archivos
+#      (hash del nombre): guardar reescribe solo ese shard y el ranking
+#      fusiona los top-K de cada shard. Al iniciar se migra Usuarios.json +
+#      diario una sola vez; esos archivos quedan como respaldo sin usarse
 # =============================================================================
 
+import os
+import uuid
 from data.archivos_json import cargar_json, guardar_json, verificar_archivo_existe
+from data.diario_partidas import (
+    obtener_ruta_diario,
+    registrar_entrada_diario,
+    leer_diario,
+    vaciar_diario,
+    diario_requiere_compactacion
+)
+from data.estado_buff import obtener_estado_usuario_buff, actualizar_estado_usuario_buff
+from data.bloqueo_archivos import bloqueo_archivo, BloqueoNoDisponibleError
+from data import repositorio_historial
+from data.indice_usuarios import guardar_usuarios_indexado, leer_usuario_indexado, indice_usuarios_vigente
+from data.ranking_materializado import (
+    cargar_ranking_materializado,
+    guardar_ranking_materializado,
+    crear_tabla_ranking,
+    construir_entrada_ranking,
+    buscar_entrada_ranking,
+    puede_entrar_al_ranking,
+    actualizar_entrada_ranking,
+    fusionar_tablas_ranking,
+    obtener_entradas_visibles
+)
+from data.shards_usuarios import (
+    shards_creados,
+    guardar_configuracion_shards,
+    obtener_ruta_shard_usuario,
+    listar_rutas_shards,
+    mapear_shards
+)
+from data import repositorio_usuarios_sqlite
 from models.usuario import crear_usuario_nuevo, actualizar_estadisticas_usuario
-from utils.algoritmos import calcular_estadisticas_lista
-from config.constantes import RUTA_USUARIOS, RUTA_ESTADO_BUFF
+from utils.algoritmos import crear_agregado_vacio, actualizar_agregado, calcular_agregado_lista
+from config.constantes import RUTA_USUARIOS, RUTA_ESTADO_BUFF, BACKEND_USUARIOS, RUTA_BASE_DATOS_USUARIOS, TAMANO_RANKING
+
+# Clave del snapshot con la última entrada del diario aplicada (no es un usuario)
+CLAVE_MARCA_DIARIO = "__diario__"
+
+# Listas de cada usuario que tienen un agregado incremental en "agregados"
+CAMPOS_AGREGADOS = ("puntajes", "tiempos", "aciertos", "total_preguntas", "porcentajes")
+
+# =============================================================================
+# USA_BACKEND_SQLITE
+# =============================================================================
+# Descripción: Indica si las operaciones sobre este archivo deben delegarse
+#              en la base SQLite (BACKEND_USUARIOS == "sqlite")
+#
+# Uso en Pygame: Se usa internamente; la UI sigue pasando RUTA_USUARIOS
+#
+# Parámetros:
+#   - archivo (str): Ruta del archivo de usuarios recibida
+#
+# Retorna:
+#   - bool: True si corresponde usar repositorio_usuarios_sqlite
+#
+# Ejemplo de uso:
+#   if usa_backend_sqlite(archivo): ...
+# =============================================================================
+def usa_backend_sqlite(archivo: str) -> bool:
+    """Indica si el archivo de usuarios se redirige a la base SQLite."""
+    return BACKEND_USUARIOS == "sqlite" and archivo == RUTA_USUARIOS
+
+
+def usa_backend_shards(archivo: str) -> bool:
+    """Indica si el archivo de usuarios se reparte en shards (Usuarios_shards/)."""
+    return BACKEND_USUARIOS == "shards" and archivo == RUTA_USUARIOS
+
 
 # =============================================================================
 # OBTENER_USUARIO
@@ -49,26 +143,77 @@ from config.constantes import RUTA_USUARIOS, RUTA_ESTADO_BUFF
 # =============================================================================
 def obtener_usuario(nombre_usuario: str, archivo: str) -> dict:
     """Obtiene los datos de un usuario desde el archivo."""
+    if usa_backend_sqlite(archivo):
+        return repositorio_usuarios_sqlite.obtener_usuario(nombre_usuario, RUTA_BASE_DATOS_USUARIOS)
+    if usa_backend_shards(archivo):
+        return obtener_usuario_shards(nombre_usuario, archivo)
+    
     resultado = {"error": ""}
     
-    if verificar_archivo_existe(archivo, "No hay estadísticas guardadas") == False:
+    hay_diario = os.path.exists(obtener_ruta_diario(archivo))
+    if not hay_diario and verificar_archivo_existe(archivo, "No hay estadísticas guardadas") == False:
         resultado["error"] = "No hay estadísticas guardadas"
     else:
-        datos = cargar_json(archivo)
-        if not datos:
-            resultado["error"] = "Error al cargar estadísticas"
-        else:
-            # Buscar el usuario iterando por las claves del diccionario
-            usuario_encontrado = False
-            for clave in datos:
-                if clave == nombre_usuario:
-                    usuario_encontrado = True
-                    break
-            
-            if not usuario_encontrado:
-                resultado["error"] = "Usuario '" + nombre_usuario + "' no encontrado"
-            else:
+        # El diario se lee antes que el snapshot (ver cargar_usuarios)
+        diario = leer_diario(archivo)
+        lectura = leer_usuario_indexado(archivo, nombre_usuario)
+        if lectura["vigente"]:
+            # Solo el registro de este usuario + sus partidas del diario
+            datos = {}
+            if lectura["usuario"] is not None and nombre_usuario != CLAVE_MARCA_DIARIO:
+                datos[nombre_usuario] = lectura["usuario"]
+            marca = leer_usuario_indexado(archivo, CLAVE_MARCA_DIARIO)["usuario"]
+            entradas = []
+            for entrada in filtrar_entradas_pendientes(diario, obtener_ultimo_id_marca(marca)):
+                if entrada["usuario"] == nombre_usuario:
+                    entradas.append(entrada)
+            datos = aplicar_entradas_diario(datos, entradas)
+            if nombre_usuario in datos:
                 resultado = datos[nombre_usuario]
+            else:
+                resultado["error"] = "Usuario '" + nombre_usuario + "' no encontrado"
+        else:
+            resultado = buscar_usuario_carga_completa(nombre_usuario, archivo)
+    
+    return resultado
+
+
+# =============================================================================
+# BUSCAR_USUARIO_CARGA_COMPLETA
+# =============================================================================
+# Descripción: Busca un usuario cargando todo Usuarios.json (fallback cuando
+#              el índice no existe o está desactualizado)
+# 
+# Uso en Pygame: Se usa internamente desde obtener_usuario
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - archivo (str): Ruta del archivo de usuarios
+#
+# Retorna:
+#   - dict: Datos del usuario o dict con "error" si no existe
+#
+# Ejemplo de uso:
+#   usuario = buscar_usuario_carga_completa("Juan", "usuarios.json")
+# =============================================================================
+def buscar_usuario_carga_completa(nombre_usuario: str, archivo: str) -> dict:
+    """Busca un usuario cargando el archivo completo."""
+    resultado = {"error": ""}
+    datos = cargar_usuarios(archivo)
+    if not datos:
+        resultado["error"] = "Error al cargar estadísticas"
+    else:
+        # Buscar el usuario iterando por las claves del diccionario
+        usuario_encontrado = False
+        for clave in datos:
+            if clave == nombre_usuario:
+                usuario_encontrado = True
+                break
+        
+        if not usuario_encontrado:
+            resultado["error"] = "Usuario '" + nombre_usuario + "' no encontrado"
+        else:
+            resultado = datos[nombre_usuario]
     
     return resultado
 
@@ -86,22 +231,468 @@ def obtener_usuario(nombre_usuario: str, archivo: str) -> dict:
 #   - archivo_usuarios (str): Ruta del archivo de usuarios
 #
 # Retorna:
-#   - None
+#   - bool: True si se guardó; False si otro proceso mantuvo el bloqueo
+#           del archivo demasiado tiempo (no se escribe nada sin bloqueo)
 #
 # Ejemplo de uso:
 #   guardar_estadisticas_usuario("Juan", resultado_partida, "usuarios.json")
 # =============================================================================
-def guardar_estadisticas_usuario(nombre_usuario: str, resultado: dict, archivo_usuarios: str) -> None:
+def guardar_estadisticas_usuario(nombre_usuario: str, resultado: dict, archivo_usuarios: str) -> bool:
     """Guarda las estadísticas de una partida para un usuario."""
-    datos = cargar_json(archivo_usuarios, {})
-    datos = inicializar_datos_usuario(nombre_usuario, datos)
-    usuario = datos[nombre_usuario]
-    usuario = actualizar_listas_estadisticas(usuario, resultado)
-    datos[nombre_usuario] = usuario
-    guardar_json(archivo_usuarios, datos)
+    guardado = True
+    try:
+        if usa_backend_sqlite(archivo_usuarios):
+            repositorio_usuarios_sqlite.guardar_estadisticas_usuario(nombre_usuario, resultado, RUTA_BASE_DATOS_USUARIOS)
+        elif usa_backend_shards(archivo_usuarios):
+            guardar_estadisticas_shards(nombre_usuario, resultado, archivo_usuarios)
+        else:
+            guardar_estadisticas_diario(nombre_usuario, resultado, archivo_usuarios)
+    except BloqueoNoDisponibleError as e:
+        print(f"❌ No se guardó la partida de {nombre_usuario}: {e}")
+        guardado = False
+    return guardado
+
+
+def guardar_estadisticas_diario(nombre_usuario: str, resultado: dict, archivo_usuarios: str) -> None:
+    """Guarda una partida en el diario (backend JSON); lanza BloqueoNoDisponibleError."""
+    id_partida = uuid.uuid4().hex
+    entrada = {
+        "usuario": nombre_usuario,
+        "id_partida": id_partida,
+        "resultado": resumir_resultado(resultado, id_partida)
+    }
+    
+    # Otro proceso puede estar guardando o compactando: historial, diario y
+    # ranking se modifican bajo el mismo bloqueo (el ranking se relee adentro)
+    with bloqueo_archivo(archivo_usuarios):
+        # El detalle por respuesta va al historial del usuario; el diario y
+        # Usuarios.json solo guardan el resumen con el id de la partida
+        repositorio_historial.registrar_partidas_historial(
+            archivo_usuarios, nombre_usuario, [(id_partida, resultado.get("detalle", []))]
+        )
+        
+        # Solo se agrega una línea al diario: el costo no depende del archivo completo
+        registrar_entrada_diario(archivo_usuarios, entrada)
+        actualizar_ranking_con_partida(archivo_usuarios, nombre_usuario, resultado)
+        
+        if diario_requiere_compactacion(archivo_usuarios):
+            compactar_diario_usuarios(archivo_usuarios)
+    return None
+
+
+# =============================================================================
+# ACTUALIZAR_RANKING_CON_PARTIDA
+# =============================================================================
+# Descripción: Actualiza el ranking materializado con una partida nueva
+# 
+# Uso en Pygame: Se usa automáticamente al guardar estadísticas
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta del archivo de usuarios
+#   - nombre_usuario (str): Nombre del usuario
+#   - resultado (dict): Resultado de la partida (ya registrado en el diario)
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   actualizar_ranking_con_partida(RUTA_USUARIOS, "Juan", resultado)
+# =============================================================================
+def actualizar_ranking_con_partida(archivo_usuarios: str, nombre_usuario: str, resultado: dict) -> None:
+    """Actualiza el top-K persistido con el resultado de una partida."""
+    tabla = cargar_ranking_materializado(archivo_usuarios)
+    if tabla is None:
+        # Primera vez: se construye desde los datos (ya incluye esta partida)
+        reconstruir_ranking_materializado(archivo_usuarios)
+        return None
+    
+    puntaje = resultado["puntos_totales"]
+    porcentaje = 0
+    if resultado["total_preguntas"] > 0:
+        porcentaje = (resultado["respuestas_correctas"] / resultado["total_preguntas"]) * 100
+    porcentaje = round(porcentaje, 1)
+    
+    anterior = buscar_entrada_ranking(tabla, nombre_usuario)
+    entrada = None
+    if anterior is not None:
+        # Ya está en el top-K: se actualiza con sus sumas, sin leer el historial
+        entrada = construir_entrada_ranking(
+            nombre_usuario,
+            anterior["intentos"] + 1,
+            max(anterior["mejor_puntaje"], puntaje),
+            anterior["suma_puntaje"] + puntaje,
+            max(anterior["mejor_porcentaje"], porcentaje),
+            anterior["suma_porcentaje"] + porcentaje
+        )
+    elif puede_entrar_al_ranking(tabla, puntaje):
+        # Entra al top-K: se necesitan sus estadísticas completas (caso poco frecuente)
+        usuario = obtener_usuario(nombre_usuario, archivo_usuarios)
+        if "error" not in usuario:
+            entrada = calcular_entrada_ranking(nombre_usuario, usuario)
+    
+    if entrada is not None:
+        guardar_ranking_materializado(archivo_usuarios, actualizar_entrada_ranking(tabla, entrada))
     return None
 
 
+# =============================================================================
+# CARGAR_USUARIOS
+# =============================================================================
+# Descripción: Carga todos los usuarios: snapshot (Usuarios.json) + diario
+# 
+# Uso en Pygame: Se usa para rankings y perfiles
+#
+# Parámetros:
+#   - archivo (str): Ruta del archivo de usuarios
+#
+# Retorna:
+#   - dict: Usuarios con todas las partidas registradas aplicadas
+#
+# Ejemplo de uso:
+#   datos = cargar_usuarios("usuarios.json")
+# =============================================================================
+def cargar_usuarios(archivo: str) -> dict:
+    """Carga el snapshot de usuarios y le aplica el diario de partidas."""
+    # Primero el diario: si otro proceso compacta entre las dos lecturas,
+    # las entradas repetidas se saltean por la marca del snapshot
+    entradas = leer_diario(archivo)
+    datos = cargar_json(archivo, {})
+    ultimo_id = separar_marca_diario(datos)
+    datos = aplicar_entradas_diario(datos, filtrar_entradas_pendientes(entradas, ultimo_id))
+    return datos
+
+
+# =============================================================================
+# SEPARAR_MARCA_DIARIO / FILTRAR_ENTRADAS_PENDIENTES
+# =============================================================================
+# Descripción: El snapshot guarda en la clave CLAVE_MARCA_DIARIO el id de la
+#              última entrada del diario que ya tiene aplicada. Si una
+#              compactación se interrumpió después de escribir el snapshot
+#              (o un lector leyó el diario antes de que se vaciara), las
+#              entradas hasta esa marca se saltean
+#
+# Uso en Pygame: Se usan internamente al cargar y al compactar
+#
+# Ejemplo de uso:
+#   ultimo_id = separar_marca_diario(datos)
+#   entradas = filtrar_entradas_pendientes(leer_diario(archivo), ultimo_id)
+# =============================================================================
+def separar_marca_diario(datos: dict) -> str:
+    """Quita la marca del diario de los datos y retorna el último id aplicado."""
+    return obtener_ultimo_id_marca(datos.pop(CLAVE_MARCA_DIARIO, None))
+
+
+def obtener_ultimo_id_marca(marca) -> str:
+    """Obtiene el último id aplicado de la marca del snapshot (o None)."""
+    ultimo_id = None
+    if isinstance(marca, dict):
+        ultimo_id = marca.get("ultimo_id")
+    return ultimo_id
+
+
+def filtrar_entradas_pendientes(entradas: list, ultimo_id: str) -> list:
+    """Retorna las entradas del diario posteriores a la última aplicada."""
+    pendientes = entradas
+    if ultimo_id is not None:
+        indice = 0
+        while indice < len(entradas):
+            if entradas[indice]["id_partida"] == ultimo_id:
+                pendientes = entradas[indice + 1:]
+            indice += 1
+    return pendientes
+
+
+# =============================================================================
+# APLICAR_ENTRADAS_DIARIO
+# =============================================================================
+# Descripción: Aplica las entradas del diario sobre los datos de usuarios
+# 
+# Uso en Pygame: Se usa internamente al cargar y al compactar
+#
+# Parámetros:
+#   - datos (dict): Diccionario de todos los usuarios (se modifica)
+#   - entradas (list): Entradas pendientes del diario, en orden
+#                      (filtrar_entradas_pendientes)
+#
+# Retorna:
+#   - dict: Datos con las partidas del diario aplicadas
+#
+# Ejemplo de uso:
+#   datos = aplicar_entradas_diario(datos, filtrar_entradas_pendientes(leer_diario(archivo), ultimo_id))
+# =============================================================================
+def aplicar_entradas_diario(datos: dict, entradas: list) -> dict:
+    """Aplica las entradas del diario sobre los datos de usuarios."""
+    indice = 0
+    while indice < len(entradas):
+        entrada = entradas[indice]
+        nombre = entrada["usuario"]
+        datos = inicializar_datos_usuario(nombre, datos)
+        datos[nombre] = actualizar_listas_estadisticas(datos[nombre], entrada["resultado"])
+        indice += 1
+    
+    return datos
+
+
+# =============================================================================
+# COMPACTAR_DIARIO_USUARIOS
+# =============================================================================
+# Descripción: Vuelca el diario dentro de Usuarios.json y lo vacía
+# 
+# Uso en Pygame: Se llama al iniciar el juego y cuando el diario crece
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta del archivo de usuarios
+#
+# Retorna:
+#   - bool: True si se compactó (o no había nada que compactar); False
+#           si falló la escritura o no se obtuvo el bloqueo a tiempo
+#
+# Ejemplo de uso:
+#   compactar_diario_usuarios(RUTA_USUARIOS)
+# =============================================================================
+def compactar_diario_usuarios(archivo_usuarios: str) -> bool:
+    """Vuelca el diario de partidas dentro de Usuarios.json y lo vacía."""
+    try:
+        if usa_backend_shards(archivo_usuarios):
+            exito = migrar_usuarios_a_shards(archivo_usuarios)
+        elif usa_backend_sqlite(archivo_usuarios):
+            exito = migrar_usuarios_a_sqlite(archivo_usuarios)
+        else:
+            # Sin el bloqueo, una partida agregada al diario entre la lectura
+            # y el vaciado se perdería
+            with bloqueo_archivo(archivo_usuarios):
+                exito = compactar_diario_bloqueado(archivo_usuarios)
+    except BloqueoNoDisponibleError as e:
+        # Se reintenta al iniciar o al guardar la próxima partida
+        print(f"⚠️ No se compactó el diario de partidas: {e}")
+        exito = False
+    return exito
+
+
+def compactar_diario_bloqueado(archivo_usuarios: str) -> bool:
+    """Compacta el diario; el llamador ya tiene el bloqueo de Usuarios.json."""
+    diario = leer_diario(archivo_usuarios)
+    datos = cargar_json(archivo_usuarios, {})
+    ultimo_id = separar_marca_diario(datos)
+    entradas = filtrar_entradas_pendientes(diario, ultimo_id)
+    
+    # Migraciones únicas: usuarios guardados antes de existir los agregados,
+    # detalle de respuestas que todavía está dentro del snapshot o del diario
+    # y marcas del diario guardadas dentro de cada perfil
+    completados = completar_agregados_usuarios(datos)
+    completados += trasladar_historial_usuarios(archivo_usuarios, datos)
+    completados += quitar_marcas_diario_usuarios(datos)
+    entradas = trasladar_detalle_entradas(archivo_usuarios, entradas)
+    if not diario and completados == 0:
+        if not datos or indice_usuarios_vigente(archivo_usuarios):
+            return True
+    
+    datos = aplicar_entradas_diario(datos, entradas)
+    if entradas:
+        ultimo_id = entradas[-1]["id_partida"]
+    if ultimo_id is not None:
+        datos[CLAVE_MARCA_DIARIO] = {"ultimo_id": ultimo_id}
+    # Snapshot con un usuario por línea + índice de offsets (ver data/indice_usuarios)
+    exito = guardar_usuarios_indexado(archivo_usuarios, datos)
+    if exito:
+        vaciar_diario(archivo_usuarios)
+    return exito
+
+
+def quitar_marcas_diario_usuarios(datos: dict) -> int:
+    """Quita de los perfiles la marca del diario que se guardaba en cada uno."""
+    quitadas = 0
+    for nombre in datos:
+        if isinstance(datos[nombre], dict) and "ultimo_id_diario" in datos[nombre]:
+            del datos[nombre]["ultimo_id_diario"]
+            quitadas += 1
+    return quitadas
+
+
+# =============================================================================
+# RESUMIR_RESULTADO
+# =============================================================================
+# Descripción: Copia el resultado de una partida sin el detalle de respuestas
+#              y con el id de la partida
+# 
+# Uso en Pygame: Se usa internamente al guardar y al migrar el diario
+#
+# Parámetros:
+#   - resultado (dict): Resultado de la partida
+#   - id_partida (str): Id de la partida en el historial
+#
+# Retorna:
+#   - dict: Resultado sin "detalle" y con "id_partida"
+#
+# Ejemplo de uso:
+#   resumen = resumir_resultado(resultado, id_partida)
+# =============================================================================
+def resumir_resultado(resultado: dict, id_partida: str) -> dict:
+    """Copia el resultado de una partida sin el detalle de respuestas."""
+    resumen = {}
+    for clave in resultado:
+        if clave != "detalle":
+            resumen[clave] = resultado[clave]
+    resumen["id_partida"] = id_partida
+    return resumen
+
+
+# =============================================================================
+# TRASLADAR_DETALLE_ENTRADAS
+# =============================================================================
+# Descripción: Mueve al historial el detalle de entradas del diario escritas
+#              antes de existir el historial separado
+# 
+# Uso en Pygame: Se usa al compactar
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta del archivo de usuarios
+#   - entradas (list): Entradas leídas del diario
+#
+# Retorna:
+#   - list: Entradas con el resultado resumido
+#
+# Ejemplo de uso:
+#   entradas = trasladar_detalle_entradas(RUTA_USUARIOS, entradas)
+# =============================================================================
+def trasladar_detalle_entradas(archivo_usuarios: str, entradas: list) -> list:
+    """Mueve al historial el detalle que todavía está en el diario."""
+    trasladadas = []
+    for entrada in entradas:
+        resultado = entrada["resultado"]
+        if "detalle" in resultado:
+            repositorio_historial.registrar_partidas_historial(
+                archivo_usuarios, entrada["usuario"], [(entrada["id_partida"], resultado["detalle"])]
+            )
+            entrada = dict(entrada)
+            entrada["resultado"] = resumir_resultado(resultado, entrada["id_partida"])
+        trasladadas.append(entrada)
+    return trasladadas
+
+
+# =============================================================================
+# TRASLADAR_HISTORIAL_USUARIOS
+# =============================================================================
+# Descripción: Mueve al historial separado el detalle de respuestas que
+#              todavía está dentro de Usuarios.json y deja solo los ids
+# 
+# Uso en Pygame: Se usa al compactar (migración única al iniciar el juego)
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta del archivo de usuarios
+#   - datos (dict): Diccionario de todos los usuarios (se modifica)
+#
+# Retorna:
+#   - int: Cantidad de usuarios migrados
+#
+# Ejemplo de uso:
+#   migrados = trasladar_historial_usuarios(RUTA_USUARIOS, datos)
+# =============================================================================
+def trasladar_historial_usuarios(archivo_usuarios: str, datos: dict) -> int:
+    """Mueve el detalle de respuestas del snapshot al historial separado."""
+    migrados = 0
+    for nombre in datos:
+        usuario = datos[nombre]
+        if not isinstance(usuario, dict):
+            continue
+        
+        partidas = []
+        ids = []
+        for elemento in usuario.get("historial", []):
+            if isinstance(elemento, str):
+                ids.append(elemento)
+            else:
+                id_partida = uuid.uuid4().hex
+                partidas.append((id_partida, elemento))
+                ids.append(id_partida)
+        
+        if partidas:
+            if repositorio_historial.registrar_partidas_historial(archivo_usuarios, nombre, partidas):
+                usuario["historial"] = ids
+                migrados += 1
+    return migrados
+
+
+# =============================================================================
+# OBTENER_DETALLE_PARTIDA
+# =============================================================================
+# Descripción: Obtiene el detalle de respuestas de una partida por su id
+# 
+# Uso en Pygame: Para mostrar el detalle de una partida del historial
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - id_partida (str): Id guardado en usuario["historial"]
+#   - archivo (str): Ruta del archivo de usuarios
+#
+# Retorna:
+#   - list: Detalle de respuestas, o None si no existe
+#
+# Ejemplo de uso:
+#   detalle = obtener_detalle_partida("Juan", usuario["historial"][-1], RUTA_USUARIOS)
+# =============================================================================
+def obtener_detalle_partida(nombre_usuario: str, id_partida: str, archivo: str):
+    """Obtiene el detalle de respuestas de una partida por su id."""
+    if usa_backend_sqlite(archivo):
+        return repositorio_usuarios_sqlite.obtener_detalle_partida(id_partida, RUTA_BASE_DATOS_USUARIOS)
+    return repositorio_historial.obtener_detalle_partida(archivo, nombre_usuario, id_partida)
+
+
+# =============================================================================
+# OBTENER_AGREGADOS_USUARIO
+# =============================================================================
+# Descripción: Obtiene los agregados de un usuario; si no los tiene (datos
+#              viejos) los calcula desde sus listas y los guarda en el dict
+# 
+# Uso en Pygame: Se usa para ranking y pantalla de estadísticas
+#
+# Parámetros:
+#   - usuario (dict): Datos del usuario (se completa si le faltan agregados)
+#
+# Retorna:
+#   - dict: {campo: {"cantidad", "total", "mejor", "peor", "promedio"}}
+#           para cada campo de CAMPOS_AGREGADOS
+#
+# Ejemplo de uso:
+#   agregados = obtener_agregados_usuario(usuario)
+#   mejor = agregados["puntajes"]["mejor"]
+# =============================================================================
+def obtener_agregados_usuario(usuario: dict) -> dict:
+    """Obtiene (o calcula una vez) los agregados de un usuario."""
+    if "agregados" not in usuario:
+        agregados = {}
+        for campo in CAMPOS_AGREGADOS:
+            agregados[campo] = calcular_agregado_lista(usuario.get(campo, []))
+        usuario["agregados"] = agregados
+    return usuario["agregados"]
+
+
+# =============================================================================
+# COMPLETAR_AGREGADOS_USUARIOS
+# =============================================================================
+# Descripción: Agrega los agregados a los usuarios que no los tienen
+# 
+# Uso en Pygame: Se usa al compactar (backfill único al iniciar el juego)
+#
+# Parámetros:
+#   - datos (dict): Diccionario de todos los usuarios (se modifica)
+#
+# Retorna:
+#   - int: Cantidad de usuarios completados
+#
+# Ejemplo de uso:
+#   completados = completar_agregados_usuarios(datos)
+# =============================================================================
+def completar_agregados_usuarios(datos: dict) -> int:
+    """Calcula los agregados de los usuarios que todavía no los tienen."""
+    completados = 0
+    for nombre in datos:
+        if isinstance(datos[nombre], dict) and "agregados" not in datos[nombre]:
+            obtener_agregados_usuario(datos[nombre])
+            completados += 1
+    return completados
+
+
 # =============================================================================
 # INICIALIZAR_DATOS_USUARIO
 # =============================================================================
@@ -140,7 +731,8 @@ def inicializar_datos_usuario(nombre: str, datos: dict) -> dict:
             "aciertos": [],
             "total_preguntas": [],
             "porcentajes": [],
-            "historial": []
+            "historial": [],
+            "agregados": crear_agregados_vacios()
         }
         resultado = datos
     
@@ -156,7 +748,7 @@ def inicializar_datos_usuario(nombre: str, datos: dict) -> dict:
 #
 # Parámetros:
 #   - usuario (dict): Datos del usuario
-#   - resultado (dict): Resultado de la partida
+#   - resultado (dict): Resultado de la partida (resumido, con "id_partida")
 #
 # Retorna:
 #   - dict: Usuario con estadísticas actualizadas
@@ -166,21 +758,59 @@ def inicializar_datos_usuario(nombre: str, datos: dict) -> dict:
 # =============================================================================
 def actualizar_listas_estadisticas(usuario: dict, resultado: dict) -> dict:
     """Actualiza las listas de estadísticas de un usuario."""
-    usuario["intentos"] = usuario["intentos"] + 1
-    usuario["puntajes"].append(resultado["puntos_totales"])
-    usuario["tiempos"].append(resultado["tiempo_total_segundos"])
-    usuario["aciertos"].append(resultado["respuestas_correctas"])
-    usuario["total_preguntas"].append(resultado["total_preguntas"])
+    # Usuarios anteriores a los agregados: se calculan una vez antes de sumar
+    agregados = obtener_agregados_usuario(usuario)
     
     porcentaje = 0
     if resultado["total_preguntas"] > 0:
         porcentaje = (resultado["respuestas_correctas"] / resultado["total_preguntas"]) * 100
-    usuario["porcentajes"].append(round(porcentaje, 1))
-    usuario["historial"].append(resultado["detalle"])
+    
+    valores = {
+        "puntajes": resultado["puntos_totales"],
+        "tiempos": resultado["tiempo_total_segundos"],
+        "aciertos": resultado["respuestas_correctas"],
+        "total_preguntas": resultado["total_preguntas"],
+        "porcentajes": round(porcentaje, 1)
+    }
+    
+    usuario["intentos"] = usuario["intentos"] + 1
+    for campo in CAMPOS_AGREGADOS:
+        usuario[campo].append(valores[campo])
+        agregados[campo] = actualizar_agregado(agregados[campo], valores[campo])
+    
+    # Solo el id: el detalle está en data/repositorio_historial
+    if "id_partida" in resultado:
+        usuario["historial"].append(resultado["id_partida"])
+    else:
+        usuario["historial"].append(resultado.get("detalle", []))
 
     return usuario
 
 
+# =============================================================================
+# CREAR_AGREGADOS_VACIOS
+# =============================================================================
+# Descripción: Crea los agregados de un usuario nuevo
+# 
+# Uso en Pygame: Se usa internamente al inicializar usuarios
+#
+# Parámetros:
+#   Ninguno
+#
+# Retorna:
+#   - dict: {campo: agregado vacío} para cada campo de CAMPOS_AGREGADOS
+#
+# Ejemplo de uso:
+#   usuario["agregados"] = crear_agregados_vacios()
+# =============================================================================
+def crear_agregados_vacios() -> dict:
+    """Crea los agregados vacíos de un usuario nuevo."""
+    agregados = {}
+    for campo in CAMPOS_AGREGADOS:
+        agregados[campo] = crear_agregado_vacio()
+    return agregados
+
+
 # =============================================================================
 # OBTENER_RANKING
 # =============================================================================
@@ -199,7 +829,12 @@ def actualizar_listas_estadisticas(usuario: dict, resultado: dict) -> dict:
 # =============================================================================
 def obtener_ranking(archivo: str) -> list:
     """Obtiene el ranking de todos los jugadores."""
-    datos = cargar_json(archivo)
+    if usa_backend_sqlite(archivo):
+        return repositorio_usuarios_sqlite.obtener_ranking(RUTA_BASE_DATOS_USUARIOS)
+    if usa_backend_shards(archivo):
+        return obtener_ranking_shards(archivo)
+    
+    datos = cargar_usuarios(archivo)
     ranking = []
     
     if datos:
@@ -208,13 +843,10 @@ def obtener_ranking(archivo: str) -> list:
             
             # Verificar con 'in' en lugar de iterar
             if "puntajes" in stats and len(stats["puntajes"]) > 0:
-                stats_puntajes = calcular_estadisticas_lista(stats["puntajes"])
-                
-                # Usar .get() con valores por defecto
-                if "porcentajes" in stats:
-                    stats_porcentajes = calcular_estadisticas_lista(stats["porcentajes"])
-                else:
-                    stats_porcentajes = {"mejor": 0, "promedio": 0}
+                # Agregados mantenidos al guardar: O(1) por usuario
+                agregados = obtener_agregados_usuario(stats)
+                stats_puntajes = agregados["puntajes"]
+                stats_porcentajes = agregados["porcentajes"]
                 
                 intentos = stats.get("intentos", 0)
                 
@@ -230,6 +862,118 @@ def obtener_ranking(archivo: str) -> list:
     return ordenar_ranking(ranking)
 
 
+# =============================================================================
+# CALCULAR_ENTRADA_RANKING
+# =============================================================================
+# Descripción: Calcula la entrada del ranking materializado de un usuario
+#              a partir de sus agregados
+# 
+# Uso en Pygame: Se usa al reconstruir el ranking o cuando alguien entra
+#
+# Parámetros:
+#   - nombre (str): Nombre del usuario
+#   - stats (dict): Datos del usuario (puntajes, porcentajes, intentos)
+#
+# Retorna:
+#   - dict: Entrada con sumas (ver data/ranking_materializado)
+#
+# Ejemplo de uso:
+#   entrada = calcular_entrada_ranking("Juan", datos["Juan"])
+# =============================================================================
+def calcular_entrada_ranking(nombre: str, stats: dict) -> dict:
+    """Calcula la entrada del ranking de un usuario desde sus agregados."""
+    agregados = obtener_agregados_usuario(stats)
+    stats_puntajes = agregados["puntajes"]
+    stats_porcentajes = agregados["porcentajes"]
+    intentos = stats.get("intentos", 0)
+    
+    entrada = construir_entrada_ranking(
+        nombre,
+        intentos,
+        stats_puntajes["mejor"],
+        stats_puntajes["total"],
+        stats_porcentajes["mejor"],
+        stats_porcentajes["total"]
+    )
+    # Mismos promedios que obtener_ranking (sobre la cantidad de partidas de cada lista)
+    entrada["promedio_puntaje"] = round(stats_puntajes["promedio"], 2)
+    entrada["promedio_porcentaje"] = round(stats_porcentajes["promedio"], 1)
+    return entrada
+
+
+# =============================================================================
+# RECONSTRUIR_RANKING_MATERIALIZADO
+# =============================================================================
+# Descripción: Recalcula el top-K desde todos los usuarios (backfill)
+# 
+# Uso en Pygame: Se usa una sola vez, si el archivo de ranking no existe
+#
+# Parámetros:
+#   - archivo (str): Ruta del archivo de usuarios
+#   - capacidad (int): Cantidad de jugadores a guardar (K)
+#
+# Retorna:
+#   - dict: Tabla top-K reconstruida
+#
+# Ejemplo de uso:
+#   tabla = reconstruir_ranking_materializado(RUTA_USUARIOS)
+# =============================================================================
+def reconstruir_ranking_materializado(archivo: str, capacidad: int = TAMANO_RANKING) -> dict:
+    """Recalcula el top-K desde todos los usuarios y lo guarda."""
+    try:
+        with bloqueo_archivo(archivo):
+            tabla = calcular_tabla_ranking(cargar_usuarios(archivo), capacidad)
+            guardar_ranking_materializado(archivo, tabla)
+    except BloqueoNoDisponibleError as e:
+        # Leer no necesita el bloqueo: se muestra el ranking sin guardarlo
+        print(f"⚠️ No se guardó el ranking: {e}")
+        tabla = calcular_tabla_ranking(cargar_usuarios(archivo), capacidad)
+    return tabla
+
+
+def calcular_tabla_ranking(datos: dict, capacidad: int) -> dict:
+    """Arma el top-K a partir de todos los usuarios."""
+    tabla = crear_tabla_ranking(capacidad)
+    for nombre in datos:
+        stats = datos[nombre]
+        if "puntajes" in stats and len(stats["puntajes"]) > 0:
+            entrada = calcular_entrada_ranking(nombre, stats)
+            if puede_entrar_al_ranking(tabla, entrada["mejor_puntaje"]):
+                tabla = actualizar_entrada_ranking(tabla, entrada)
+    return tabla
+
+
+# =============================================================================
+# OBTENER_TOP_RANKING
+# =============================================================================
+# Descripción: Obtiene los mejores jugadores desde el ranking materializado
+# 
+# Uso en Pygame: Pantalla de Rankings (O(K), no carga a todos los usuarios)
+#
+# Parámetros:
+#   - archivo (str): Ruta del archivo de usuarios
+#   - limite (int): Cantidad de jugadores (default: TAMANO_RANKING)
+#
+# Retorna:
+#   - list: Lista con el mismo formato que obtener_ranking, recortada
+#
+# Ejemplo de uso:
+#   top_10 = obtener_top_ranking(RUTA_USUARIOS, 10)
+# =============================================================================
+def obtener_top_ranking(archivo: str, limite: int = TAMANO_RANKING) -> list:
+    """Obtiene los mejores jugadores desde el ranking materializado."""
+    if usa_backend_sqlite(archivo):
+        return repositorio_usuarios_sqlite.obtener_ranking(RUTA_BASE_DATOS_USUARIOS, limite)
+    if usa_backend_shards(archivo):
+        return obtener_top_ranking_shards(archivo, limite)
+    
+    tabla = cargar_ranking_materializado(archivo)
+    if tabla is None or tabla["capacidad"] < limite:
+        tabla = reconstruir_ranking_materializado(archivo, max(limite, TAMANO_RANKING))
+    
+    return obtener_entradas_visibles(tabla, limite)
+
+
 def ordenar_ranking(ranking: list) -> list:
     """Ordena el ranking por mejor puntaje usando insertion sort optimizado."""
     if len(ranking) <= 1:
@@ -250,6 +994,363 @@ def ordenar_ranking(ranking: list) -> list:
     
     return ranking
 
+
+# =============================================================================
+# FUSIONAR_RANKINGS_ORDENADOS
+# =============================================================================
+# Descripción: Une rankings ya ordenados por mejor puntaje (merge de merge
+#              sort, de a pares) sin volver a ordenar todo
+#
+# Uso en Pygame: Ranking completo con BACKEND_USUARIOS == "shards"
+#
+# Parámetros:
+#   - rankings (list): Listas ordenadas con ordenar_ranking
+#
+# Retorna:
+#   - list: Un solo ranking ordenado (en empates, primero la lista anterior)
+#
+# Ejemplo de uso:
+#   ranking = fusionar_rankings_ordenados([ranking_shard_0, ranking_shard_1])
+# =============================================================================
+def fusionar_rankings_ordenados(rankings: list) -> list:
+    """Une rankings ya ordenados en uno solo, de a pares."""
+    pendientes = list(rankings)
+    if not pendientes:
+        pendientes = [[]]
+    
+    while len(pendientes) > 1:
+        siguientes = []
+        for k in range(0, len(pendientes) - 1, 2):
+            izquierda = pendientes[k]
+            derecha = pendientes[k + 1]
+            fusion = []
+            i = 0
+            j = 0
+            while i < len(izquierda) and j < len(derecha):
+                if derecha[j]["mejor_puntaje"] > izquierda[i]["mejor_puntaje"]:
+                    fusion.append(derecha[j])
+                    j += 1
+                else:
+                    fusion.append(izquierda[i])
+                    i += 1
+            fusion += izquierda[i:]
+            fusion += derecha[j:]
+            siguientes.append(fusion)
+        if len(pendientes) % 2 == 1:
+            siguientes.append(pendientes[-1])
+        pendientes = siguientes
+    
+    return pendientes[0]
+
+# =============================================================================
+# BACKEND POR SHARDS (BACKEND_USUARIOS == "shards")
+# =============================================================================
+
+# =============================================================================
+# OBTENER_USUARIO_SHARDS
+# =============================================================================
+# Descripción: Obtiene un perfil leyendo solo el shard del jugador
+#
+# Uso en Pygame: Igual que obtener_usuario
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - archivo (str): Ruta de Usuarios.json (define la carpeta de shards)
+#
+# Retorna:
+#   - dict: Datos del usuario o dict con "error" si no existe
+#
+# Ejemplo de uso:
+#   usuario = obtener_usuario_shards("Juan", RUTA_USUARIOS)
+# =============================================================================
+def obtener_usuario_shards(nombre_usuario: str, archivo: str) -> dict:
+    """Obtiene un perfil leyendo solo el shard del jugador."""
+    resultado = {"error": ""}
+    
+    ruta_shard = obtener_ruta_shard_usuario(archivo, nombre_usuario)
+    datos = cargar_json(ruta_shard, {})
+    if nombre_usuario in datos:
+        resultado = datos[nombre_usuario]
+    elif not shards_creados(archivo):
+        resultado["error"] = "No hay estadísticas guardadas"
+    else:
+        resultado["error"] = "Usuario '" + nombre_usuario + "' no encontrado"
+    
+    return resultado
+
+
+# =============================================================================
+# GUARDAR_ESTADISTICAS_SHARDS
+# =============================================================================
+# Descripción: Guarda una partida reescribiendo solo el shard del jugador
+#              y el top-K de ese shard
+#
+# Uso en Pygame: Igual que guardar_estadisticas_usuario
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - resultado (dict): Resultado de la partida
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   guardar_estadisticas_shards("Juan", resultado_partida, RUTA_USUARIOS)
+# =============================================================================
+def guardar_estadisticas_shards(nombre_usuario: str, resultado: dict, archivo_usuarios: str) -> None:
+    """Guarda una partida reescribiendo solo el shard del jugador."""
+    id_partida = uuid.uuid4().hex
+    if not shards_creados(archivo_usuarios):
+        migrar_usuarios_a_shards(archivo_usuarios)
+    
+    ruta_shard = obtener_ruta_shard_usuario(archivo_usuarios, nombre_usuario)
+    # El bloqueo es por shard: jugadores de otros shards guardan en paralelo
+    with bloqueo_archivo(ruta_shard):
+        repositorio_historial.registrar_partidas_historial(
+            archivo_usuarios, nombre_usuario, [(id_partida, resultado.get("detalle", []))]
+        )
+        datos = cargar_json(ruta_shard, {})
+        datos = inicializar_datos_usuario(nombre_usuario, datos)
+        datos[nombre_usuario] = actualizar_listas_estadisticas(
+            datos[nombre_usuario], resumir_resultado(resultado, id_partida)
+        )
+        guardar_json(ruta_shard, datos)
+        
+        # El perfil completo ya está en memoria: la entrada sale de sus agregados
+        tabla = cargar_ranking_materializado(ruta_shard)
+        if tabla is None:
+            calcular_ranking_shard(ruta_shard, TAMANO_RANKING)
+        else:
+            entrada = calcular_entrada_ranking(nombre_usuario, datos[nombre_usuario])
+            if buscar_entrada_ranking(tabla, nombre_usuario) is not None or puede_entrar_al_ranking(tabla, entrada["mejor_puntaje"]):
+                guardar_ranking_materializado(ruta_shard, actualizar_entrada_ranking(tabla, entrada))
+    return None
+
+
+# =============================================================================
+# CALCULAR_RANKING_SHARD
+# =============================================================================
+# Descripción: Recalcula y guarda el top-K de un shard
+#
+# Uso en Pygame: Se usa al migrar y cuando falta el top-K de un shard;
+#                puede correr en otro proceso (ver mapear_shards)
+#
+# Parámetros:
+#   - ruta_shard (str): Ruta del shard
+#   - capacidad (int): K del top-K
+#
+# Retorna:
+#   - dict: Tabla top-K del shard
+#
+# Ejemplo de uso:
+#   tabla = calcular_ranking_shard(ruta_shard, 10)
+# =============================================================================
+def calcular_ranking_shard(ruta_shard: str, capacidad: int) -> dict:
+    """Recalcula y guarda el top-K de un shard."""
+    try:
+        with bloqueo_archivo(ruta_shard):
+            tabla = calcular_tabla_ranking(cargar_json(ruta_shard, {}), capacidad)
+            guardar_ranking_materializado(ruta_shard, tabla)
+    except BloqueoNoDisponibleError as e:
+        print(f"⚠️ No se guardó el ranking del shard: {e}")
+        tabla = calcular_tabla_ranking(cargar_json(ruta_shard, {}), capacidad)
+    return tabla
+
+
+def calcular_ranking_completo_shard(ruta_shard: str) -> list:
+    """Retorna el ranking ordenado de todos los jugadores de un shard."""
+    entradas = []
+    datos = cargar_json(ruta_shard, {})
+    for nombre in datos:
+        stats = datos[nombre]
+        if "puntajes" in stats and len(stats["puntajes"]) > 0:
+            entradas.append(calcular_entrada_ranking(nombre, stats))
+    return ordenar_ranking(obtener_entradas_visibles({"entradas": entradas}, len(entradas)))
+
+
+# =============================================================================
+# OBTENER_TOP_RANKING_SHARDS
+# =============================================================================
+# Descripción: Ranking top-K global fusionando el top-K de cada shard
+#
+# Uso en Pygame: Igual que obtener_top_ranking
+#
+# Parámetros:
+#   - archivo (str): Ruta de Usuarios.json
+#   - limite (int): Cantidad de jugadores
+#
+# Retorna:
+#   - list: Lista con el mismo formato que obtener_ranking, recortada
+#
+# Ejemplo de uso:
+#   top_10 = obtener_top_ranking_shards(RUTA_USUARIOS, 10)
+# =============================================================================
+def obtener_top_ranking_shards(archivo: str, limite: int = TAMANO_RANKING) -> list:
+    """Ranking top-K global fusionando el top-K de cada shard."""
+    tablas = []
+    faltantes = []
+    for ruta_shard in listar_rutas_shards(archivo):
+        tabla = cargar_ranking_materializado(ruta_shard)
+        if tabla is None or tabla["capacidad"] < limite:
+            faltantes.append(ruta_shard)
+        else:
+            tablas.append(tabla)
+    
+    # Los shards sin top-K (o con K chico) se recalculan, en paralelo si son grandes
+    if faltantes:
+        tablas += mapear_shards(calcular_ranking_shard, faltantes, (max(limite, TAMANO_RANKING),))
+    
+    return obtener_entradas_visibles(fusionar_tablas_ranking(tablas, limite), limite)
+
+
+# =============================================================================
+# OBTENER_RANKING_SHARDS
+# =============================================================================
+# Descripción: Ranking completo: cada shard calcula y ordena sus entradas
+#              (en paralelo si son grandes) y después se fusionan
+#
+# Uso en Pygame: Igual que obtener_ranking
+#
+# Parámetros:
+#   - archivo (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - list: Lista de usuarios ordenados por mejor puntaje
+#
+# Ejemplo de uso:
+#   ranking = obtener_ranking_shards(RUTA_USUARIOS)
+# =============================================================================
+def obtener_ranking_shards(archivo: str) -> list:
+    """Ranking completo calculado shard por shard."""
+    rankings = mapear_shards(calcular_ranking_completo_shard, listar_rutas_shards(archivo))
+    return fusionar_rankings_ordenados(rankings)
+
+
+# =============================================================================
+# MIGRAR_USUARIOS_A_SHARDS
+# =============================================================================
+# Descripción: Reparte Usuarios.json + diario en los shards (una sola vez)
+#
+# Uso en Pygame: Se llama al iniciar (compactar_diario_usuarios) con
+#                BACKEND_USUARIOS == "shards"
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - bool: True si los shards quedaron creados
+#
+# Ejemplo de uso:
+#   migrar_usuarios_a_shards(RUTA_USUARIOS)
+# =============================================================================
+def migrar_usuarios_a_shards(archivo_usuarios: str) -> bool:
+    """Reparte los usuarios del archivo único en los shards."""
+    exito = True
+    migrados = None
+    
+    with bloqueo_archivo(archivo_usuarios):
+        if not shards_creados(archivo_usuarios):
+            datos = cargar_usuarios(archivo_usuarios)
+            completar_agregados_usuarios(datos)
+            trasladar_historial_usuarios(archivo_usuarios, datos)
+            
+            por_shard = {}
+            for nombre in datos:
+                ruta_shard = obtener_ruta_shard_usuario(archivo_usuarios, nombre)
+                if ruta_shard not in por_shard:
+                    por_shard[ruta_shard] = {}
+                por_shard[ruta_shard][nombre] = datos[nombre]
+            
+            for ruta_shard in por_shard:
+                if not guardar_json(ruta_shard, por_shard[ruta_shard]):
+                    exito = False
+            
+            # shards.json se escribe al final: si algo falló se reintenta al iniciar
+            if exito:
+                exito = guardar_configuracion_shards(archivo_usuarios)
+                migrados = len(datos)
+    
+    # El top-K de cada shard se arma después de soltar el bloqueo de
+    # Usuarios.json: cada proceso del pool solo bloquea su shard
+    if exito and migrados is not None:
+        mapear_shards(calcular_ranking_shard, listar_rutas_shards(archivo_usuarios), (TAMANO_RANKING,))
+        print(f"📦 {migrados} usuarios repartidos en {len(listar_rutas_shards(archivo_usuarios))} shards")
+    
+    return exito
+
+
+# =============================================================================
+# MIGRAR_USUARIOS_A_SQLITE
+# =============================================================================
+# Descripción: Copia Usuarios.json + diario, el historial de respuestas y
+#              EstadoBuff.json a la base SQLite cuando la base está vacía
+#              (una sola vez, al pasar BACKEND_USUARIOS a "sqlite")
+#
+# Uso en Pygame: Se llama al iniciar (compactar_diario_usuarios) con
+#                BACKEND_USUARIOS == "sqlite"
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#   - ruta_db (str): Ruta de la base SQLite
+#   - ruta_estado (str): Ruta de EstadoBuff.json
+#
+# Retorna:
+#   - bool: True si la base quedó con los usuarios (o ya los tenía)
+#
+# Ejemplo de uso:
+#   migrar_usuarios_a_sqlite(RUTA_USUARIOS)
+# =============================================================================
+def migrar_usuarios_a_sqlite(archivo_usuarios: str, ruta_db: str = RUTA_BASE_DATOS_USUARIOS,
+                             ruta_estado: str = RUTA_ESTADO_BUFF) -> bool:
+    """Importa los usuarios del backend JSON en una base SQLite vacía."""
+    if not repositorio_usuarios_sqlite.base_vacia(ruta_db):
+        return True
+    
+    with bloqueo_archivo(archivo_usuarios):
+        datos = cargar_usuarios(archivo_usuarios)
+        # EstadoBuff.json directo: con este backend data/estado_buff lee la base
+        estados = cargar_json(ruta_estado, {})
+        
+        usuarios = {}
+        for nombre in datos:
+            usuario = datos[nombre]
+            detalles = {}
+            for partida in repositorio_historial.leer_historial_usuario(archivo_usuarios, nombre):
+                detalles[partida["id_partida"]] = partida["detalle"]
+            
+            partidas = []
+            historial = usuario.get("historial", [])
+            i = 0
+            while i < len(usuario["puntajes"]):
+                detalle = []
+                if i < len(historial):
+                    # Id del historial separado o detalle anterior a esa migración
+                    if isinstance(historial[i], str):
+                        detalle = detalles.get(historial[i], [])
+                    else:
+                        detalle = historial[i]
+                partidas.append({
+                    "puntos_totales": usuario["puntajes"][i],
+                    "tiempo_total_segundos": usuario["tiempos"][i],
+                    "respuestas_correctas": usuario["aciertos"][i],
+                    "total_preguntas": usuario["total_preguntas"][i],
+                    "detalle": detalle
+                })
+                i += 1
+            usuarios[nombre] = {"partidas": partidas, "estado": estados.get(nombre, {})}
+        
+        # Jugadores con objeto o vidas extra pero sin partidas guardadas
+        for nombre in estados:
+            if nombre not in usuarios and isinstance(estados[nombre], dict):
+                usuarios[nombre] = {"partidas": [], "estado": estados[nombre]}
+        
+        importados = repositorio_usuarios_sqlite.importar_usuarios(usuarios, ruta_db)
+        if importados:
+            print(f"📦 {importados} usuarios importados a {ruta_db}")
+    
+    return True
+
 # =============================================================================
 # FUNCIONES PARA VIDAS EXTRA
 # =============================================================================
@@ -265,61 +1366,22 @@ def obtener_vidas_extra(nombre_usuario: str, ruta_archivo: str = RUTA_ESTADO_BUF
     Retorna:
         int: Número de vidas extra disponibles
     """
-    import json
-    from pathlib import Path
-    
-    ruta = Path(ruta_archivo)
-    
-    if not ruta.exists():
-        return 0
-    
-    try:
-        with open(ruta, 'r', encoding='utf-8') as archivo:
-            datos = json.load(archivo)
-            
-            if nombre_usuario in datos:
-                usuario_data = datos[nombre_usuario]
-                return usuario_data.get("vidas_extra", 0)
-            
-            return 0
-    except:
-        return 0
+    usuario_data = obtener_estado_usuario_buff(nombre_usuario, ruta_archivo)
+    return usuario_data.get("vidas_extra", 0)
 
 
 def guardar_vidas_extra(nombre_usuario: str, vidas_extra: int, ruta_archivo: str = RUTA_ESTADO_BUFF):
     """
     Guarda las vidas extra del usuario en EstadoBuff.json.
     
+    La escritura a disco es diferida (ver data/estado_buff.py).
+    
     Parámetros:
         nombre_usuario (str): Nombre del usuario
         vidas_extra (int): Número de vidas extra a guardar
         ruta_archivo (str): Ruta del archivo EstadoBuff.json
     """
-    import json
-    from pathlib import Path
-    
-    ruta = Path(ruta_archivo)
-    
-    # Cargar datos existentes
-    if ruta.exists():
-        try:
-            with open(ruta, 'r', encoding='utf-8') as archivo:
-                datos = json.load(archivo)
-        except:
-            datos = {}
-    else:
-        datos = {}
-    
-    # Crear entrada del usuario si no existe
-    if nombre_usuario not in datos:
-        datos[nombre_usuario] = {}
-    
-    # Actualizar vidas extra
-    datos[nombre_usuario]["vidas_extra"] = vidas_extra
-    
-    # Guardar
-    with open(ruta, 'w', encoding='utf-8') as archivo:
-        json.dump(datos, archivo, indent=2, ensure_ascii=False)
+    actualizar_estado_usuario_buff(nombre_usuario, {"vidas_extra": vidas_extra}, ruta=ruta_archivo)
     
     print(f"💾 Vidas extra guardadas para {nombre_usuario}: {vidas_extra}")
 
@@ -338,73 +1400,38 @@ def obtener_objeto_equipado(nombre_usuario: str, ruta_archivo: str = RUTA_ESTADO
     Retorna:
         str o None: Tipo de objeto equipado o None si no tiene
     """
-    import json
-    from pathlib import Path
-    
-    ruta = Path(ruta_archivo)
-    
-    if not ruta.exists():
-        return None
-    
-    try:
-        with open(ruta, 'r', encoding='utf-8') as archivo:
-            datos = json.load(archivo)
-            
-            if nombre_usuario in datos:
-                usuario_data = datos[nombre_usuario]
-                return usuario_data.get("objeto_excepcional", None)
-            
-            return None
-    except:
-        return None
+    usuario_data = obtener_estado_usuario_buff(nombre_usuario, ruta_archivo)
+    return usuario_data.get("objeto_excepcional", None)
 
 
 def guardar_objeto_equipado(nombre_usuario: str, tipo_objeto: str = None, vidas_extra: int = None, ruta_archivo: str = RUTA_ESTADO_BUFF):
     """
     Guarda el objeto equipado del usuario en EstadoBuff.json.
     
+    La escritura a disco es diferida (ver data/estado_buff.py).
+    
     Parámetros:
         nombre_usuario (str): Nombre del usuario
         tipo_objeto (str): Tipo de objeto ("espada", "armadura", etc.) o None para eliminar
         vidas_extra (int): Vidas extra a guardar (opcional)
         ruta_archivo (str): Ruta del archivo EstadoBuff.json
     """
-    import json
-    from pathlib import Path
-    
-    ruta = Path(ruta_archivo)
-    
-    # Cargar datos existentes
-    if ruta.exists():
-        try:
-            with open(ruta, 'r', encoding='utf-8') as archivo:
-                datos = json.load(archivo)
-        except:
-            datos = {}
-    else:
-        datos = {}
-    
-    # Crear entrada del usuario si no existe
-    if nombre_usuario not in datos:
-        datos[nombre_usuario] = {}
+    cambios = {}
+    claves_a_eliminar = []
     
     # Actualizar objeto
     if tipo_objeto is None:
-        # Eliminar el objeto
-        if "objeto_excepcional" in datos[nombre_usuario]:
-            del datos[nombre_usuario]["objeto_excepcional"]
+        claves_a_eliminar.append("objeto_excepcional")
     else:
-        datos[nombre_usuario]["objeto_excepcional"] = tipo_objeto
+        cambios["objeto_excepcional"] = tipo_objeto
     
     # Actualizar vidas si se especificaron
     if vidas_extra is not None:
-        datos[nombre_usuario]["vidas_extra"] = vidas_extra
+        cambios["vidas_extra"] = vidas_extra
     
-    # Guardar
-    with open(ruta, 'w', encoding='utf-8') as archivo:
-        json.dump(datos, archivo, indent=2, ensure_ascii=False)
+    actualizar_estado_usuario_buff(nombre_usuario, cambios, claves_a_eliminar, ruta_archivo)
     
     if tipo_objeto:
         print(f"💾 Objeto '{tipo_objeto}' equipado para {nombre_usuario}")
     else:
-        print(f"💾 Objeto eliminado para {nombre_usuario}")
\ No newline at end of file
+        print(f"💾 Objeto eliminado para {nombre_usuario}")
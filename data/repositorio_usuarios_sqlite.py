@@ -0,0 +1,503 @@
+# =============================================================================
+# REPOSITORIO DE USUARIOS - BACKEND SQLITE
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Implementación alternativa del repositorio de usuarios sobre un archivo
+#    SQLite local. Expone las mismas operaciones que repositorio_usuarios
+#    (perfil, estadísticas, ranking, vidas extra y objeto equipado) con
+#    tablas para usuarios, partidas e historial de respuestas.
+#
+# 📥 IMPORTADO EN:
+#    - data/repositorio_usuarios.py - cuando BACKEND_USUARIOS == "sqlite"
+#    - data/estado_buff.py - para vidas extra y objeto equipado
+#
+# 🔗 DEPENDENCIAS:
+#    - sqlite3: base de datos embebida de la biblioteca estándar
+#    - json: para guardar el detalle de cada respuesta y el filtro de vistas
+#    - os: para crear el directorio de la base si no existe
+#    - utils/algoritmos: para calcular_agregado_lista
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Guardar una partida es un INSERT: no reescribe a los demás jugadores
+#    - Agregados (mejor puntaje, sumas) mantenidos en la tabla usuarios
+#    - Índice sobre mejor_puntaje: el ranking no recorre todos los perfiles
+#    - Los diccionarios retornados tienen el mismo formato que el backend JSON
+#    - El perfil no lee la tabla respuestas: "historial" son ids de partida
+#    - El esquema se crea y migra una vez por archivo y proceso (no en cada
+#      conexión); bases creadas antes de preguntas_vistas reciben la columna
+#      con ALTER TABLE
+#    - importar_usuarios carga los perfiles del backend JSON en una base
+#      vacía (una sola vez, al cambiar BACKEND_USUARIOS)
+# =============================================================================
+
+import os
+import json
+import sqlite3
+from contextlib import closing
+from utils.algoritmos import calcular_agregado_lista
+
+ESQUEMA_SQL = """
+CREATE TABLE IF NOT EXISTS usuarios (
+    nombre TEXT PRIMARY KEY,
+    intentos INTEGER NOT NULL DEFAULT 0,
+    mejor_puntaje INTEGER,
+    suma_puntaje INTEGER NOT NULL DEFAULT 0,
+    mejor_porcentaje REAL,
+    suma_porcentaje REAL NOT NULL DEFAULT 0,
+    vidas_extra INTEGER NOT NULL DEFAULT 0,
+    objeto_equipado TEXT,
+    preguntas_vistas TEXT
+);
+CREATE TABLE IF NOT EXISTS partidas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    usuario TEXT NOT NULL REFERENCES usuarios(nombre),
+    puntaje INTEGER NOT NULL,
+    tiempo REAL NOT NULL,
+    aciertos INTEGER NOT NULL,
+    total_preguntas INTEGER NOT NULL,
+    porcentaje REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS respuestas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    partida_id INTEGER NOT NULL REFERENCES partidas(id),
+    orden INTEGER NOT NULL,
+    pregunta_id INTEGER,
+    es_correcta INTEGER,
+    puntos INTEGER,
+    detalle TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_usuarios_mejor_puntaje ON usuarios(mejor_puntaje DESC);
+CREATE INDEX IF NOT EXISTS idx_partidas_usuario ON partidas(usuario, id);
+CREATE INDEX IF NOT EXISTS idx_respuestas_partida ON respuestas(partida_id, orden);
+"""
+
+# Columnas agregadas después de la primera versión: {columna: definición}
+COLUMNAS_MIGRADAS = {"preguntas_vistas": "TEXT"}
+
+# Archivos con el esquema ya creado y migrado en este proceso
+_bases_preparadas = set()
+
+# =============================================================================
+# CONECTAR
+# =============================================================================
+# Descripción: Abre la base de datos; la primera vez por archivo crea el
+#              esquema si no existe y agrega las columnas nuevas a bases
+#              anteriores
+#
+# Uso en Pygame: Se usa internamente en cada operación
+#
+# Parámetros:
+#   - ruta_db (str): Ruta del archivo SQLite
+#
+# Retorna:
+#   - sqlite3.Connection: Conexión abierta
+#
+# Ejemplo de uso:
+#   with closing(conectar(ruta_db)) as conexion:
+#       ...
+# =============================================================================
+def conectar(ruta_db: str) -> sqlite3.Connection:
+    """Abre la base de datos y crea el esquema si no existe."""
+    directorio = os.path.dirname(ruta_db)
+    if directorio and not os.path.exists(directorio):
+        os.makedirs(directorio)
+
+    conexion = sqlite3.connect(ruta_db, timeout=10)
+    conexion.row_factory = sqlite3.Row
+    if ruta_db not in _bases_preparadas:
+        conexion.executescript(ESQUEMA_SQL)
+        migrar_esquema(conexion)
+        _bases_preparadas.add(ruta_db)
+    return conexion
+
+
+def migrar_esquema(conexion: sqlite3.Connection) -> None:
+    """Agrega a la tabla usuarios las columnas de COLUMNAS_MIGRADAS que falten."""
+    existentes = set()
+    for fila in conexion.execute("PRAGMA table_info(usuarios)"):
+        existentes.add(fila["name"])
+    with conexion:
+        for columna, definicion in COLUMNAS_MIGRADAS.items():
+            if columna not in existentes:
+                conexion.execute("ALTER TABLE usuarios ADD COLUMN " + columna + " " + definicion)
+    return None
+
+
+# =============================================================================
+# OBTENER_USUARIO
+# =============================================================================
+# Descripción: Obtiene el perfil de un usuario con el formato del backend JSON
+#
+# Uso en Pygame: Igual que repositorio_usuarios.obtener_usuario
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - ruta_db (str): Ruta del archivo SQLite
+#
+# Retorna:
+#   - dict: Datos del usuario o dict con "error" si no existe
+#
+# Ejemplo de uso:
+#   usuario = obtener_usuario("Juan", RUTA_BASE_DATOS_USUARIOS)
+# =============================================================================
+def obtener_usuario(nombre_usuario: str, ruta_db: str) -> dict:
+    """Obtiene el perfil de un usuario desde SQLite."""
+    with closing(conectar(ruta_db)) as conexion:
+        fila_usuario = conexion.execute(
+            "SELECT intentos FROM usuarios WHERE nombre = ?", (nombre_usuario,)
+        ).fetchone()
+
+        if fila_usuario is None or fila_usuario["intentos"] == 0:
+            # Mismos mensajes que el backend JSON (base sin partidas = sin archivo)
+            if conexion.execute("SELECT 1 FROM partidas LIMIT 1").fetchone() is None:
+                return {"error": "No hay estadísticas guardadas"}
+            return {"error": "Usuario '" + nombre_usuario + "' no encontrado"}
+
+        usuario = {
+            "intentos": fila_usuario["intentos"],
+            "puntajes": [],
+            "tiempos": [],
+            "aciertos": [],
+            "total_preguntas": [],
+            "porcentajes": [],
+            "historial": []
+        }
+
+        partidas = conexion.execute(
+            "SELECT id, puntaje, tiempo, aciertos, total_preguntas, porcentaje "
+            "FROM partidas WHERE usuario = ? ORDER BY id", (nombre_usuario,)
+        ).fetchall()
+
+        for partida in partidas:
+            usuario["puntajes"].append(partida["puntaje"])
+            usuario["tiempos"].append(partida["tiempo"])
+            usuario["aciertos"].append(partida["aciertos"])
+            usuario["total_preguntas"].append(partida["total_preguntas"])
+            usuario["porcentajes"].append(partida["porcentaje"])
+            # Igual que el backend JSON: solo el id, el detalle se pide aparte
+            usuario["historial"].append(str(partida["id"]))
+
+    # Mismo formato que el backend JSON (ver repositorio_usuarios.CAMPOS_AGREGADOS)
+    agregados = {}
+    for campo in ("puntajes", "tiempos", "aciertos", "total_preguntas", "porcentajes"):
+        agregados[campo] = calcular_agregado_lista(usuario[campo])
+    usuario["agregados"] = agregados
+
+    return usuario
+
+
+# =============================================================================
+# BASE_VACIA
+# =============================================================================
+# Descripción: Indica si la base todavía no tiene usuarios (recién creada)
+#
+# Uso en Pygame: Al iniciar, para decidir si importar Usuarios.json
+#
+# Parámetros:
+#   - ruta_db (str): Ruta del archivo SQLite
+#
+# Retorna:
+#   - bool: True si la tabla usuarios está vacía
+#
+# Ejemplo de uso:
+#   if base_vacia(RUTA_BASE_DATOS_USUARIOS): ...
+# =============================================================================
+def base_vacia(ruta_db: str) -> bool:
+    """Indica si la base no tiene ningún usuario."""
+    with closing(conectar(ruta_db)) as conexion:
+        fila = conexion.execute("SELECT 1 FROM usuarios LIMIT 1").fetchone()
+    return fila is None
+
+
+# =============================================================================
+# IMPORTAR_USUARIOS
+# =============================================================================
+# Descripción: Carga en una base vacía los perfiles y el estado de buffs del
+#              backend JSON, en una sola transacción
+#
+# Uso en Pygame: Se usa desde repositorio_usuarios.migrar_usuarios_a_sqlite
+#
+# Parámetros:
+#   - usuarios (dict): {nombre: {"partidas": list, "estado": dict}}, donde
+#                      cada partida es un resultado (puntos_totales,
+#                      tiempo_total_segundos, respuestas_correctas,
+#                      total_preguntas, detalle) y "estado" tiene el
+#                      formato de EstadoBuff.json
+#   - ruta_db (str): Ruta del archivo SQLite
+#
+# Retorna:
+#   - int: Usuarios importados (0 si la base ya tenía usuarios)
+#
+# Ejemplo de uso:
+#   importar_usuarios({"Juan": {"partidas": [resultado], "estado": {}}}, RUTA_BASE_DATOS_USUARIOS)
+# =============================================================================
+def importar_usuarios(usuarios: dict, ruta_db: str) -> int:
+    """Importa perfiles del backend JSON en una base vacía."""
+    importados = 0
+    with closing(conectar(ruta_db)) as conexion:
+        with conexion:
+            # BEGIN IMMEDIATE: otro proceso no puede importar o guardar entre
+            # la verificación y los INSERT
+            conexion.execute("BEGIN IMMEDIATE")
+            if conexion.execute("SELECT 1 FROM usuarios LIMIT 1").fetchone() is None:
+                for nombre in usuarios:
+                    conexion.execute("INSERT INTO usuarios (nombre) VALUES (?)", (nombre,))
+                    for resultado in usuarios[nombre]["partidas"]:
+                        insertar_partida(conexion, nombre, resultado)
+                    estado = usuarios[nombre]["estado"]
+                    if estado:
+                        vistas = estado.get("preguntas_vistas", None)
+                        conexion.execute(
+                            "UPDATE usuarios SET vidas_extra = ?, objeto_equipado = ?, preguntas_vistas = ? WHERE nombre = ?",
+                            (estado.get("vidas_extra", 0), estado.get("objeto_excepcional", None),
+                             json.dumps(vistas) if vistas is not None else None, nombre)
+                        )
+                    importados += 1
+    return importados
+
+
+# =============================================================================
+# OBTENER_DETALLE_PARTIDA
+# =============================================================================
+# Descripción: Obtiene el detalle de respuestas de una partida
+#
+# Uso en Pygame: Igual que repositorio_usuarios.obtener_detalle_partida
+#
+# Parámetros:
+#   - id_partida (str): Id de la partida (como aparece en "historial")
+#   - ruta_db (str): Ruta del archivo SQLite
+#
+# Retorna:
+#   - list: Detalle de respuestas, o None si la partida no existe
+#
+# Ejemplo de uso:
+#   detalle = obtener_detalle_partida(usuario["historial"][-1], RUTA_BASE_DATOS_USUARIOS)
+# =============================================================================
+def obtener_detalle_partida(id_partida: str, ruta_db: str):
+    """Obtiene el detalle de respuestas de una partida desde SQLite."""
+    detalle = None
+    with closing(conectar(ruta_db)) as conexion:
+        existe = conexion.execute(
+            "SELECT 1 FROM partidas WHERE id = ?", (int(id_partida),)
+        ).fetchone()
+        if existe is not None:
+            filas = conexion.execute(
+                "SELECT detalle FROM respuestas WHERE partida_id = ? ORDER BY orden",
+                (int(id_partida),)
+            ).fetchall()
+            detalle = [json.loads(fila["detalle"]) for fila in filas]
+    return detalle
+
+
+# =============================================================================
+# GUARDAR_ESTADISTICAS_USUARIO
+# =============================================================================
+# Descripción: Guarda una partida y actualiza los agregados del usuario
+#
+# Uso en Pygame: Igual que repositorio_usuarios.guardar_estadisticas_usuario
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - resultado (dict): Resultado de la partida (ver construir_estadisticas_partida)
+#   - ruta_db (str): Ruta del archivo SQLite
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   guardar_estadisticas_usuario("Juan", resultado, RUTA_BASE_DATOS_USUARIOS)
+# =============================================================================
+def guardar_estadisticas_usuario(nombre_usuario: str, resultado: dict, ruta_db: str) -> None:
+    """Guarda una partida en SQLite en una sola transacción."""
+    with closing(conectar(ruta_db)) as conexion:
+        with conexion:
+            conexion.execute(
+                "INSERT OR IGNORE INTO usuarios (nombre) VALUES (?)", (nombre_usuario,)
+            )
+            insertar_partida(conexion, nombre_usuario, resultado)
+
+    return None
+
+
+def insertar_partida(conexion: sqlite3.Connection, nombre_usuario: str, resultado: dict) -> int:
+    """Inserta una partida con sus respuestas y suma sus agregados (sin commit)."""
+    puntaje = resultado["puntos_totales"]
+    porcentaje = 0
+    if resultado["total_preguntas"] > 0:
+        porcentaje = (resultado["respuestas_correctas"] / resultado["total_preguntas"]) * 100
+    porcentaje = round(porcentaje, 1)
+
+    cursor = conexion.execute(
+        "INSERT INTO partidas (usuario, puntaje, tiempo, aciertos, total_preguntas, porcentaje) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (nombre_usuario, puntaje, resultado["tiempo_total_segundos"],
+         resultado["respuestas_correctas"], resultado["total_preguntas"], porcentaje)
+    )
+    partida_id = cursor.lastrowid
+
+    filas_respuestas = []
+    orden = 0
+    for respuesta in resultado.get("detalle", []):
+        filas_respuestas.append((
+            partida_id,
+            orden,
+            respuesta.get("pregunta_id", respuesta.get("id")),
+            1 if respuesta.get("es_correcta", False) else 0,
+            respuesta.get("puntos", 0),
+            json.dumps(respuesta, ensure_ascii=False)
+        ))
+        orden += 1
+    conexion.executemany(
+        "INSERT INTO respuestas (partida_id, orden, pregunta_id, es_correcta, puntos, detalle) "
+        "VALUES (?, ?, ?, ?, ?, ?)", filas_respuestas
+    )
+
+    conexion.execute(
+        "UPDATE usuarios SET "
+        "intentos = intentos + 1, "
+        "suma_puntaje = suma_puntaje + ?, "
+        "suma_porcentaje = suma_porcentaje + ?, "
+        "mejor_puntaje = CASE WHEN mejor_puntaje IS NULL OR ? > mejor_puntaje THEN ? ELSE mejor_puntaje END, "
+        "mejor_porcentaje = CASE WHEN mejor_porcentaje IS NULL OR ? > mejor_porcentaje THEN ? ELSE mejor_porcentaje END "
+        "WHERE nombre = ?",
+        (puntaje, porcentaje, puntaje, puntaje, porcentaje, porcentaje, nombre_usuario)
+    )
+    return partida_id
+
+
+# =============================================================================
+# OBTENER_RANKING
+# =============================================================================
+# Descripción: Obtiene el ranking ordenado por mejor puntaje usando el índice
+#
+# Uso en Pygame: Igual que repositorio_usuarios.obtener_ranking
+#
+# Parámetros:
+#   - ruta_db (str): Ruta del archivo SQLite
+#   - limite (int): Cantidad máxima de jugadores (None = todos)
+#
+# Retorna:
+#   - list: Lista de dicts con el mismo formato que el backend JSON
+#
+# Ejemplo de uso:
+#   top_10 = obtener_ranking(RUTA_BASE_DATOS_USUARIOS, 10)
+# =============================================================================
+def obtener_ranking(ruta_db: str, limite: int = None) -> list:
+    """Obtiene el ranking de jugadores desde SQLite."""
+    consulta = (
+        "SELECT nombre, intentos, mejor_puntaje, suma_puntaje, mejor_porcentaje, suma_porcentaje "
+        "FROM usuarios WHERE intentos > 0 ORDER BY mejor_puntaje DESC, rowid"
+    )
+    parametros = ()
+    if limite is not None:
+        consulta += " LIMIT ?"
+        parametros = (limite,)
+
+    ranking = []
+    with closing(conectar(ruta_db)) as conexion:
+        for fila in conexion.execute(consulta, parametros):
+            intentos = fila["intentos"]
+            ranking.append({
+                "nombre": fila["nombre"],
+                "mejor_puntaje": fila["mejor_puntaje"],
+                "promedio_puntaje": round(fila["suma_puntaje"] / intentos, 2),
+                "mejor_porcentaje": fila["mejor_porcentaje"],
+                "promedio_porcentaje": round(fila["suma_porcentaje"] / intentos, 1),
+                "intentos": intentos
+            })
+
+    return ranking
+
+
+# =============================================================================
+# OBTENER_ESTADO_BUFF_USUARIO
+# =============================================================================
+# Descripción: Obtiene vidas extra, objeto equipado y preguntas vistas con
+#              el formato de EstadoBuff.json ({"vidas_extra": int,
+#              "objeto_excepcional": str, "preguntas_vistas": dict})
+#
+# Uso en Pygame: Lo usa data/estado_buff.py al cargar un usuario
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - ruta_db (str): Ruta del archivo SQLite
+#
+# Retorna:
+#   - dict: Estado del usuario ({} si no existe)
+#
+# Ejemplo de uso:
+#   estado = obtener_estado_buff_usuario("Juan", RUTA_BASE_DATOS_USUARIOS)
+# =============================================================================
+def obtener_estado_buff_usuario(nombre_usuario: str, ruta_db: str) -> dict:
+    """Obtiene vidas extra y objeto equipado de un usuario desde SQLite."""
+    estado = {}
+    with closing(conectar(ruta_db)) as conexion:
+        fila = conexion.execute(
+            "SELECT vidas_extra, objeto_equipado, preguntas_vistas FROM usuarios WHERE nombre = ?",
+            (nombre_usuario,)
+        ).fetchone()
+
+    if fila is not None:
+        estado["vidas_extra"] = fila["vidas_extra"]
+        if fila["objeto_equipado"] is not None:
+            estado["objeto_excepcional"] = fila["objeto_equipado"]
+        if fila["preguntas_vistas"] is not None:
+            estado["preguntas_vistas"] = json.loads(fila["preguntas_vistas"])
+
+    return estado
+
+
+# =============================================================================
+# GUARDAR_ESTADO_BUFF_USUARIO
+# =============================================================================
+# Descripción: Guarda vidas extra, objeto equipado y preguntas vistas de un
+#              usuario
+#
+# Uso en Pygame: Lo usa data/estado_buff.py al volcar cambios pendientes
+#
+# Parámetros:
+#   - nombre_usuario (str): Nombre del usuario
+#   - estado_usuario (dict): Estado con el formato de EstadoBuff.json
+#   - ruta_db (str): Ruta del archivo SQLite
+#   - claves (list): Claves de EstadoBuff a escribir (None = todas); las
+#                    columnas no incluidas conservan lo que otro proceso guardó
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   guardar_estado_buff_usuario("Juan", {"vidas_extra": 2}, RUTA_BASE_DATOS_USUARIOS)
+# =============================================================================
+def guardar_estado_buff_usuario(nombre_usuario: str, estado_usuario: dict, ruta_db: str, claves: list = None) -> None:
+    """Guarda vidas extra y objeto equipado de un usuario en SQLite."""
+    if claves is None:
+        claves = ["vidas_extra", "objeto_excepcional", "preguntas_vistas"]
+
+    asignaciones = []
+    valores = []
+    if "vidas_extra" in claves:
+        asignaciones.append("vidas_extra = ?")
+        valores.append(estado_usuario.get("vidas_extra", 0))
+    if "objeto_excepcional" in claves:
+        asignaciones.append("objeto_equipado = ?")
+        valores.append(estado_usuario.get("objeto_excepcional", None))
+    if "preguntas_vistas" in claves:
+        asignaciones.append("preguntas_vistas = ?")
+        vistas = estado_usuario.get("preguntas_vistas", None)
+        if vistas is not None:
+            vistas = json.dumps(vistas)
+        valores.append(vistas)
+    valores.append(nombre_usuario)
+
+    with closing(conectar(ruta_db)) as conexion:
+        with conexion:
+            conexion.execute(
+                "INSERT OR IGNORE INTO usuarios (nombre) VALUES (?)", (nombre_usuario,)
+            )
+            if asignaciones:
+                conexion.execute(
+                    "UPDATE usuarios SET " + ", ".join(asignaciones) + " WHERE nombre = ?",
+                    valores
+                )
+
+    return None
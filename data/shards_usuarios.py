@@ -0,0 +1,225 @@
+# =============================================================================
+# DISTRIBUCIÓN DE USUARIOS EN SHARDS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Reparte los perfiles en N archivos (shards) según un hash del nombre del
+#    jugador. Guardar una partida solo lee y reescribe el shard del jugador,
+#    así el costo por guardado es ~1/N de los datos. Cada shard mantiene su
+#    propio top-K y el ranking global se arma fusionando esos top-K.
+#
+# 📥 IMPORTADO EN:
+#    - data/repositorio_usuarios.py - cuando BACKEND_USUARIOS == "shards"
+#
+# 🔗 DEPENDENCIAS:
+#    - os: rutas y tamaños de los shards
+#    - hashlib: hash estable del nombre (hash() cambia entre ejecuciones)
+#    - concurrent.futures: cálculo por shard en varios procesos
+#    - data/archivos_json: para cargar_json, guardar_json
+#    - config/constantes: para CANTIDAD_SHARDS_USUARIOS,
+#      TAMANO_MINIMO_RANKING_PARALELO
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - La cantidad de shards se guarda en shards.json al crearlos: cambiar la
+#      constante después no desordena a los jugadores existentes
+#    - Cada jugador vive en un solo shard: los top-K de los shards son
+#      disjuntos y se pueden fusionar sin duplicados
+#    - Los shards son independientes: recalcular su ranking se reparte entre
+#      procesos (solo si hay datos suficientes para amortizar crearlos)
+#    - Con "spawn" (Windows, macOS) cada proceso importa el script principal:
+#      Main.py y ui/Pygame/main.py solo arrancan el juego bajo __main__
+#
+# Estructura:
+#    assets/Usuarios_shards/shards.json            {"cantidad": N}
+#    assets/Usuarios_shards/usuarios_007.json      {usuario: {...}, ...}
+#    assets/Usuarios_shards/usuarios_007_ranking.json
+# =============================================================================
+
+import os
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from data.archivos_json import cargar_json, guardar_json
+from config.constantes import CANTIDAD_SHARDS_USUARIOS, TAMANO_MINIMO_RANKING_PARALELO
+
+# Cantidad de shards ya leída de shards.json: {directorio: cantidad}
+_cantidades_shards = {}
+
+
+# =============================================================================
+# OBTENER_DIRECTORIO_SHARDS
+# =============================================================================
+# Descripción: Obtiene la carpeta de shards asociada a un archivo de usuarios
+#
+# Uso en Pygame: Se usa internamente
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - str: Ruta de la carpeta (ej: Usuarios_shards)
+#
+# Ejemplo de uso:
+#   directorio = obtener_directorio_shards(RUTA_USUARIOS)
+# =============================================================================
+def obtener_directorio_shards(archivo_usuarios: str) -> str:
+    """Obtiene la carpeta de shards asociada a un archivo de usuarios."""
+    base, _ = os.path.splitext(archivo_usuarios)
+    return base + "_shards"
+
+
+def obtener_ruta_configuracion_shards(archivo_usuarios: str) -> str:
+    """Obtiene la ruta de shards.json dentro de la carpeta de shards."""
+    return os.path.join(obtener_directorio_shards(archivo_usuarios), "shards.json")
+
+
+# =============================================================================
+# SHARDS_CREADOS
+# =============================================================================
+# Descripción: Indica si ya existe la carpeta de shards configurada
+#
+# Uso en Pygame: Se usa al iniciar para decidir si hay que migrar
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - bool: True si existe shards.json
+#
+# Ejemplo de uso:
+#   if not shards_creados(RUTA_USUARIOS): ...
+# =============================================================================
+def shards_creados(archivo_usuarios: str) -> bool:
+    """Indica si ya existe la carpeta de shards configurada."""
+    return os.path.exists(obtener_ruta_configuracion_shards(archivo_usuarios))
+
+
+# =============================================================================
+# OBTENER_CANTIDAD_SHARDS
+# =============================================================================
+# Descripción: Cantidad de shards con que se creó la carpeta
+#
+# Uso en Pygame: Se usa internamente para ubicar a cada jugador
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#
+# Retorna:
+#   - int: Valor de shards.json, o CANTIDAD_SHARDS_USUARIOS si no existe
+#
+# Ejemplo de uso:
+#   cantidad = obtener_cantidad_shards(RUTA_USUARIOS)
+# =============================================================================
+def obtener_cantidad_shards(archivo_usuarios: str) -> int:
+    """Retorna la cantidad de shards con que se creó la carpeta."""
+    directorio = obtener_directorio_shards(archivo_usuarios)
+    cantidad = CANTIDAD_SHARDS_USUARIOS
+    if directorio in _cantidades_shards:
+        cantidad = _cantidades_shards[directorio]
+    else:
+        configuracion = cargar_json(obtener_ruta_configuracion_shards(archivo_usuarios), {})
+        if "cantidad" in configuracion:
+            cantidad = configuracion["cantidad"]
+            _cantidades_shards[directorio] = cantidad
+    return cantidad
+
+
+# =============================================================================
+# GUARDAR_CONFIGURACION_SHARDS
+# =============================================================================
+# Descripción: Crea shards.json fijando la cantidad de shards
+#
+# Uso en Pygame: Se usa una vez, al crear la carpeta de shards
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#   - cantidad (int): Cantidad de shards (default: CANTIDAD_SHARDS_USUARIOS)
+#
+# Retorna:
+#   - bool: True si se guardó correctamente
+#
+# Ejemplo de uso:
+#   guardar_configuracion_shards(RUTA_USUARIOS, 16)
+# =============================================================================
+def guardar_configuracion_shards(archivo_usuarios: str, cantidad: int = CANTIDAD_SHARDS_USUARIOS) -> bool:
+    """Crea shards.json con la cantidad de shards."""
+    exito = guardar_json(obtener_ruta_configuracion_shards(archivo_usuarios), {"cantidad": cantidad})
+    if exito:
+        _cantidades_shards[obtener_directorio_shards(archivo_usuarios)] = cantidad
+    return exito
+
+
+# =============================================================================
+# OBTENER_RUTA_SHARD_USUARIO
+# =============================================================================
+# Descripción: Obtiene el shard donde vive un jugador
+#
+# Uso en Pygame: Se usa al leer y al guardar un perfil
+#
+# Parámetros:
+#   - archivo_usuarios (str): Ruta de Usuarios.json
+#   - nombre_usuario (str): Nombre del jugador
+#
+# Retorna:
+#   - str: Ruta del shard (ej: Usuarios_shards/usuarios_007.json)
+#
+# Ejemplo de uso:
+#   ruta = obtener_ruta_shard_usuario(RUTA_USUARIOS, "Juan")
+# =============================================================================
+def obtener_ruta_shard_usuario(archivo_usuarios: str, nombre_usuario: str) -> str:
+    """Obtiene el shard donde vive un jugador."""
+    resumen = hashlib.sha1(nombre_usuario.encode("utf-8")).hexdigest()
+    indice = int(resumen[:8], 16) % obtener_cantidad_shards(archivo_usuarios)
+    return obtener_ruta_shard(archivo_usuarios, indice)
+
+
+def obtener_ruta_shard(archivo_usuarios: str, indice: int) -> str:
+    """Obtiene la ruta del shard número 'indice'."""
+    return os.path.join(obtener_directorio_shards(archivo_usuarios), "usuarios_" + str(indice).zfill(3) + ".json")
+
+
+def listar_rutas_shards(archivo_usuarios: str) -> list:
+    """Retorna las rutas de todos los shards (existan o no todavía)."""
+    rutas = []
+    for indice in range(obtener_cantidad_shards(archivo_usuarios)):
+        rutas.append(obtener_ruta_shard(archivo_usuarios, indice))
+    return rutas
+
+
+# =============================================================================
+# MAPEAR_SHARDS
+# =============================================================================
+# Descripción: Aplica una función a cada shard, en varios procesos si los
+#              shards suman al menos TAMANO_MINIMO_RANKING_PARALELO bytes
+#
+# Uso en Pygame: Ranking completo y reconstrucción de los top-K por shard
+#
+# Parámetros:
+#   - funcion: Función de nivel de módulo (tiene que poder importarse
+#              desde otro proceso) que recibe (ruta_shard, *argumentos)
+#   - rutas (list): Rutas de los shards
+#   - argumentos (tuple): Argumentos extra iguales para todos los shards
+#
+# Retorna:
+#   - list: Resultados en el mismo orden que rutas
+#
+# Ejemplo de uso:
+#   tablas = mapear_shards(calcular_ranking_shard, rutas, (10,))
+# =============================================================================
+def mapear_shards(funcion, rutas: list, argumentos: tuple = ()) -> list:
+    """Aplica una función a cada shard, en paralelo si conviene."""
+    total_bytes = 0
+    for ruta in rutas:
+        if os.path.exists(ruta):
+            total_bytes += os.path.getsize(ruta)
+
+    columnas = [rutas]
+    for argumento in argumentos:
+        columnas.append([argumento] * len(rutas))
+
+    procesos = min(len(rutas), os.cpu_count() or 1)
+    if procesos > 1 and total_bytes >= TAMANO_MINIMO_RANKING_PARALELO:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            resultados = list(ejecutor.map(funcion, *columnas))
+    else:
+        resultados = list(map(funcion, *columnas))
+
+    return resultados
@@ -0,0 +1,199 @@
+# =============================================================================
+# MODELO FILTRO DE PREGUNTAS VISTAS (BLOOM POR GENERACIONES)
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Conjunto probabilístico y compacto con las preguntas que un jugador vio
+#    hace poco, para no repetirlas entre partidas. Son dos filtros de Bloom:
+#    "actual" recibe las preguntas nuevas y, cuando llega a su capacidad,
+#    pasa a ser "anterior" y se empieza uno vacío. Así el filtro recuerda
+#    entre CAPACIDAD y 2 * CAPACIDAD preguntas recientes y su tamaño no
+#    crece con la cantidad de partidas.
+#
+# 📥 IMPORTADO EN:
+#    - core/sesion_juego.py - filtro del jugador durante la partida
+#    - data/indice_preguntas.py, data/indice_ponderado.py - para fue_vista
+#    - core/logica_juego.py - para fue_vista (camino sin índice)
+#    - ui/consola/juego_consola.py - para agregar_vista
+#
+# 🔗 DEPENDENCIAS:
+#    - hashlib: hash estable entre procesos (hash() de Python cambia por proceso)
+#    - base64: los bits se guardan como texto en EstadoBuff.json
+#    - math: tamaño óptimo del filtro
+#    - config/constantes: para FILTRO_VISTAS_CAPACIDAD, FILTRO_VISTAS_TASA_FALSOS
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Sin falsos negativos: una pregunta vista hace poco siempre se detecta
+#    - Falsos positivos ~ FILTRO_VISTAS_TASA_FALSOS: alguna pregunta nueva
+#      se trata como vista (solo baja un poco su chance de salir)
+#    - Con los valores por defecto son ~240 bytes por generación
+#    - k posiciones por doble hashing: h1 + i * h2 (un solo blake2b)
+#
+# Estructura:
+#    {
+#        "m": int,              # bits por generación
+#        "k": int,              # posiciones por pregunta
+#        "capacidad": int,      # preguntas por generación
+#        "insertados": int,     # preguntas en "actual"
+#        "actual": bytearray,
+#        "anterior": bytearray
+#    }
+# =============================================================================
+
+import math
+import base64
+import hashlib
+from config.constantes import FILTRO_VISTAS_CAPACIDAD, FILTRO_VISTAS_TASA_FALSOS
+
+
+# =============================================================================
+# CREAR_FILTRO_VISTAS
+# =============================================================================
+# Descripción: Crea un filtro vacío dimensionado para la capacidad y la tasa
+#              de falsos positivos pedidas
+#
+# Uso en Pygame: Jugador sin filtro guardado
+#
+# Parámetros:
+#   - capacidad (int): Preguntas por generación
+#   - tasa_falsos (float): Probabilidad de falso positivo con el filtro lleno
+#
+# Retorna:
+#   - dict: Filtro vacío (ver Estructura)
+#
+# Ejemplo de uso:
+#   filtro = crear_filtro_vistas()
+# =============================================================================
+def crear_filtro_vistas(capacidad: int = FILTRO_VISTAS_CAPACIDAD, tasa_falsos: float = FILTRO_VISTAS_TASA_FALSOS) -> dict:
+    """Crea un filtro de preguntas vistas vacío."""
+    m = max(8, int(math.ceil(-capacidad * math.log(tasa_falsos) / (math.log(2) ** 2))))
+    m = (m + 7) // 8 * 8
+    k = max(1, int(round(m / capacidad * math.log(2))))
+
+    filtro = {
+        "m": m,
+        "k": k,
+        "capacidad": capacidad,
+        "insertados": 0,
+        "actual": bytearray(m // 8),
+        "anterior": bytearray(m // 8)
+    }
+    return filtro
+
+
+def posiciones_filtro(filtro: dict, pregunta_id) -> list:
+    """Calcula los k bits de una pregunta (doble hashing)."""
+    resumen = hashlib.blake2b(str(pregunta_id).encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(resumen[:8], "little")
+    h2 = int.from_bytes(resumen[8:], "little") | 1
+    posiciones = []
+    for i in range(filtro["k"]):
+        posiciones.append((h1 + i * h2) % filtro["m"])
+    return posiciones
+
+
+def contiene_bits(bits: bytearray, posiciones: list) -> bool:
+    """Indica si todos los bits de las posiciones están encendidos."""
+    contiene = True
+    for posicion in posiciones:
+        if not bits[posicion >> 3] & (1 << (posicion & 7)):
+            contiene = False
+            break
+    return contiene
+
+
+# =============================================================================
+# FUE_VISTA
+# =============================================================================
+# Descripción: Indica si una pregunta está (probablemente) entre las vistas
+#              recientemente
+#
+# Uso en Pygame: Al seleccionar la pregunta siguiente
+#
+# Parámetros:
+#   - filtro (dict): Filtro del jugador (None = ninguna vista)
+#   - pregunta_id: ID de la pregunta
+#
+# Retorna:
+#   - bool: True si fue vista (o falso positivo)
+#
+# Ejemplo de uso:
+#   if fue_vista(filtro, 17): ...
+# =============================================================================
+def fue_vista(filtro: dict, pregunta_id) -> bool:
+    """Indica si una pregunta fue vista recientemente."""
+    vista = False
+    if filtro is not None:
+        posiciones = posiciones_filtro(filtro, pregunta_id)
+        vista = contiene_bits(filtro["actual"], posiciones) or contiene_bits(filtro["anterior"], posiciones)
+    return vista
+
+
+# =============================================================================
+# AGREGAR_VISTA
+# =============================================================================
+# Descripción: Agrega una pregunta al filtro; si la generación actual está
+#              llena, la descarta a "anterior" y empieza una vacía
+#
+# Uso en Pygame: Al mostrar cada pregunta
+#
+# Parámetros:
+#   - filtro (dict): Filtro del jugador (se modifica)
+#   - pregunta_id: ID de la pregunta
+#
+# Retorna:
+#   - None
+#
+# Ejemplo de uso:
+#   agregar_vista(filtro, 17)
+# =============================================================================
+def agregar_vista(filtro: dict, pregunta_id) -> None:
+    """Agrega una pregunta al filtro de vistas."""
+    posiciones = posiciones_filtro(filtro, pregunta_id)
+    if not contiene_bits(filtro["actual"], posiciones):
+        if filtro["insertados"] >= filtro["capacidad"]:
+            filtro["anterior"] = filtro["actual"]
+            filtro["actual"] = bytearray(filtro["m"] // 8)
+            filtro["insertados"] = 0
+        for posicion in posiciones:
+            filtro["actual"][posicion >> 3] |= 1 << (posicion & 7)
+        filtro["insertados"] += 1
+    return None
+
+
+# =============================================================================
+# SERIALIZAR_FILTRO_VISTAS / DESERIALIZAR_FILTRO_VISTAS
+# =============================================================================
+# Descripción: Convierten el filtro a un dict apto para JSON (bits en
+#              base64) y de vuelta. Un filtro guardado con otro tamaño
+#              (cambiaron las constantes) o dañado se reemplaza por uno vacío
+#
+# Ejemplo de uso:
+#   datos = serializar_filtro_vistas(filtro)
+#   filtro = deserializar_filtro_vistas(datos)
+# =============================================================================
+def serializar_filtro_vistas(filtro: dict) -> dict:
+    """Convierte el filtro a un dict serializable en JSON."""
+    return {
+        "m": filtro["m"],
+        "k": filtro["k"],
+        "capacidad": filtro["capacidad"],
+        "insertados": filtro["insertados"],
+        "actual": base64.b64encode(bytes(filtro["actual"])).decode("ascii"),
+        "anterior": base64.b64encode(bytes(filtro["anterior"])).decode("ascii")
+    }
+
+
+def deserializar_filtro_vistas(datos) -> dict:
+    """Reconstruye el filtro guardado (o uno vacío si no sirve)."""
+    filtro = crear_filtro_vistas()
+    if isinstance(datos, dict) and datos.get("m") == filtro["m"] and datos.get("k") == filtro["k"]:
+        try:
+            actual = bytearray(base64.b64decode(datos["actual"]))
+            anterior = bytearray(base64.b64decode(datos["anterior"]))
+            if len(actual) == len(filtro["actual"]) and len(anterior) == len(filtro["anterior"]):
+                filtro["actual"] = actual
+                filtro["anterior"] = anterior
+                filtro["insertados"] = int(datos.get("insertados", 0))
+        except (KeyError, TypeError, ValueError):
+            pass
+    return filtro
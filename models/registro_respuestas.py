@@ -0,0 +1,103 @@
+# =============================================================================
+# MODELO: REGISTRO DE RESPUESTAS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Lista de respuestas de una partida junto con sus contadores (racha
+#    actual, errores y correctas), que se actualizan al registrar cada
+#    respuesta. Consultar la racha o los errores deja de recorrer la lista.
+#
+# 📥 IMPORTADO EN:
+#    - core/logica_preguntas.py - calcular_racha_actual, contar_errores_totales
+#    - core/logica_juego.py - construir_estadisticas_partida
+#    - ui/Pygame/Estados/Gameplay/gameplay.py - respuestas de la partida
+#    - ui/consola/juego_consola.py - respuestas de la partida
+#    - core/reproduccion_partidas.py - respuestas de la partida reproducida
+#
+# 🔗 DEPENDENCIAS:
+#    Ninguna
+#
+# 💡 NOTAS PARA LA DEFENSA:
+#    - Registrar una respuesta es O(1): suma a un contador y agrega a la lista
+#    - Las funciones de core siguen aceptando una lista común (la recorren);
+#      con un registro leen el contador directamente
+#    - En modo sin fin la partida no se vuelve más lenta a medida que crece
+#
+# Estructura:
+#    {
+#        "respuestas": [dict, ...],   # en orden, igual que antes
+#        "racha": int,                # correctas consecutivas al final
+#        "errores": int,
+#        "correctas": int
+#    }
+# =============================================================================
+
+
+# =============================================================================
+# CREAR_REGISTRO_RESPUESTAS
+# =============================================================================
+# Descripción: Crea un registro vacío para una partida nueva
+#
+# Uso en Pygame: Se usa en Gameplay.startup
+#
+# Parámetros:
+#   Ninguno
+#
+# Retorna:
+#   - dict: Registro vacío (ver Estructura)
+#
+# Ejemplo de uso:
+#   registro = crear_registro_respuestas()
+# =============================================================================
+def crear_registro_respuestas() -> dict:
+    """Crea un registro de respuestas vacío."""
+    registro = {
+        "respuestas": [],
+        "racha": 0,
+        "errores": 0,
+        "correctas": 0
+    }
+    return registro
+
+
+# =============================================================================
+# REGISTRAR_RESPUESTA
+# =============================================================================
+# Descripción: Agrega una respuesta y actualiza racha, errores y correctas
+#
+# Uso en Pygame: Después de procesar cada respuesta
+#
+# Parámetros:
+#   - registro (dict): Registro de la partida (se modifica)
+#   - respuesta (dict): Respuesta con la clave "es_correcta"
+#
+# Retorna:
+#   - dict: El mismo registro actualizado
+#
+# Ejemplo de uso:
+#   registrar_respuesta(registro, {"pregunta_id": 3, "es_correcta": True})
+# =============================================================================
+def registrar_respuesta(registro: dict, respuesta: dict) -> dict:
+    """Agrega una respuesta al registro y actualiza sus contadores."""
+    registro["respuestas"].append(respuesta)
+
+    if respuesta.get("es_correcta", False):
+        registro["correctas"] = registro["correctas"] + 1
+        registro["racha"] = registro["racha"] + 1
+    else:
+        registro["errores"] = registro["errores"] + 1
+        registro["racha"] = 0
+
+    return registro
+
+
+def es_registro_respuestas(respuestas) -> bool:
+    """Indica si se recibió un registro de respuestas (y no una lista)."""
+    return isinstance(respuestas, dict) and "respuestas" in respuestas
+
+
+def obtener_respuestas_registro(respuestas) -> list:
+    """Retorna la lista de respuestas de un registro o la lista recibida."""
+    lista = respuestas
+    if es_registro_respuestas(respuestas):
+        lista = respuestas["respuestas"]
+    return lista
@@ -0,0 +1,68 @@
+# =============================================================================
+# CONFIGURACIÓN COMPARTIDA DE LOS TESTS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Agrega la raíz del proyecto al path (igual que ui/Pygame/main.py) y
+#    ofrece como fixtures el banco de preguntas real y resultados de
+#    partida de ejemplo.
+#
+#    Uso: python -m pytest -q
+# =============================================================================
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ruta_proyecto = Path(__file__).resolve().parent.parent
+if str(ruta_proyecto) not in sys.path:
+    sys.path.insert(0, str(ruta_proyecto))
+
+from data.repositorio_preguntas import leer_preguntas_csv
+from data.archivos_json import verificar_y_obtener_ruta
+from config.constantes import RUTA_PREGUNTAS
+
+
+@pytest.fixture(scope="session")
+def preguntas():
+    """Banco de preguntas de assets/preguntas.csv."""
+    return leer_preguntas_csv(verificar_y_obtener_ruta(RUTA_PREGUNTAS))
+
+
+
+def armar_resultado(puntos: int, correctas: int, total: int = 10, tiempo: float = 60.0) -> dict:
+    """Resultado de partida con el formato que reciben los repositorios."""
+    return {
+        "puntos_totales": puntos,
+        "tiempo_total_segundos": tiempo,
+        "respuestas_correctas": correctas,
+        "total_preguntas": total,
+        "detalle": [{"pregunta_id": 1, "respuesta": "A", "es_correcta": correctas > 0}]
+    }
+
+
+@pytest.fixture
+def crear_resultado():
+    """Fábrica de resultados de partida: crear_resultado(puntos, correctas)."""
+    return armar_resultado
+
+
+# (usuario, puntos, correctas): mejores puntajes distintos para que el
+# orden del ranking no dependa de cómo desempata cada backend
+PARTIDAS_EJEMPLO = [
+    ("Ana", 120, 8),
+    ("Beto", 40, 3),
+    ("Ana", 90, 7),
+    ("Carla", 75, 6),
+    ("Beto", 160, 10),
+    ("Carla", -10, 1)
+]
+
+
+@pytest.fixture
+def partidas_ejemplo():
+    """Partidas de tres jugadores como (usuario, resultado)."""
+    partidas = []
+    for i, (nombre, puntos, correctas) in enumerate(PARTIDAS_EJEMPLO):
+        partidas.append((nombre, armar_resultado(puntos, correctas, tiempo=30.0 + i)))
+    return partidas
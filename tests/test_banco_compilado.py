@@ -0,0 +1,53 @@
+# =============================================================================
+# TESTS - BANCO COMPILADO DE PREGUNTAS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    El banco compilado (pickle) se escribe atómicamente junto al CSV, se
+#    usa mientras el CSV no cambie y se regenera cuando cambia.
+# =============================================================================
+
+import os
+
+from data import repositorio_preguntas
+from data.repositorio_preguntas import cargar_preguntas_desde_csv, obtener_ruta_banco_compilado
+
+ENCABEZADO = "id,nivel,pregunta,dificultad,categoria,correcta,a,b,c,d\n"
+LINEA_1 = '1,1,"¿Dios del trueno nórdico?",1,nordica,2,Zeus,Thor,Ra,Ares\n'
+LINEA_2 = '2,1,"¿Río sagrado de Egipto?",1,egipcia,1,Nilo,Tigris,Éufrates,Amazonas\n'
+
+
+def escribir_csv(ruta: str, lineas: list) -> None:
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write(ENCABEZADO + "".join(lineas))
+
+
+def test_el_banco_compilado_se_reutiliza_y_se_regenera(tmp_path, monkeypatch):
+    ruta_csv = str(tmp_path / "preguntas.csv")
+    escribir_csv(ruta_csv, [LINEA_1])
+    monkeypatch.setattr(repositorio_preguntas, "_bancos_cargados", {})
+
+    preguntas = cargar_preguntas_desde_csv(ruta_csv)
+    assert preguntas[1]["correcta"] == "Thor"
+    assert os.path.exists(obtener_ruta_banco_compilado(ruta_csv))
+    # Solo quedan el CSV y el pickle: sin temporales
+    assert sorted(os.listdir(tmp_path)) == ["preguntas.csv", "preguntas_compilado.pickle"]
+
+    # Sin caché en memoria se lee el pickle, no el CSV
+    monkeypatch.setattr(repositorio_preguntas, "_bancos_cargados", {})
+    monkeypatch.setattr(repositorio_preguntas, "leer_preguntas_csv", None)
+    assert cargar_preguntas_desde_csv(ruta_csv) == preguntas
+    monkeypatch.undo()
+
+    escribir_csv(ruta_csv, [LINEA_1, LINEA_2])
+    monkeypatch.setattr(repositorio_preguntas, "_bancos_cargados", {})
+    assert sorted(cargar_preguntas_desde_csv(ruta_csv)) == [1, 2]
+
+
+def test_un_banco_compilado_corrupto_se_ignora(tmp_path, monkeypatch):
+    ruta_csv = str(tmp_path / "preguntas.csv")
+    escribir_csv(ruta_csv, [LINEA_1, LINEA_2])
+    with open(obtener_ruta_banco_compilado(ruta_csv), "wb") as f:
+        f.write(b"no es un pickle")
+    monkeypatch.setattr(repositorio_preguntas, "_bancos_cargados", {})
+
+    assert sorted(cargar_preguntas_desde_csv(ruta_csv)) == [1, 2]
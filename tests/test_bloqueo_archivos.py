@@ -0,0 +1,132 @@
+# =============================================================================
+# TESTS - BLOQUEO DE ARCHIVOS Y FUSIÓN DE BUFFS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    - bloqueo_archivo es reentrante y, si otro proceso u otro hilo lo
+#      mantiene más de tiempo_maximo, lanza BloqueoNoDisponibleError sin
+#      ejecutar el bloque
+#    - Varios procesos guardando partidas a la vez no pierden ninguna
+#    - El volcado de EstadoBuff.json fusiona por clave con lo que otro
+#      proceso escribió en disco
+# =============================================================================
+
+import sys
+import threading
+import subprocess
+import multiprocessing
+
+import pytest
+
+from data.archivos_json import cargar_json, guardar_json
+from data.bloqueo_archivos import bloqueo_archivo, obtener_ruta_bloqueo, obtener_metricas_bloqueo, BloqueoNoDisponibleError
+from data.estado_buff import actualizar_estado_usuario_buff, obtener_estado_usuario_buff, volcar_ruta_estado, descartar_cache_estado_buff
+from data.repositorio_usuarios import guardar_estadisticas_usuario, cargar_usuarios
+from tests.conftest import armar_resultado
+
+# Proceso que toma el bloqueo, avisa y lo mantiene unos segundos
+CODIGO_TOMAR_BLOQUEO = (
+    "import fcntl, sys, time\n"
+    "f = open(sys.argv[1], 'w')\n"
+    "fcntl.flock(f, fcntl.LOCK_EX)\n"
+    "print('listo', flush=True)\n"
+    "time.sleep(float(sys.argv[2]))\n"
+)
+
+PROCESOS = 4
+PARTIDAS_POR_PROCESO = 5
+
+
+def test_bloqueo_reentrante_en_el_mismo_hilo(tmp_path):
+    archivo = str(tmp_path / "Usuarios.json")
+    with bloqueo_archivo(archivo):
+        with bloqueo_archivo(archivo, tiempo_maximo=0):
+            guardar_json(archivo, {"ok": True})
+    assert cargar_json(archivo) == {"ok": True}
+
+
+def test_bloqueo_de_otro_proceso_expira(tmp_path):
+    pytest.importorskip("fcntl")
+    archivo = str(tmp_path / "Usuarios.json")
+    proceso = subprocess.Popen(
+        [sys.executable, "-c", CODIGO_TOMAR_BLOQUEO, obtener_ruta_bloqueo(archivo), "5"],
+        stdout=subprocess.PIPE, text=True
+    )
+    try:
+        assert proceso.stdout.readline().strip() == "listo"
+        expirados = obtener_metricas_bloqueo()["expirados"]
+        ejecutado = []
+        with pytest.raises(BloqueoNoDisponibleError):
+            with bloqueo_archivo(archivo, tiempo_maximo=0.2):
+                ejecutado.append(True)
+        assert ejecutado == []
+        assert obtener_metricas_bloqueo()["expirados"] == expirados + 1
+    finally:
+        proceso.kill()
+        proceso.wait()
+
+    # Al terminar el otro proceso el bloqueo queda libre
+    with bloqueo_archivo(archivo, tiempo_maximo=1):
+        pass
+
+
+def test_bloqueo_de_otro_hilo_expira(tmp_path):
+    archivo = str(tmp_path / "Usuarios.json")
+    errores = []
+
+    def esperar_bloqueo() -> None:
+        try:
+            with bloqueo_archivo(archivo, tiempo_maximo=0.2):
+                errores.append(None)
+        except BloqueoNoDisponibleError as e:
+            errores.append(e)
+
+    with bloqueo_archivo(archivo):
+        hilo = threading.Thread(target=esperar_bloqueo)
+        hilo.start()
+        hilo.join(5)
+    assert not hilo.is_alive()
+    assert isinstance(errores[0], BloqueoNoDisponibleError)
+
+
+def guardar_partidas_proceso(archivo: str, numero: int) -> None:
+    """Cuerpo de cada proceso: partidas propias y en un usuario compartido."""
+    for i in range(PARTIDAS_POR_PROCESO):
+        guardar_estadisticas_usuario("jugador_" + str(numero), armar_resultado(10 + i, 5), archivo)
+        guardar_estadisticas_usuario("Compartido", armar_resultado(100 * numero + i, 5), archivo)
+
+
+def test_procesos_concurrentes_no_pierden_partidas(tmp_path):
+    archivo = str(tmp_path / "Usuarios.json")
+    contexto = multiprocessing.get_context("spawn")
+    procesos = [contexto.Process(target=guardar_partidas_proceso, args=(archivo, n)) for n in range(PROCESOS)]
+    for proceso in procesos:
+        proceso.start()
+    for proceso in procesos:
+        proceso.join(60)
+        assert proceso.exitcode == 0
+
+    usuarios = cargar_usuarios(archivo)
+    assert usuarios["Compartido"]["intentos"] == PROCESOS * PARTIDAS_POR_PROCESO
+    assert sorted(usuarios["Compartido"]["puntajes"]) == sorted(
+        100 * n + i for n in range(PROCESOS) for i in range(PARTIDAS_POR_PROCESO)
+    )
+    for n in range(PROCESOS):
+        assert usuarios["jugador_" + str(n)]["intentos"] == PARTIDAS_POR_PROCESO
+
+
+def test_volcado_fusiona_por_clave_con_otro_proceso(tmp_path):
+    ruta = str(tmp_path / "EstadoBuff.json")
+    guardar_json(ruta, {"Ana": {"vidas_extra": 1}})
+    try:
+        assert obtener_estado_usuario_buff("Ana", ruta) == {"vidas_extra": 1}
+        actualizar_estado_usuario_buff("Ana", {"vidas_extra": 2}, None, ruta)
+
+        # Otro proceso equipa un objeto a Ana y agrega a Beto antes del volcado
+        guardar_json(ruta, {"Ana": {"vidas_extra": 1, "objeto_excepcional": "espada"},
+                            "Beto": {"vidas_extra": 3}})
+        assert volcar_ruta_estado(ruta)
+
+        assert cargar_json(ruta) == {"Ana": {"vidas_extra": 2, "objeto_excepcional": "espada"},
+                                     "Beto": {"vidas_extra": 3}}
+    finally:
+        descartar_cache_estado_buff(ruta)
@@ -0,0 +1,59 @@
+# =============================================================================
+# TESTS - CAMINO GARANTIZADO DEL MINIJUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    generar_camino_garantizado es iterativo (tableros grandes sin límite de
+#    recursión), reproducible con un random.Random y no comparte estado
+#    entre llamadas. El tablero de listas siembra el camino con valores
+#    estrictamente crecientes.
+# =============================================================================
+
+import sys
+import random
+
+from core import logica_minijuego
+from core.logica_minijuego import generar_camino_garantizado, generar_matriz_resoluble
+from core.solucionador_minijuego import analizar_tablero_minijuego
+
+PASOS_VALIDOS = {(1, 0), (0, 1), (1, 1)}
+
+
+def es_camino_valido(camino: list, tamano: int) -> bool:
+    pasos = {(b[0] - a[0], b[1] - a[1]) for a, b in zip(camino, camino[1:])}
+    return camino[0] == (0, 0) and camino[-1] == (tamano - 1, tamano - 1) and pasos <= PASOS_VALIDOS
+
+
+def test_camino_reproducible_con_semilla():
+    for semilla in range(20):
+        camino = generar_camino_garantizado(12, random.Random(semilla))
+        assert camino == generar_camino_garantizado(12, random.Random(semilla))
+        assert es_camino_valido(camino, 12)
+    assert generar_camino_garantizado(1) == [(0, 0)]
+
+
+def test_camino_en_tablero_grande():
+    tamano = 3 * sys.getrecursionlimit()
+    camino = generar_camino_garantizado(tamano, random.Random(1))
+    assert es_camino_valido(camino, tamano)
+    assert tamano <= len(camino) <= 2 * tamano - 1
+
+
+def test_llamadas_sin_estado_compartido():
+    primero = generar_camino_garantizado(6)
+    segundo = generar_camino_garantizado(6)
+    assert primero.count((0, 0)) == 1
+    assert segundo.count((0, 0)) == 1
+    assert segundo[-1] == (5, 5)
+
+
+def test_tablero_de_listas_reproducible_y_creciente(monkeypatch):
+    # Fuerza la versión de listas aunque numpy esté instalado
+    monkeypatch.setattr(logica_minijuego, "numpy_disponible", lambda: False)
+    for semilla in range(20):
+        matriz = generar_matriz_resoluble(8, random.Random(semilla))
+        assert matriz == generar_matriz_resoluble(8, random.Random(semilla))
+
+        camino = generar_camino_garantizado(8, random.Random(semilla))
+        valores = [matriz[f][c] for f, c in camino]
+        assert all(a < b for a, b in zip(valores, valores[1:]))
+        assert analizar_tablero_minijuego(matriz)["resoluble"]
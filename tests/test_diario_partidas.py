@@ -0,0 +1,76 @@
+# =============================================================================
+# TESTS - DIARIO DE PARTIDAS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    - El diario se aplica una sola vez: releerlo, compactar dos veces o
+#      reaparecer después de una compactación interrumpida no duplica partidas
+#    - Compactar no cambia lo que se lee (cargar_usuarios, obtener_usuario)
+# =============================================================================
+
+from data.diario_partidas import obtener_ruta_diario, leer_diario
+from data.repositorio_usuarios import (
+    guardar_estadisticas_usuario,
+    cargar_usuarios,
+    compactar_diario_usuarios,
+    obtener_usuario
+)
+
+
+def guardar_partidas(archivo: str, partidas: list) -> None:
+    for nombre, resultado in partidas:
+        assert guardar_estadisticas_usuario(nombre, resultado, archivo)
+
+
+def test_releer_el_diario_no_duplica_partidas(tmp_path, partidas_ejemplo):
+    archivo = str(tmp_path / "Usuarios.json")
+    guardar_partidas(archivo, partidas_ejemplo)
+
+    primera = cargar_usuarios(archivo)
+    assert cargar_usuarios(archivo) == primera
+    assert primera["Ana"]["intentos"] == 2
+    assert primera["Ana"]["puntajes"] == [120, 90]
+
+
+def test_compactar_conserva_los_datos(tmp_path, partidas_ejemplo):
+    archivo = str(tmp_path / "Usuarios.json")
+    guardar_partidas(archivo, partidas_ejemplo)
+    antes = cargar_usuarios(archivo)
+
+    assert compactar_diario_usuarios(archivo)
+    assert leer_diario(archivo) == []
+    assert cargar_usuarios(archivo) == antes
+    for nombre in antes:
+        assert obtener_usuario(nombre, archivo) == antes[nombre]
+
+    # Compactar de nuevo sin partidas nuevas no cambia nada
+    compactar_diario_usuarios(archivo)
+    assert cargar_usuarios(archivo) == antes
+
+
+def test_diario_repetido_despues_de_compactar_no_se_aplica_dos_veces(tmp_path, partidas_ejemplo):
+    archivo = str(tmp_path / "Usuarios.json")
+    guardar_partidas(archivo, partidas_ejemplo)
+    with open(obtener_ruta_diario(archivo), "rb") as f:
+        diario = f.read()
+    antes = cargar_usuarios(archivo)
+
+    # Corte entre escribir el snapshot y vaciar el diario: el diario vuelve
+    compactar_diario_usuarios(archivo)
+    with open(obtener_ruta_diario(archivo), "wb") as f:
+        f.write(diario)
+
+    assert cargar_usuarios(archivo) == antes
+    assert obtener_usuario("Ana", archivo) == antes["Ana"]
+    compactar_diario_usuarios(archivo)
+    assert cargar_usuarios(archivo) == antes
+
+
+def test_partidas_nuevas_despues_de_compactar(tmp_path, partidas_ejemplo, crear_resultado):
+    archivo = str(tmp_path / "Usuarios.json")
+    guardar_partidas(archivo, partidas_ejemplo)
+    compactar_diario_usuarios(archivo)
+
+    guardar_estadisticas_usuario("Ana", crear_resultado(200, 10), archivo)
+    assert cargar_usuarios(archivo)["Ana"]["puntajes"] == [120, 90, 200]
+    compactar_diario_usuarios(archivo)
+    assert obtener_usuario("Ana", archivo)["puntajes"] == [120, 90, 200]
@@ -0,0 +1,105 @@
+# =============================================================================
+# TESTS - ESTADO DE BUFFS EN MEMORIA
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    - EstadoBuff.json se lee una vez; las consultas siguientes salen de
+#      memoria
+#    - Los cambios quedan pendientes hasta el volcado y se fusionan por
+#      clave con lo que haya escrito otro proceso
+#    - Si el archivo cambia en disco se relee sin perder lo pendiente
+# =============================================================================
+
+import os
+
+from data import estado_buff
+from data.archivos_json import guardar_json, cargar_json
+from data.estado_buff import (
+    obtener_estado_usuario_buff,
+    volcar_estados_pendientes,
+    volcar_ruta_estado,
+    descartar_cache_estado_buff
+)
+from core.logica_buffeos import verificar_objeto_equipado, guardar_objeto_equipado, eliminar_objeto_equipado
+
+
+def preparar_estado(tmp_path, monkeypatch, contenido: dict) -> tuple:
+    """Crea el archivo y cuenta las lecturas que hace estado_buff."""
+    ruta = str(tmp_path / "EstadoBuff.json")
+    guardar_json(ruta, contenido)
+    descartar_cache_estado_buff(ruta)
+
+    # Sin volcado automático durante el test: solo los volcados explícitos
+    monkeypatch.setattr(estado_buff, "RETARDO_ESCRITURA_ESTADO_BUFF", 60)
+    lecturas = []
+    cargar = estado_buff.cargar_json
+
+    def cargar_contando(archivo, *args, **kwargs):
+        lecturas.append(os.path.basename(archivo))
+        return cargar(archivo, *args, **kwargs)
+
+    monkeypatch.setattr(estado_buff, "cargar_json", cargar_contando)
+    return ruta, lecturas
+
+
+def test_se_lee_una_vez_y_se_consulta_en_memoria(tmp_path, monkeypatch):
+    ruta, lecturas = preparar_estado(tmp_path, monkeypatch, {"Ana": {"objeto_excepcional": "espada"}})
+
+    for _ in range(50):
+        assert verificar_objeto_equipado("Ana", ruta) == "espada"
+        assert verificar_objeto_equipado("Beto", ruta) is None
+    assert lecturas == ["EstadoBuff.json"]
+
+    # La copia devuelta no modifica el estado en memoria
+    obtener_estado_usuario_buff("Ana", ruta)["objeto_excepcional"] = "armadura"
+    assert verificar_objeto_equipado("Ana", ruta) == "espada"
+    descartar_cache_estado_buff(ruta)
+
+
+def test_los_cambios_esperan_al_volcado(tmp_path, monkeypatch):
+    ruta, lecturas = preparar_estado(tmp_path, monkeypatch, {})
+
+    guardar_objeto_equipado("Ana", "raciones", ruta)
+    guardar_objeto_equipado("Beto", "armadura", ruta)
+    assert verificar_objeto_equipado("Ana", ruta) == "raciones"
+    assert cargar_json(ruta, {}) == {}
+
+    assert volcar_estados_pendientes()
+    assert cargar_json(ruta, {}) == {"Ana": {"objeto_excepcional": "raciones"}, "Beto": {"objeto_excepcional": "armadura"}}
+
+    # eliminar_objeto_equipado es una transacción: escribe al terminar
+    assert eliminar_objeto_equipado("Ana", ruta)
+    assert not eliminar_objeto_equipado("Ana", ruta)
+    assert cargar_json(ruta, {}) == {"Ana": {}, "Beto": {"objeto_excepcional": "armadura"}}
+    descartar_cache_estado_buff(ruta)
+
+
+def test_el_volcado_fusiona_con_el_disco(tmp_path, monkeypatch):
+    ruta, lecturas = preparar_estado(tmp_path, monkeypatch, {"Ana": {"vidas_extra": 1}})
+    guardar_objeto_equipado("Ana", "espada", ruta)
+
+    # Otro proceso escribe antes del volcado
+    guardar_json(ruta, {"Ana": {"vidas_extra": 3}, "Carla": {"objeto_excepcional": "raciones"}})
+
+    # Se relee el disco y se conserva el cambio pendiente
+    assert obtener_estado_usuario_buff("Ana", ruta) == {"vidas_extra": 3, "objeto_excepcional": "espada"}
+    assert verificar_objeto_equipado("Carla", ruta) == "raciones"
+
+    assert volcar_ruta_estado(ruta)
+    assert cargar_json(ruta, {}) == {
+        "Ana": {"vidas_extra": 3, "objeto_excepcional": "espada"},
+        "Carla": {"objeto_excepcional": "raciones"}
+    }
+    descartar_cache_estado_buff(ruta)
+
+
+def test_descartar_vuelca_lo_pendiente(tmp_path, monkeypatch):
+    ruta, lecturas = preparar_estado(tmp_path, monkeypatch, {})
+    guardar_objeto_equipado("Ana", "bolsa_monedas", ruta)
+
+    descartar_cache_estado_buff(ruta)
+    assert cargar_json(ruta, {}) == {"Ana": {"objeto_excepcional": "bolsa_monedas"}}
+
+    del lecturas[:]
+    assert verificar_objeto_equipado("Ana", ruta) == "bolsa_monedas"
+    assert lecturas == ["EstadoBuff.json"]
+    descartar_cache_estado_buff(ruta)
@@ -0,0 +1,55 @@
+# =============================================================================
+# TESTS - FILTRO DE PREGUNTAS VISTAS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    El filtro de Bloom no tiene falsos negativos: toda pregunta agregada en
+#    las últimas CAPACIDAD inserciones se detecta, también después de
+#    serializarlo. Los falsos positivos quedan cerca de la tasa configurada.
+# =============================================================================
+
+from models.filtro_vistas import (
+    crear_filtro_vistas,
+    fue_vista,
+    agregar_vista,
+    serializar_filtro_vistas,
+    deserializar_filtro_vistas
+)
+
+
+def test_sin_falsos_negativos():
+    filtro = crear_filtro_vistas(capacidad=200, tasa_falsos=0.01)
+    for pid in range(200):
+        agregar_vista(filtro, pid)
+    assert all(fue_vista(filtro, pid) for pid in range(200))
+
+
+def test_sin_falsos_negativos_al_rotar_generaciones():
+    filtro = crear_filtro_vistas(capacidad=50, tasa_falsos=0.01)
+    for pid in range(1000):
+        agregar_vista(filtro, pid)
+        # Las últimas "capacidad" siempre están en actual o anterior
+        desde = max(0, pid - 49)
+        assert all(fue_vista(filtro, vista) for vista in range(desde, pid + 1))
+
+
+def test_serializar_conserva_las_vistas():
+    filtro = crear_filtro_vistas()
+    for pid in range(0, 300, 3):
+        agregar_vista(filtro, pid)
+    copia = deserializar_filtro_vistas(serializar_filtro_vistas(filtro))
+    assert all(fue_vista(copia, pid) for pid in range(0, 300, 3))
+    assert copia["insertados"] == filtro["insertados"]
+
+
+def test_falsos_positivos_cerca_de_la_tasa():
+    filtro = crear_filtro_vistas(capacidad=200, tasa_falsos=0.01)
+    for pid in range(200):
+        agregar_vista(filtro, pid)
+    falsos = sum(1 for pid in range(10000, 30000) if fue_vista(filtro, pid))
+    assert falsos / 20000 < 0.03
+
+
+def test_filtro_vacio_o_ausente():
+    assert not fue_vista(None, 1)
+    assert not fue_vista(crear_filtro_vistas(), 1)
+    assert not fue_vista(deserializar_filtro_vistas(None), 1)
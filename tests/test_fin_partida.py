@@ -0,0 +1,75 @@
+# =============================================================================
+# TESTS - ESCRITURAS DE UN FIN DE PARTIDA
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Terminar una partida (confirmar_sesion_juego, guardar_estadisticas_usuario
+#    y guardar_registro_eventos, en el orden de Gameplay y Game_Over) hace
+#    una sola escritura física por archivo: un os.replace por archivo JSON
+#    reescrito o una apertura en modo "a" por archivo de líneas.
+# =============================================================================
+
+import os
+import builtins
+from collections import Counter
+
+from core.sesion_juego import crear_sesion_en_memoria, confirmar_sesion_juego
+from core.registro_eventos import crear_registro_eventos, registrar_fin_eventos
+from data.archivos_json import guardar_json
+from data.repositorio_eventos import guardar_registro_eventos
+from data.repositorio_usuarios import guardar_estadisticas_usuario
+from models.filtro_vistas import crear_filtro_vistas, agregar_vista
+
+
+def contar_escrituras(monkeypatch) -> Counter:
+    """Cuenta, por archivo destino, los os.replace y las aperturas para escribir."""
+    escrituras = Counter()
+    abrir = builtins.open
+    reemplazar = os.replace
+
+    def abrir_contando(archivo, modo="r", *args, **kwargs):
+        if "w" in modo or "a" in modo:
+            escrituras[os.path.basename(archivo)] += 1
+        return abrir(archivo, modo, *args, **kwargs)
+
+    def reemplazar_contando(origen, destino, *args, **kwargs):
+        escrituras[os.path.basename(destino)] += 1
+        return reemplazar(origen, destino, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", abrir_contando)
+    monkeypatch.setattr(os, "replace", reemplazar_contando)
+    return escrituras
+
+
+def terminar_partida(tmp_path, nombre: str, resultado: dict) -> None:
+    """Fin de partida de Gameplay + guardado de Game_Over sobre archivos temporales."""
+    estado_path = str(tmp_path / "EstadoBuff.json")
+    vistas = crear_filtro_vistas(100, 0.01)
+    agregar_vista(vistas, 1)
+    sesion = crear_sesion_en_memoria(nombre, "espada", 1, estado_path, vistas)
+    registro = crear_registro_eventos(nombre, 1, "espada", 1, "pygame", vistas)
+
+    assert confirmar_sesion_juego(sesion, 1, 2)["guardado"]
+    registrar_fin_eventos(registro, resultado, 1, 2, False)
+    assert guardar_registro_eventos(registro, str(tmp_path / "EventosPartidas.jsonl"))
+    assert guardar_estadisticas_usuario(nombre, resultado, str(tmp_path / "Usuarios.json"))
+
+
+def test_fin_de_partida_escribe_cada_archivo_una_vez(tmp_path, monkeypatch, partidas_ejemplo, crear_resultado):
+    guardar_json(str(tmp_path / "EstadoBuff.json"), {"Ana": {"objeto_excepcional": "espada", "vidas_extra": 1}})
+    for nombre, resultado in partidas_ejemplo:
+        assert guardar_estadisticas_usuario(nombre, resultado, str(tmp_path / "Usuarios.json"))
+
+    escrituras = contar_escrituras(monkeypatch)
+    terminar_partida(tmp_path, "Ana", crear_resultado(200, 9))
+
+    assert "EstadoBuff.json" in escrituras
+    assert "EventosPartidas.jsonl" in escrituras
+    assert "Usuarios_diario.jsonl" in escrituras
+    assert set(escrituras.values()) == {1}
+
+
+def test_primera_partida_tambien_escribe_una_vez(tmp_path, monkeypatch, crear_resultado):
+    escrituras = contar_escrituras(monkeypatch)
+    terminar_partida(tmp_path, "Nuevo", crear_resultado(50, 4))
+
+    assert set(escrituras.values()) == {1}
@@ -0,0 +1,93 @@
+# =============================================================================
+# TESTS - TABLAS ALIAS E ÍNDICE PONDERADO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Las frecuencias muestreadas coinciden con los pesos, tanto en la tabla
+#    alias sola como al elegir preguntas por categoría. Los pesos por vistas
+#    salen del filtro del jugador.
+# =============================================================================
+
+import random
+from collections import Counter
+
+from data.indice_ponderado import crear_tabla_alias, muestrear_alias, preparar_indice_ponderado, es_indice_ponderado
+from core.logica_juego import obtener_pregunta_para_nivel, preparar_indice_juego, calcular_pesos_categoria_juego
+from models.filtro_vistas import crear_filtro_vistas, agregar_vista
+
+MUESTRAS = 100000
+TOLERANCIA = 0.01
+
+
+def frecuencias(conteo: Counter, total: int) -> dict:
+    return {clave: cantidad / total for clave, cantidad in conteo.items()}
+
+
+def test_tabla_alias_respeta_los_pesos():
+    pesos = [1, 2, 3, 4, 0.5, 0]
+    tabla = crear_tabla_alias(pesos)
+    rng = random.Random(0)
+    conteo = Counter(muestrear_alias(tabla, rng) for _ in range(MUESTRAS))
+
+    observadas = frecuencias(conteo, MUESTRAS)
+    for posicion, peso in enumerate(pesos):
+        assert abs(observadas.get(posicion, 0.0) - peso / sum(pesos)) < TOLERANCIA
+    assert 5 not in conteo
+
+
+def test_tabla_alias_con_un_solo_elemento():
+    tabla = crear_tabla_alias([3.0])
+    rng = random.Random(0)
+    assert {muestrear_alias(tabla, rng) for _ in range(100)} == {0}
+
+
+def test_primera_pregunta_sigue_el_peso_de_su_categoria(preguntas):
+    categorias = sorted({p["categoria"] for p in preguntas.values() if p["nivel"] == 1})
+    pesos_categoria = {categoria: i + 1 for i, categoria in enumerate(categorias)}
+    rng = random.Random(0)
+    conteo = Counter()
+    indice = None
+    muestras = 20000
+    for _ in range(muestras):
+        indice = preparar_indice_ponderado(preguntas, None, pesos_categoria, indice)
+        conteo[obtener_pregunta_para_nivel(preguntas, 1, [], indice, rng)["categoria"]] += 1
+
+    observadas = frecuencias(conteo, muestras)
+    total = sum(pesos_categoria.values())
+    for categoria, peso in pesos_categoria.items():
+        assert abs(observadas[categoria] - peso / total) < 0.02
+
+
+def test_cada_consumidor_tiene_su_indice(preguntas):
+    pesos_categoria = {"griega": 2}
+    a = preparar_indice_ponderado(preguntas, None, pesos_categoria)
+    b = preparar_indice_ponderado(preguntas, None, pesos_categoria)
+    assert a is not b
+
+    while obtener_pregunta_para_nivel(preguntas, 1, [], b, random.Random(1)):
+        pass
+    assert obtener_pregunta_para_nivel(preguntas, 1, [], a, random.Random(1))
+
+
+def test_pesos_por_vistas_favorecen_la_categoria_menos_vista(preguntas):
+    vistas = crear_filtro_vistas(1000, 0.001)
+    griegas = [pid for pid, p in preguntas.items() if p["categoria"] == "griega"]
+    for pid in griegas[:3]:
+        agregar_vista(vistas, pid)
+
+    pesos = calcular_pesos_categoria_juego(preguntas, vistas)
+    assert pesos["griega"] == 1 / 4
+    assert {peso for categoria, peso in pesos.items() if categoria != "griega"} == {1.0}
+    assert es_indice_ponderado(preparar_indice_juego(preguntas, None, vistas))
+
+
+def test_sin_vistas_el_indice_es_uniforme(preguntas):
+    vacio = crear_filtro_vistas(1000, 0.001)
+    assert calcular_pesos_categoria_juego(preguntas, vacio) == {}
+    assert not es_indice_ponderado(preparar_indice_juego(preguntas, None, vacio))
+    assert not es_indice_ponderado(preparar_indice_juego(preguntas))
+
+
+def test_pesos_iguales_en_otro_dict_restauran_el_indice(preguntas):
+    indice = preparar_indice_ponderado(preguntas, None, {"griega": 0.5})
+    assert preparar_indice_ponderado(preguntas, None, {"griega": 0.5}, indice) is indice
+    assert preparar_indice_ponderado(preguntas, None, {"griega": 2}, indice) is not indice
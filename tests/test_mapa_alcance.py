@@ -0,0 +1,52 @@
+# =============================================================================
+# TESTS - MAPA DE ALCANCE DEL MINIJUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Las consultas del mapa precalculado (es_movimiento_legal,
+#    tiene_movimientos, lleva_al_objetivo) responden lo mismo que
+#    obtener_movimientos_validos y el análisis del solucionador, celda por
+#    celda.
+# =============================================================================
+
+import random
+
+from core.logica_minijuego import obtener_movimientos_validos, inicializar_estado_minijuego
+from core.solucionador_minijuego import (
+    crear_mapa_alcance,
+    es_movimiento_legal,
+    tiene_movimientos,
+    lleva_al_objetivo,
+    analizar_tablero_minijuego
+)
+
+
+def tablero_aleatorio(tamano: int, rng: random.Random) -> list:
+    return [[rng.randint(1, 3 * tamano) for _ in range(tamano)] for _ in range(tamano)]
+
+
+def comparar_mapa(matriz: list) -> None:
+    tamano = len(matriz)
+    mapa = crear_mapa_alcance(matriz)
+    analisis = analizar_tablero_minijuego(matriz)
+    celdas = [(f, c) for f in range(tamano) for c in range(tamano)]
+
+    for desde in celdas:
+        validos = {(f, c) for f, c, _, _ in obtener_movimientos_validos(matriz, desde, matriz[desde[0]][desde[1]])}
+        for hacia in celdas:
+            assert es_movimiento_legal(mapa, desde, hacia) == (hacia in validos)
+        assert tiene_movimientos(mapa, desde) == bool(validos)
+        assert lleva_al_objetivo(mapa, desde) == analisis["alcanza_objetivo"][desde[0]][desde[1]]
+
+
+def test_mapa_igual_que_movimientos_validos():
+    rng = random.Random(0)
+    for tamano in (1, 2, 3, 5, 8):
+        for _ in range(30):
+            comparar_mapa(tablero_aleatorio(tamano, rng))
+
+
+def test_el_estado_del_minijuego_trae_su_mapa():
+    estado = inicializar_estado_minijuego(6, random.Random(3))
+    comparar_mapa(estado["matriz"])
+    assert estado["mapa_alcance"] == crear_mapa_alcance(estado["matriz"])
+    assert lleva_al_objetivo(estado["mapa_alcance"], estado["jugador_pos"])
@@ -0,0 +1,71 @@
+# =============================================================================
+# TESTS - POOL DE TABLEROS DEL MINIJUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    - Los tableros dentro de la banda se marcan "en_banda"; si la banda no
+#      se alcanza se usa el más cercano, marcado y contado aparte
+#    - Un error al generar no mata al hilo de recarga: se cuenta y se reintenta
+# =============================================================================
+
+import time
+import random
+
+from core import pool_tableros
+from core.pool_tableros import generar_tablero_validado, iniciar_pool_tableros, tomar_tablero, detener_pool_tableros
+
+INTENTOS = 5
+
+
+def esperar_pool_lleno(pool: dict, segundos: float = 10.0) -> None:
+    limite = time.monotonic() + segundos
+    with pool["condicion"]:
+        while len(pool["tableros"]) < pool["capacidad"] and time.monotonic() < limite:
+            pool["condicion"].wait(0.05)
+    assert len(pool["tableros"]) == pool["capacidad"]
+
+
+def test_tablero_en_banda():
+    estado, descartados = generar_tablero_validado(5, 0.0, 1.0, random.Random(1))
+    assert estado["en_banda"]
+    assert descartados == 0
+
+
+def test_banda_imposible_marca_el_tablero(monkeypatch):
+    monkeypatch.setattr(pool_tableros, "INTENTOS_TABLERO_EN_BANDA", INTENTOS)
+    estado, descartados = generar_tablero_validado(5, 2.0, 3.0, random.Random(1))
+    assert not estado["en_banda"]
+    assert descartados == INTENTOS - 1
+
+
+def test_pool_cuenta_los_tableros_fuera_de_banda(monkeypatch):
+    monkeypatch.setattr(pool_tableros, "INTENTOS_TABLERO_EN_BANDA", INTENTOS)
+    pool = iniciar_pool_tableros(4, 2.0, 3.0, capacidad=2, procesos=0)
+    try:
+        esperar_pool_lleno(pool)
+        with pool["condicion"]:
+            assert pool["fuera_de_banda"] == pool["generados"] // INTENTOS
+            assert pool["descartados"] == pool["fuera_de_banda"] * (INTENTOS - 1)
+        assert not tomar_tablero(pool)["en_banda"]
+    finally:
+        detener_pool_tableros(pool)
+
+
+def test_un_error_al_generar_no_detiene_la_recarga(monkeypatch):
+    generar = pool_tableros.generar_tablero_validado
+    llamadas = []
+
+    def generar_fallando_una_vez(*args):
+        llamadas.append(args)
+        if len(llamadas) == 1:
+            raise RuntimeError("falla de prueba")
+        return generar(*args)
+
+    monkeypatch.setattr(pool_tableros, "generar_tablero_validado", generar_fallando_una_vez)
+    monkeypatch.setattr(pool_tableros, "ESPERA_REINTENTO_POOL_TABLEROS", 0.01)
+    pool = iniciar_pool_tableros(3, 0.0, 1.0, capacidad=2, procesos=0)
+    try:
+        esperar_pool_lleno(pool)
+        assert pool["errores"] == 1
+        assert pool["hilo"].is_alive()
+    finally:
+        detener_pool_tableros(pool)
@@ -0,0 +1,95 @@
+# =============================================================================
+# TESTS - PUNTAJE POR LOTES
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Las funciones por lotes dan los mismos puntos que las escalares, con
+#    numpy (se saltea si no está instalado) y con el camino en Python puro.
+# =============================================================================
+
+import random
+
+import pytest
+
+from core import logica_puntaje_lotes
+from core.logica_puntaje import calcular_puntos_base, calcular_puntaje_con_buffeo
+from core.logica_buffeos import calcular_puntos_buffeo
+from core.logica_puntaje_lotes import (
+    calcular_puntos_base_lote,
+    calcular_puntos_buffeo_lote,
+    calcular_puntaje_con_buffeo_lote,
+    calcular_rachas_previas_lote,
+    puntuar_respuestas_lote
+)
+
+RESPUESTAS = 2000
+
+
+@pytest.fixture(params=["numpy", "python"])
+def camino(request, monkeypatch):
+    """Corre cada test con numpy y con el camino sin numpy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(logica_puntaje_lotes, "np", None)
+    return request.param
+
+
+def lista(valores) -> list:
+    """Arreglo numpy o lista -> lista de int de Python."""
+    return [int(valor) for valor in valores]
+
+
+def respuestas_aleatorias(semilla: int) -> tuple:
+    rng = random.Random(semilla)
+    correctas = [rng.random() < 0.6 for _ in range(RESPUESTAS)]
+    # Incluye dificultades fuera de la tabla (valen 0)
+    dificultades = [rng.choice([0, 1, 2, 3, 4, -1]) for _ in range(RESPUESTAS)]
+    rachas = [rng.randint(0, 12) for _ in range(RESPUESTAS)]
+    objetos = [rng.choice([None, "espada", "armadura", "raciones"]) for _ in range(RESPUESTAS)]
+    return correctas, dificultades, rachas, objetos
+
+
+def test_puntos_base_igual_que_escalar(camino):
+    correctas, dificultades, _, _ = respuestas_aleatorias(1)
+    esperados = [calcular_puntos_base(c, d) for c, d in zip(correctas, dificultades)]
+    assert lista(calcular_puntos_base_lote(correctas, dificultades)) == esperados
+
+
+def test_puntos_buffeo_igual_que_escalar(camino):
+    _, _, rachas, objetos = respuestas_aleatorias(2)
+    lote = calcular_puntos_buffeo_lote(rachas, objetos)
+    for clave in ("puntos", "por_racha", "por_objeto"):
+        assert lista(lote[clave]) == [calcular_puntos_buffeo(r, o)[clave] for r, o in zip(rachas, objetos)]
+
+
+def test_puntaje_con_buffeo_igual_que_escalar(camino):
+    rng = random.Random(3)
+    columnas = [[rng.randint(-3, 8) for _ in range(RESPUESTAS)] for _ in range(4)]
+    lote = calcular_puntaje_con_buffeo_lote(*columnas)
+    escalares = [calcular_puntaje_con_buffeo(*fila) for fila in zip(*columnas)]
+    for clave in ("total", "base", "buffeo", "raciones", "bolsa"):
+        assert lista(lote[clave]) == [puntaje[clave] for puntaje in escalares]
+
+
+def test_rachas_previas(camino):
+    assert lista(calcular_rachas_previas_lote([True, True, False, True])) == [0, 1, 2, 0]
+    assert lista(calcular_rachas_previas_lote([])) == []
+
+    correctas, _, _, _ = respuestas_aleatorias(4)
+    esperadas = []
+    racha = 0
+    for es_correcta in correctas:
+        esperadas.append(racha)
+        racha = racha + 1 if es_correcta else 0
+    assert lista(calcular_rachas_previas_lote(correctas)) == esperadas
+
+
+def test_puntuar_respuestas_solo_suma_buffeo_si_es_correcta(camino):
+    correctas, dificultades, _, objetos = respuestas_aleatorias(5)
+    rachas = lista(calcular_rachas_previas_lote(correctas))
+    puntaje = puntuar_respuestas_lote(correctas, dificultades, rachas, objetos)
+
+    for i in range(RESPUESTAS):
+        base = calcular_puntos_base(correctas[i], dificultades[i])
+        buffeo = calcular_puntos_buffeo(rachas[i], objetos[i])["puntos"] if correctas[i] else 0
+        assert int(puntaje["total"][i]) == base + buffeo
@@ -0,0 +1,39 @@
+# =============================================================================
+# TESTS - REGISTRO DE RESPUESTAS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Los contadores del registro (racha, errores, correctas) dan lo mismo
+#    que recorrer la lista de respuestas, después de cada respuesta.
+# =============================================================================
+
+import random
+
+from models.registro_respuestas import crear_registro_respuestas, registrar_respuesta, obtener_respuestas_registro
+from core.logica_preguntas import calcular_racha_actual, contar_errores_totales
+from core.logica_juego import construir_estadisticas_partida, verificar_condicion_fin_partida
+
+
+def test_contadores_igual_que_recorrer_la_lista():
+    rng = random.Random(0)
+    registro = crear_registro_respuestas()
+    lista = []
+    for i in range(500):
+        respuesta = {"pregunta_id": i, "es_correcta": rng.random() < 0.7}
+        registrar_respuesta(registro, respuesta)
+        lista.append(respuesta)
+
+        assert calcular_racha_actual(registro) == calcular_racha_actual(lista)
+        assert contar_errores_totales(registro) == contar_errores_totales(lista)
+        assert verificar_condicion_fin_partida(registro) == verificar_condicion_fin_partida(lista)
+
+    assert obtener_respuestas_registro(registro) == lista
+    assert construir_estadisticas_partida(registro, 40, 5, 90.0) == construir_estadisticas_partida(lista, 40, 5, 90.0)
+
+
+def test_respuesta_sin_es_correcta_cuenta_como_error():
+    registro = crear_registro_respuestas()
+    registrar_respuesta(registro, {"pregunta_id": 1, "es_correcta": True})
+    registrar_respuesta(registro, {"pregunta_id": 2})
+    assert registro["errores"] == contar_errores_totales(registro["respuestas"]) == 1
+    assert registro["racha"] == calcular_racha_actual(registro["respuestas"]) == 0
+    assert registro["correctas"] == 1
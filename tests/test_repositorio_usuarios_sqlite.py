@@ -0,0 +1,62 @@
+# =============================================================================
+# TESTS - BACKEND SQLITE DE USUARIOS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    El backend JSON y el SQLite dan los mismos perfiles, ranking y mensajes
+#    de error, también después de migrar Usuarios.json a la base.
+# =============================================================================
+
+from data import repositorio_usuarios_sqlite
+from data.repositorio_usuarios import (
+    guardar_estadisticas_usuario,
+    compactar_diario_usuarios,
+    obtener_usuario,
+    obtener_ranking,
+    obtener_top_ranking,
+    migrar_usuarios_a_sqlite
+)
+
+CAMPOS_PERFIL = ("intentos", "puntajes", "tiempos", "aciertos", "total_preguntas", "porcentajes", "agregados")
+JUGADORES = ("Ana", "Beto", "Carla")
+
+
+def perfil(usuario: dict) -> dict:
+    return {campo: usuario[campo] for campo in CAMPOS_PERFIL}
+
+
+def test_json_y_sqlite_dan_los_mismos_resultados(tmp_path, partidas_ejemplo):
+    archivo = str(tmp_path / "Usuarios.json")
+    ruta_db = str(tmp_path / "Usuarios.db")
+
+    assert obtener_usuario("Ana", archivo) == {"error": "No hay estadísticas guardadas"}
+    assert repositorio_usuarios_sqlite.obtener_usuario("Ana", ruta_db) == {"error": "No hay estadísticas guardadas"}
+
+    for nombre, resultado in partidas_ejemplo:
+        guardar_estadisticas_usuario(nombre, resultado, archivo)
+        repositorio_usuarios_sqlite.guardar_estadisticas_usuario(nombre, resultado, ruta_db)
+
+    for nombre in JUGADORES:
+        assert perfil(obtener_usuario(nombre, archivo)) == perfil(repositorio_usuarios_sqlite.obtener_usuario(nombre, ruta_db))
+
+    assert obtener_usuario("Nadie", archivo) == repositorio_usuarios_sqlite.obtener_usuario("Nadie", ruta_db)
+    assert obtener_ranking(archivo) == repositorio_usuarios_sqlite.obtener_ranking(ruta_db)
+    assert obtener_top_ranking(archivo, 2) == repositorio_usuarios_sqlite.obtener_ranking(ruta_db, 2)
+
+    # Después de compactar el JSON sigue coincidiendo
+    compactar_diario_usuarios(archivo)
+    assert obtener_ranking(archivo) == repositorio_usuarios_sqlite.obtener_ranking(ruta_db)
+
+
+def test_migrar_a_sqlite_importa_los_usuarios_del_json(tmp_path, partidas_ejemplo):
+    archivo = str(tmp_path / "Usuarios.json")
+    ruta_db = str(tmp_path / "Usuarios.db")
+    for nombre, resultado in partidas_ejemplo:
+        guardar_estadisticas_usuario(nombre, resultado, archivo)
+
+    assert migrar_usuarios_a_sqlite(archivo, ruta_db, str(tmp_path / "EstadoBuff.json"))
+    for nombre in JUGADORES:
+        assert perfil(obtener_usuario(nombre, archivo)) == perfil(repositorio_usuarios_sqlite.obtener_usuario(nombre, ruta_db))
+    assert obtener_ranking(archivo) == repositorio_usuarios_sqlite.obtener_ranking(ruta_db)
+
+    # Una base con datos no se vuelve a importar
+    assert repositorio_usuarios_sqlite.importar_usuarios({"Otro": {"partidas": [], "estado": None}}, ruta_db) == 0
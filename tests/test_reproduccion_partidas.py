@@ -0,0 +1,133 @@
+# =============================================================================
+# TESTS - REPRODUCCIÓN DE PARTIDAS CON SEMILLA
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Juega una partida como Gameplay (preguntas con la semilla y el filtro
+#    de vistas del jugador, respuestas por core/) y verifica que
+#    reproducir_partida obtiene los mismos eventos, tomando las preguntas
+#    del registro o volviendo a sortearlas.
+# =============================================================================
+
+import copy
+import random
+
+from core.logica_juego import preparar_indice_juego, obtener_pregunta_para_nivel, procesar_pregunta_completa, construir_estadisticas_partida
+from core.logica_preguntas import calcular_racha_actual, determinar_intentos_maximos, contar_errores_totales
+from core.logica_buffeos import calcular_vidas_ganadas, cumple_requisitos_objeto
+from core.sesion_juego import crear_sesion_en_memoria, obtener_objeto_sesion, registrar_pregunta_vista
+from core.registro_eventos import (
+    crear_registro_eventos,
+    crear_generador_partida,
+    registrar_pregunta_sorteada,
+    registrar_respuesta_eventos,
+    registrar_fin_eventos
+)
+from core.reproduccion_partidas import reproducir_partida
+from models.registro_respuestas import crear_registro_respuestas, registrar_respuesta
+from models.filtro_vistas import crear_filtro_vistas, agregar_vista
+from config.constantes import PREGUNTAS_POR_NIVEL, MAX_ERRORES_PERMITIDOS
+
+USUARIO = "Tester"
+
+
+def jugar_partida_registrada(preguntas: dict, semilla: int, vistas: dict, objeto: str = None) -> dict:
+    """Partida completa con el flujo de Gameplay; devuelve su registro de eventos."""
+    sesion = crear_sesion_en_memoria(USUARIO, objeto, 0, None, vistas)
+    registro = crear_registro_eventos(USUARIO, semilla, objeto, 0, "pygame", vistas)
+    rng = crear_generador_partida(semilla)
+    jugador = random.Random(semilla + 1)
+    indice = preparar_indice_juego(preguntas, None, vistas)
+    respuestas = crear_registro_respuestas()
+    puntos_totales = 0
+    puntos_buffeo = 0
+    game_over = False
+
+    for nivel in (1, 2, 3):
+        for _ in range(PREGUNTAS_POR_NIVEL.get(nivel, 0)):
+            if game_over:
+                break
+            pregunta = obtener_pregunta_para_nivel(preguntas, nivel, [], indice, rng, sesion["vistas"])
+            if not pregunta:
+                break
+            registrar_pregunta_sorteada(registro, pregunta)
+            registrar_pregunta_vista(sesion, pregunta["id"])
+
+            letra = jugador.choice(["A", "B", "C", "D"][:len(pregunta["opciones"])])
+            racha = calcular_racha_actual(respuestas)
+            objeto_antes = obtener_objeto_sesion(sesion)
+            resultado = procesar_pregunta_completa(
+                pregunta, USUARIO, racha, letra, 0, determinar_intentos_maximos(USUARIO, sesion), sesion
+            )
+            registrar_respuesta_eventos(registro, pregunta, letra, racha, resultado,
+                                        objeto_antes, obtener_objeto_sesion(sesion))
+            registrar_respuesta(respuestas, resultado)
+            if resultado["es_correcta"]:
+                puntos_totales += resultado["puntos"]
+            puntos_buffeo += resultado.get("puntos_buffeo", 0)
+            game_over = contar_errores_totales(respuestas) >= MAX_ERRORES_PERMITIDOS
+
+    estadisticas = construir_estadisticas_partida(respuestas, puntos_totales, puntos_buffeo, 0)
+    registrar_fin_eventos(
+        registro,
+        estadisticas,
+        max(0, contar_errores_totales(respuestas) - MAX_ERRORES_PERMITIDOS),
+        calcular_vidas_ganadas(puntos_totales),
+        cumple_requisitos_objeto(estadisticas["respuestas_correctas"], estadisticas["total_preguntas"])
+    )
+    return registro
+
+
+def filtro_con_mitad_del_banco(preguntas: dict) -> dict:
+    vistas = crear_filtro_vistas()
+    for pid in list(preguntas)[::2]:
+        agregar_vista(vistas, pid)
+    return vistas
+
+
+def test_reproducir_con_semilla_obtiene_los_mismos_eventos(preguntas):
+    for semilla in (1, 7, 2024):
+        registro = jugar_partida_registrada(preguntas, semilla, None)
+        reproduccion = reproducir_partida(registro, preguntas, regenerar_preguntas=True)
+        assert reproduccion["terminada"]
+        assert reproduccion["diferencias"] == []
+        assert reproduccion["eventos"] == registro["eventos"]
+
+
+def test_reproducir_con_filtro_de_vistas(preguntas):
+    for semilla in (1, 7, 2024):
+        registro = jugar_partida_registrada(preguntas, semilla, filtro_con_mitad_del_banco(preguntas))
+        reproduccion = reproducir_partida(registro, preguntas, regenerar_preguntas=True)
+        assert reproduccion["diferencias"] == []
+        assert reproduccion["eventos"] == registro["eventos"]
+
+
+def test_el_filtro_guardado_es_el_del_inicio(preguntas):
+    vistas = filtro_con_mitad_del_banco(preguntas)
+    inicial = copy.deepcopy(vistas)
+    registro = jugar_partida_registrada(preguntas, 3, vistas)
+
+    # La partida agregó sus preguntas al filtro; el registro guarda el de antes
+    assert vistas != inicial
+    assert registro["estado_inicial"]["vistas"] == crear_registro_eventos(USUARIO, 3, vistas=inicial)["estado_inicial"]["vistas"]
+
+
+def test_reproducir_con_objeto_y_sin_filtro(preguntas):
+    registro = jugar_partida_registrada(preguntas, 99, None, "armadura")
+    assert registro["estado_inicial"]["vistas"] is None
+    assert reproducir_partida(registro, preguntas, regenerar_preguntas=True)["diferencias"] == []
+
+
+def test_reproducir_desde_los_eventos_sin_volver_a_sortear(preguntas):
+    registro = jugar_partida_registrada(preguntas, 5, None, "espada")
+    reproduccion = reproducir_partida(registro, preguntas)
+    assert reproduccion["diferencias"] == []
+    assert reproduccion["estadisticas"]["total_preguntas"] > 0
+
+
+def test_una_respuesta_cambiada_se_detecta(preguntas):
+    registro = jugar_partida_registrada(preguntas, 11, None)
+    for evento in registro["eventos"]:
+        if evento["tipo"] == "respuesta_dada":
+            evento["puntos"] += 1
+            break
+    assert reproducir_partida(registro, preguntas)["diferencias"] != []
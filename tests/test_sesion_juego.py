@@ -0,0 +1,87 @@
+# =============================================================================
+# TESTS - SESIÓN DE JUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    - crear_sesion_juego toma una foto del objeto y las vidas extra
+#    - Usar el objeto durante la partida no toca el archivo
+#    - confirmar_sesion_juego escribe todo junto, una sola vez
+# =============================================================================
+
+import os
+
+from core.sesion_juego import crear_sesion_juego, confirmar_sesion_juego, obtener_objeto_sesion
+from core.logica_buffeos import usar_armadura, usar_bolsa_monedas
+from data.archivos_json import guardar_json, cargar_json
+from data.estado_buff import descartar_cache_estado_buff, actualizar_estado_usuario_buff
+from config.constantes import MAX_VIDAS_EXTRA
+
+
+def preparar_estado(tmp_path, contenido: dict) -> str:
+    ruta = str(tmp_path / "EstadoBuff.json")
+    guardar_json(ruta, contenido)
+    descartar_cache_estado_buff(ruta)
+    return ruta
+
+
+def contar_reemplazos(monkeypatch) -> list:
+    reemplazos = []
+    reemplazar = os.replace
+
+    def reemplazar_contando(origen, destino, *args, **kwargs):
+        reemplazos.append(os.path.basename(destino))
+        return reemplazar(origen, destino, *args, **kwargs)
+
+    monkeypatch.setattr(os, "replace", reemplazar_contando)
+    return reemplazos
+
+
+def test_la_sesion_es_una_foto_del_inicio(tmp_path):
+    ruta = preparar_estado(tmp_path, {"Ana": {"objeto_excepcional": "armadura", "vidas_extra": 2}})
+    sesion = crear_sesion_juego("Ana", ruta)
+
+    # Un cambio posterior en el almacén no altera la partida en curso
+    actualizar_estado_usuario_buff("Ana", {"objeto_excepcional": "raciones"}, None, ruta)
+    assert obtener_objeto_sesion(sesion) == "armadura"
+    assert sesion["vidas_extra_iniciales"] == 2
+    descartar_cache_estado_buff(ruta)
+
+    vacia = crear_sesion_juego("Nadie", ruta)
+    assert obtener_objeto_sesion(vacia) is None
+    assert vacia["vidas_extra_iniciales"] == 0
+
+
+def test_consumir_objeto_no_escribe_y_confirmar_escribe_una_vez(tmp_path, monkeypatch):
+    ruta = preparar_estado(tmp_path, {"Ana": {"objeto_excepcional": "armadura", "vidas_extra": 1}})
+    sesion = crear_sesion_juego("Ana", ruta)
+    reemplazos = contar_reemplazos(monkeypatch)
+
+    assert not usar_bolsa_monedas("Ana", True, 10, sesion)["objeto_usado"]
+    assert usar_armadura("Ana", False, sesion)["protegido"]
+    assert obtener_objeto_sesion(sesion) is None
+    assert not usar_armadura("Ana", False, sesion)["protegido"]
+    assert reemplazos == []
+    assert cargar_json(ruta, {})["Ana"]["objeto_excepcional"] == "armadura"
+
+    confirmado = confirmar_sesion_juego(sesion, 1, 3)
+    assert confirmado == {"objeto_consumido": "armadura", "vidas_extra": 3, "guardado": True}
+    assert reemplazos == ["EstadoBuff.json"]
+    guardado = cargar_json(ruta, {})["Ana"]
+    assert "objeto_excepcional" not in guardado
+    assert guardado["vidas_extra"] == 3
+    descartar_cache_estado_buff(ruta)
+
+
+def test_confirmar_respeta_cambios_de_otro_proceso(tmp_path):
+    ruta = preparar_estado(tmp_path, {"Ana": {"vidas_extra": 1}, "Beto": {"vidas_extra": 0}})
+    sesion = crear_sesion_juego("Ana", ruta)
+
+    # Otro proceso escribe mientras dura la partida
+    guardar_json(ruta, {"Ana": {"vidas_extra": 2}, "Beto": {"objeto_excepcional": "espada"}})
+
+    confirmado = confirmar_sesion_juego(sesion, 0, 10)
+    assert confirmado["vidas_extra"] == MAX_VIDAS_EXTRA
+    assert confirmado["objeto_consumido"] is None
+    en_disco = cargar_json(ruta, {})
+    assert en_disco["Ana"]["vidas_extra"] == MAX_VIDAS_EXTRA
+    assert en_disco["Beto"] == {"objeto_excepcional": "espada"}
+    descartar_cache_estado_buff(ruta)
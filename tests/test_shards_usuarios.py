@@ -0,0 +1,94 @@
+# =============================================================================
+# TESTS - USUARIOS REPARTIDOS EN SHARDS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Migrar Usuarios.json + diario a los shards conserva perfiles y ranking,
+#    las partidas nuevas van al shard del jugador y el top-K de cada shard
+#    se arma sin tener tomado el bloqueo de Usuarios.json.
+# =============================================================================
+
+import threading
+
+from data import repositorio_usuarios
+from data.bloqueo_archivos import bloqueo_archivo, BloqueoNoDisponibleError
+from data.shards_usuarios import shards_creados, listar_rutas_shards, obtener_ruta_shard_usuario
+from data.archivos_json import cargar_json
+from data.repositorio_usuarios import (
+    guardar_estadisticas_usuario,
+    obtener_usuario,
+    obtener_ranking,
+    obtener_top_ranking,
+    migrar_usuarios_a_shards,
+    guardar_estadisticas_shards,
+    obtener_usuario_shards,
+    obtener_ranking_shards,
+    obtener_top_ranking_shards
+)
+
+CAMPOS_PERFIL = ("intentos", "puntajes", "tiempos", "aciertos", "total_preguntas", "porcentajes")
+JUGADORES = ("Ana", "Beto", "Carla")
+
+
+def perfil(usuario: dict) -> dict:
+    return {campo: usuario[campo] for campo in CAMPOS_PERFIL}
+
+
+def guardar_partidas(archivo: str, partidas: list) -> None:
+    for nombre, resultado in partidas:
+        assert guardar_estadisticas_usuario(nombre, resultado, archivo)
+
+
+def test_migrar_conserva_perfiles_y_ranking(tmp_path, partidas_ejemplo):
+    archivo = str(tmp_path / "Usuarios.json")
+    guardar_partidas(archivo, partidas_ejemplo)
+
+    assert migrar_usuarios_a_shards(archivo)
+    assert shards_creados(archivo)
+    for nombre in JUGADORES:
+        assert perfil(obtener_usuario_shards(nombre, archivo)) == perfil(obtener_usuario(nombre, archivo))
+        assert nombre in cargar_json(obtener_ruta_shard_usuario(archivo, nombre), {})
+    assert obtener_ranking_shards(archivo) == obtener_ranking(archivo)
+    assert obtener_top_ranking_shards(archivo, 2) == obtener_top_ranking(archivo, 2)
+
+    # Migrar de nuevo no hace nada
+    assert migrar_usuarios_a_shards(archivo)
+    assert obtener_ranking_shards(archivo) == obtener_ranking(archivo)
+
+
+def test_partidas_nuevas_van_al_shard_del_jugador(tmp_path, partidas_ejemplo, crear_resultado):
+    archivo = str(tmp_path / "Usuarios.json")
+    guardar_partidas(archivo, partidas_ejemplo[:3])
+    for nombre, resultado in partidas_ejemplo[3:]:
+        guardar_estadisticas_shards(nombre, resultado, archivo)
+    guardar_estadisticas_shards("Dario", crear_resultado(500, 10), archivo)
+
+    assert obtener_usuario_shards("Beto", archivo)["puntajes"] == [40, 160]
+    assert obtener_usuario_shards("Dario", archivo)["intentos"] == 1
+    assert obtener_top_ranking_shards(archivo, 1)[0]["nombre"] == "Dario"
+    assert len(obtener_ranking_shards(archivo)) == 4
+
+
+def test_el_ranking_de_los_shards_se_arma_sin_el_bloqueo_de_usuarios(tmp_path, monkeypatch, partidas_ejemplo):
+    archivo = str(tmp_path / "Usuarios.json")
+    guardar_partidas(archivo, partidas_ejemplo)
+    libre = []
+
+    def tomar_bloqueo_desde_otro_hilo() -> None:
+        try:
+            with bloqueo_archivo(archivo, tiempo_maximo=0.2):
+                libre.append(True)
+        except BloqueoNoDisponibleError:
+            libre.append(False)
+
+    mapear = repositorio_usuarios.mapear_shards
+
+    def mapear_verificando(funcion, rutas, argumentos=()):
+        hilo = threading.Thread(target=tomar_bloqueo_desde_otro_hilo)
+        hilo.start()
+        hilo.join()
+        return mapear(funcion, rutas, argumentos)
+
+    monkeypatch.setattr(repositorio_usuarios, "mapear_shards", mapear_verificando)
+    assert migrar_usuarios_a_shards(archivo)
+    assert libre == [True]
+    assert len(listar_rutas_shards(archivo)) > 1
@@ -0,0 +1,66 @@
+# =============================================================================
+# TESTS - SIMULADOR DE PARTIDAS
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    - La misma simulación da el mismo resumen con 1 o con N procesos
+#    - No toca el random global, no escribe archivos y deja las constantes
+#      de balance como estaban
+#    - Los jugadores modelo extremos dan los resultados esperados
+# =============================================================================
+
+import os
+import random
+import builtins
+
+from core import simulador_partidas
+from core.simulador_partidas import simular_partidas
+from config import constantes
+
+MODELO = {"tipo": "por_dificultad", "acierto": {1: 0.9, 2: 0.7, 3: 0.5}}
+
+
+def test_mismo_resultado_con_uno_o_varios_procesos(preguntas, monkeypatch):
+    # Bloques chicos: la simulación se reparte en varios
+    monkeypatch.setattr(simulador_partidas, "PARTIDAS_POR_BLOQUE", 50)
+    uno = simular_partidas(preguntas, MODELO, 200, partidas_por_jugador=3, procesos=1, semilla=5)
+    varios = simular_partidas(preguntas, MODELO, 200, partidas_por_jugador=3, procesos=2, semilla=5)
+    assert uno == varios
+    assert uno["partidas"] == 200
+    assert simular_partidas(preguntas, MODELO, 200, procesos=1, semilla=6) != uno
+
+
+def test_sin_efectos_secundarios(preguntas, monkeypatch):
+    def prohibido(*args, **kwargs):
+        raise AssertionError("el simulador no debe escribir archivos")
+
+    abrir = builtins.open
+
+    def abrir_solo_lectura(archivo, modo="r", *args, **kwargs):
+        if "w" in modo or "a" in modo or "+" in modo:
+            prohibido()
+        return abrir(archivo, modo, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", abrir_solo_lectura)
+    monkeypatch.setattr(os, "replace", prohibido)
+
+    racha = dict(constantes.PUNTOS_BUFFEO_POR_RACHA)
+    vida = constantes.PUNTOS_POR_VIDA_EXTRA
+    random.seed(123)
+    estado = random.getstate()
+
+    configuracion = {"puntos_buffeo_por_racha": {3: 10}, "puntos_por_vida_extra": 5}
+    simular_partidas(preguntas, MODELO, 100, configuracion, procesos=1, semilla=1)
+
+    assert random.getstate() == estado
+    assert constantes.PUNTOS_BUFFEO_POR_RACHA == racha
+    assert constantes.PUNTOS_POR_VIDA_EXTRA == vida
+
+
+def test_jugadores_extremos(preguntas):
+    nunca = simular_partidas(preguntas, {"tipo": "fijo", "acierto": 0.0}, 100, procesos=1)
+    assert nunca["game_over"] == 100
+    assert nunca["objetos_merecidos"] == 0
+
+    siempre = simular_partidas(preguntas, {"tipo": "fijo", "acierto": 1.0}, 100, procesos=1)
+    assert siempre["game_over"] == 0
+    assert siempre["objetos_merecidos"] == 100
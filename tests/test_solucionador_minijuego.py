@@ -0,0 +1,111 @@
+# =============================================================================
+# TESTS - SOLUCIONADOR DEL MINIJUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    En tableros chicos el análisis por DP coincide con fuerza bruta:
+#    recorrer todos los caminos con obtener_movimientos_validos (el tablero
+#    es un DAG porque los valores crecen estrictamente).
+# =============================================================================
+
+import random
+
+from core.logica_minijuego import obtener_movimientos_validos, generar_matriz_resoluble
+from core.solucionador_minijuego import analizar_tablero_minijuego, calcular_dificultad_tablero
+
+TABLEROS_POR_TAMANO = 150
+
+
+def tablero_aleatorio(tamano: int, rng: random.Random) -> list:
+    # Valores en un rango chico: hay empates, caminos cortados y varios ganadores
+    return [[rng.randint(1, 2 * tamano) for _ in range(tamano)] for _ in range(tamano)]
+
+
+def movimientos(matriz: list, pos: tuple) -> list:
+    return [(f, c) for f, c, _, _ in obtener_movimientos_validos(matriz, pos, matriz[pos[0]][pos[1]])]
+
+
+def caminos_ganadores(matriz: list, pos: tuple) -> list:
+    """Todos los caminos de pos al objetivo (la partida termina al llegar)."""
+    objetivo = (len(matriz) - 1, len(matriz) - 1)
+    caminos = []
+    if pos == objetivo:
+        caminos.append([pos])
+    else:
+        for siguiente in movimientos(matriz, pos):
+            for resto in caminos_ganadores(matriz, siguiente):
+                caminos.append([pos] + resto)
+    return caminos
+
+
+def alcanzables_desde_inicio(matriz: list) -> set:
+    objetivo = (len(matriz) - 1, len(matriz) - 1)
+    vistos = {(0, 0)}
+    pendientes = [(0, 0)]
+    while pendientes:
+        pos = pendientes.pop()
+        if pos != objetivo:
+            for siguiente in movimientos(matriz, pos):
+                if siguiente not in vistos:
+                    vistos.add(siguiente)
+                    pendientes.append(siguiente)
+    return vistos
+
+
+def es_camino_valido(matriz: list, camino: list) -> bool:
+    valido = camino[0] == (0, 0) and camino[-1] == (len(matriz) - 1, len(matriz) - 1)
+    for actual, siguiente in zip(camino, camino[1:]):
+        valido = valido and siguiente in movimientos(matriz, actual)
+    return valido
+
+
+def comparar_con_fuerza_bruta(matriz: list) -> None:
+    tamano = len(matriz)
+    objetivo = (tamano - 1, tamano - 1)
+    analisis = analizar_tablero_minijuego(matriz)
+    celdas = [(f, c) for f in range(tamano) for c in range(tamano)]
+
+    alcanza = {pos: bool(caminos_ganadores(matriz, pos)) for pos in celdas}
+    for f, c in celdas:
+        assert analisis["alcanza_objetivo"][f][c] == alcanza[(f, c)]
+
+    ganadores = caminos_ganadores(matriz, (0, 0))
+    assert analisis["resoluble"] == bool(ganadores)
+    if ganadores:
+        assert len(analisis["camino_mas_corto"]) == min(len(camino) for camino in ganadores)
+        assert len(analisis["camino_mas_largo"]) == max(len(camino) for camino in ganadores)
+        assert es_camino_valido(matriz, analisis["camino_mas_corto"])
+        assert es_camino_valido(matriz, analisis["camino_mas_largo"])
+    else:
+        assert analisis["camino_mas_corto"] == []
+        assert analisis["camino_mas_largo"] == []
+
+    alcanzables = alcanzables_desde_inicio(matriz)
+    sin_objetivo = [pos for pos in celdas if pos != objetivo]
+    assert analisis["celdas_alcanzables"] == len(alcanzables)
+    assert analisis["celdas_sin_movimientos"] == sum(1 for pos in sin_objetivo if not movimientos(matriz, pos))
+    assert analisis["callejones"] == sum(1 for pos in sin_objetivo if not alcanza[pos])
+    assert analisis["callejones_alcanzables"] == sum(1 for pos in sin_objetivo if not alcanza[pos] and pos in alcanzables)
+
+
+def test_analisis_igual_que_fuerza_bruta():
+    rng = random.Random(0)
+    for tamano in (1, 2, 3, 4):
+        for _ in range(TABLEROS_POR_TAMANO):
+            comparar_con_fuerza_bruta(tablero_aleatorio(tamano, rng))
+
+
+def test_tableros_generados_son_resolubles():
+    for semilla in range(50):
+        matriz = generar_matriz_resoluble(5, random.Random(semilla))
+        comparar_con_fuerza_bruta(matriz)
+        analisis = analizar_tablero_minijuego(matriz)
+        assert analisis["resoluble"]
+        assert 0.0 <= calcular_dificultad_tablero(analisis) < 1.0
+
+
+def test_tablero_sin_solucion_tiene_dificultad_maxima():
+    # (0,0) es el valor más alto: no hay ningún movimiento
+    matriz = [[9, 1], [2, 3]]
+    analisis = analizar_tablero_minijuego(matriz)
+    assert not analisis["resoluble"]
+    assert calcular_dificultad_tablero(analisis) == 1.0
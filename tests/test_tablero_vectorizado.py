@@ -0,0 +1,54 @@
+# =============================================================================
+# TESTS - TABLERO VECTORIZADO DEL MINIJUEGO
+# =============================================================================
+# 📄 DESCRIPCIÓN:
+#    Con numpy (se saltea si no está instalado): el camino sembrado va de
+#    (0,0) a la esquina final con pasos abajo/derecha/diagonal, sus valores
+#    en el tablero son estrictamente crecientes y el solucionador confirma
+#    que el tablero es resoluble.
+# =============================================================================
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.logica_tablero_vectorizado import generar_camino_vectorizado, generar_tablero_resoluble, tablero_a_lista
+from core.logica_minijuego import generar_matriz_resoluble
+from core.solucionador_minijuego import analizar_tablero_minijuego
+from config.constantes import TAMAÑO_MINIMO_TABLERO_NUMPY
+
+TAMANOS = (1, 2, 5, TAMAÑO_MINIMO_TABLERO_NUMPY, 40)
+SEMILLAS = range(20)
+
+
+def test_el_camino_sembrado_es_estrictamente_creciente():
+    for tamano in TAMANOS:
+        for semilla in SEMILLAS:
+            # generar_tablero_resoluble sortea primero el camino: con la
+            # misma semilla se obtiene el camino que sembró
+            filas, columnas = generar_camino_vectorizado(tamano, np.random.default_rng(semilla))
+            tablero = generar_tablero_resoluble(tamano, np.random.default_rng(semilla))
+
+            assert tablero.shape == (tamano, tamano)
+            assert (filas[0], columnas[0]) == (0, 0)
+            assert (filas[-1], columnas[-1]) == (tamano - 1, tamano - 1)
+            pasos = set(zip(np.diff(filas).tolist(), np.diff(columnas).tolist()))
+            assert pasos <= {(1, 0), (0, 1), (1, 1)}
+            assert np.all(np.diff(tablero[filas, columnas]) > 0)
+
+
+def test_el_tablero_es_resoluble():
+    for tamano in TAMANOS:
+        for semilla in SEMILLAS:
+            tablero = generar_tablero_resoluble(tamano, np.random.default_rng(semilla))
+            assert analizar_tablero_minijuego(tablero_a_lista(tablero))["resoluble"]
+
+
+def test_generar_matriz_resoluble_usa_numpy_y_es_reproducible():
+    tamano = TAMAÑO_MINIMO_TABLERO_NUMPY
+    matriz = generar_matriz_resoluble(tamano, random.Random(7))
+    assert matriz == generar_matriz_resoluble(tamano, random.Random(7))
+    assert all(type(valor) is int for fila in matriz for valor in fila)
+    assert analizar_tablero_minijuego(matriz)["resoluble"]
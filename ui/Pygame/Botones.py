@@ -55,6 +55,10 @@ class Boton:
         self.hover = False
         self.activo = True
         
+        # Texto renderizado (se reutiliza mientras el texto no cambie)
+        self.texto_render = None
+        self.texto_renderizado = None
+        
     def verificar_click(self, pos: tuple) -> bool:
         """
         Verifica si se hizo clic en el botón.
@@ -81,6 +85,21 @@ class Boton:
         else:
             self.hover = False
     
+    def renderizar_texto(self) -> pygame.Surface:
+        """
+        Renderiza el texto del botón, una sola vez por texto.
+        
+        Se puede llamar antes de mostrar el botón (precarga) para que el
+        primer frame no tenga que renderizar.
+        
+        Retorna:
+            pygame.Surface: Texto renderizado
+        """
+        if self.texto_render is None or self.texto_renderizado != self.texto:
+            self.texto_render = self.fuente.render(self.texto, True, self.color_texto)
+            self.texto_renderizado = self.texto
+        return self.texto_render
+    
     def draw(self, surface: pygame.Surface):
         """
         Dibuja el botón en la superficie.
@@ -98,7 +117,7 @@ class Boton:
         surface.blit(imagen, self.rect.topleft)
         
         # Dibujar texto centrado
-        texto_render = self.fuente.render(self.texto, True, self.color_texto)
+        texto_render = self.renderizar_texto()
         texto_rect = texto_render.get_rect(center=(self.rect.centerx, self.rect.centery - 10))
         
         # Si el botón está inactivo, hacer el texto más oscuro
@@ -91,8 +91,10 @@ class gameOver(BaseEstado):
             
             # Guardar en el archivo de usuarios
             try:
-                guardar_estadisticas_usuario(nombre_jugador, resultado, RUTA_USUARIOS)
-                print(f"✅ Estadísticas guardadas para {nombre_jugador}")
+                if guardar_estadisticas_usuario(nombre_jugador, resultado, RUTA_USUARIOS):
+                    print(f"✅ Estadísticas guardadas para {nombre_jugador}")
+                else:
+                    print(f"❌ Las estadísticas de {nombre_jugador} no se guardaron")
             except Exception as e:
                 print(f"❌ Error al guardar estadísticas: {e}")
     
@@ -4,6 +4,7 @@
 # Pantalla principal del juego de trivia
 # =============================================================================
 
+import time
 import pygame
 from .base import BaseEstado
 from config.constantes import ALTO, ANCHO
@@ -11,15 +12,27 @@ from ..Botones import Boton, BOTON_ALTO_PEQUENO, BOTON_ANCHO_PEQUENO
 from ..recursos import cargar_imagen, cargar_fuente_principal
 from ..efectos import dibujar_degradado_vertical, dibujar_sombra_texto
 from data.repositorio_preguntas import cargar_preguntas_desde_csv
+from core.sesion_juego import crear_sesion_juego, obtener_objeto_sesion, confirmar_sesion_juego, registrar_pregunta_vista
+from core.registro_eventos import (
+    generar_semilla_partida,
+    crear_generador_partida,
+    crear_registro_eventos,
+    registrar_pregunta_sorteada,
+    registrar_respuesta_eventos,
+    registrar_fin_eventos
+)
+from data.repositorio_eventos import guardar_registro_eventos
 from core.logica_juego import (
     obtener_pregunta_para_nivel,
+    preparar_indice_juego,
     preparar_datos_pregunta_para_ui,
     calcular_datos_buffeo_para_ui,
     procesar_pregunta_completa,
     verificar_condicion_fin_partida
 )
-from core.logica_preguntas import calcular_racha_actual, determinar_intentos_maximos
-from core.logica_buffeos import verificar_objeto_equipado, verificar_merecimiento_objeto
+from core.logica_preguntas import calcular_racha_actual, determinar_intentos_maximos, contar_errores_totales
+from models.registro_respuestas import crear_registro_respuestas, registrar_respuesta
+from core.logica_buffeos import verificar_merecimiento_objeto, calcular_vidas_ganadas
 from config.constantes import RUTA_PREGUNTAS, PREGUNTAS_POR_NIVEL, MAX_ERRORES_PERMITIDOS
 
 
@@ -56,8 +69,9 @@ class gameplay(BaseEstado):
         
         # Estado del juego
         self.preguntas = {}
+        self.indice_preguntas = None
         self.preguntas_usadas = []
-        self.respuestas_partida = []
+        self.respuestas_partida = crear_registro_respuestas()
         self.nivel_actual = 1
         self.numero_pregunta_nivel = 0
         self.pregunta_actual = None
@@ -70,6 +84,13 @@ class gameplay(BaseEstado):
         self.vidas_extra_iniciales = 0
         self.max_errores_con_vidas = MAX_ERRORES_PERMITIDOS
         
+        # Sesión de juego (objeto y vidas en memoria), se crea en startup
+        self.sesion = None
+        
+        # Registro de eventos y generador con semilla, se crean en startup
+        self.registro_eventos = None
+        self.rng = None
+        
         # Constante para conversión de índice a letra
         self.ASCII_A = 65
         
@@ -86,6 +107,12 @@ class gameplay(BaseEstado):
         
         # Botones de opciones (se crean dinámicamente)
         self.botones_opciones = []
+        
+        # Textos de la pregunta ya renderizados: [(superficie, rect), ...]
+        self.textos_pregunta = []
+        
+        # Siguiente pregunta preparada mientras se muestra el resultado
+        self.precarga = None
     
     def startup(self, persist: dict):
         """
@@ -100,25 +127,36 @@ class gameplay(BaseEstado):
         # Obtener nombre del jugador
         self.nombre_usuario = self.persist.get("nombre_jugador", "Jugador")
         
-        # ⬅️ CALCULAR ERRORES PERMITIDOS CON VIDAS EXTRA
-        from core.logica_buffeos import calcular_errores_permitidos_con_vidas, obtener_vidas_extra_usuario
+        # Foto de objeto y vidas extra: durante la partida no se vuelve a
+        # consultar el estado de buffs (ver core/sesion_juego)
+        self.sesion = crear_sesion_juego(self.nombre_usuario)
         
-        self.vidas_extra_iniciales = obtener_vidas_extra_usuario(self.nombre_usuario)
-        self.max_errores_con_vidas = calcular_errores_permitidos_con_vidas(self.nombre_usuario)
+        # ⬅️ CALCULAR ERRORES PERMITIDOS CON VIDAS EXTRA
+        self.vidas_extra_iniciales = self.sesion["vidas_extra_iniciales"]
+        self.max_errores_con_vidas = MAX_ERRORES_PERMITIDOS + self.vidas_extra_iniciales
         
         print(f"🎮 Iniciando partida - Errores permitidos: {self.max_errores_con_vidas} (Base: {MAX_ERRORES_PERMITIDOS} + Extra: {self.vidas_extra_iniciales})")
         
         # Verificar objeto equipado al inicio
-        objeto_equipado = verificar_objeto_equipado(self.nombre_usuario)
+        objeto_equipado = obtener_objeto_sesion(self.sesion)
         if objeto_equipado:
             print(f"🎮 Iniciando partida con objeto: {objeto_equipado}")
         else:
             print(f"🎮 Iniciando partida sin objetos especiales")
         
+        # Semilla de la partida: con ella y el registro de eventos la partida
+        # se puede reproducir (core/reproduccion_partidas)
+        semilla = generar_semilla_partida()
+        self.rng = crear_generador_partida(semilla)
+        self.registro_eventos = crear_registro_eventos(
+            self.nombre_usuario, semilla, objeto_equipado, self.vidas_extra_iniciales, "pygame", self.sesion["vistas"]
+        )
+        
         # Resetear estado del juego
         self.preguntas = cargar_preguntas_desde_csv(RUTA_PREGUNTAS)
+        self.indice_preguntas = preparar_indice_juego(self.preguntas, self.indice_preguntas, self.sesion["vistas"])
         self.preguntas_usadas = []
-        self.respuestas_partida = []
+        self.respuestas_partida = crear_registro_respuestas()
         self.nivel_actual = 1
         self.numero_pregunta_nivel = 0
         self.puntos_totales = 0
@@ -130,44 +168,81 @@ class gameplay(BaseEstado):
         self.resultado_actual = None
         self.buffeo_activo = False
         self.datos_buffeo = None
+        self.precarga = None
         
-        # Cargar primera pregunta
+        # Cargar primera pregunta (después, procesar_respuesta mantiene el buffeo al día)
+        self.actualizar_buffeo()
         self.cargar_siguiente_pregunta()
     
-    def cargar_siguiente_pregunta(self):
-        """Carga la siguiente pregunta del nivel actual."""
-        # Verificar si terminó el nivel
-        if self.numero_pregunta_nivel >= PREGUNTAS_POR_NIVEL.get(self.nivel_actual, 0):
-            # Pasar al siguiente nivel
-            self.nivel_actual += 1
-            self.numero_pregunta_nivel = 0
+    def precargar_siguiente_pregunta(self):
+        """
+        Avanza un paso de la preparación de la siguiente pregunta.
+        
+        Se llama una vez por frame mientras se muestra el resultado, así el
+        trabajo queda repartido: 1) seleccionar la pregunta, 2) crear los
+        botones y renderizar sus textos, 3) renderizar el texto de la
+        pregunta. Cuando termina, self.precarga["lista"] es True.
+        """
+        if self.precarga is None:
+            # Nivel y número que tendrá la siguiente pregunta (se aplican al mostrarla)
+            nivel = self.nivel_actual
+            numero = self.numero_pregunta_nivel
+            if numero >= PREGUNTAS_POR_NIVEL.get(nivel, 0):
+                nivel += 1
+                numero = 0
             
-            # Verificar si terminó el juego
-            if self.nivel_actual > 3:
-                self.terminar_juego()
-                return
+            pregunta = None
+            if nivel <= 3:
+                pregunta = obtener_pregunta_para_nivel(
+                    self.preguntas,
+                    nivel,
+                    self.preguntas_usadas,
+                    self.indice_preguntas,
+                    self.rng,
+                    self.sesion["vistas"]
+                )
+            
+            # Sin pregunta (fin de niveles o banco agotado) no hay nada más que preparar
+            self.precarga = {
+                "pregunta": pregunta,
+                "nivel": nivel,
+                "numero": numero + 1,
+                "botones": None,
+                "textos": None,
+                "lista": not pregunta
+            }
+        elif self.precarga["botones"] is None:
+            self.precarga["botones"] = self.crear_botones_opciones(self.precarga["pregunta"])
+        elif not self.precarga["lista"]:
+            self.precarga["textos"] = self.renderizar_textos_pregunta(self.precarga["pregunta"])
+            self.precarga["lista"] = True
+    
+    def cargar_siguiente_pregunta(self):
+        """Muestra la siguiente pregunta (la prepara ahora si no estaba precargada)."""
+        while self.precarga is None or not self.precarga["lista"]:
+            self.precargar_siguiente_pregunta()
         
-        # Obtener pregunta
-        self.pregunta_actual = obtener_pregunta_para_nivel(
-            self.preguntas,
-            self.nivel_actual,
-            self.preguntas_usadas
-        )
+        precarga = self.precarga
+        self.precarga = None
         
-        if self.pregunta_actual is None or not self.pregunta_actual:
-            # No hay más preguntas, terminar juego
+        if not precarga["pregunta"]:
+            # Terminaron los niveles o no hay más preguntas
+            self.nivel_actual = precarga["nivel"]
             self.terminar_juego()
             return
         
-        # Agregar a preguntas usadas
-        self.preguntas_usadas.append(self.pregunta_actual.get("id", 0))
-        self.numero_pregunta_nivel += 1
+        # Intercambio: todo ya está seleccionado y renderizado
+        self.pregunta_actual = precarga["pregunta"]
+        self.nivel_actual = precarga["nivel"]
+        self.numero_pregunta_nivel = precarga["numero"]
+        self.botones_opciones = precarga["botones"]
+        self.textos_pregunta = precarga["textos"]
         
-        # Actualizar buffeo antes de mostrar la pregunta
-        self.actualizar_buffeo()
+        registrar_pregunta_sorteada(self.registro_eventos, self.pregunta_actual)
+        registrar_pregunta_vista(self.sesion, self.pregunta_actual.get("id", 0))
         
-        # Crear botones de opciones
-        self.crear_botones_opciones()
+        # Agregar a preguntas usadas
+        self.preguntas_usadas.append(self.pregunta_actual.get("id", 0))
         
         # Resetear estado de respuesta
         self.opcion_seleccionada = -1
@@ -177,17 +252,17 @@ class gameplay(BaseEstado):
     
     def actualizar_buffeo(self):
         """Actualiza los datos del buffeo según la racha actual."""
-        self.datos_buffeo = calcular_datos_buffeo_para_ui(self.racha_actual, self.nombre_usuario)
+        self.datos_buffeo = calcular_datos_buffeo_para_ui(self.racha_actual, self.nombre_usuario, self.sesion)
         self.buffeo_activo = self.datos_buffeo.get("tiene_buffeo", False)
         
         # DEBUG: Mostrar información del buffeo
         if self.buffeo_activo:
             print(f"🔥 Buffeo activo - Racha: {self.racha_actual}, Puntos extra: {self.datos_buffeo.get('puntos_totales', 0)}")
     
-    def crear_botones_opciones(self):
-        """Crea los botones para las opciones de respuesta."""
-        self.botones_opciones = []
-        opciones = self.pregunta_actual.get("opciones", [])
+    def crear_botones_opciones(self, pregunta: dict) -> list:
+        """Crea los botones (con el texto ya renderizado) para las opciones de una pregunta."""
+        botones = []
+        opciones = pregunta.get("opciones", [])
         
         # TUS VALORES PERSONALIZADOS (NO MODIFICADOS)
         y_start = 200
@@ -204,7 +279,10 @@ class gameplay(BaseEstado):
                 self.fuente_opcion,
                 (80, 80, 150)
             )
-            self.botones_opciones.append(boton)
+            boton.renderizar_texto()
+            botones.append(boton)
+        
+        return botones
     
     def procesar_respuesta(self, indice_opcion: int):
         """
@@ -224,7 +302,7 @@ class gameplay(BaseEstado):
         letra_respuesta = chr(self.ASCII_A + indice_opcion)
         
         # Verificar objeto antes de procesar
-        objeto_equipado = verificar_objeto_equipado(self.nombre_usuario)
+        objeto_equipado = obtener_objeto_sesion(self.sesion)
         print(f"📝 Procesando respuesta '{letra_respuesta}' - Objeto: {objeto_equipado}, Racha: {self.racha_actual}")
         
         # Procesar con la lógica del core
@@ -234,7 +312,8 @@ class gameplay(BaseEstado):
             self.racha_actual,
             letra_respuesta,
             0,
-            determinar_intentos_maximos(self.nombre_usuario)
+            determinar_intentos_maximos(self.nombre_usuario, self.sesion),
+            self.sesion
         )
         
         # DEBUG: Mostrar puntos obtenidos
@@ -242,20 +321,23 @@ class gameplay(BaseEstado):
         es_correcta = self.resultado_actual.get("es_correcta", False)
         print(f"✅ Resultado: {'Correcta' if es_correcta else 'Incorrecta'} - Puntos: {puntos_obtenidos}")
         
+        registrar_respuesta_eventos(
+            self.registro_eventos, self.pregunta_actual, letra_respuesta, self.racha_actual,
+            self.resultado_actual, objeto_equipado, obtener_objeto_sesion(self.sesion)
+        )
+        
+        # Guardar respuesta (el registro actualiza racha y errores en O(1))
+        registrar_respuesta(self.respuestas_partida, self.resultado_actual)
+        
         # Actualizar estadísticas
         if es_correcta:
             self.puntos_totales += puntos_obtenidos
-            self.racha_actual += 1
-        else:
-            self.racha_actual = 0
-            self.errores += 1
+        self.racha_actual = calcular_racha_actual(self.respuestas_partida)
+        self.errores = contar_errores_totales(self.respuestas_partida)
         
         # Actualizar buffeo después de responder
         self.actualizar_buffeo()
         
-        # Guardar respuesta
-        self.respuestas_partida.append(self.resultado_actual)
-        
         # Mostrar resultado
         self.mostrar_resultado = True
         self.esperando_respuesta = False
@@ -268,46 +350,42 @@ class gameplay(BaseEstado):
     
     def terminar_juego(self):
         """Termina el juego y pasa al estado Game Over o Selección de Objeto."""
-        from core.logica_buffeos import (
-            consumir_vidas_extra_usuario, 
-            calcular_vidas_ganadas, 
-            guardar_vidas_extra_usuario,
-            consumir_objeto_equipado,  # ⬅️ NUEVO
-            verificar_objeto_equipado
-        )
-        
-        # Contar respuestas correctas
-        respuestas_correctas = sum(
-            1 for r in self.respuestas_partida 
-            if r.get("es_correcta", False)
-        )
-        
-        # ⬅️ CONSUMIR OBJETO EQUIPADO SI TENÍA UNO
-        objeto_usado = verificar_objeto_equipado(self.nombre_usuario)
-        if objeto_usado:
-            consumir_objeto_equipado(self.nombre_usuario)
-            print(f"⚔️ Objeto '{objeto_usado}' consumido al terminar partida")
+        # Respuestas correctas (contador del registro, sin recorrer la lista)
+        respuestas_correctas = self.respuestas_partida["correctas"]
         
-        # CONSUMIR VIDAS EXTRA USADAS
+        # CONSUMIR VIDAS EXTRA USADAS Y CALCULAR VIDAS GANADAS
         vidas_usadas = max(0, self.errores - MAX_ERRORES_PERMITIDOS)
+        vidas_ganadas = calcular_vidas_ganadas(self.puntos_totales)
+        
+        # Una sola transacción con todo el fin de partida: quita el objeto
+        # con el que se empezó y aplica vidas usadas y ganadas
+        confirmacion = confirmar_sesion_juego(self.sesion, vidas_usadas, vidas_ganadas)
+        if not confirmacion["guardado"]:
+            print("⚠️ Objeto y vidas extra de esta partida no quedaron guardados")
+        if confirmacion["objeto_consumido"]:
+            print(f"⚔️ Objeto '{confirmacion['objeto_consumido']}' consumido al terminar partida")
         if vidas_usadas > 0:
-            consumir_vidas_extra_usuario(self.nombre_usuario, vidas_usadas)
             print(f"💔 Vidas extra consumidas: {vidas_usadas}")
-        
-        # CALCULAR VIDAS GANADAS
-        vidas_ganadas = calcular_vidas_ganadas(self.puntos_totales)
         if vidas_ganadas > 0:
-            guardar_vidas_extra_usuario(self.nombre_usuario, vidas_ganadas)
             print(f"💚 Vidas extra ganadas: {vidas_ganadas} (por {self.puntos_totales} puntos)")
         
         # Verificar si merece objeto especial
-        total_preguntas = len(self.respuestas_partida)
+        total_preguntas = len(self.respuestas_partida["respuestas"])
         merece_objeto = verificar_merecimiento_objeto(
             self.nombre_usuario, 
             respuestas_correctas, 
             total_preguntas
         )
         
+        # Cerrar y guardar el registro de eventos (una línea por partida)
+        registrar_fin_eventos(self.registro_eventos, {
+            "puntos_totales": self.puntos_totales,
+            "respuestas_correctas": respuestas_correctas,
+            "total_preguntas": total_preguntas,
+            "tiempo_total_segundos": round(time.time() - self.registro_eventos["inicio"])
+        }, vidas_usadas, vidas_ganadas, merece_objeto)
+        guardar_registro_eventos(self.registro_eventos)
+        
         # Pasar estadísticas al siguiente estado
         self.persist["puntos_totales"] = self.puntos_totales
         self.persist["respuestas_correctas"] = respuestas_correctas
@@ -394,6 +472,9 @@ class gameplay(BaseEstado):
             # Avanzar automáticamente después de 3 segundos
             if self.tiempo_resultado > 3000:
                 self.cargar_siguiente_pregunta()
+            elif not self.done and (self.precarga is None or not self.precarga["lista"]):
+                # Mientras tanto, preparar la siguiente pregunta (un paso por frame)
+                self.precargar_siguiente_pregunta()
     
     def draw(self, surface: pygame.Surface):
         """
@@ -466,8 +547,8 @@ class gameplay(BaseEstado):
         errores_render = self.fuente_stats.render(errores_text, True, color_error)
         surface.blit(errores_render, (400, y))
         
-        # Mostrar objeto equipado
-        objeto = verificar_objeto_equipado(self.nombre_usuario)
+        # Mostrar objeto equipado (desde la sesión: se dibuja en cada frame)
+        objeto = obtener_objeto_sesion(self.sesion)
         if objeto:
             y += 35
             # Mapeo de nombres de objetos para display
@@ -522,16 +603,22 @@ class gameplay(BaseEstado):
             objeto_render = self.fuente_buffeo.render(objeto_text, True, (150, 255, 150))
             surface.blit(objeto_render, (x + 10, y_offset))
     
-    def dibujar_pregunta(self, surface: pygame.Surface):
-        """Dibuja la pregunta actual."""
-        descripcion = self.pregunta_actual.get("descripcion", "")
-        categoria = self.pregunta_actual.get("categoria", "")
+    def renderizar_textos_pregunta(self, pregunta: dict) -> list:
+        """
+        Renderiza categoría y enunciado (dividido en líneas) de una pregunta.
+        
+        Retorna:
+            list: [(superficie, rect), ...] listos para blit
+        """
+        textos = []
+        descripcion = pregunta.get("descripcion", "")
+        categoria = pregunta.get("categoria", "")
         
         # Categoría
         cat_text = f"[{categoria}]"
         cat_render = self.fuente_opcion.render(cat_text, True, (150, 150, 255))
         cat_rect = cat_render.get_rect(center=(self.screen_rect.centerx, 120))
-        surface.blit(cat_render, cat_rect)
+        textos.append((cat_render, cat_rect))
         
         # Pregunta (dividir en líneas si es muy larga)
         palabras = descripcion.split()
@@ -554,8 +641,15 @@ class gameplay(BaseEstado):
         for linea in lineas:
             pregunta_render = self.fuente_pregunta.render(linea.strip(), True, self.color_pregunta)
             pregunta_rect = pregunta_render.get_rect(center=(self.screen_rect.centerx, y_offset))
-            surface.blit(pregunta_render, pregunta_rect)
+            textos.append((pregunta_render, pregunta_rect))
             y_offset += 35
+        
+        return textos
+    
+    def dibujar_pregunta(self, surface: pygame.Surface):
+        """Dibuja la pregunta actual (textos renderizados al cargarla)."""
+        for superficie, rect in self.textos_pregunta:
+            surface.blit(superficie, rect)
     
     def dibujar_resultado(self, surface: pygame.Surface):
         """Dibuja el resultado de la respuesta."""
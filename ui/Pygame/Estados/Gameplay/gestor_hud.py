@@ -6,7 +6,7 @@
 #    puntos, nivel, racha, errores, objetos equipados y vidas extra.
 #
 # 🔗 DEPENDENCIAS CORE:
-#    - core/logica_buffeos.py: verificar_objeto_equipado()
+#    - core/logica_buffeos.py: obtener_objeto_actual()
 #
 # 🔗 DEPENDENCIAS PYGAME:
 #    - pygame: Para renderizado de texto
@@ -23,7 +23,7 @@
 # =============================================================================
 
 import pygame
-from core.logica_buffeos import verificar_objeto_equipado
+from core.logica_buffeos import obtener_objeto_actual
 from config.constantes import PREGUNTAS_POR_NIVEL, MAX_ERRORES_PERMITIDOS
 
 
@@ -72,7 +72,7 @@ class GestorHUD:
         
         return None
     
-    def inicializar(self, nombre_usuario: str, vidas_extra: int, max_errores: int) -> None:
+    def inicializar(self, nombre_usuario: str, vidas_extra: int, max_errores: int, sesion: dict = None) -> None:
         """
         Inicializa HUD para nueva partida.
         
@@ -80,6 +80,8 @@ class GestorHUD:
             nombre_usuario (str): Nombre del jugador
             vidas_extra (int): Vidas extra iniciales del jugador
             max_errores (int): Máximo de errores permitidos (base + vidas extra)
+            sesion (dict): Sesión de juego (opcional): el objeto se lee de
+                           ahí en cada frame en lugar del estado de buffs
         
         Returns:
             None
@@ -91,6 +93,7 @@ class GestorHUD:
             hud.inicializar("Jugador1", 2, 4)
         """
         self.nombre_usuario = nombre_usuario
+        self.sesion = sesion
         self.puntos_totales = 0
         self.nivel_actual = 1
         self.numero_pregunta_nivel = 0
@@ -279,7 +282,7 @@ class GestorHUD:
         pantalla.blit(errores_render, (400, y))
         
         # Mostrar objeto equipado si existe
-        objeto = verificar_objeto_equipado(self.nombre_usuario)
+        objeto = obtener_objeto_actual(self.nombre_usuario, self.sesion)
         if objeto:
             y = y + 35
             
@@ -25,7 +25,7 @@
 
 import pygame
 from data.repositorio_preguntas import cargar_preguntas_desde_csv
-from core.logica_juego import obtener_pregunta_para_nivel
+from core.logica_juego import obtener_pregunta_para_nivel, preparar_indice_juego
 from config.constantes import RUTA_PREGUNTAS, PREGUNTAS_POR_NIVEL
 from ..efectos import dibujar_sombra_texto
 
@@ -52,6 +52,7 @@ class GestorPreguntas:
             gestor = GestorPreguntas(fuente, (255, 255, 200))
         """
         self.preguntas = {}
+        self.indice_preguntas = None
         self.preguntas_usadas = []
         self.pregunta_actual = None
         self.nivel_actual = 1
@@ -63,10 +64,14 @@ class GestorPreguntas:
         
         return None
     
-    def cargar_preguntas(self) -> None:
+    def cargar_preguntas(self, vistas: dict = None) -> None:
         """
         Carga todas las preguntas desde el archivo CSV.
         
+        Args:
+            vistas (dict): Filtro de vistas del jugador, para ponderar las
+                categorías que vio menos (opcional)
+        
         Returns:
             None
         
@@ -77,6 +82,7 @@ class GestorPreguntas:
             gestor.cargar_preguntas()
         """
         self.preguntas = cargar_preguntas_desde_csv(RUTA_PREGUNTAS)
+        self.indice_preguntas = preparar_indice_juego(self.preguntas, self.indice_preguntas, vistas)
         return None
     
     def siguiente_pregunta(self) -> bool:
@@ -109,7 +115,8 @@ class GestorPreguntas:
         self.pregunta_actual = obtener_pregunta_para_nivel(
             self.preguntas,
             self.nivel_actual,
-            self.preguntas_usadas
+            self.preguntas_usadas,
+            self.indice_preguntas
         )
         
         # Verificar si se obtuvo una pregunta válida
@@ -8,7 +8,7 @@
 # 🔗 DEPENDENCIAS CORE:
 #    - core/logica_juego.py: procesar_pregunta_completa()
 #    - core/logica_preguntas.py: determinar_intentos_maximos()
-#    - core/logica_buffeos.py: verificar_objeto_equipado()
+#    - core/logica_buffeos.py: obtener_objeto_actual()
 #
 # 🔗 DEPENDENCIAS PYGAME:
 #    - ui/Pygame/Botones.py: Boton (clase existente)
@@ -28,7 +28,7 @@ import pygame
 from ..Botones import Boton, BOTON_ANCHO_PEQUENO, BOTON_ALTO_PEQUENO
 from core.logica_juego import procesar_pregunta_completa
 from core.logica_preguntas import determinar_intentos_maximos
-from core.logica_buffeos import verificar_objeto_equipado
+from core.logica_buffeos import obtener_objeto_actual
 
 
 class GestorRespuestas:
@@ -172,7 +172,7 @@ class GestorRespuestas:
         return indice_clickeado
     
     def procesar_respuesta(self, indice_opcion: int, pregunta_actual: dict, 
-                          nombre_usuario: str, racha_actual: int) -> dict:
+                          nombre_usuario: str, racha_actual: int, sesion: dict = None) -> dict:
         """
         Procesa la respuesta usando la lógica del core.
         
@@ -181,6 +181,7 @@ class GestorRespuestas:
             pregunta_actual (dict): Diccionario con datos de la pregunta
             nombre_usuario (str): Nombre del jugador
             racha_actual (int): Racha actual del jugador
+            sesion (dict): Sesión de juego (opcional, ver core/sesion_juego)
         
         Returns:
             dict: Resultado del procesamiento (puntos, es_correcta, etc.)
@@ -214,7 +215,7 @@ class GestorRespuestas:
         letra_respuesta = chr(self.ASCII_A + indice_opcion)
         
         # Verificar objeto equipado antes de procesar
-        objeto_equipado = verificar_objeto_equipado(nombre_usuario)
+        objeto_equipado = obtener_objeto_actual(nombre_usuario, sesion)
         print(f"📝 Procesando respuesta '{letra_respuesta}' - Objeto: {objeto_equipado}, Racha: {racha_actual}")
         
         # DELEGAR PROCESAMIENTO AL CORE
@@ -224,7 +225,8 @@ class GestorRespuestas:
             racha_actual,
             letra_respuesta,
             0,  # Intento actual (primer intento)
-            determinar_intentos_maximos(nombre_usuario)
+            determinar_intentos_maximos(nombre_usuario, sesion),
+            sesion
         )
         
         # DEBUG: Mostrar resultado
@@ -8,11 +8,9 @@ import pygame
 from .base import BaseEstado
 from ..Botones import Boton, crear_botones_centrados
 from ..recursos import cargar_imagen, cargar_fuente_principal
-from core.logica_minijuego import (
-    generar_matriz_resoluble,  # ⬅️ CAMBIADO
-    obtener_movimientos_validos,
-    verificar_victoria  # ⬅️ ESTE SÍ EXISTE
-)
+from core.logica_minijuego import verificar_victoria  # ⬅️ ESTE SÍ EXISTE
+from core.pool_tableros import iniciar_pool_tableros, tomar_tablero
+from core.solucionador_minijuego import es_movimiento_legal, tiene_movimientos, lleva_al_objetivo
 from config.constantes import ANCHO, ALTO, TAMAÑO_MATRIZ_MINIJUEGO
 
 
@@ -40,6 +38,7 @@ class minijuego(BaseEstado):
         self.color_celda_actual = (255, 215, 0)
         self.color_celda_visitada = (150, 150, 200)
         self.color_celda_valida = (100, 255, 100)
+        self.color_celda_sin_salida = (255, 140, 60)
         self.color_texto = (255, 255, 255)
         self.color_texto_celda = (0, 0, 0)
         
@@ -49,11 +48,16 @@ class minijuego(BaseEstado):
         self.fuente_instrucciones = cargar_fuente_principal(24)
         self.fuente_boton = cargar_fuente_principal(32)
         
+        # Pool de tableros: se van generando y validando en segundo plano
+        # mientras el jugador está en otras pantallas
+        self.pool_tableros = iniciar_pool_tableros(TAMAÑO_MATRIZ_MINIJUEGO)
+        
         # Estado del juego
         self.matriz = None
+        self.mapa_alcance = None
         self.pos_actual = (0, 0)
-        self.camino_recorrido = [(0, 0)]
-        self.movimientos_validos = []
+        self.camino_recorrido = {(0, 0)}
+        self.mostrar_pistas = False
         self.terminado = False
         self.victoria = False
         self.tamano_celda = 80
@@ -91,23 +95,18 @@ class minijuego(BaseEstado):
     
     def iniciar_nuevo_juego(self):
         """Inicia un nuevo juego del minijuego."""
-        # ⬅️ GENERAR MATRIZ
-        self.matriz = generar_matriz_resoluble(TAMAÑO_MATRIZ_MINIJUEGO)
+        # ⬅️ TOMAR MATRIZ DEL POOL (ya validada por dificultad y con su mapa
+        # de alcance: movimientos legales y celdas sin salida en O(1))
+        estado = tomar_tablero(self.pool_tableros)
+        self.matriz = estado["matriz"]
+        self.mapa_alcance = estado["mapa_alcance"]
         self.pos_actual = (0, 0)
-        self.camino_recorrido = [(0, 0)]
+        self.camino_recorrido = {(0, 0)}
         self.terminado = False
         self.victoria = False
         self.mostrar_derrota = False
         
-        # ⬅️ OBTENER MOVIMIENTOS VÁLIDOS (necesita matriz, pos, valor)
-        valor_actual = self.matriz[0][0]
-        self.movimientos_validos = obtener_movimientos_validos(
-            self.matriz, 
-            self.pos_actual, 
-            valor_actual
-        )
-        
-        print("🎮 Minijuego iniciado")
+        print(f"🎮 Minijuego iniciado (dificultad {estado['dificultad']:.2f})")
         print(f"📍 Posición inicial: {self.pos_actual}")
     
     def get_event(self, event: pygame.event.Event):
@@ -147,6 +146,9 @@ class minijuego(BaseEstado):
                 if event.key == pygame.K_ESCAPE:
                     self.sig_estado = "Menu"
                     self.done = True
+                elif event.key == pygame.K_h:
+                    # Pistas: marca los movimientos que ya no llevan al objetivo
+                    self.mostrar_pistas = not self.mostrar_pistas
     
     def procesar_click(self, pos: tuple):
         """
@@ -176,17 +178,11 @@ class minijuego(BaseEstado):
         
         nueva_pos = (fila, col)
         
-        # Verificar si es un movimiento válido (buscar en la lista)
-        es_valido = False
-        for mov in self.movimientos_validos:
-            if (mov[0], mov[1]) == nueva_pos:
-                es_valido = True
-                break
-        
-        if es_valido:
+        # Verificar si es un movimiento válido (mapa de alcance)
+        if es_movimiento_legal(self.mapa_alcance, self.pos_actual, nueva_pos):
             # Realizar movimiento
             self.pos_actual = nueva_pos
-            self.camino_recorrido.append(nueva_pos)
+            self.camino_recorrido.add(nueva_pos)
             
             # ⬅️ VERIFICAR VICTORIA (recibe pos y tamaño)
             if verificar_victoria(self.pos_actual, TAMAÑO_MATRIZ_MINIJUEGO):
@@ -194,16 +190,8 @@ class minijuego(BaseEstado):
                 self.terminado = True
                 self.victoria = True
             else:
-                # Actualizar movimientos válidos
-                valor_actual = self.matriz[self.pos_actual[0]][self.pos_actual[1]]
-                self.movimientos_validos = obtener_movimientos_validos(
-                    self.matriz,
-                    self.pos_actual,
-                    valor_actual
-                )
-                
                 # Verificar si no hay movimientos (derrota)
-                if not self.movimientos_validos:
+                if not tiene_movimientos(self.mapa_alcance, self.pos_actual):
                     print("😢 Derrota - No hay movimientos válidos")
                     self.mostrar_derrota = True
     
@@ -249,7 +237,7 @@ class minijuego(BaseEstado):
         
         # Instrucciones
         if not self.terminado:
-            instruccion = "Muevete solo a casillas con valores MAYORES"
+            instruccion = "Muevete solo a casillas con valores MAYORES (H: pistas)"
             inst_render = self.fuente_instrucciones.render(instruccion, True, self.color_texto)
             inst_rect = inst_render.get_rect(center=(self.screen_rect.centerx, 100))
             surface.blit(inst_render, inst_rect)
@@ -287,14 +275,14 @@ class minijuego(BaseEstado):
                     color = self.color_celda_actual
                 elif pos in self.camino_recorrido:
                     color = self.color_celda_visitada
+                elif es_movimiento_legal(self.mapa_alcance, self.pos_actual, pos):
+                    # Con pistas, los movimientos sin salida se marcan distinto
+                    if self.mostrar_pistas and not lleva_al_objetivo(self.mapa_alcance, pos):
+                        color = self.color_celda_sin_salida
+                    else:
+                        color = self.color_celda_valida
                 else:
-                    # Verificar si es movimiento válido
-                    es_valido = False
-                    for mov in self.movimientos_validos:
-                        if (mov[0], mov[1]) == pos:
-                            es_valido = True
-                            break
-                    color = self.color_celda_valida if es_valido else self.color_celda
+                    color = self.color_celda
                 
                 # Dibujar celda
                 pygame.draw.rect(surface, color, (x, y, self.tamano_celda, self.tamano_celda))
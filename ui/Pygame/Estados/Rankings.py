@@ -9,8 +9,8 @@ from .base import BaseEstado
 from ..Botones import Boton, crear_botones_centrados
 from ..efectos import dibujar_degradado_vertical
 from ..recursos import cargar_imagen, cargar_fuente_principal
-from data.repositorio_usuarios import obtener_ranking
-from config.constantes import RUTA_USUARIOS
+from data.repositorio_usuarios import obtener_top_ranking
+from config.constantes import RUTA_USUARIOS, TAMANO_RANKING
 
 
 class rankings(BaseEstado):
@@ -70,12 +70,8 @@ class rankings(BaseEstado):
         self.persist = persist
         self.done = False
         
-        # Cargar ranking
-        self.ranking_data = obtener_ranking(RUTA_USUARIOS)
-        
-        # Limitar a top 10
-        if len(self.ranking_data) > 10:
-            self.ranking_data = self.ranking_data[:10]
+        # Cargar top 10 desde el ranking materializado (no recorre todos los usuarios)
+        self.ranking_data = obtener_top_ranking(RUTA_USUARIOS, TAMANO_RANKING)
     
     def get_event(self, event: pygame.event.Event):
         """
@@ -22,31 +22,42 @@ from ui.Pygame.Estados.Historia import historia
 from ui.Pygame.Estados.Minijuego import minijuego
 from ui.Pygame.Estados.Rankings import rankings
 from ui.Pygame.Estados.SeleccionObjeto import seleccionObjeto
-from config.constantes import ANCHO, ALTO, FPS
+from config.constantes import ANCHO, ALTO, FPS, RUTA_USUARIOS
 from ui.Pygame.Juego import juego
+from data.repositorio_usuarios import compactar_diario_usuarios
 
 # ============================================
 # INICIALIZACIÓN Y EJECUCIÓN
 # ============================================
-pygame.init()
-
-pantalla = pygame.display.set_mode((ANCHO, ALTO))
-pygame.display.set_caption("Trivia Mitológica")
-
-estados = {
-    "Menu": menu(),
-    "Gameplay": gameplay(),
-    "Historia": historia(),
-    "Gameover": gameOver(),
-    # ⬅️ ELIMINADO: "Splash": splash(),
-    "Minijuego": minijuego(),
-    "Rankings": rankings(),
-    "SeleccionObjeto": seleccionObjeto()
-}
-
-# Inicia con Historia
-Juego = juego(pantalla, estados, "Historia", FPS)
-Juego.run()
-
-pygame.quit()
-sys.exit()
\ No newline at end of file
+# Solo bajo __main__: con "spawn" (Windows, macOS) los procesos de
+# mapear_shards y del pool de tableros importan este archivo y, sin la
+# guarda, cada uno abriría otra ventana del juego
+def main():
+    """Punto de entrada de la versión gráfica."""
+    compactar_diario_usuarios(RUTA_USUARIOS)
+    pygame.init()
+
+    pantalla = pygame.display.set_mode((ANCHO, ALTO))
+    pygame.display.set_caption("Trivia Mitológica")
+
+    estados = {
+        "Menu": menu(),
+        "Gameplay": gameplay(),
+        "Historia": historia(),
+        "Gameover": gameOver(),
+        # ⬅️ ELIMINADO: "Splash": splash(),
+        "Minijuego": minijuego(),
+        "Rankings": rankings(),
+        "SeleccionObjeto": seleccionObjeto()
+    }
+
+    # Inicia con Historia
+    Juego = juego(pantalla, estados, "Historia", FPS)
+    Juego.run()
+
+    pygame.quit()
+    sys.exit()
+
+
+if __name__ == "__main__":
+    main()
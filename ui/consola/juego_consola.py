@@ -11,17 +11,31 @@ from data.repositorio_preguntas import cargar_preguntas_desde_csv
 from data.repositorio_usuarios import guardar_estadisticas_usuario
 from core.logica_juego import (
     obtener_pregunta_para_nivel,
+    preparar_indice_juego,
     procesar_pregunta_completa,
     construir_estadisticas_partida,
     verificar_condicion_fin_partida,
     calcular_datos_buffeo_para_ui
 )
 from core.logica_preguntas import calcular_racha_actual, determinar_intentos_maximos
+from models.registro_respuestas import crear_registro_respuestas, registrar_respuesta
 from core.logica_buffeos import (
     verificar_merecimiento_objeto,
+    verificar_objeto_equipado,
     guardar_objeto_equipado,
     obtener_opciones_objetos
 )
+from core.registro_eventos import (
+    generar_semilla_partida,
+    crear_generador_partida,
+    crear_registro_eventos,
+    registrar_pregunta_sorteada,
+    registrar_respuesta_eventos,
+    registrar_fin_eventos
+)
+from data.repositorio_eventos import guardar_registro_eventos
+from core.sesion_juego import cargar_filtro_vistas, guardar_filtro_vistas
+from models.filtro_vistas import agregar_vista
 from utils.formateadores import quitar_espacios_extremos, convertir_a_mayusculas
 from config.constantes import PREGUNTAS_POR_NIVEL
 from config.mensajes import *
@@ -131,6 +145,8 @@ def preguntar_reintento() -> bool:
 #   - pregunta (dict): Pregunta a procesar
 #   - nombre_usuario (str): Nombre del usuario
 #   - racha_actual (int): Racha de respuestas correctas
+#   - registro_eventos (dict): Registro de eventos de la partida (opcional);
+#     se emite un evento por intento, final=False si hay otro después
 #
 # Retorna:
 #   - dict: Resultado completo de la pregunta
@@ -138,7 +154,8 @@ def preguntar_reintento() -> bool:
 # Ejemplo de uso:
 #   resultado = procesar_pregunta_con_ui(pregunta, "Juan", 3)
 # =============================================================================
-def procesar_pregunta_con_ui(pregunta: dict, nombre_usuario: str, racha_actual: int) -> dict:
+def procesar_pregunta_con_ui(pregunta: dict, nombre_usuario: str, racha_actual: int,
+                             registro_eventos: dict = None) -> dict:
     """Procesa una pregunta completa con interfaz de consola."""
     max_intentos = determinar_intentos_maximos(nombre_usuario)
     intentos = 0
@@ -156,6 +173,7 @@ def procesar_pregunta_con_ui(pregunta: dict, nombre_usuario: str, racha_actual:
         duracion = round(fin - inicio, 2)
         
         # Procesar respuesta
+        objeto_antes = verificar_objeto_equipado(nombre_usuario)
         resultado = procesar_pregunta_completa(
             pregunta, nombre_usuario, racha_actual,
             respuesta, intentos, max_intentos
@@ -164,6 +182,17 @@ def procesar_pregunta_con_ui(pregunta: dict, nombre_usuario: str, racha_actual:
         # Mostrar resultado
         mostrar_resultado_consola(resultado)
         
+        # Decidir el reintento antes de registrar: define si el intento es final
+        reintentar = False
+        if resultado["valida"] and not resultado["es_correcta"] and resultado.get("puede_reintentar", False):
+            reintentar = preguntar_reintento()
+        if registro_eventos is not None:
+            registrar_respuesta_eventos(
+                registro_eventos, pregunta, respuesta, racha_actual, resultado,
+                objeto_antes, verificar_objeto_equipado(nombre_usuario),
+                resultado["valida"] and not reintentar
+            )
+        
         # Si es válida y correcta, terminar
         if resultado["valida"] and resultado["es_correcta"]:
             resultado_final = resultado
@@ -177,7 +206,7 @@ def procesar_pregunta_con_ui(pregunta: dict, nombre_usuario: str, racha_actual:
         
         # Si es incorrecta y puede reintentar
         if resultado.get("puede_reintentar", False):
-            if preguntar_reintento():
+            if reintentar:
                 intentos += 1
                 continue
             else:
@@ -213,16 +242,22 @@ def procesar_pregunta_con_ui(pregunta: dict, nombre_usuario: str, racha_actual:
 #   - preguntas (dict): Todas las preguntas
 #   - preguntas_usadas (list): IDs de preguntas ya usadas
 #   - nombre_usuario (str): Nombre del usuario
-#   - respuestas_partida (list): Respuestas de la partida
+#   - respuestas_partida (dict): Registro de respuestas de la partida
+#     (models/registro_respuestas)
+#   - indice (dict): Índice de preguntas de la partida (opcional)
+#   - registro_eventos (dict): Registro de eventos de la partida (opcional)
+#   - rng (random.Random): Generador con la semilla de la partida (opcional)
+#   - vistas (dict): Filtro de preguntas vistas del jugador (opcional)
 #
 # Retorna:
 #   - dict: Resultado del nivel
 #
 # Ejemplo de uso:
-#   resultado = jugar_nivel_consola(1, preguntas, [], "Juan", [])
+#   resultado = jugar_nivel_consola(1, preguntas, [], "Juan", crear_registro_respuestas())
 # =============================================================================
 def jugar_nivel_consola(nivel: int, preguntas: dict, preguntas_usadas: list,
-                       nombre_usuario: str, respuestas_partida: list) -> dict:
+                       nombre_usuario: str, respuestas_partida: dict, indice: dict = None,
+                       registro_eventos: dict = None, rng=None, vistas: dict = None) -> dict:
     """Juega un nivel completo en consola."""
     cantidad = PREGUNTAS_POR_NIVEL[nivel]
     
@@ -244,13 +279,17 @@ def jugar_nivel_consola(nivel: int, preguntas: dict, preguntas_usadas: list,
             print(f"🔥 Racha actual: {racha} respuestas correctas")
         
         # Obtener pregunta
-        pregunta = obtener_pregunta_para_nivel(preguntas, nivel, preguntas_usadas)
+        pregunta = obtener_pregunta_para_nivel(preguntas, nivel, preguntas_usadas, indice, rng, vistas)
         if pregunta is None:
             print(f"❌ No hay más preguntas disponibles para el nivel {nivel}")
             break
+        if registro_eventos is not None:
+            registrar_pregunta_sorteada(registro_eventos, pregunta)
+        if vistas is not None:
+            agregar_vista(vistas, pregunta["id"])
         
         # Procesar pregunta
-        resultado = procesar_pregunta_con_ui(pregunta, nombre_usuario, racha)
+        resultado = procesar_pregunta_con_ui(pregunta, nombre_usuario, racha, registro_eventos)
         
         # Registrar respuesta
         respuesta_completa = {
@@ -266,7 +305,7 @@ def jugar_nivel_consola(nivel: int, preguntas: dict, preguntas_usadas: list,
         }
         
         respuestas_nivel.append(respuesta_completa)
-        respuestas_partida.append(respuesta_completa)
+        registrar_respuesta(respuestas_partida, respuesta_completa)
         preguntas_usadas.append(pregunta["id"])
         
         # Acumular estadísticas
@@ -380,12 +419,21 @@ def jugar_partida_completa_consola(nombre: str, archivo_usuarios: str, archivo_p
     """Ejecuta una partida completa en modo consola."""
     print(INICIANDO_PARTIDA.format("="*50, "="*50))
     
-    # Cargar preguntas
+    # Cargar preguntas (los pesos por categoría salen de lo que el jugador ya vio)
     preguntas = cargar_preguntas_desde_csv(archivo_preguntas)
+    vistas = cargar_filtro_vistas(nombre)
+    indice = preparar_indice_juego(preguntas, None, vistas)
+    
+    # Registro de eventos con la semilla de la partida (sin vidas extra en consola)
+    semilla = generar_semilla_partida()
+    rng = crear_generador_partida(semilla)
+    registro_eventos = crear_registro_eventos(
+        nombre, semilla, verificar_objeto_equipado(nombre), 0, "consola", vistas
+    )
     
     # Inicializar estado
     preguntas_usadas = []
-    respuestas_partida = []
+    respuestas_partida = crear_registro_respuestas()
     puntos_totales = 0
     buffeo_totales = 0
     correctas_totales = 0
@@ -395,7 +443,8 @@ def jugar_partida_completa_consola(nombre: str, archivo_usuarios: str, archivo_p
     for nivel in [1, 2, 3]:
         resultado_nivel = jugar_nivel_consola(
             nivel, preguntas, preguntas_usadas, 
-            nombre, respuestas_partida
+            nombre, respuestas_partida, indice,
+            registro_eventos, rng, vistas
         )
         
         puntos_totales += resultado_nivel["total_puntos"]
@@ -409,8 +458,9 @@ def jugar_partida_completa_consola(nombre: str, archivo_usuarios: str, archivo_p
             break
     
     # Verificar si merece objeto especial
-    total_preguntas = len(respuestas_partida)
-    if verificar_merecimiento_objeto(nombre, correctas_totales, total_preguntas):
+    total_preguntas = len(respuestas_partida["respuestas"])
+    merece_objeto = verificar_merecimiento_objeto(nombre, correctas_totales, total_preguntas)
+    if merece_objeto:
         print(FELICITACIONES_OBJETO)
         objeto = seleccionar_objeto_especial()
         guardar_objeto_equipado(nombre, objeto)
@@ -429,5 +479,9 @@ def jugar_partida_completa_consola(nombre: str, archivo_usuarios: str, archivo_p
         respuestas_partida, puntos_totales, buffeo_totales, tiempo_total
     )
     
-    guardar_estadisticas_usuario(nombre, estadisticas, archivo_usuarios)
+    if not guardar_estadisticas_usuario(nombre, estadisticas, archivo_usuarios):
+        print("⚠️ La partida no quedó guardada en las estadísticas.")
+    registrar_fin_eventos(registro_eventos, estadisticas, 0, 0, merece_objeto)
+    guardar_registro_eventos(registro_eventos)
+    guardar_filtro_vistas(nombre, vistas)
     mostrar_resumen_final(nombre, estadisticas)
@@ -4,9 +4,8 @@
 # Implementación del menú principal en modo consola
 # =============================================================================
 
-from data.repositorio_usuarios import obtener_usuario, obtener_ranking
+from data.repositorio_usuarios import obtener_usuario, obtener_ranking, obtener_agregados_usuario
 from utils.formateadores import quitar_espacios_extremos
-from utils.algoritmos import calcular_estadisticas_lista
 from config.constantes import RUTA_USUARIOS, RUTA_PREGUNTAS
 from config.mensajes import BIENVENIDA, PEDIR_NOMBRE, NOMBRE_VACIO, DESPEDIDA, OPCION_INVALIDA_MENU
 
@@ -100,14 +99,8 @@ def mostrar_estadisticas_consola(nombre: str, archivo_usuarios: str = None) -> N
         print(f"❌ {usuario['error']}")
         return
     
-    # Calcular estadísticas
-    stats = {
-        "puntajes": calcular_estadisticas_lista(usuario.get("puntajes", [])),
-        "tiempos": calcular_estadisticas_lista(usuario.get("tiempos", [])),
-        "aciertos": calcular_estadisticas_lista(usuario.get("aciertos", [])),
-        "porcentajes": calcular_estadisticas_lista(usuario.get("porcentajes", [])),
-        "total_preguntas": calcular_estadisticas_lista(usuario.get("total_preguntas", []))
-    }
+    # Estadísticas mantenidas al guardar cada partida (sin recorrer las listas)
+    stats = obtener_agregados_usuario(usuario)
     
     intentos = usuario.get("intentos", 0)
     ultimo_puntaje = usuario["puntajes"][-1] if usuario.get("puntajes") else 0
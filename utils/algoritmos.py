@@ -9,6 +9,7 @@
 # 📥 IMPORTADO EN:
 #    - data/repositorio_usuarios.py (línea 9) - para calcular_estadisticas_lista
 #    - ui/consola/menu_consola.py - para operaciones con listas de estadísticas
+#    - data/repositorio_usuarios.py - para los agregados incrementales por usuario
 #
 # 🔗 DEPENDENCIAS:
 #    Ninguna (algoritmos puros)
@@ -19,6 +20,7 @@
 #    - UN SOLO return por función (usamos variables de control)
 #    - No se usan funciones built-in prohibidas (sum, max, min, filter, etc.)
 #    - Útiles para explicar complejidad algorítmica O(n)
+#    - Los agregados incrementales pasan de O(n) por consulta a O(1)
 # =============================================================================
 
 # =============================================================================
@@ -192,3 +194,89 @@ def calcular_estadisticas_lista(lista) -> dict:
         "peor": peor,
         "total": total
     }
+
+
+# =============================================================================
+# CREAR_AGREGADO_VACIO
+# =============================================================================
+# Descripción: Crea un agregado incremental vacío (mismas claves que
+#              calcular_estadisticas_lista más "cantidad")
+# 
+# Uso en Pygame: Se guarda en cada usuario para no recorrer sus listas
+#
+# Parámetros:
+#   Ninguno
+#
+# Retorna:
+#   - dict: {"cantidad": 0, "total": 0, "mejor": 0, "peor": 0, "promedio": 0}
+#
+# Ejemplo de uso:
+#   agregado = crear_agregado_vacio()
+# =============================================================================
+def crear_agregado_vacio() -> dict:
+    """Crea un agregado incremental vacío."""
+    return {
+        "cantidad": 0,
+        "total": 0,
+        "mejor": 0,
+        "peor": 0,
+        "promedio": 0
+    }
+
+
+# =============================================================================
+# ACTUALIZAR_AGREGADO
+# =============================================================================
+# Descripción: Incorpora un valor nuevo a un agregado en O(1)
+# 
+# Uso en Pygame: Se usa al guardar cada partida
+#
+# Parámetros:
+#   - agregado (dict): Agregado a actualizar (se modifica)
+#   - valor (int/float): Valor nuevo
+#
+# Retorna:
+#   - dict: Agregado actualizado
+#
+# Ejemplo de uso:
+#   agregado = actualizar_agregado(agregado, 25)
+# =============================================================================
+def actualizar_agregado(agregado: dict, valor) -> dict:
+    """Incorpora un valor nuevo a un agregado en O(1)."""
+    if agregado["cantidad"] == 0:
+        agregado["mejor"] = valor
+        agregado["peor"] = valor
+    else:
+        if valor > agregado["mejor"]:
+            agregado["mejor"] = valor
+        if valor < agregado["peor"]:
+            agregado["peor"] = valor
+    agregado["cantidad"] = agregado["cantidad"] + 1
+    agregado["total"] = agregado["total"] + valor
+    agregado["promedio"] = agregado["total"] / agregado["cantidad"]
+    return agregado
+
+
+# =============================================================================
+# CALCULAR_AGREGADO_LISTA
+# =============================================================================
+# Descripción: Construye el agregado de una lista completa (para migrar
+#              usuarios que todavía no lo tienen)
+# 
+# Uso en Pygame: Se usa una sola vez por usuario (backfill)
+#
+# Parámetros:
+#   - lista (list): Lista de números
+#
+# Retorna:
+#   - dict: Agregado equivalente a aplicar actualizar_agregado a cada valor
+#
+# Ejemplo de uso:
+#   agregado = calcular_agregado_lista([10, 20, 30])
+# =============================================================================
+def calcular_agregado_lista(lista) -> dict:
+    """Construye el agregado incremental de una lista completa."""
+    agregado = crear_agregado_vacio()
+    for valor in lista:
+        agregado = actualizar_agregado(agregado, valor)
+    return agregado